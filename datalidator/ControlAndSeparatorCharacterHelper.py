@@ -0,0 +1,181 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from typing import final, Final, Dict, List, Tuple, Iterable, Optional
+import re
+import sys
+import unicodedata
+
+
+__all__ = "ControlAndSeparatorCharacterHelper",
+
+
+@final
+class ControlAndSeparatorCharacterHelper:
+    """
+    This class provides precomputed lookup structures for finding control and separator characters, i.e. characters
+     that belong to one of the "C" or "Z" Unicode character categories (as reported by unicodedata.category()), in
+     strings. It is used by StringControlAndSeparatorCharacterFilter and
+     StringContainsNoControlOrSeparatorCharactersValidator, so that they do not have to look up the category of each
+     character of their input strings in Python code.
+
+    The structures are built on first use and cached for each 'allowed_characters' string (= characters which are not
+     considered to be control or separator characters). Building the regex for the first time takes a fraction of a
+     second, as the category of each Unicode code point has to be looked up.
+
+    NOTE: https://www.compart.com/en/unicode/category
+    """
+
+    __slots__ = ()
+
+    __CONTROL_AND_SEPARATOR_CATEGORY_PREFIXES: Final[Tuple[str, ...]] = ("C", "Z")
+    __FIRST_ASTRAL_CODE_POINT: Final[int] = 0x10000  # The first code point outside the Basic Multilingual Plane
+    __ASTRAL_RANGE_GROUP_SIZE: Final[int] = 64
+
+    # The caches are only ever added to; in the worst case, a structure is built more than once by concurrent threads
+    __control_and_separator_character_ranges: Optional[List[Tuple[int, int]]] = None
+    __ascii_deletion_tables: Final[Dict[str, Dict[int, None]]] = {}
+    __character_regexes: Final[Dict[str, re.Pattern]] = {}
+
+    def __init__(self):
+        raise NotImplementedError("The '{}' class is not supposed to be instantiated!".format(self.__class__.__name__))
+
+    @classmethod
+    def get_ascii_deletion_table(cls, allowed_characters: str) -> Dict[int, None]:
+        """
+        :return: A str.translate() table which deletes the ASCII control and separator characters which are not in
+         'allowed_characters'. It must only be applied to ASCII strings (see str.isascii()).
+        """
+
+        table = cls.__ascii_deletion_tables.get(allowed_characters, None)
+        if table is None:
+            table = {
+                code_point: None for code_point in range(128)
+                if cls.__is_control_or_separator_character(chr(code_point)) and (chr(code_point) not in allowed_characters)
+            }
+            cls.__ascii_deletion_tables[allowed_characters] = table
+
+        return table
+
+    @classmethod
+    def get_character_regex(cls, allowed_characters: str) -> re.Pattern:
+        """
+        :return: A compiled regex matching any single control or separator character which is not in
+         'allowed_characters'.
+        """
+
+        regex = cls.__character_regexes.get(allowed_characters, None)
+        if regex is None:
+            regex = re.compile(cls.__generate_regex_pattern(allowed_characters))
+            cls.__character_regexes[allowed_characters] = regex
+
+        return regex
+
+    @classmethod
+    def __generate_regex_pattern(cls, allowed_characters: str) -> str:
+        allowed_code_points = sorted(set(map(ord, allowed_characters)))
+
+        bmp_ranges, astral_ranges = [], []
+        for range_start, range_end in cls.__get_control_and_separator_character_ranges():
+            # The allowed characters split the ranges which contain them
+            for allowed_code_point in allowed_code_points:
+                if range_start <= allowed_code_point <= range_end:
+                    if range_start < allowed_code_point:
+                        cls.__add_range(bmp_ranges, astral_ranges, range_start, allowed_code_point - 1)
+                    range_start = allowed_code_point + 1
+
+            if range_start <= range_end:
+                cls.__add_range(bmp_ranges, astral_ranges, range_start, range_end)
+
+        # The regex engine stores the BMP part of a character class as a bitmap, but it compares characters with the
+        #  ranges outside the BMP one by one - even the BMP characters which are not in the bitmap. The astral ranges
+        #  are therefore matched in a separate alternative, which is only tried for astral characters, and are split
+        #  into groups so that each character is compared with a limited number of ranges.
+        alternatives = []
+        if len(bmp_ranges) > 0:
+            alternatives.append(cls.__generate_character_class(bmp_ranges))
+
+        if len(astral_ranges) > 0:
+            group_size = cls.__ASTRAL_RANGE_GROUP_SIZE
+            group_alternatives = []
+            group_start = cls.__FIRST_ASTRAL_CODE_POINT
+            for group_index in range(0, len(astral_ranges), group_size):
+                group_ranges = astral_ranges[group_index:(group_index + group_size)]
+                group_end = group_ranges[-1][1]
+                group_alternatives.append("(?={}){}".format(
+                    cls.__generate_character_class(((group_start, group_end),)),
+                    cls.__generate_character_class(group_ranges)
+                ))
+                group_start = group_end + 1
+
+            alternatives.append("(?={})(?:{})".format(
+                cls.__generate_character_class(((cls.__FIRST_ASTRAL_CODE_POINT, sys.maxunicode),)),
+                "|".join(group_alternatives)
+            ))
+
+        if len(alternatives) == 0:
+            return "(?!)"  # Never matches
+
+        return "|".join(alternatives)
+
+    @classmethod
+    def __add_range(cls, bmp_ranges: List[Tuple[int, int]], astral_ranges: List[Tuple[int, int]], range_start: int, range_end: int) -> None:
+        if range_start < cls.__FIRST_ASTRAL_CODE_POINT:
+            bmp_ranges.append((range_start, min(range_end, cls.__FIRST_ASTRAL_CODE_POINT - 1)))
+
+        if range_end >= cls.__FIRST_ASTRAL_CODE_POINT:
+            astral_ranges.append((max(range_start, cls.__FIRST_ASTRAL_CODE_POINT), range_end))
+
+    @classmethod
+    def __generate_character_class(cls, ranges: Iterable[Tuple[int, int]]) -> str:
+        return "[" + "".join(cls.__generate_character_class_range(range_start, range_end) for range_start, range_end in ranges) + "]"
+
+    @classmethod
+    def __generate_character_class_range(cls, range_start: int, range_end: int) -> str:
+        if range_start == range_end:
+            return "\\U{:08x}".format(range_start)
+
+        return "\\U{:08x}-\\U{:08x}".format(range_start, range_end)
+
+    @classmethod
+    def __get_control_and_separator_character_ranges(cls) -> List[Tuple[int, int]]:
+        if cls.__control_and_separator_character_ranges is None:
+            ranges = []
+            range_start = None
+            for code_point in range(sys.maxunicode + 1):
+                if cls.__is_control_or_separator_character(chr(code_point)):
+                    if range_start is None:
+                        range_start = code_point
+                elif range_start is not None:
+                    ranges.append((range_start, code_point - 1))
+                    range_start = None
+
+            if range_start is not None:
+                ranges.append((range_start, sys.maxunicode))
+
+            cls.__control_and_separator_character_ranges = ranges
+
+        return cls.__control_and_separator_character_ranges
+
+    @classmethod
+    def __is_control_or_separator_character(cls, char: str) -> bool:
+        return unicodedata.category(char)[0] in cls.__CONTROL_AND_SEPARATOR_CATEGORY_PREFIXES
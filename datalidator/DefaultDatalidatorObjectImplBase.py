@@ -20,7 +20,7 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import final, Final
+from typing import final, Final, Any, Callable, Dict, Tuple, Type
 import abc
 from datalidator.DatalidatorObjectIface import DatalidatorObjectIface
 
@@ -35,10 +35,20 @@ class DefaultDatalidatorObjectImplBase(DatalidatorObjectIface, metaclass=abc.ABC
     All blueprints, filters and validators that ship with this library are subclasses of this base class.
     When implementing your own blueprints, filters or validators, you may choose to either inherit from this class
      as well (this is the easier way) or implement DatalidatorObjectIface yourselves.
+
+    Instances of this class are picklable, as long as the values of their attributes are picklable, so they can be
+     built once and then sent to other processes (e.g. to the workers of 'concurrent.futures.ProcessPoolExecutor')
+     without their initializers being run again. Some classes hold data which are derived from their configuration
+     and which cannot (or should not) be pickled, such as lookup tables containing bound private methods or lazily
+     built caches. The names of the slots holding such data are declared in the '__TRANSIENT_SLOTS' constant of the
+     class which declares the slots - these slots are not pickled, and the class's private
+     '__initialize_transient_slots()' method is called to initialize them again when the object is being unpickled.
     """
 
     __slots__ = "_tag",
 
+    __pickling_plans: Dict[Type, Tuple[Tuple[str, ...], Tuple[Callable[[Any], None], ...]]] = {}  # Populated lazily - see __get_pickling_plan()
+
     def __init__(self, tag: str = ""):
         """
         :param tag: See the docstring of DatalidatorObjectIface.get_tag() for more information.
@@ -49,3 +59,71 @@ class DefaultDatalidatorObjectImplBase(DatalidatorObjectIface, metaclass=abc.ABC
     @final
     def get_tag(self) -> str:
         return self._tag
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = {}
+
+        for attribute_name in self.__class__.__get_pickling_plan()[0]:
+            try:
+                state[attribute_name] = getattr(self, attribute_name)
+            except AttributeError:  # The slot has not been assigned a value
+                pass
+
+        # Subclasses which do not declare __slots__ have a __dict__
+        state.update(getattr(self, "__dict__", {}))
+
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for attribute_name, value in state.items():
+            setattr(self, attribute_name, value)
+
+        for initialize_transient_slots in self.__class__.__get_pickling_plan()[1]:
+            initialize_transient_slots(self)
+
+    @classmethod
+    @final
+    def __get_pickling_plan(cls) -> Tuple[Tuple[str, ...], Tuple[Callable[[Any], None], ...]]:
+        # Returns a tuple of (the names of the attributes which are pickled, the '__initialize_transient_slots()'
+        #  methods of the classes which declare transient slots). The plan is built only once per class, as walking
+        #  through the class's MRO is too slow to be done each time an object is (un)pickled.
+        pickling_plan = DefaultDatalidatorObjectImplBase.__pickling_plans.get(cls, None)
+        if pickling_plan is not None:
+            return pickling_plan
+
+        pickled_attribute_names = []
+        transient_slot_initializers = []
+        for class_ in cls.__mro__:
+            transient_slot_names = class_.__dict__.get(cls.__get_private_attribute_name(class_, "__TRANSIENT_SLOTS"), ())
+            for slot_name in cls.__get_slot_names(class_):
+                if (slot_name not in transient_slot_names) and (slot_name not in ("__dict__", "__weakref__")):
+                    pickled_attribute_names.append(cls.__get_private_attribute_name(class_, slot_name))
+
+            initialize_transient_slots = class_.__dict__.get(cls.__get_private_attribute_name(class_, "__initialize_transient_slots"), None)
+            if initialize_transient_slots is not None:
+                transient_slot_initializers.append(initialize_transient_slots)
+
+        # Superclasses' transient slots are initialized first, as subclasses might depend on them
+        pickling_plan = (tuple(pickled_attribute_names), tuple(reversed(transient_slot_initializers)))
+        DefaultDatalidatorObjectImplBase.__pickling_plans[cls] = pickling_plan
+
+        return pickling_plan
+
+    @classmethod
+    @final
+    def __get_slot_names(cls, class_: Type) -> Tuple[str, ...]:
+        slot_names = class_.__dict__.get("__slots__", ())
+        if isinstance(slot_names, str):
+            return slot_names,
+
+        return tuple(slot_names)
+
+    @classmethod
+    @final
+    def __get_private_attribute_name(cls, class_: Type, attribute_name: str) -> str:
+        # Mimics the name mangling performed by the Python compiler
+        stripped_class_name = class_.__name__.lstrip("_")
+        if (not attribute_name.startswith("__")) or attribute_name.endswith("__") or (stripped_class_name == ""):
+            return attribute_name
+
+        return "_" + stripped_class_name + attribute_name
@@ -0,0 +1,173 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from typing import final, Final, FrozenSet, Type, Any
+import sys
+import math
+import uuid
+import decimal
+import datetime
+import fractions
+import ipaddress
+
+
+__all__ = "EqualityKeyHelper",
+
+
+@final
+class EqualityKeyHelper:
+    """
+    This class helps the library's components to look values up in sets and dictionaries, instead of comparing them
+     with other values one by one, without changing the semantics of the '==' operator.
+
+    For two values A and B which both have an equality key, A == B holds exactly when their equality keys are equal
+     (and therefore have the same hash); a NaN is only equal to itself, like when it is looked up using the 'in'
+     operator. Values of the hash-consistent data types (see HASH_CONSISTENT_DATA_TYPES) have an equality key; lists,
+     tuples, dictionaries and sets (exactly these types, not their subclasses) consisting only of such values have a
+     tuple-based equality key. Other values (e.g. instances of user-defined classes, including subclasses of built-in
+     types, which may override __eq__()) do not have an equality key and must be compared using the '==' operator.
+
+    The equality keys are resistant to hash flooding: numbers whose hash could be made to collide with the hashes of
+     other numbers by the sender of the input data (e.g. integers larger than 2^61 - 1, whose hash is computed modulo
+     this number) are represented by bytes, which are hashed using the randomized string hash function.
+    """
+
+    __slots__ = ()
+
+    # For values of these types, equality implies an equal hash (e.g. 1 == 1.0 == True == Decimal(1), and they all have
+    #  the same hash), and their '==' operator does not consider values of any other types equal.
+    HASH_CONSISTENT_DATA_TYPES: Final[FrozenSet[Type]] = frozenset((
+        str, bytes, int, bool, float, complex, type(None), decimal.Decimal, fractions.Fraction,
+        datetime.datetime, datetime.date, datetime.time, datetime.timedelta, uuid.UUID,
+        ipaddress.IPv4Address, ipaddress.IPv6Address, ipaddress.IPv4Network, ipaddress.IPv6Network
+    ))
+
+    # Returned by get_equality_key() for values which do not have an equality key
+    NO_EQUALITY_KEY: Final[object] = object()
+
+    # Integers whose absolute value is smaller than this have distinct hashes (see sys.hash_info.modulus)
+    __MAX_HASH_DISTINCT_INTEGER: Final[int] = sys.hash_info.modulus - 1
+
+    # Decimals with larger exponents do not have an equality key, as they would have to be converted to huge integers
+    __MAX_ABSOLUTE_DECIMAL_EXPONENT: Final[int] = 4300
+
+    def __init__(self):
+        raise NotImplementedError("The '{}' class is not supposed to be instantiated!".format(self.__class__.__name__))
+
+    @classmethod
+    def get_equality_key(cls, value: Any) -> Any:
+        """
+        :return: The equality key of 'value' (which is guaranteed to be hashable), or NO_EQUALITY_KEY if it does not
+         have one.
+        """
+
+        if value.__class__ is str:  # The most common case
+            return value
+
+        try:
+            key = cls.__generate_equality_key(value)
+            hash(key)
+        except (TypeError, RecursionError):  # e.g. Decimal("sNaN") is not hashable
+            return cls.NO_EQUALITY_KEY
+
+        return key
+
+    @classmethod
+    def __generate_equality_key(cls, value: Any) -> Any:
+        value_type = value.__class__
+
+        if value_type is str or value_type is bytes or value_type is type(None):
+            return value
+
+        if value_type is int or value_type is bool:
+            if -cls.__MAX_HASH_DISTINCT_INTEGER <= value <= cls.__MAX_HASH_DISTINCT_INTEGER:
+                return value
+            return cls.__generate_rational_number_equality_key(value, 1)
+
+        if value_type is float:
+            if not math.isfinite(value):
+                return cls.__generate_non_finite_number_equality_key(value, math.isnan(value))
+            return cls.__generate_rational_number_equality_key(*value.as_integer_ratio())
+
+        if value_type is decimal.Decimal:
+            if value.is_snan():
+                raise TypeError("A signalling NaN does not have an equality key!")
+            if not value.is_finite():
+                return cls.__generate_non_finite_number_equality_key(value, value.is_nan())
+            if abs(value.as_tuple().exponent) > cls.__MAX_ABSOLUTE_DECIMAL_EXPONENT:
+                raise TypeError("The decimal's exponent is too large!")
+            return cls.__generate_rational_number_equality_key(*value.as_integer_ratio())
+
+        if value_type is fractions.Fraction:
+            return cls.__generate_rational_number_equality_key(value.numerator, value.denominator)
+
+        if value_type is complex:
+            if math.isnan(value.real) or math.isnan(value.imag):
+                return cls.__generate_non_finite_number_equality_key(value, True)
+            if value.imag == 0:
+                return cls.__generate_equality_key(value.real)
+            return complex, cls.__generate_equality_key(value.real), cls.__generate_equality_key(value.imag)
+
+        # The hashes of UUIDs and IP networks are computed from integers, so they may collide as well
+        if value_type is uuid.UUID:
+            return uuid.UUID, value.bytes
+
+        if value_type is ipaddress.IPv4Network or value_type is ipaddress.IPv6Network:
+            return value_type, value.network_address.packed, value.prefixlen
+
+        if value_type in cls.HASH_CONSISTENT_DATA_TYPES:
+            return value
+
+        # The type is a part of the keys of the containers, as e.g. [1] != (1,). The keys of all the other values are
+        #  either not tuples, or tuples whose first item is not a container type, so they cannot be equal to these keys.
+        if value_type is list or value_type is tuple:
+            return value_type, tuple(map(cls.__generate_equality_key, value))
+
+        if value_type is dict:
+            return dict, frozenset((cls.__generate_equality_key(key), cls.__generate_equality_key(item)) for key, item in value.items())
+
+        if value_type is set or value_type is frozenset:
+            # Sets and frozensets containing the same items are equal; their items are compared using their hashes anyway
+            return frozenset, frozenset(value)
+
+        raise TypeError("The value does not have an equality key!")
+
+    @classmethod
+    def __generate_rational_number_equality_key(cls, numerator: int, denominator: int) -> Any:
+        # Numbers of all the types are equal if their exact (rational) values are equal
+        if denominator == 1 and -cls.__MAX_HASH_DISTINCT_INTEGER <= numerator <= cls.__MAX_HASH_DISTINCT_INTEGER:
+            return numerator
+
+        return fractions.Fraction, cls.__convert_integer_to_bytes(numerator), cls.__convert_integer_to_bytes(denominator)
+
+    @classmethod
+    def __generate_non_finite_number_equality_key(cls, value: Any, is_nan: bool) -> Any:
+        if is_nan:
+            # A NaN is not equal to anything, but the 'in' operator and dictionaries consider identical objects equal.
+            #  Python versions older than 3.10 hash all NaNs to 0, so the NaN itself cannot be used as the key.
+            return "NaN", id(value)
+
+        return "Infinity", (value > 0)
+
+    @classmethod
+    def __convert_integer_to_bytes(cls, integer: int) -> bytes:
+        return integer.to_bytes((integer.bit_length() + 8) // 8, "little", signed=True)
@@ -0,0 +1,98 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from typing import final, Final, Any, Callable, TypeVar
+import asyncio
+import time
+from datalidator.blueprints.extras.AsyncUseOptions import AsyncUseOptions
+
+
+__all__ = "AsyncUseContext", "AsyncUseContext_T"
+AsyncUseContext_T = TypeVar("AsyncUseContext_T")
+
+
+@final
+class AsyncUseContext:
+    """
+    A utility class holding the state of a single use_async() call (see DefaultBlueprintImplBase.use_async()). It is
+     passed to all the blueprints used during the call, so that they share the budgets specified in AsyncUseOptions.
+
+    Blueprints which process many items should call consume_item_budget() once per item, and if it returns True, await
+     yield_to_event_loop() before processing the next item.
+
+    Instances of this class are not thread-safe - they must be used only by the task which runs the use_async() call.
+    """
+
+    __slots__ = "__options", "__processed_item_count", "__last_yield_time"
+
+    def __init__(self, options: AsyncUseOptions):
+        self.__options: Final[AsyncUseOptions] = options
+        self.__processed_item_count: int = 0
+        self.__last_yield_time: float = time.perf_counter()
+
+    @final
+    def get_options(self) -> AsyncUseOptions:
+        return self.__options
+
+    @final
+    def consume_item_budget(self) -> bool:
+        """
+        Counts one processed item against the budgets.
+
+        :return: Whether the budgets have been used up, i.e. whether control should be yielded to the event loop.
+        """
+
+        self.__processed_item_count += 1
+        if self.__processed_item_count >= self.__options.get_yield_item_budget():
+            return True
+
+        yield_time_budget = self.__options.get_yield_time_budget()
+        return (yield_time_budget is not None) and ((time.perf_counter() - self.__last_yield_time) >= yield_time_budget)
+
+    @final
+    async def yield_to_event_loop(self) -> None:
+        await asyncio.sleep(0)
+
+        self.__processed_item_count = 0
+        self.__last_yield_time = time.perf_counter()
+
+    @final
+    def should_offload_to_executor(self, item_count: int) -> bool:
+        executor_item_threshold = self.__options.get_executor_item_threshold()
+
+        return (executor_item_threshold is not None) and (item_count > executor_item_threshold)
+
+    @final
+    async def run_in_executor(self, function: Callable[[Any], AsyncUseContext_T], argument: Any) -> AsyncUseContext_T:
+        """
+        Runs 'function(argument)' in the executor specified in the options (or in the event loop's default executor)
+         and waits for it to finish without blocking the event loop.
+
+        If the executor runs the function in another process, the function, its argument and its return value must be
+         picklable (bound methods of blueprints are picklable if the methods are not private).
+
+        :param function: The synchronous function to run.
+        :param argument: The argument to pass to the function.
+        :return: The return value of the function.
+        """
+
+        return await asyncio.get_running_loop().run_in_executor(self.__options.get_executor(), function, argument)
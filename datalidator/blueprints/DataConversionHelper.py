@@ -20,8 +20,11 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import Final, Generic, Callable, Any, Tuple, Type, Sequence, TypeVar
+from typing import Final, Generic, Callable, Any, Tuple, Type, Sequence, Union, TypeVar
+from datalidator.blueprints.exc.InvalidInputDataExc import InvalidInputDataExc
 from datalidator.blueprints.exc.utils.InvalidInputDataExcFactory import InvalidInputDataExcFactory
+from datalidator.blueprints.DataTypeDispatchTable import DataTypeDispatchTable
+from datalidator.blueprints.extras.UseResult import UseResult
 
 
 __all__ = "DataConversionHelper", "DataConversionHelper_T"
@@ -81,3 +84,64 @@ class DataConversionHelper(Generic[DataConversionHelper_T]):
             data_type_allowlist += data_types
 
         raise self._invalid_input_data_exc_factory.generate_input_data_type_not_in_allowlist_exc(data_type_allowlist, input_data)
+
+    def convert_input_using_data_type_dispatch_table(self, dispatch_table: DataTypeDispatchTable[DataConversionHelper_T], input_data: Any) -> DataConversionHelper_T:
+        """
+        Works in the same way as convert_input_using_per_data_type_converter_functions(), but the converter function is
+         looked up in 'dispatch_table', which should be built only once (e.g. in a blueprint's initializer), instead of
+         the type-converter pairs being scanned each time this method is called.
+        """
+
+        converter_function = dispatch_table.get_converter_function(input_data)
+        if converter_function is None:
+            raise self._invalid_input_data_exc_factory.generate_input_data_type_not_in_allowlist_exc(dispatch_table.get_data_type_allowlist(), input_data)
+
+        return converter_function(input_data)
+
+    # The following methods work in the same way as the methods above, but instead of raising the exceptions, they
+    #  return them inside unsuccessful results (see UseResult). The converter functions passed to them must not raise
+    #  the 'InvalidInputDataExc' exceptions either - they return them instead of the output data. Blueprints use these
+    #  methods to implement their '_try_parse()' method (or the '_try_parse_in_*_mode()' methods), so that invalid input
+    #  data are rejected without any exception being raised and caught when the blueprints are used via try_use().
+    #  The output data produced by the converter functions must not be exceptions themselves - only the exceptions'
+    #  builtin base class is checked, as checking instances of the abstract InvalidInputDataExc class is comparatively
+    #  slow and the check is done for all the output data.
+    def try_convert_input(self, exc_returning_converter_function: Callable[[Any], Union[DataConversionHelper_T, InvalidInputDataExc]], input_data: Any) -> UseResult[DataConversionHelper_T]:
+        output_data = exc_returning_converter_function(input_data)
+        if isinstance(output_data, BaseException):
+            return UseResult.from_exception(output_data)
+
+        return UseResult.from_output(output_data)
+
+    def try_convert_input_with_data_type_allowlist(self, exc_returning_converter_function: Callable[[Any], Union[DataConversionHelper_T, InvalidInputDataExc]], data_type_allowlist: Tuple[Type, ...], input_data: Any) -> UseResult[DataConversionHelper_T]:
+        if not isinstance(input_data, data_type_allowlist):
+            return UseResult.from_exception(self._invalid_input_data_exc_factory.generate_input_data_type_not_in_allowlist_exc(data_type_allowlist, input_data))
+
+        # The body of try_convert_input() is inlined in this method and the ones below, as they are called for each
+        #  piece of input data
+        output_data = exc_returning_converter_function(input_data)
+        if isinstance(output_data, BaseException):
+            return UseResult.from_exception(output_data)
+
+        return UseResult.from_output(output_data)
+
+    def try_convert_input_with_data_type_blocklist(self, exc_returning_converter_function: Callable[[Any], Union[DataConversionHelper_T, InvalidInputDataExc]], data_type_blocklist: Tuple[Type, ...], input_data: Any) -> UseResult[DataConversionHelper_T]:
+        if isinstance(input_data, data_type_blocklist):
+            return UseResult.from_exception(self._invalid_input_data_exc_factory.generate_input_data_type_in_blocklist_exc(data_type_blocklist, input_data))
+
+        output_data = exc_returning_converter_function(input_data)
+        if isinstance(output_data, BaseException):
+            return UseResult.from_exception(output_data)
+
+        return UseResult.from_output(output_data)
+
+    def try_convert_input_using_data_type_dispatch_table(self, exc_returning_dispatch_table: DataTypeDispatchTable[Union[DataConversionHelper_T, InvalidInputDataExc]], input_data: Any) -> UseResult[DataConversionHelper_T]:
+        exc_returning_converter_function = exc_returning_dispatch_table.get_converter_function(input_data)
+        if exc_returning_converter_function is None:
+            return UseResult.from_exception(self._invalid_input_data_exc_factory.generate_input_data_type_not_in_allowlist_exc(exc_returning_dispatch_table.get_data_type_allowlist(), input_data))
+
+        output_data = exc_returning_converter_function(input_data)
+        if isinstance(output_data, BaseException):
+            return UseResult.from_exception(output_data)
+
+        return UseResult.from_output(output_data)
@@ -0,0 +1,104 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from typing import final, Final, Generic, Callable, Any, Dict, Optional, Tuple, Type, Sequence, TypeVar
+
+
+__all__ = "DataTypeDispatchTable", "DataTypeDispatchTable_T"
+DataTypeDispatchTable_T = TypeVar("DataTypeDispatchTable_T")
+
+
+@final
+class DataTypeDispatchTable(Generic[DataTypeDispatchTable_T]):
+    """
+    A table which maps data types to converter functions. It is meant to be built only once (e.g. in a blueprint's
+     initializer) and then passed to 'DataConversionHelper.convert_input_using_data_type_dispatch_table()' each time
+     input data are converted.
+
+    The table is built from a sequence of type-converter pairs in the same format as the one accepted by
+     'DataConversionHelper.convert_input_using_per_data_type_converter_functions()', and converter functions are
+     resolved in the same way - the first pair whose data types the input data are an instance of is used. However,
+     the resolved converter function is cached per the input data's exact type, so the pairs have to be scanned only
+     the first time input data of a particular type are converted.
+
+    NOTE: The data types in the pairs should be concrete classes - the results of custom __instancecheck__() methods
+     (e.g. of abstract base classes to which classes can be registered later) are cached as well!
+    """
+
+    __slots__ = "__type_converter_pairs", "__data_type_allowlist", "__converter_function_cache"
+
+    # Input data of arbitrarily many types might be passed to the table, so the number of cached types is limited.
+    __MAX_CACHED_DATA_TYPE_COUNT: Final[int] = 256
+
+    def __init__(self, type_converter_pairs: Sequence[Tuple[Tuple[Type, ...], Callable[[Any], DataTypeDispatchTable_T]]]):
+        self.__type_converter_pairs: Final[Tuple[Tuple[Tuple[Type, ...], Callable[[Any], DataTypeDispatchTable_T]], ...]] = tuple(
+            (tuple(data_types), converter_function) for data_types, converter_function in type_converter_pairs
+        )
+        self.__data_type_allowlist: Final[Tuple[Type, ...]] = tuple(
+            data_type for data_types, _ in self.__type_converter_pairs for data_type in data_types
+        )
+
+        # data_type:type -> converter_function:callable/None (None if there is no suitable converter function)
+        self.__converter_function_cache: Final[Dict[Type, Optional[Callable[[Any], DataTypeDispatchTable_T]]]] = {}
+
+    @final
+    def get_type_converter_pairs(self) -> Sequence[Tuple[Tuple[Type, ...], Callable[[Any], DataTypeDispatchTable_T]]]:
+        return self.__type_converter_pairs  # An *immutable* sequence (tuple) is returned
+
+    @final
+    def get_data_type_allowlist(self) -> Tuple[Type, ...]:
+        return self.__data_type_allowlist
+
+    @final
+    def get_converter_function(self, input_data: Any) -> Optional[Callable[[Any], DataTypeDispatchTable_T]]:
+        """
+        Returns the converter function suitable for 'input_data', or None if there is none.
+
+        :param input_data: The untrusted input data whose converter function should be returned.
+        :return: The converter function for 'input_data', or None if there is no suitable converter function.
+        """
+
+        data_type = type(input_data)
+
+        # isinstance() takes the '__class__' attribute into account as well; objects which override it are therefore
+        #  never looked up in the cache.
+        if input_data.__class__ is not data_type:
+            return self.__find_converter_function(input_data)
+
+        try:
+            return self.__converter_function_cache[data_type]
+        except KeyError:
+            pass
+
+        converter_function = self.__find_converter_function(input_data)
+        if len(self.__converter_function_cache) < self.__class__.__MAX_CACHED_DATA_TYPE_COUNT:
+            self.__converter_function_cache[data_type] = converter_function
+
+        return converter_function
+
+    @final
+    def __find_converter_function(self, input_data: Any) -> Optional[Callable[[Any], DataTypeDispatchTable_T]]:
+        for data_types, converter_function in self.__type_converter_pairs:
+            if isinstance(input_data, data_types):
+                return converter_function
+
+        return None
@@ -20,13 +20,19 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import final, Any, Generic, TypeVar
+from typing import final, Any, Callable, Generic, Iterable, List, Optional, Tuple, TypeVar, TYPE_CHECKING
 import abc
 from datalidator.DefaultDatalidatorObjectImplBase import DefaultDatalidatorObjectImplBase
 from datalidator.exc.DatalidatorExc import DatalidatorExc
 from datalidator.exc.err.DatalidatorError import DatalidatorError
 from datalidator.blueprints.BlueprintIface import BlueprintIface
+from datalidator.blueprints.AsyncUseContext import AsyncUseContext
+from datalidator.blueprints.extras.AsyncUseOptions import AsyncUseOptions
+from datalidator.blueprints.extras.BatchUseResult import BatchUseResult
+from datalidator.blueprints.extras.UseResult import UseResult
 from datalidator.blueprints.exc.UnexpectedExceptionRaisedInBlueprintExc import UnexpectedExceptionRaisedInBlueprintExc
+if TYPE_CHECKING:  # The compiler module imports this module
+    from datalidator.blueprints.compiler.BlueprintCompiler import BlueprintCompiler
 
 
 __all__ = "DefaultBlueprintImplBase", "DefaultBlueprintImplBase_T"
@@ -59,7 +65,102 @@ class DefaultBlueprintImplBase(BlueprintIface[DefaultBlueprintImplBase_T], Defau
         except (DatalidatorExc, DatalidatorError) as e:
             raise e
         except Exception as f:
-            raise UnexpectedExceptionRaisedInBlueprintExc("{}: {}".format(f.__class__.__name__, str(f)), self._tag, f)
+            raise self._generate_unexpected_exception_raised_in_blueprint_exc(f)
+
+    @final
+    def try_use(self, input_data: Any) -> UseResult[DefaultBlueprintImplBase_T]:
+        """
+        Uses the blueprint on 'input_data' like use(), but instead of raising the 'DatalidatorExc' exception if the
+         input data cannot be processed, the exception is returned inside an unsuccessful result (see UseResult). The
+         output data are returned inside a successful result otherwise.
+
+        Blueprints which support it reject invalid input data without raising any exception at all on this path - the
+         built-in primitive blueprints (e.g. IntegerBlueprint or StringBlueprint) return the exceptions produced by their
+         converter functions and validators (see DefaultValidatorImplBase.try_validate()), and the special blueprints
+         which wrap other blueprints (e.g. ExceptionHandlingBlueprint) pass the wrapped blueprints' results up. This
+         makes the method considerably faster than catching the exception raised by use() when a large share of the
+         input data is invalid.
+
+        Only 'DatalidatorExc' exceptions are returned - errors (e.g. 'InvalidBlueprintConfigError') are raised
+         immediately, as they are not related to the input data.
+
+        :param input_data: The untrusted input data.
+        :return: The output data or the exception, wrapped in a result.
+        """
+
+        try:
+            return self._try_use(input_data)
+        except (DatalidatorExc, DatalidatorError) as e:
+            raise e
+        except Exception as f:
+            return UseResult.from_exception(self._generate_unexpected_exception_raised_in_blueprint_exc(f))
+
+    @final
+    async def use_async(self, input_data: Any, async_use_options: Optional[AsyncUseOptions] = None) -> DefaultBlueprintImplBase_T:
+        """
+        Uses the blueprint on 'input_data' like use(), but as a coroutine which yields control to the running event loop
+         from time to time while large input data are being processed, so that the other tasks running in the event
+         loop are not blocked for the whole time. The output data and the raised exceptions are the same as if use()
+         was called.
+
+        Container blueprints (e.g. ListBlueprint or PredefinedDictionaryBlueprint) yield control to the event loop
+         according to the budgets specified in 'async_use_options', and they can also offload the processing of huge
+         input data to an executor (see AsyncUseOptions). Blueprints nested in other blueprints are used asynchronously
+         as well, unless they do not benefit from it (see the '_benefits_from_async_use()' method) or they are not
+         subclasses of this base class - such blueprints are used synchronously.
+
+        :param input_data: The untrusted input data.
+        :param async_use_options: The options controlling the cooperative yielding; if None, the default options are used.
+        :return: The output data.
+        :raises DatalidatorExc: The superclass of all exceptions raised by this library.
+        """
+
+        if async_use_options is None:
+            async_use_options = AsyncUseOptions()
+
+        return await self.__use_async_in_exception_handling_context(input_data, AsyncUseContext(async_use_options))
+
+    @final
+    async def __use_async_in_exception_handling_context(self, input_data: Any, async_use_context: AsyncUseContext) -> DefaultBlueprintImplBase_T:
+        try:
+            return await self._use_async(input_data, async_use_context)
+        except (DatalidatorExc, DatalidatorError) as e:
+            raise e
+        except Exception as f:
+            raise self._generate_unexpected_exception_raised_in_blueprint_exc(f)
+
+    @final
+    def use_many(self, input_data_iterable: Iterable[Any]) -> List[DefaultBlueprintImplBase_T]:
+        """
+        Uses the blueprint on each of the items retrieved from 'input_data_iterable' and returns the outputs in a list,
+         in the same order as the items were retrieved. The result is the same as if use() was called on each of the
+         items, but the per-call work (e.g. looking up the blueprint's configuration) is done only once.
+
+        The iterable itself is trusted (it is iterated over using a simple for loop), but the items retrieved from it
+         are not.
+
+        :param input_data_iterable: An iterable of untrusted input data items.
+        :return: The output data of the items.
+        :raises DatalidatorExc: If any of the items cannot be processed; the rest of the items are not processed then.
+        """
+
+        return self._use_many(input_data_iterable)
+
+    @final
+    def use_many_and_collect_exceptions(self, input_data_iterable: Iterable[Any]) -> BatchUseResult[DefaultBlueprintImplBase_T]:
+        """
+        Uses the blueprint on each of the items retrieved from 'input_data_iterable', like use_many(), but does not
+         stop on the first item which cannot be processed. Instead, the 'DatalidatorExc' exceptions raised for such items
+         are collected and returned along with the outputs of the other items (see BatchUseResult).
+
+        Only 'DatalidatorExc' exceptions are collected - errors (e.g. 'InvalidBlueprintConfigError') are raised
+         immediately, as they are not related to the input data.
+
+        :param input_data_iterable: An iterable of untrusted input data items.
+        :return: The outputs and exceptions of the items, paired with the items' indices.
+        """
+
+        return self._use_many_and_collect_exceptions(input_data_iterable)
 
     @abc.abstractmethod
     def _use(self, input_data: Any) -> DefaultBlueprintImplBase_T:
@@ -84,3 +185,206 @@ class DefaultBlueprintImplBase(BlueprintIface[DefaultBlueprintImplBase_T], Defau
         """
 
         raise NotImplementedError(DefaultBlueprintImplBase._use.__qualname__)
+
+    def _try_use(self, input_data: Any) -> UseResult[DefaultBlueprintImplBase_T]:
+        """
+        The implementation of the try_use() method. The method runs in the same context as the '_use()' method does.
+
+        The default implementation calls the '_use()' method and catches the 'DatalidatorExc' exception it may raise.
+         Subclasses which only pass the input data to other blueprints (and possibly handle their failures) should
+         override this method and use the '_try_use_blueprint()' method on the wrapped blueprints, so that failures
+         are passed up as results instead of being raised (and caught again) at each level of nesting.
+
+        :param input_data: The untrusted input data.
+        :return: The output data or the exception, wrapped in a result.
+        """
+
+        try:
+            return UseResult.from_output(self._use(input_data))
+        except DatalidatorExc as e:
+            return UseResult.from_exception(e)
+
+    @final
+    def _try_use_blueprint(self, blueprint: BlueprintIface[DefaultBlueprintImplBase_T], input_data: Any) -> UseResult[DefaultBlueprintImplBase_T]:
+        """
+        Uses 'blueprint' (usually a blueprint wrapped by the calling blueprint) on 'input_data' and returns the result.
+         If 'blueprint' is a subclass of this base class, its try_use() method is used; otherwise, its use() method is
+         called and the 'DatalidatorExc' exception it may raise is caught.
+
+        :param blueprint: The blueprint to use.
+        :param input_data: The untrusted input data.
+        :return: The output data or the exception, wrapped in a result.
+        """
+
+        if isinstance(blueprint, DefaultBlueprintImplBase):
+            return blueprint.try_use(input_data)
+
+        try:
+            return UseResult.from_output(blueprint.use(input_data))
+        except DatalidatorExc as e:
+            return UseResult.from_exception(e)
+
+    async def _use_async(self, input_data: Any, async_use_context: AsyncUseContext) -> DefaultBlueprintImplBase_T:
+        """
+        The implementation of the use_async() method. The method runs in the same context as the '_use()' method does.
+
+        The default implementation calls the '_use()' method, i.e. the blueprint is used synchronously. Subclasses which
+         process many items or which pass the input data to other blueprints should override this method, use the
+         '_use_blueprint_async()' method on the nested blueprints, yield control to the event loop according to
+         'async_use_context' (see AsyncUseContext) and override the '_benefits_from_async_use()' method as well.
+
+        :param input_data: The untrusted input data.
+        :param async_use_context: The state of the current use_async() call, shared by all the blueprints used during it.
+        :return: The output data.
+        :raises DatalidatorExc: The superclass of all exceptions raised by this library.
+        """
+
+        return self._use(input_data)
+
+    def _benefits_from_async_use(self) -> bool:
+        """
+        Returns whether the blueprint benefits from being used asynchronously, i.e. whether its '_use_async()' method
+         can yield control to the event loop, when it is nested in another blueprint used via the use_async() method.
+         If False is returned, the blueprint's use() method is called instead, as awaiting a coroutine which never
+         yields would only slow the processing down.
+
+        The default implementation returns False.
+
+        :return: Whether the blueprint benefits from being used asynchronously.
+        """
+
+        return False
+
+    def _requires_async_use(self) -> bool:
+        """
+        Returns whether the blueprint can only be used asynchronously, e.g. because it or one of the blueprints nested
+         in it has asynchronous validators or filters (see DefaultAsyncValidatorImplBase and DefaultAsyncFilterImplBase).
+         Such blueprints are never offloaded to an executor during use_async() calls. Blueprints which return True
+         must return True from the '_benefits_from_async_use()' method as well.
+
+        The default implementation returns False.
+
+        :return: Whether the blueprint can only be used asynchronously.
+        """
+
+        return False
+
+    @final
+    async def _use_blueprint_async(self, blueprint: BlueprintIface[DefaultBlueprintImplBase_T], input_data: Any, async_use_context: AsyncUseContext) -> DefaultBlueprintImplBase_T:
+        """
+        Uses 'blueprint' (usually a blueprint nested in the calling blueprint) on 'input_data' within the current
+         use_async() call, if it is a subclass of this base class and it benefits from being used asynchronously;
+         otherwise, its use() method is called. Blueprints which run many items through the same blueprint may check
+         this once using the '_does_blueprint_benefit_from_async_use()' method and call the use() method directly, so
+         that a coroutine does not have to be created for each of the items.
+
+        :param blueprint: The blueprint to use.
+        :param input_data: The untrusted input data.
+        :param async_use_context: The state of the current use_async() call.
+        :return: The output data.
+        :raises DatalidatorExc: The superclass of all exceptions raised by this library.
+        """
+
+        if self._does_blueprint_benefit_from_async_use(blueprint):
+            return await blueprint.__use_async_in_exception_handling_context(input_data, async_use_context)
+
+        return blueprint.use(input_data)
+
+    @final
+    def _does_blueprint_benefit_from_async_use(self, blueprint: BlueprintIface[Any]) -> bool:
+        """
+        Returns whether '_use_blueprint_async()' uses 'blueprint' asynchronously. Blueprints which only wrap other
+         blueprints may use this method in their implementation of '_benefits_from_async_use()' as well.
+
+        :param blueprint: The blueprint to check.
+        :return: Whether the blueprint is a subclass of this base class and it benefits from being used asynchronously.
+        """
+
+        return isinstance(blueprint, DefaultBlueprintImplBase) and blueprint._benefits_from_async_use()
+
+    @final
+    def _does_blueprint_require_async_use(self, blueprint: BlueprintIface[Any]) -> bool:
+        """
+        Returns whether 'blueprint' can only be used asynchronously (see the '_requires_async_use()' method). Blueprints
+         which nest other blueprints should use this method in their implementation of '_requires_async_use()'.
+
+        :param blueprint: The blueprint to check.
+        :return: Whether the blueprint is a subclass of this base class and it can only be used asynchronously.
+        """
+
+        return isinstance(blueprint, DefaultBlueprintImplBase) and blueprint._requires_async_use()
+
+    def _use_many(self, input_data_iterable: Iterable[Any]) -> List[DefaultBlueprintImplBase_T]:
+        """
+        The implementation of the use_many() method. Subclasses may override this method if they are able to process
+         many input data items at once more efficiently than the default implementation, which calls the blueprint's
+         compiled function (see the _get_batch_use_function() method) on each of the items.
+
+        :param input_data_iterable: An iterable of untrusted input data items.
+        :return: The output data of the items.
+        :raises DatalidatorExc: If any of the items cannot be processed.
+        """
+
+        use_function = self._get_batch_use_function()
+
+        return [use_function(input_data) for input_data in input_data_iterable]
+
+    def _use_many_and_collect_exceptions(self, input_data_iterable: Iterable[Any]) -> BatchUseResult[DefaultBlueprintImplBase_T]:
+        """
+        The implementation of the use_many_and_collect_exceptions() method. Subclasses may override this method for the
+         same reasons as the _use_many() method.
+
+        The default implementation calls the try_use() method on each of the items, so that the items which cannot be
+         processed are rejected without any exception being raised and caught, if the blueprint supports it.
+
+        :param input_data_iterable: An iterable of untrusted input data items.
+        :return: The outputs and exceptions of the items, paired with the items' indices.
+        """
+
+        try_use = self.try_use
+
+        outputs: List[Tuple[int, DefaultBlueprintImplBase_T]] = []
+        exceptions: List[Tuple[int, DatalidatorExc]] = []
+        item_count = 0
+        for input_data in input_data_iterable:
+            result = try_use(input_data)
+            if result.is_successful():
+                outputs.append((item_count, result.get_output()))
+            else:
+                exceptions.append((item_count, result.get_exception()))
+            item_count += 1
+
+        return BatchUseResult[DefaultBlueprintImplBase_T](outputs, exceptions, item_count)
+
+    @final
+    def _get_batch_use_function(self) -> Callable[[Any], DefaultBlueprintImplBase_T]:
+        from datalidator.blueprints.compiler.BlueprintCompiler import BlueprintCompiler  # The compiler module imports this module
+
+        # The blueprint is compiled on each batch, as blueprints do not hold any state which could be used to cache the
+        #  compiled function
+        return BlueprintCompiler().compile_to_function(self)
+
+    def _compile(self, blueprint_compiler: "BlueprintCompiler") -> Callable[[Any], DefaultBlueprintImplBase_T]:
+        """
+        Returns a function which behaves exactly like this blueprint's use() method, i.e. it accepts untrusted input
+         data, returns the same output data and raises the same exceptions (with the same originator tags) as the
+         use() method would. This method is called by 'BlueprintCompiler' (see its docstring for more information) and
+         should not be called directly.
+
+        Subclasses may override this method to return a specialized function which does the same work as the use()
+         method in fewer steps, e.g. with the blueprint's configuration resolved in advance and nested blueprints
+         compiled as well (using 'blueprint_compiler'). The returned function must run in a context equivalent to the
+         one the '_use()' method runs in - see the '_generate_unexpected_exception_raised_in_blueprint_exc()' method.
+
+        The default implementation returns the use() method itself, as it knows nothing about what the '_use()' method
+         of a subclass does.
+
+        :param blueprint_compiler: The compiler which should be used to compile nested blueprints, if there are any.
+        :return: A function which behaves exactly like this blueprint's use() method.
+        """
+
+        return self.use
+
+    @final
+    def _generate_unexpected_exception_raised_in_blueprint_exc(self, raised_exception: Exception) -> UnexpectedExceptionRaisedInBlueprintExc:  # DP: Factory
+        return UnexpectedExceptionRaisedInBlueprintExc("{}: {}".format(raised_exception.__class__.__name__, str(raised_exception)), self._tag, raised_exception)
@@ -20,13 +20,18 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import final, Final, Any, Sequence, Generic, TypeVar
+from typing import final, Final, Any, Sequence, Tuple, Type, Callable, Optional, Generic, TypeVar, TYPE_CHECKING
 import abc
+import types
+from datalidator.exc.DatalidatorExc import DatalidatorExc
 from datalidator.blueprints.DefaultBlueprintWithStandardFeaturesImplBase import DefaultBlueprintWithStandardFeaturesImplBase
 from datalidator.blueprints.ParsingMode import ParsingMode
+from datalidator.blueprints.extras.UseResult import UseResult
 from datalidator.filters.FilterIface import FilterIface
 from datalidator.validators.ValidatorIface import ValidatorIface
 from datalidator.exc.err.ThisShouldNeverHappenError import ThisShouldNeverHappenError
+if TYPE_CHECKING:  # The compiler module imports this module
+    from datalidator.blueprints.compiler.BlueprintCompiler import BlueprintCompiler
 
 
 __all__ = "DefaultBlueprintWithModeSupportImplBase", "DefaultBlueprintWithModeSupportImplBase_T"
@@ -43,7 +48,8 @@ class DefaultBlueprintWithModeSupportImplBase(DefaultBlueprintWithStandardFeatur
     Refer to the class hierarchy document to find out which classes extend this base class.
     """
 
-    __slots__ = "__parsing_mode",
+    __slots__ = "__parsing_mode", "__parse_function_for_current_mode", "__try_parse_function_for_current_mode"
+    __TRANSIENT_SLOTS: Final[Tuple[str, ...]] = ("__parse_function_for_current_mode", "__try_parse_function_for_current_mode")
 
     _DEFAULT_PARSING_MODE: Final[ParsingMode] = ParsingMode.MODE_RATIONAL
 
@@ -56,6 +62,14 @@ class DefaultBlueprintWithModeSupportImplBase(DefaultBlueprintWithStandardFeatur
 
         self.__parsing_mode: Final[ParsingMode] = parsing_mode
 
+        self.__initialize_transient_slots()
+
+    @final
+    def __initialize_transient_slots(self) -> None:
+        # The parse function for the current mode is resolved only once, as the parsing mode cannot change.
+        self.__parse_function_for_current_mode: Final[Optional[Callable[[Any], DefaultBlueprintWithModeSupportImplBase_T]]] = self.__get_parse_function_for_current_mode()
+        self.__try_parse_function_for_current_mode: Final[Optional[Callable[[Any], UseResult[DefaultBlueprintWithModeSupportImplBase_T]]]] = self.__get_try_parse_function_for_current_mode()
+
     @classmethod
     @final
     def get_default_parsing_mode(cls) -> ParsingMode:
@@ -67,11 +81,7 @@ class DefaultBlueprintWithModeSupportImplBase(DefaultBlueprintWithStandardFeatur
 
     @final
     def _parse(self, input_data: Any) -> DefaultBlueprintWithModeSupportImplBase_T:
-        parse_func_for_current_mode = ({
-            ParsingMode.MODE_LOOSE: self._parse_in_loose_mode,
-            ParsingMode.MODE_RATIONAL: self._parse_in_rational_mode,
-            ParsingMode.MODE_STRICT: self._parse_in_strict_mode
-        }.get(self.__parsing_mode, None))
+        parse_func_for_current_mode = self.__parse_function_for_current_mode
 
         if parse_func_for_current_mode is None:
             # This can happen only if the library is used incorrectly (not according to type annotations in this case)
@@ -82,6 +92,68 @@ class DefaultBlueprintWithModeSupportImplBase(DefaultBlueprintWithStandardFeatur
 
         return parse_func_for_current_mode(input_data)
 
+    @final
+    def _try_parse(self, input_data: Any) -> UseResult[DefaultBlueprintWithModeSupportImplBase_T]:
+        try_parse_func_for_current_mode = self.__try_parse_function_for_current_mode
+
+        if try_parse_func_for_current_mode is None:
+            return self._parse(input_data)  # Raises ThisShouldNeverHappenError, as the parsing mode is invalid
+
+        return try_parse_func_for_current_mode(input_data)
+
+    def _compile_parse(self, blueprint_compiler: "BlueprintCompiler") -> Callable[[Any], DefaultBlueprintWithModeSupportImplBase_T]:
+        # If the parsing mode is invalid, _parse() itself is returned, so that the error gets raised when the compiled
+        #  blueprint is used, as it would be normally.
+        parse_func_for_current_mode = self.__parse_function_for_current_mode
+        if parse_func_for_current_mode is None:
+            return self._parse
+
+        return parse_func_for_current_mode
+
+    @final
+    def __get_parse_function_for_current_mode(self) -> Optional[Callable[[Any], DefaultBlueprintWithModeSupportImplBase_T]]:
+        if not isinstance(self.__parsing_mode, ParsingMode):  # Invalid parsing modes might not even be hashable
+            return None
+
+        return ({
+            ParsingMode.MODE_LOOSE: self._parse_in_loose_mode,
+            ParsingMode.MODE_RATIONAL: self._parse_in_rational_mode,
+            ParsingMode.MODE_STRICT: self._parse_in_strict_mode
+        }.get(self.__parsing_mode, None))
+
+    @final
+    def __get_try_parse_function_for_current_mode(self) -> Optional[Callable[[Any], UseResult[DefaultBlueprintWithModeSupportImplBase_T]]]:
+        if not isinstance(self.__parsing_mode, ParsingMode):  # Invalid parsing modes might not even be hashable
+            return None
+
+        method_names = ({
+            ParsingMode.MODE_LOOSE: ("_parse_in_loose_mode", "_try_parse_in_loose_mode"),
+            ParsingMode.MODE_RATIONAL: ("_parse_in_rational_mode", "_try_parse_in_rational_mode"),
+            ParsingMode.MODE_STRICT: ("_parse_in_strict_mode", "_try_parse_in_strict_mode")
+        }.get(self.__parsing_mode, None))
+        if method_names is None:
+            return None
+
+        parse_method_name, try_parse_method_name = method_names
+
+        # If a subclass overrides a '_parse_in_*_mode()' method, but not the corresponding '_try_parse_in_*_mode()'
+        #  method overridden by one of its superclasses (e.g. a subclass of IntegerBlueprint), the overridden try-parse
+        #  method would not reflect the change - the default implementation, which calls the parse method, is used then.
+        parse_method_class = self.__get_class_defining_attribute(parse_method_name)
+        try_parse_method_class = self.__get_class_defining_attribute(try_parse_method_name)
+        if (parse_method_class is not try_parse_method_class) and issubclass(parse_method_class, try_parse_method_class):
+            return types.MethodType(getattr(DefaultBlueprintWithModeSupportImplBase, try_parse_method_name), self)
+
+        return getattr(self, try_parse_method_name)
+
+    @final
+    def __get_class_defining_attribute(self, attribute_name: str) -> Type:
+        for class_ in self.__class__.__mro__:
+            if attribute_name in class_.__dict__:
+                return class_
+
+        raise ThisShouldNeverHappenError("None of the classes in the MRO of {} defines '{}'!".format(self.__class__.__name__, attribute_name), self._tag)
+
     @abc.abstractmethod
     def _parse_in_loose_mode(self, input_data: Any) -> DefaultBlueprintWithModeSupportImplBase_T:
         """
@@ -126,3 +198,54 @@ class DefaultBlueprintWithModeSupportImplBase(DefaultBlueprintWithStandardFeatur
         """
 
         raise NotImplementedError(DefaultBlueprintWithModeSupportImplBase._parse_in_strict_mode.__qualname__)
+
+    def _try_parse_in_loose_mode(self, input_data: Any) -> UseResult[DefaultBlueprintWithModeSupportImplBase_T]:
+        """
+        Behaves exactly like the '_parse_in_loose_mode()' method, but returns the 'DatalidatorExc' exception inside an
+         unsuccessful result instead of raising it. See the docstring of the
+         'DefaultBlueprintWithStandardFeaturesImplBase._try_parse()' method for more information.
+
+        The default implementation calls the '_parse_in_loose_mode()' method and catches the exception it may raise.
+
+        :param input_data: The untrusted input data to be converted to output data.
+        :return: The output data of generic type 'VT' or the exception, wrapped in a result.
+        """
+
+        try:
+            return UseResult.from_output(self._parse_in_loose_mode(input_data))
+        except DatalidatorExc as e:
+            return UseResult.from_exception(e)
+
+    def _try_parse_in_rational_mode(self, input_data: Any) -> UseResult[DefaultBlueprintWithModeSupportImplBase_T]:
+        """
+        Behaves exactly like the '_parse_in_rational_mode()' method, but returns the 'DatalidatorExc' exception inside
+         an unsuccessful result instead of raising it. See the docstring of the
+         'DefaultBlueprintWithStandardFeaturesImplBase._try_parse()' method for more information.
+
+        The default implementation calls the '_parse_in_rational_mode()' method and catches the exception it may raise.
+
+        :param input_data: The untrusted input data to be converted to output data.
+        :return: The output data of generic type 'VT' or the exception, wrapped in a result.
+        """
+
+        try:
+            return UseResult.from_output(self._parse_in_rational_mode(input_data))
+        except DatalidatorExc as e:
+            return UseResult.from_exception(e)
+
+    def _try_parse_in_strict_mode(self, input_data: Any) -> UseResult[DefaultBlueprintWithModeSupportImplBase_T]:
+        """
+        Behaves exactly like the '_parse_in_strict_mode()' method, but returns the 'DatalidatorExc' exception inside an
+         unsuccessful result instead of raising it. See the docstring of the
+         'DefaultBlueprintWithStandardFeaturesImplBase._try_parse()' method for more information.
+
+        The default implementation calls the '_parse_in_strict_mode()' method and catches the exception it may raise.
+
+        :param input_data: The untrusted input data to be converted to output data.
+        :return: The output data of generic type 'VT' or the exception, wrapped in a result.
+        """
+
+        try:
+            return UseResult.from_output(self._parse_in_strict_mode(input_data))
+        except DatalidatorExc as e:
+            return UseResult.from_exception(e)
@@ -20,14 +20,25 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import final, Final, Sequence, Tuple, Any, Optional, Type, Generic, TypeVar
+from typing import final, Final, Sequence, Tuple, FrozenSet, Any, Optional, Type, Callable, Awaitable, Generic, TypeVar, TYPE_CHECKING
 import abc
+import asyncio
+from datalidator.exc.DatalidatorExc import DatalidatorExc
+from datalidator.exc.err.DatalidatorError import DatalidatorError
 from datalidator.blueprints.DefaultBlueprintImplBase import DefaultBlueprintImplBase
+from datalidator.blueprints.AsyncUseContext import AsyncUseContext
+from datalidator.blueprints.extras.UseResult import UseResult
 from datalidator.blueprints.DataConversionHelper import DataConversionHelper
 from datalidator.blueprints.exc.utils.InvalidInputDataExcFactory import InvalidInputDataExcFactory
 from datalidator.blueprints.exc.UnexpectedOutputDataTypeExc import UnexpectedOutputDataTypeExc
 from datalidator.filters.FilterIface import FilterIface
+from datalidator.filters.DefaultFilterImplBase import DefaultFilterImplBase
+from datalidator.filters.DefaultAsyncFilterImplBase import DefaultAsyncFilterImplBase
 from datalidator.validators.ValidatorIface import ValidatorIface
+from datalidator.validators.DefaultValidatorImplBase import DefaultValidatorImplBase
+from datalidator.validators.DefaultAsyncValidatorImplBase import DefaultAsyncValidatorImplBase
+if TYPE_CHECKING:  # The compiler module imports this module
+    from datalidator.blueprints.compiler.BlueprintCompiler import BlueprintCompiler
 
 
 __all__ = "DefaultBlueprintWithStandardFeaturesImplBase", "DefaultBlueprintWithStandardFeaturesImplBase_T"
@@ -46,7 +57,8 @@ class DefaultBlueprintWithStandardFeaturesImplBase(DefaultBlueprintImplBase[Defa
     Refer to the class hierarchy document to find out which classes extend this base class.
     """
 
-    __slots__ = "__filters", "__validators", "_invalid_input_data_exc_factory", "_data_conversion_helper"
+    __slots__ = "__filters", "__validators", "_invalid_input_data_exc_factory", "_data_conversion_helper", "__execution_plan", "__async_execution_plan", "__try_validator_functions"
+    __TRANSIENT_SLOTS: Final[Tuple[str, ...]] = ("__execution_plan", "__async_execution_plan", "__try_validator_functions")  # The lazily built execution plans are not pickled
 
     def __init__(self,
                  filters: Sequence[FilterIface[DefaultBlueprintWithStandardFeaturesImplBase_T]] = (),
@@ -66,6 +78,16 @@ class DefaultBlueprintWithStandardFeaturesImplBase(DefaultBlueprintImplBase[Defa
         self._invalid_input_data_exc_factory: Final[InvalidInputDataExcFactory] = InvalidInputDataExcFactory(self._tag)
         self._data_conversion_helper: Final[DataConversionHelper[DefaultBlueprintWithStandardFeaturesImplBase_T]] = DataConversionHelper[DefaultBlueprintWithStandardFeaturesImplBase_T](self._invalid_input_data_exc_factory)
 
+        self.__initialize_transient_slots()
+
+    @final
+    def __initialize_transient_slots(self) -> None:
+        # The execution plans cannot be built here, as _get_allowed_output_data_types() might depend on instance
+        #  variables which are initialized by subclasses after this initializer returns. See __get_execution_plan().
+        self.__execution_plan: Optional[Tuple[Optional[Tuple[Type, ...]], Optional[FrozenSet[Type]], Tuple[Tuple[Callable[[Any], Any], bool], ...], Tuple[Callable[[Any], None], ...]]] = None
+        self.__async_execution_plan: Optional[Tuple[Tuple[Tuple[Callable[[Any], Any], bool, bool], ...], Tuple[Callable[[Any], None], ...], Tuple[Callable[[Any], Awaitable[None]], ...], bool]] = None
+        self.__try_validator_functions: Optional[Tuple[Callable[[Any], Optional[DatalidatorExc]], ...]] = None
+
     @final
     def get_filters(self) -> Sequence[FilterIface[DefaultBlueprintWithStandardFeaturesImplBase_T]]:
         return self.__filters  # An *immutable* sequence (tuple) is returned
@@ -76,21 +98,290 @@ class DefaultBlueprintWithStandardFeaturesImplBase(DefaultBlueprintImplBase[Defa
 
     @final
     def _use(self, input_data: Any) -> DefaultBlueprintWithStandardFeaturesImplBase_T:  # DP: Template method
-        # Allowed data types fetched once and saved here to prevent them from changing between the two calls of __check_allowed_output_data_types()
+        return self.__use_execution_plan(self._parse, self.__get_execution_plan(), input_data)
+
+    @final
+    def _try_use(self, input_data: Any) -> UseResult[DefaultBlueprintWithStandardFeaturesImplBase_T]:  # DP: Template method
+        parse_result = self._try_parse(input_data)
+        if not parse_result.is_successful():
+            return parse_result
+
+        return self.__try_run_execution_plan_on_parsed_data(self.__get_execution_plan(), self.__get_try_validator_functions(), parse_result)
+
+    @final
+    async def _use_async(self, input_data: Any, async_use_context: AsyncUseContext) -> DefaultBlueprintWithStandardFeaturesImplBase_T:  # DP: Template method
+        output_data = await self._parse_async(input_data, async_use_context)
+
+        return await self.__run_async_execution_plan_on_parsed_data(self.__get_execution_plan(), self.__get_async_execution_plan(), output_data)
+
+    def _benefits_from_async_use(self) -> bool:
+        # Subclasses which override this method must not return False if this implementation returns True.
+        return self.__get_async_execution_plan()[3]
+
+    def _requires_async_use(self) -> bool:
+        # Blueprints with asynchronous filters or validators cannot be used synchronously at all. Subclasses which nest
+        #  other blueprints should override this method and check the nested blueprints as well.
+        return self.__get_async_execution_plan()[3]
+
+    @final
+    def _compile(self, blueprint_compiler: "BlueprintCompiler") -> Callable[[Any], DefaultBlueprintWithStandardFeaturesImplBase_T]:  # DP: Template method
+        # In addition to the execution plan (see __get_execution_plan()), the parse function is resolved here once.
+        parse_function = self._compile_parse(blueprint_compiler)
+        execution_plan = self.__get_execution_plan()
+        use_execution_plan = self.__use_execution_plan
+        generate_unexpected_exception_raised_exc = self._generate_unexpected_exception_raised_in_blueprint_exc
+
+        def compiled_use(input_data: Any) -> DefaultBlueprintWithStandardFeaturesImplBase_T:
+            try:
+                return use_execution_plan(parse_function, execution_plan, input_data)
+            except (DatalidatorExc, DatalidatorError):
+                raise
+            except Exception as f:
+                raise generate_unexpected_exception_raised_exc(f)
+
+        return compiled_use
+
+    def _compile_parse(self, blueprint_compiler: "BlueprintCompiler") -> Callable[[Any], DefaultBlueprintWithStandardFeaturesImplBase_T]:
+        """
+        Returns a function which behaves exactly like this blueprint's '_parse()' method. It is called when the
+         blueprint is being compiled by 'BlueprintCompiler' (see the docstring of the
+         'DefaultBlueprintImplBase._compile()' method for more information).
+
+        Blueprints which contain nested blueprints should override this method and use the nested blueprints' compiled
+         functions (obtained from 'blueprint_compiler') instead of calling their use() methods. Keep in mind that if
+         a subclass changes the way input data are parsed, it must make sure that the function returned by this method
+         reflects the change.
+
+        The default implementation returns the '_parse()' method itself.
+
+        :param blueprint_compiler: The compiler which should be used to compile nested blueprints, if there are any.
+        :return: A function which behaves exactly like this blueprint's '_parse()' method.
+        """
+
+        return self._parse
+
+    def _try_parse(self, input_data: Any) -> UseResult[DefaultBlueprintWithStandardFeaturesImplBase_T]:
+        """
+        Behaves exactly like this blueprint's '_parse()' method, but instead of raising the 'DatalidatorExc' exception
+         if the input data are invalid, the exception is returned inside an unsuccessful result (see UseResult). It is
+         called when the blueprint is used via the try_use() method.
+
+        Blueprints which are often used on invalid input data should override this method (or, in the case of
+         blueprints with parsing mode support, the '_try_parse_in_*_mode()' methods) and reject the data using the
+         'try_*()' methods of this class's instance of 'DataConversionHelper', so that no exception has to be raised
+         and caught. Keep in mind that if a subclass changes the way input data are parsed, it must make sure that this
+         method reflects the change.
+
+        The default implementation calls the '_parse()' method and catches the 'DatalidatorExc' exception it may raise.
+
+        :param input_data: The untrusted input data to be converted to output data.
+        :return: The output data of generic type 'VT' or the exception, wrapped in a result.
+        """
+
+        try:
+            return UseResult.from_output(self._parse(input_data))
+        except DatalidatorExc as e:
+            return UseResult.from_exception(e)
+
+    async def _parse_async(self, input_data: Any, async_use_context: AsyncUseContext) -> DefaultBlueprintWithStandardFeaturesImplBase_T:
+        """
+        Behaves exactly like this blueprint's '_parse()' method, but it is called when the blueprint is used via the
+         use_async() method (see the docstring of the 'DefaultBlueprintImplBase._use_async()' method for more
+         information).
+
+        Blueprints which process many items or which contain nested blueprints should override this method (as well as
+         the '_benefits_from_async_use()' method) to yield control to the event loop while parsing the input data and to
+         use the nested blueprints asynchronously. Keep in mind that if a subclass changes the way input data are
+         parsed, it must make sure that this method reflects the change.
+
+        The default implementation calls the '_parse()' method.
+
+        :param input_data: The untrusted input data to be converted to output data.
+        :param async_use_context: The state of the current use_async() call, shared by all the blueprints used during it.
+        :return: The output data of generic type 'VT'.
+        :raises DatalidatorExc: The superclass of all exceptions raised by this library.
+        """
+
+        return self._parse(input_data)
+
+    @final
+    def __get_execution_plan(self) -> Tuple[Optional[Tuple[Type, ...]], Optional[FrozenSet[Type]], Tuple[Tuple[Callable[[Any], Any], bool], ...], Tuple[Callable[[Any], None], ...]]:
+        # Returns a (allowed output data types, allowed output data types as a frozenset, filter steps, validator
+        #  functions) tuple, where the filter steps are (filter function, whether the filter's output data type has to
+        #  be checked) tuples. Everything the plan consists of is derived from this blueprint's immutable configuration,
+        #  so it is built only once, when the blueprint is used or compiled for the first time. If the plan happens to
+        #  be built by several threads at once, all of them build an equivalent plan.
+        if self.__execution_plan is not None:
+            return self.__execution_plan
+
         allowed_output_data_types = self._get_allowed_output_data_types()
+        allowed_output_data_type_set = (None if allowed_output_data_types is None else frozenset(allowed_output_data_types))
+
+        filter_steps = tuple(
+            (filter_.filter, self.__must_filter_output_data_type_be_checked(filter_, allowed_output_data_type_set)) for filter_ in self.__filters
+        )
+        validator_functions = tuple(validator.validate for validator in self.__validators)
+
+        self.__execution_plan = (allowed_output_data_types, allowed_output_data_type_set, filter_steps, validator_functions)
+        return self.__execution_plan
+
+    @final
+    def __get_async_execution_plan(self) -> Tuple[Tuple[Tuple[Callable[[Any], Any], bool, bool], ...], Tuple[Callable[[Any], None], ...], Tuple[Callable[[Any], Awaitable[None]], ...], bool]:
+        # Returns a (filter steps, synchronous validator functions, asynchronous validator functions, whether there are
+        #  any asynchronous filters or validators) tuple, where the filter steps are (filter function, whether the
+        #  filter function is a coroutine function, whether the filter's output data type has to be checked) tuples.
+        #  It is used instead of the filter steps and validator functions of the regular execution plan when the
+        #  blueprint is used via the use_async() method, and it is built only once as well.
+        if self.__async_execution_plan is not None:
+            return self.__async_execution_plan
+
+        filter_steps = []
+        for filter_, (filter_function, check_output_data_type) in zip(self.__filters, self.__get_execution_plan()[2]):
+            if isinstance(filter_, DefaultAsyncFilterImplBase):
+                filter_steps.append((filter_.filter_async, True, check_output_data_type))
+            else:
+                filter_steps.append((filter_function, False, check_output_data_type))
+
+        validator_functions = tuple(validator.validate for validator in self.__validators if not isinstance(validator, DefaultAsyncValidatorImplBase))
+        async_validator_functions = tuple(validator.validate_async for validator in self.__validators if isinstance(validator, DefaultAsyncValidatorImplBase))
+        has_async_steps = (len(async_validator_functions) > 0) or any(is_async for _, is_async, _ in filter_steps)
+
+        self.__async_execution_plan = (tuple(filter_steps), validator_functions, async_validator_functions, has_async_steps)
+        return self.__async_execution_plan
 
+    @final
+    def __get_try_validator_functions(self) -> Tuple[Callable[[Any], Optional[DatalidatorExc]], ...]:
+        # Returns the functions which are used instead of the validator functions of the regular execution plan when the
+        #  blueprint is used via the try_use() method. They return the exception instead of raising it; validators which
+        #  are not subclasses of DefaultValidatorImplBase are wrapped in a function which catches the exception.
+        if self.__try_validator_functions is not None:
+            return self.__try_validator_functions
+
+        self.__try_validator_functions = tuple(self.__get_try_validator_function(validator) for validator in self.__validators)
+        return self.__try_validator_functions
+
+    @staticmethod
+    def __get_try_validator_function(validator: ValidatorIface[DefaultBlueprintWithStandardFeaturesImplBase_T]) -> Callable[[Any], Optional[DatalidatorExc]]:
+        if isinstance(validator, DefaultValidatorImplBase):
+            return validator.try_validate
+
+        def try_validate(data: Any) -> Optional[DatalidatorExc]:
+            try:
+                validator.validate(data)
+            except DatalidatorExc as e:
+                return e
+
+            return None
+
+        return try_validate
+
+    @final
+    def __must_filter_output_data_type_be_checked(self, filter_: FilterIface[DefaultBlueprintWithStandardFeaturesImplBase_T], allowed_output_data_type_set: Optional[FrozenSet[Type]]) -> bool:
+        if allowed_output_data_type_set is None:
+            return False
+
+        # The data passed to the filter have already been checked to be of one of the allowed output data types; if the
+        #  filter guarantees to preserve all of these types, its output data cannot be of any other type.
+        if isinstance(filter_, DefaultFilterImplBase) and allowed_output_data_type_set.issubset(filter_.get_exactly_preserved_data_types()):
+            return False
+
+        return True
+
+    @final
+    def __use_execution_plan(self, parse_function: Callable[[Any], DefaultBlueprintWithStandardFeaturesImplBase_T], execution_plan: Tuple[Optional[Tuple[Type, ...]], Optional[FrozenSet[Type]], Tuple[Tuple[Callable[[Any], Any], bool], ...], Tuple[Callable[[Any], None], ...]], input_data: Any) -> DefaultBlueprintWithStandardFeaturesImplBase_T:
         # --- PARSE ---
-        output_data = self._parse(input_data)
-        self.__check_allowed_output_data_types(allowed_output_data_types, output_data)  # Raises an UnexpectedOutputDataTypeExc if the output data type is invalid
+        output_data = parse_function(input_data)
+
+        return self.__run_execution_plan_on_parsed_data(execution_plan, output_data)
+
+    @final
+    def __run_execution_plan_on_parsed_data(self, execution_plan: Tuple[Optional[Tuple[Type, ...]], Optional[FrozenSet[Type]], Tuple[Tuple[Callable[[Any], Any], bool], ...], Tuple[Callable[[Any], None], ...]], output_data: DefaultBlueprintWithStandardFeaturesImplBase_T) -> DefaultBlueprintWithStandardFeaturesImplBase_T:
+        allowed_output_data_types, allowed_output_data_type_set, filter_steps, validator_functions = execution_plan
+
+        # --- (CHECK THE PARSED DATA) ---
+        if (allowed_output_data_type_set is not None) and (output_data.__class__ not in allowed_output_data_type_set):
+            self.__check_allowed_output_data_types(allowed_output_data_types, output_data)  # Raises an UnexpectedOutputDataTypeExc if the output data type is invalid
+
+        # --- FILTER ---
+        for filter_function, check_output_data_type in filter_steps:
+            output_data = filter_function(output_data)
+            if check_output_data_type and (output_data.__class__ not in allowed_output_data_type_set):
+                self.__check_allowed_output_data_types(allowed_output_data_types, output_data)  # Raises an UnexpectedOutputDataTypeExc if the output data type is invalid
+
+        # --- VALIDATE ---
+        # Validators do not return anything, so the output data type does not need to be checked again afterwards.
+        for validator_function in validator_functions:
+            validator_function(output_data)
+
+        # --- (RETURN) ---
+        return output_data
+
+    @final
+    def __try_run_execution_plan_on_parsed_data(self, execution_plan: Tuple[Optional[Tuple[Type, ...]], Optional[FrozenSet[Type]], Tuple[Tuple[Callable[[Any], Any], bool], ...], Tuple[Callable[[Any], None], ...]], try_validator_functions: Tuple[Callable[[Any], Optional[DatalidatorExc]], ...], parse_result: UseResult[DefaultBlueprintWithStandardFeaturesImplBase_T]) -> UseResult[DefaultBlueprintWithStandardFeaturesImplBase_T]:
+        allowed_output_data_types, allowed_output_data_type_set, filter_steps, _ = execution_plan
+        output_data = parse_result.get_output()
+
+        # Filters do not reject data (they may only fail unexpectedly) and the output data type check is only
+        #  a last-resort safety check, so the exceptions raised by them are simply caught.
+        try:
+            # --- (CHECK THE PARSED DATA) ---
+            if (allowed_output_data_type_set is not None) and (output_data.__class__ not in allowed_output_data_type_set):
+                self.__check_allowed_output_data_types(allowed_output_data_types, output_data)  # Raises an UnexpectedOutputDataTypeExc if the output data type is invalid
+
+            # --- FILTER ---
+            for filter_function, check_output_data_type in filter_steps:
+                output_data = filter_function(output_data)
+                if check_output_data_type and (output_data.__class__ not in allowed_output_data_type_set):
+                    self.__check_allowed_output_data_types(allowed_output_data_types, output_data)  # Raises an UnexpectedOutputDataTypeExc if the output data type is invalid
+        except DatalidatorExc as e:
+            return UseResult.from_exception(e)
+
+        # --- VALIDATE ---
+        for try_validator_function in try_validator_functions:
+            validation_exception = try_validator_function(output_data)
+            if validation_exception is not None:
+                return UseResult.from_exception(validation_exception)
+
+        # --- (RETURN) ---
+        if not filter_steps:  # The output data have not been changed by any filter, so the parse result can be reused
+            return parse_result
+
+        return UseResult.from_output(output_data)
+
+    @final
+    async def __run_async_execution_plan_on_parsed_data(self, execution_plan: Tuple[Optional[Tuple[Type, ...]], Optional[FrozenSet[Type]], Tuple[Tuple[Callable[[Any], Any], bool], ...], Tuple[Callable[[Any], None], ...]], async_execution_plan: Tuple[Tuple[Tuple[Callable[[Any], Any], bool, bool], ...], Tuple[Callable[[Any], None], ...], Tuple[Callable[[Any], Awaitable[None]], ...], bool], output_data: DefaultBlueprintWithStandardFeaturesImplBase_T) -> DefaultBlueprintWithStandardFeaturesImplBase_T:
+        if not async_execution_plan[3]:  # There are no asynchronous filters or validators
+            return self.__run_execution_plan_on_parsed_data(execution_plan, output_data)
+
+        allowed_output_data_types, allowed_output_data_type_set, _, _ = execution_plan
+        filter_steps, validator_functions, async_validator_functions, _ = async_execution_plan
+
+        # --- (CHECK THE PARSED DATA) ---
+        if (allowed_output_data_type_set is not None) and (output_data.__class__ not in allowed_output_data_type_set):
+            self.__check_allowed_output_data_types(allowed_output_data_types, output_data)  # Raises an UnexpectedOutputDataTypeExc if the output data type is invalid
 
         # --- FILTER ---
-        output_data = self.__filter(output_data, allowed_output_data_types)
+        # Each filter receives the output of the previous one, so the filters cannot run concurrently.
+        for filter_function, is_async, check_output_data_type in filter_steps:
+            output_data = ((await filter_function(output_data)) if is_async else filter_function(output_data))
+            if check_output_data_type and (output_data.__class__ not in allowed_output_data_type_set):
+                self.__check_allowed_output_data_types(allowed_output_data_types, output_data)  # Raises an UnexpectedOutputDataTypeExc if the output data type is invalid
 
         # --- VALIDATE ---
-        self.__validate(output_data)
+        # The synchronous validators are cheap, so they run first - if any of them fails, the asynchronous ones do not
+        #  need to run at all. The asynchronous validators are independent of each other, so they run concurrently.
+        for validator_function in validator_functions:
+            validator_function(output_data)
+
+        if len(async_validator_functions) == 1:
+            await async_validator_functions[0](output_data)
+        elif len(async_validator_functions) > 1:
+            validation_results = await asyncio.gather(*(validator_function(output_data) for validator_function in async_validator_functions), return_exceptions=True)
+            for validation_result in validation_results:
+                if isinstance(validation_result, BaseException):
+                    raise validation_result  # The exception of the first failed validator (in the order of the validator sequence) is raised
 
         # --- (RETURN) ---
-        self.__check_allowed_output_data_types(allowed_output_data_types, output_data)  # Raises an UnexpectedOutputDataTypeExc if the output data type is invalid
         return output_data
 
     @abc.abstractmethod
@@ -106,6 +397,9 @@ class DefaultBlueprintWithStandardFeaturesImplBase(DefaultBlueprintImplBase[Defa
          which is using the blueprint). To turn off the check, return 'None' from this method; however, it is
          recommended to let the check happen if possible.
 
+        This method is called only once per blueprint instance (when the blueprint is used or compiled for the first
+         time), so its return value must not change during the blueprint's lifetime.
+
         WARNING: This functionality should be considered as only a last-resort safety check (as per the rules of
          defensive programming) and should not be relied upon! Blueprints and filters must not produce output data of
          incorrect data types in any case and this check's purpose is to prevent the program using this library from
@@ -162,16 +456,3 @@ class DefaultBlueprintWithStandardFeaturesImplBase(DefaultBlueprintImplBase[Defa
             ),
             self._tag
         )
-
-    @final
-    def __filter(self, output_data: DefaultBlueprintWithStandardFeaturesImplBase_T, allowed_output_data_types: Optional[Tuple[Type, ...]]) -> DefaultBlueprintWithStandardFeaturesImplBase_T:
-        for filter_ in self.__filters:
-            output_data = filter_.filter(output_data)
-            self.__check_allowed_output_data_types(allowed_output_data_types, output_data)  # Raises an UnexpectedOutputDataTypeExc if the output data type is invalid
-
-        return output_data
-
-    @final
-    def __validate(self, output_data: DefaultBlueprintWithStandardFeaturesImplBase_T) -> None:
-        for validator in self.__validators:
-            validator.validate(output_data)
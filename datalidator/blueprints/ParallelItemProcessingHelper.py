@@ -0,0 +1,185 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from typing import final, Final, Generic, Any, Callable, Iterator, List, Tuple, Sequence, Optional, TypeVar
+import concurrent.futures
+from datalidator.exc.DatalidatorExc import DatalidatorExc
+from datalidator.blueprints.BlueprintIface import BlueprintIface
+from datalidator.blueprints.extras.UseResult import UseResult
+
+
+__all__ = "ParallelItemProcessingHelper", "ParallelItemProcessingHelper_T"
+ParallelItemProcessingHelper_T = TypeVar("ParallelItemProcessingHelper_T")
+
+
+@final
+class ParallelItemProcessingHelper(Generic[ParallelItemProcessingHelper_T]):
+    """
+    A utility class used by container blueprints (e.g. ListBlueprint) to run the items of their input data through an
+     item blueprint in parallel, using a user-provided 'concurrent.futures.Executor'.
+
+    The items are split into chunks of 'chunk_size' items, each chunk is processed by a single task submitted to the
+     executor, and the outputs are returned in the same order as the items were passed in. Blueprints should process
+     the items sequentially (in the calling thread) if there are not more items than fit in a single chunk, as the
+     overhead of submitting the work to the executor would outweigh the benefits of parallel processing in such case.
+
+    The item blueprint is passed to the executor's tasks as is. Therefore, if the executor runs the tasks in other
+     processes (e.g. 'concurrent.futures.ProcessPoolExecutor'), the blueprint (including everything it references),
+     the items, their outputs and the exceptions raised while processing them must be picklable.
+    """
+
+    __slots__ = "__executor", "__chunk_size"
+
+    def __init__(self, executor: concurrent.futures.Executor, chunk_size: int):
+        self.__executor: Final[concurrent.futures.Executor] = executor
+        self.__chunk_size: Final[int] = chunk_size
+
+    @final
+    def get_executor(self) -> concurrent.futures.Executor:
+        return self.__executor
+
+    @final
+    def get_chunk_size(self) -> int:
+        return self.__chunk_size
+
+    @final
+    def should_process_items_in_parallel(self, item_count: int) -> bool:
+        return item_count > self.__chunk_size
+
+    @final
+    def use_blueprint_on_items(self, blueprint: BlueprintIface[ParallelItemProcessingHelper_T], items: Sequence[Any]) -> List[ParallelItemProcessingHelper_T]:
+        """
+        Runs 'items' through 'blueprint' in parallel and returns the outputs in a list, in the same order as the items.
+
+        :param blueprint: The blueprint the items should be run through.
+        :param items: The untrusted items.
+        :return: The outputs of the items.
+        :raises DatalidatorExc: The exception raised by the blueprint for the first invalid item (= the one with the lowest index); the tasks which have not started yet are cancelled then.
+        """
+
+        futures = self.__submit_chunks(self.__class__._use_blueprint_on_chunk, blueprint, items)
+
+        outputs = []
+        try:
+            # The futures are waited for in the order the chunks were submitted in, so the exception of the first
+            #  invalid item is raised even if a later chunk fails sooner.
+            for future in futures:
+                outputs.extend(future.result())
+        finally:
+            for future in futures:
+                future.cancel()  # Does nothing if the future is already running or done
+
+        return outputs
+
+    @final
+    def try_use_blueprint_on_items(self, blueprint: BlueprintIface[ParallelItemProcessingHelper_T], items: Sequence[Any]) -> List[UseResult[ParallelItemProcessingHelper_T]]:
+        """
+        Runs 'items' through 'blueprint' in parallel, like use_blueprint_on_items(), but returns a result (see UseResult)
+         for each of the items instead of raising the exception of the first invalid item.
+
+        :param blueprint: The blueprint the items should be run through.
+        :param items: The untrusted items.
+        :return: The results of the items.
+        """
+
+        futures = self.__submit_chunks(self.__class__._try_use_blueprint_on_chunk, blueprint, items)
+
+        results = []
+        try:
+            for future in futures:
+                results.extend(future.result())
+        finally:
+            for future in futures:
+                future.cancel()
+
+        return results
+
+    @final
+    def use_blueprints_on_item_tuples(self, blueprints: Tuple[BlueprintIface[Any], ...], item_tuples: Sequence[Tuple[Any, ...]]) -> Iterator[Any]:
+        """
+        Runs the items of each tuple in 'item_tuples' through the blueprints in 'blueprints' (the first item through the
+         first blueprint etc.) in parallel - e.g. the keys and values of a dictionary through the key and value
+         blueprints - and yields the outputs one by one, in the same order as if the tuples were processed sequentially
+         (i.e. the output of the first item of the first tuple comes first).
+
+        The items of all the tuples are submitted to the executor at once. If the returned generator is closed before it
+         is exhausted (which the caller should do explicitly if it stops iterating over it early), or if an item is
+         invalid, the tasks which have not started yet are cancelled.
+
+        :param blueprints: The blueprints the items of each tuple should be run through.
+        :param item_tuples: The tuples of untrusted items.
+        :return: A generator of the outputs of the items.
+        :raises DatalidatorExc: The exception raised by a blueprint for the first invalid item; it is raised after the outputs of all the items preceding it have been yielded.
+        """
+
+        futures = self.__submit_chunks(self.__class__._use_blueprints_on_tuple_chunk, blueprints, item_tuples)
+
+        try:
+            for future in futures:
+                outputs, exception = future.result()
+                yield from outputs
+
+                if exception is not None:
+                    raise exception
+        finally:
+            for future in futures:
+                future.cancel()
+
+    @final
+    def __submit_chunks(self, chunk_function: Callable[[Any, Sequence[Any]], Any], blueprint_or_blueprints: Any, items: Sequence[Any]) -> List[concurrent.futures.Future]:
+        chunk_size = self.__chunk_size
+
+        return [
+            self.__executor.submit(chunk_function, blueprint_or_blueprints, items[chunk_start:(chunk_start + chunk_size)])
+            for chunk_start in range(0, len(items), chunk_size)
+        ]
+
+    # The following methods are run by the executor's tasks, possibly in other processes. They must not be private
+    #  (name-mangled), as they would not be able to be pickled then.
+    @classmethod
+    def _use_blueprint_on_chunk(cls, blueprint: BlueprintIface[ParallelItemProcessingHelper_T], chunk: Sequence[Any]) -> List[ParallelItemProcessingHelper_T]:
+        return [blueprint.use(item) for item in chunk]
+
+    @classmethod
+    def _try_use_blueprint_on_chunk(cls, blueprint: BlueprintIface[ParallelItemProcessingHelper_T], chunk: Sequence[Any]) -> List[UseResult[ParallelItemProcessingHelper_T]]:
+        results = []
+        for item in chunk:
+            try:
+                results.append(UseResult.from_output(blueprint.use(item)))
+            except DatalidatorExc as e:
+                results.append(UseResult.from_exception(e))
+
+        return results
+
+    @classmethod
+    def _use_blueprints_on_tuple_chunk(cls, blueprints: Tuple[BlueprintIface[Any], ...], chunk: Sequence[Tuple[Any, ...]]) -> Tuple[List[Any], Optional[DatalidatorExc]]:
+        # The exception of the first invalid item is returned along with the outputs of the items preceding it, so that
+        #  they can be yielded before the exception is raised.
+        outputs = []
+        try:
+            for item_tuple in chunk:
+                for blueprint, item in zip(blueprints, item_tuple):
+                    outputs.append(blueprint.use(item))
+        except DatalidatorExc as e:
+            return outputs, e
+
+        return outputs, None
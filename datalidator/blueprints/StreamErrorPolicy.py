@@ -0,0 +1,56 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import enum
+
+
+__all__ = "StreamErrorPolicy",
+
+
+class StreamErrorPolicy(enum.Enum):
+    """
+    Blueprints which are able to process their input data as a stream of items (e.g. ListBlueprint using its
+     iter_use() method) yield the output items one by one, as soon as they are processed. A stream error policy
+     specifies what happens when an item which cannot be processed (= the item's blueprint raises a 'DatalidatorExc'
+     exception) is encountered in the stream:
+
+    STOP POLICY (default):
+    The item's exception is raised immediately and the stream ends. The output items yielded before the invalid item
+     has been encountered are not affected.
+
+    SKIP POLICY:
+    Invalid items are silently skipped and the stream continues with the next item.
+
+    COLLECT POLICY:
+    Invalid items are skipped and the stream continues with the next item, but the items' exceptions are collected.
+     After the last item has been processed, a single 'InvalidItemsInInputDataExc' exception containing all the
+     collected exceptions is raised (if at least one of the items was invalid).
+
+    Errors (i.e. 'DatalidatorError' and its subclasses) and exceptions related to the stream as a whole (e.g. when the
+     input data are not iterable or they contain too many items) are always raised immediately, regardless of the policy.
+    """
+
+    __slots__ = ()
+
+    POLICY_STOP = 1
+    POLICY_SKIP = 2
+    POLICY_COLLECT = 3
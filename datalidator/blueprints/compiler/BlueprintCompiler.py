@@ -0,0 +1,93 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from typing import Final, Any, Callable, Dict, Tuple, TypeVar
+from datalidator.blueprints.BlueprintIface import BlueprintIface
+from datalidator.blueprints.DefaultBlueprintImplBase import DefaultBlueprintImplBase
+from datalidator.blueprints.compiler.CompiledBlueprint import CompiledBlueprint
+
+
+__all__ = "BlueprintCompiler", "BlueprintCompiler_T"
+BlueprintCompiler_T = TypeVar("BlueprintCompiler_T")
+
+
+class BlueprintCompiler:
+    """
+    Compiles an already configured blueprint (and all the blueprints nested in it) into a single function which
+     behaves exactly like the blueprint's use() method - it returns the same output data and raises the same exceptions
+     with the same originator tags - but does the work in significantly fewer steps. This is useful when the same
+     blueprint is used to parse large amounts of input data.
+
+    When a blueprint is being used, it (among other things) looks up its parsing mode, the allowed output data types and
+     its filters and validators on every call, and nested blueprints are called through their use() methods. Since
+     blueprints are immutable, a compiled blueprint can look all of these things up only once. Each blueprint decides
+     how it is compiled (see the docstring of the 'DefaultBlueprintImplBase._compile()' method). Blueprints which do not
+     extend 'DefaultBlueprintImplBase' or which do not specialize the compilation are simply called through their use()
+     methods, so any blueprint tree can be compiled.
+
+    Compilation happens only once, so the compiled blueprint will not reflect any changes to the source blueprint made
+     afterwards (e.g. the output of a custom blueprint's '_get_allowed_output_data_types()' method changing over time).
+     This is in line with the requirement that blueprints should be immutable.
+
+    Instances of this class are NOT thread-safe, but the compiled blueprints they produce are.
+    """
+
+    __slots__ = "__compiled_functions",
+
+    def __init__(self):
+        # Blueprints which are used more than once in a blueprint tree are compiled only once.
+        # id(blueprint) -> (blueprint, compiled function); the blueprint is kept so that its ID cannot get reused.
+        self.__compiled_functions: Final[Dict[int, Tuple[BlueprintIface[Any], Callable[[Any], Any]]]] = {}
+
+    def compile(self, blueprint: BlueprintIface[BlueprintCompiler_T]) -> CompiledBlueprint[BlueprintCompiler_T]:
+        """
+        Compiles 'blueprint' (and all the blueprints nested in it).
+
+        :param blueprint: The blueprint to compile.
+        :return: A blueprint which behaves exactly like 'blueprint'.
+        """
+
+        return CompiledBlueprint[BlueprintCompiler_T](blueprint, self.compile_to_function(blueprint))
+
+    def compile_to_function(self, blueprint: BlueprintIface[BlueprintCompiler_T]) -> Callable[[Any], BlueprintCompiler_T]:
+        """
+        Compiles 'blueprint' (and all the blueprints nested in it) into a function. This method is also used by
+         blueprints to compile the blueprints nested in them.
+
+        :param blueprint: The blueprint to compile.
+        :return: A function which behaves exactly like the use() method of 'blueprint'.
+        """
+
+        try:
+            return self.__compiled_functions[id(blueprint)][1]
+        except KeyError:
+            pass
+
+        if isinstance(blueprint, CompiledBlueprint):
+            compiled_function = blueprint.get_compiled_function()
+        elif isinstance(blueprint, DefaultBlueprintImplBase):
+            compiled_function = blueprint._compile(self)  # noqa
+        else:
+            compiled_function = blueprint.use
+
+        self.__compiled_functions[id(blueprint)] = (blueprint, compiled_function)
+        return compiled_function
@@ -0,0 +1,61 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from typing import final, Final, Any, Callable, Generic, TypeVar
+from datalidator.DefaultDatalidatorObjectImplBase import DefaultDatalidatorObjectImplBase
+from datalidator.blueprints.BlueprintIface import BlueprintIface
+
+
+__all__ = "CompiledBlueprint", "CompiledBlueprint_T"
+CompiledBlueprint_T = TypeVar("CompiledBlueprint_T")
+
+
+@final
+class CompiledBlueprint(BlueprintIface[CompiledBlueprint_T], DefaultDatalidatorObjectImplBase, Generic[CompiledBlueprint_T]):
+    """
+    A blueprint returned by 'BlueprintCompiler'. Its use() method calls the function the source blueprint has been
+     compiled into, and therefore, it behaves exactly like the source blueprint's use() method.
+
+    Instances of this class should not be created directly - use the 'BlueprintCompiler.compile()' method instead.
+    Like all other blueprints, compiled blueprints can be used anywhere a blueprint is expected (e.g. as an item
+     blueprint of 'ListBlueprint').
+    """
+
+    __slots__ = "__source_blueprint", "__compiled_function"
+
+    def __init__(self, source_blueprint: BlueprintIface[CompiledBlueprint_T], compiled_function: Callable[[Any], CompiledBlueprint_T]):
+        # The compiled blueprint carries the same tag as its source blueprint
+        DefaultDatalidatorObjectImplBase.__init__(self, source_blueprint.get_tag())
+
+        self.__source_blueprint: Final[BlueprintIface[CompiledBlueprint_T]] = source_blueprint
+        self.__compiled_function: Final[Callable[[Any], CompiledBlueprint_T]] = compiled_function
+
+    def get_source_blueprint(self) -> BlueprintIface[CompiledBlueprint_T]:
+        return self.__source_blueprint
+
+    def get_compiled_function(self) -> Callable[[Any], CompiledBlueprint_T]:
+        return self.__compiled_function
+
+    def use(self, input_data: Any) -> CompiledBlueprint_T:
+        # The compiled function already runs in an exception handling context equivalent to the one used by
+        #  DefaultBlueprintImplBase.use()
+        return self.__compiled_function(input_data)
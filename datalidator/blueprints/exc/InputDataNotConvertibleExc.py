@@ -20,6 +20,7 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
+from typing import final, Final, Any, Callable, Sequence, Tuple, Type, Union
 from datalidator.blueprints.exc.InvalidInputDataExc import InvalidInputDataExc
 
 
@@ -30,3 +31,12 @@ class InputDataNotConvertibleExc(InvalidInputDataExc):
     """
     Raised when input data are unsuitable for conversion to a blueprint's output type due to their value.
     """
+
+    def __init__(self, error_message: Union[str, Callable[[], str]], originator_tag: str, input_data: Any, converted_to: Sequence[Type] = ()):
+        InvalidInputDataExc.__init__(self, error_message, originator_tag, input_data)
+
+        self.__converted_to: Final[Tuple[Type, ...]] = tuple(converted_to)
+
+    @final
+    def get_converted_to(self) -> Sequence[Type]:
+        return self.__converted_to  # An *immutable* sequence (tuple) is returned
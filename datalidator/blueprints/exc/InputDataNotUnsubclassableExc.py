@@ -20,6 +20,7 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
+from typing import final, Final, Any, Callable, Optional, Type, Union
 from datalidator.blueprints.exc.InvalidInputDataExc import InvalidInputDataExc
 
 
@@ -30,3 +31,12 @@ class InputDataNotUnsubclassableExc(InvalidInputDataExc):
     """
     Raised when input data's type is a subclass of a blueprint's output type, and they cannot be unsubclassed to the exact output type.
     """
+
+    def __init__(self, error_message: Union[str, Callable[[], str]], originator_tag: str, input_data: Any, unsubclassed_to: Optional[Type] = None):
+        InvalidInputDataExc.__init__(self, error_message, originator_tag, input_data)
+
+        self.__unsubclassed_to: Final[Optional[Type]] = unsubclassed_to
+
+    @final
+    def get_unsubclassed_to(self) -> Optional[Type]:
+        return self.__unsubclassed_to
@@ -20,6 +20,7 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
+from typing import final, Final, Any, Callable, Sequence, Tuple, Type, Union
 from datalidator.blueprints.exc.InvalidInputDataExc import InvalidInputDataExc
 
 
@@ -30,3 +31,12 @@ class InputDataTypeInBlocklistExc(InvalidInputDataExc):
     """
     Raised when input data's type is specifically blocked by a blueprint.
     """
+
+    def __init__(self, error_message: Union[str, Callable[[], str]], originator_tag: str, input_data: Any, data_type_blocklist: Sequence[Type] = ()):
+        InvalidInputDataExc.__init__(self, error_message, originator_tag, input_data)
+
+        self.__data_type_blocklist: Final[Tuple[Type, ...]] = tuple(data_type_blocklist)
+
+    @final
+    def get_data_type_blocklist(self) -> Sequence[Type]:
+        return self.__data_type_blocklist  # An *immutable* sequence (tuple) is returned
@@ -20,6 +20,7 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
+from typing import final, Final, Any, Callable, Sequence, Tuple, Type, Union
 from datalidator.blueprints.exc.InvalidInputDataExc import InvalidInputDataExc
 
 
@@ -30,3 +31,12 @@ class InputDataTypeNotInAllowlistExc(InvalidInputDataExc):
     """
     Raised when input data's type is not listed in a blueprint's input data type allowlist.
     """
+
+    def __init__(self, error_message: Union[str, Callable[[], str]], originator_tag: str, input_data: Any, data_type_allowlist: Sequence[Type] = ()):
+        InvalidInputDataExc.__init__(self, error_message, originator_tag, input_data)
+
+        self.__data_type_allowlist: Final[Tuple[Type, ...]] = tuple(data_type_allowlist)
+
+    @final
+    def get_data_type_allowlist(self) -> Sequence[Type]:
+        return self.__data_type_allowlist  # An *immutable* sequence (tuple) is returned
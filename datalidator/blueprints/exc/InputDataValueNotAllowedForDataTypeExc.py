@@ -20,6 +20,7 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
+from typing import final, Final, Any, Callable, Optional, Sequence, Tuple, Type, Union
 from datalidator.blueprints.exc.InvalidInputDataExc import InvalidInputDataExc
 
 
@@ -31,3 +32,17 @@ class InputDataValueNotAllowedForDataTypeExc(InvalidInputDataExc):
     Raised when input data's value is not allowed for the input data's type.
     It is raised, for example, by BooleanBlueprint where the only allowed values for input data of type 'int' are '0' and '1'.
     """
+
+    def __init__(self, error_message: Union[str, Callable[[], str]], originator_tag: str, input_data: Any, data_type: Optional[Type] = None, allowed_values: Sequence[Any] = ()):
+        InvalidInputDataExc.__init__(self, error_message, originator_tag, input_data)
+
+        self.__data_type: Final[Optional[Type]] = data_type
+        self.__allowed_values: Final[Tuple[Any, ...]] = tuple(allowed_values)
+
+    @final
+    def get_data_type(self) -> Optional[Type]:
+        return self.__data_type
+
+    @final
+    def get_allowed_values(self) -> Sequence[Any]:
+        return self.__allowed_values  # An *immutable* sequence (tuple) is returned
@@ -20,7 +20,7 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import final, Final, Any
+from typing import final, Final, Any, Callable, Union
 from datalidator.blueprints.exc.BlueprintExc import BlueprintExc
 
 
@@ -32,7 +32,7 @@ class InvalidInputDataExc(BlueprintExc):
     Raised when a blueprint cannot parse the input data passed to it - the exact reason is given in the error message.
     """
 
-    def __init__(self, error_message: str, originator_tag: str, input_data: Any):
+    def __init__(self, error_message: Union[str, Callable[[], str]], originator_tag: str, input_data: Any):
         BlueprintExc.__init__(self, error_message, originator_tag)
 
         self.__input_data: Final[Any] = input_data
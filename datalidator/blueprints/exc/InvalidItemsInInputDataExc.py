@@ -0,0 +1,48 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from typing import final, Final, Any, Sequence, Tuple, Callable, Union
+from datalidator.exc.DatalidatorExc import DatalidatorExc
+from datalidator.blueprints.exc.InvalidInputDataExc import InvalidInputDataExc
+
+
+__all__ = "InvalidItemsInInputDataExc",
+
+
+class InvalidItemsInInputDataExc(InvalidInputDataExc):
+    """
+    Raised when some of the items contained in input data (e.g. the items of a list processed by ListBlueprint) are
+     invalid, and the exceptions raised by the blueprints the items were run through have been collected instead of
+     being raised immediately.
+
+    The collected exceptions are paired with paths which address the invalid items within the input data (e.g. '[3]'
+     for the fourth item of a list).
+    """
+
+    def __init__(self, error_message: Union[str, Callable[[], str]], originator_tag: str, input_data: Any, item_exceptions: Sequence[Tuple[str, DatalidatorExc]]):
+        InvalidInputDataExc.__init__(self, error_message, originator_tag, input_data)
+
+        self.__item_exceptions: Final[Tuple[Tuple[str, DatalidatorExc], ...]] = tuple(item_exceptions)
+
+    @final
+    def get_item_exceptions(self) -> Sequence[Tuple[str, DatalidatorExc]]:
+        return self.__item_exceptions
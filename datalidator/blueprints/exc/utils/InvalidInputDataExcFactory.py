@@ -20,13 +20,16 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import Final, Sequence, Any, KeysView, ValuesView, Union
+from typing import final, Final, Sequence, List, Tuple, Any, Callable, Optional, KeysView, ValuesView, Union
+from datalidator.exc.DatalidatorExc import DatalidatorExc
+from datalidator.exc.err.ThisShouldNeverHappenError import ThisShouldNeverHappenError
 from datalidator.blueprints.exc.InvalidInputDataExc import InvalidInputDataExc
 from datalidator.blueprints.exc.InputDataTypeNotInAllowlistExc import InputDataTypeNotInAllowlistExc
 from datalidator.blueprints.exc.InputDataTypeInBlocklistExc import InputDataTypeInBlocklistExc
 from datalidator.blueprints.exc.InputDataNotConvertibleExc import InputDataNotConvertibleExc
 from datalidator.blueprints.exc.InputDataValueNotAllowedForDataTypeExc import InputDataValueNotAllowedForDataTypeExc
 from datalidator.blueprints.exc.InputDataNotUnsubclassableExc import InputDataNotUnsubclassableExc
+from datalidator.blueprints.exc.InvalidItemsInInputDataExc import InvalidItemsInInputDataExc
 
 
 __all__ = "InvalidInputDataExcFactory",
@@ -35,79 +38,171 @@ __all__ = "InvalidInputDataExcFactory",
 class InvalidInputDataExcFactory:  # DP: Factory
     """
     A utility class that generates common instances of 'InvalidInputDataExc' exception and its subclasses.
+
+    The error messages of the generated exceptions are rendered lazily, i.e. only when they are needed for the first
+     time (see DatalidatorExc), as many exceptions raised due to invalid input data are caught and discarded without
+     their message ever being read. The data needed to render the messages (such as the expected data types) are
+     carried by the exceptions in a structured form, so they can be accessed without the message being rendered.
+
+    The representations of input data contained in the error messages are not truncated by default; a process-wide
+     limit of their length can be set using the set_input_data_repr_length_limit() method.
     """
 
     # All of this class's methods and instance variables are public or protected - feel free to extend this class.
 
     __slots__ = "_originator_tag",
 
+    __input_data_repr_length_limit: Optional[int] = None
+
     def __init__(self, originator_tag: str):
         self._originator_tag: Final[str] = originator_tag
 
-    def generate_invalid_input_data_exc(self, error_message: str, input_data: Any) -> InvalidInputDataExc:
+    @classmethod
+    @final
+    def get_input_data_repr_length_limit(cls) -> Optional[int]:
+        return InvalidInputDataExcFactory.__input_data_repr_length_limit
+
+    @classmethod
+    @final
+    def set_input_data_repr_length_limit(cls, length_limit: Optional[int]) -> None:
+        """
+        Sets the maximum length of the representations of input data contained in error messages generated by this
+         class and its subclasses. Longer representations are truncated and suffixed with '...'. If the limit is None
+         (the default), the representations are not truncated at all.
+
+        The limit applies to exceptions generated after it has been changed. Ideally, it should be set only once, when
+         the program starts.
+
+        :param length_limit: The maximum length of the representations of input data, or None.
+        """
+
+        if (length_limit is not None) and (length_limit < 0):
+            raise ThisShouldNeverHappenError("The input data repr length limit must not be negative!", "")
+
+        InvalidInputDataExcFactory.__input_data_repr_length_limit = length_limit
+
+    def generate_invalid_input_data_exc(self, error_message: Union[str, Callable[[], str]], input_data: Any) -> InvalidInputDataExc:
         return InvalidInputDataExc(error_message, self._originator_tag, input_data)
 
     def generate_input_data_type_not_in_allowlist_exc(self, data_type_allowlist: Sequence[Any], input_data: Any) -> InvalidInputDataExc:
-        if len(data_type_allowlist) == 1:
-            error_message = "The input data must be of type '{}', not '{}'!".format(
-                self.__class__.get_class_name(data_type_allowlist[0]),
-                self.__class__.get_class_name(input_data)
-            )
-        else:
-            error_message = "The input data must be of one of these types: {}, not '{}'!".format(
+        data_type_allowlist = tuple(data_type_allowlist)
+        input_data_class_name = self.__class__.get_class_name(input_data)
+
+        def render_error_message() -> str:
+            if len(data_type_allowlist) == 1:
+                return "The input data must be of type '{}', not '{}'!".format(
+                    self.__class__.get_class_name(data_type_allowlist[0]),
+                    input_data_class_name
+                )
+
+            return "The input data must be of one of these types: {}, not '{}'!".format(
                 self.__class__.get_single_string_representation_of_class_names(data_type_allowlist),
-                self.__class__.get_class_name(input_data)
+                input_data_class_name
             )
 
-        return InputDataTypeNotInAllowlistExc(error_message, self._originator_tag, input_data)
+        return InputDataTypeNotInAllowlistExc(render_error_message, self._originator_tag, input_data, data_type_allowlist)
 
     def generate_input_data_type_in_blocklist_exc(self, data_type_blocklist: Sequence[Any], input_data: Any) -> InvalidInputDataExc:
-        if len(data_type_blocklist) == 1:
-            # The data type is taken from the blocklist because the type of the input data can be a subclass of the forbidden type
-            error_message = "The input data must not be of type '{}'!".format(self.__class__.get_class_name(data_type_blocklist[0]))
-        else:
-            error_message = "The input data (of type '{}') must not be of these types: {}!".format(
-                self.__class__.get_class_name(input_data),
+        data_type_blocklist = tuple(data_type_blocklist)
+        input_data_class_name = self.__class__.get_class_name(input_data)
+
+        def render_error_message() -> str:
+            if len(data_type_blocklist) == 1:
+                # The data type is taken from the blocklist because the type of the input data can be a subclass of the forbidden type
+                return "The input data must not be of type '{}'!".format(self.__class__.get_class_name(data_type_blocklist[0]))
+
+            return "The input data (of type '{}') must not be of these types: {}!".format(
+                input_data_class_name,
                 self.__class__.get_single_string_representation_of_class_names(data_type_blocklist)
             )
 
-        return InputDataTypeInBlocklistExc(error_message, self._originator_tag, input_data)
+        return InputDataTypeInBlocklistExc(render_error_message, self._originator_tag, input_data, data_type_blocklist)
 
     def generate_input_data_not_convertible_exc(self, converted_to: Sequence[Any], input_data: Any) -> InvalidInputDataExc:
         # Raised (mostly) in response to a "type cast" failure.
-        if len(converted_to) == 1:
-            error_message = "The input data (of type '{}') are not convertible to '{}': {}".format(
-                self.__class__.get_class_name(input_data),
-                self.__class__.get_class_name(converted_to[0]),
-                repr(input_data)
-            )
-        else:
-            error_message = "The input data (of type '{}': {}) are not convertible to at least one of these types: {}".format(
-                self.__class__.get_class_name(input_data),
-                repr(input_data),
+        converted_to = tuple(converted_to)
+        input_data_class_name = self.__class__.get_class_name(input_data)
+        input_data_repr_length_limit = self.__class__.get_input_data_repr_length_limit()
+
+        def render_error_message() -> str:
+            if len(converted_to) == 1:
+                return "The input data (of type '{}') are not convertible to '{}': {}".format(
+                    input_data_class_name,
+                    self.__class__.get_class_name(converted_to[0]),
+                    self.__class__.get_truncated_repr(input_data, input_data_repr_length_limit)
+                )
+
+            return "The input data (of type '{}': {}) are not convertible to at least one of these types: {}".format(
+                input_data_class_name,
+                self.__class__.get_truncated_repr(input_data, input_data_repr_length_limit),
                 self.__class__.get_single_string_representation_of_class_names(converted_to)
             )
 
-        return InputDataNotConvertibleExc(error_message, self._originator_tag, input_data)
+        return InputDataNotConvertibleExc(render_error_message, self._originator_tag, input_data, converted_to)
 
     def generate_input_data_value_not_allowed_for_data_type_exc(self, data_type: Any, allowed_values: Sequence[Any], input_data: Any) -> InvalidInputDataExc:
         # The data type is passed manually because the type of the input data can be a subclass of the type for which
         #  there are allowed values
-        error_message = "If the input data are of type '{}', their value must be one of these: {}, not {}!".format(
-            self.__class__.get_class_name(data_type),
-            self.__class__.get_single_string_representation_of_values(allowed_values),
-            repr(input_data)
-        )
+        allowed_values = tuple(allowed_values)
+        input_data_repr_length_limit = self.__class__.get_input_data_repr_length_limit()
+
+        def render_error_message() -> str:
+            return "If the input data are of type '{}', their value must be one of these: {}, not {}!".format(
+                self.__class__.get_class_name(data_type),
+                self.__class__.get_single_string_representation_of_values(allowed_values),
+                self.__class__.get_truncated_repr(input_data, input_data_repr_length_limit)
+            )
 
-        return InputDataValueNotAllowedForDataTypeExc(error_message, self._originator_tag, input_data)
+        return InputDataValueNotAllowedForDataTypeExc(render_error_message, self._originator_tag, input_data, data_type, allowed_values)
 
     def generate_input_data_not_unsubclassable_exc(self, unsubclassed_to: Any, input_data: Any) -> InvalidInputDataExc:
-        error_message = "The input data of type '{input_data_class_name}' (a subclass of '{subclass_name}') could not be unsubclassed to '{subclass_name}'!".format(
-            input_data_class_name=self.__class__.get_class_name(input_data),
-            subclass_name=self.__class__.get_class_name(unsubclassed_to)
-        )
+        input_data_class_name = self.__class__.get_class_name(input_data)
+
+        def render_error_message() -> str:
+            return "The input data of type '{input_data_class_name}' (a subclass of '{subclass_name}') could not be unsubclassed to '{subclass_name}'!".format(
+                input_data_class_name=input_data_class_name,
+                subclass_name=self.__class__.get_class_name(unsubclassed_to)
+            )
+
+        return InputDataNotUnsubclassableExc(render_error_message, self._originator_tag, input_data, unsubclassed_to)
+
+    def generate_invalid_items_in_input_data_exc(self, item_exceptions: Sequence[Tuple[str, DatalidatorExc]], input_data: Any) -> InvalidInputDataExc:
+        item_exceptions = tuple(item_exceptions)
+
+        def render_error_message() -> str:
+            return "The input data contain {} invalid item(s): {}".format(
+                len(item_exceptions),
+                "; ".join("{} -> {}".format(item_path, str(item_exception)) for item_path, item_exception in item_exceptions)
+            )
+
+        return InvalidItemsInInputDataExc(render_error_message, self._originator_tag, input_data, item_exceptions)
+
+    # The following methods are used by blueprints which collect the exceptions raised while processing their items,
+    #  to build the paths passed to the generate_invalid_items_in_input_data_exc() method of this class.
+    @classmethod
+    def get_list_item_path(cls, index: int) -> str:
+        return "[{}]".format(index)
+
+    @classmethod
+    def get_dict_item_path(cls, key: Any) -> str:
+        # String keys which are valid identifiers are addressed using the dot notation (e.g. 'address.zip'); other keys
+        #  are addressed using their representation in brackets (e.g. "headers['Content-Type']").
+        if key.__class__ is str and key.isidentifier():
+            return key
 
-        return InputDataNotUnsubclassableExc(error_message, self._originator_tag, input_data)
+        return "[{}]".format(cls.get_truncated_repr(key, InvalidInputDataExcFactory.__input_data_repr_length_limit))
+
+    @classmethod
+    def get_item_exceptions_with_path(cls, item_path: str, item_exception: DatalidatorExc) -> List[Tuple[str, DatalidatorExc]]:
+        # If the item's exception contains collected exceptions of nested items itself, it is flattened, so that each of
+        #  the returned paths addresses the innermost invalid item (e.g. 'items[3].address.zip').
+        if not isinstance(item_exception, InvalidItemsInInputDataExc):
+            return [(item_path, item_exception)]
+
+        return [
+            ((item_path + nested_item_path) if nested_item_path.startswith("[") else (item_path + "." + nested_item_path), nested_item_exception)
+            for nested_item_path, nested_item_exception in item_exception.get_item_exceptions()
+        ]
 
     # The following methods can be used from the outside when their output is used in an error message passed to the
     #  generate_generic_exc() method of this class.
@@ -129,3 +224,24 @@ class InvalidInputDataExcFactory:  # DP: Factory
         # The objects returned by dict.keys() and dict.values() do not work with the Sequence type annotation.
 
         return repr(tuple(objects))  # Used in error messages.
+
+    @classmethod
+    def get_truncated_repr(cls, object_: Any, length_limit: Optional[int]) -> str:
+        # Used in error messages. As error messages are rendered lazily, an exception raised by repr() cannot be
+        #  propagated (it would be raised when converting the exception to string).
+        try:
+            if length_limit is None:
+                return repr(object_)
+
+            # Only the beginning of long strings is represented, so that the whole string does not need to be copied.
+            if object_.__class__ in (str, bytes, bytearray):
+                object_ = object_[:length_limit + 1]
+
+            object_repr = repr(object_)
+        except Exception:
+            return "<unrepresentable object>"
+
+        if len(object_repr) > length_limit:
+            return object_repr[:length_limit] + "..."
+
+        return object_repr
@@ -0,0 +1,76 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from typing import final, Final, Optional
+import concurrent.futures
+
+
+__all__ = "AsyncUseOptions",
+
+
+@final
+class AsyncUseOptions:
+    """
+    Options which control how blueprints behave when they are used via the use_async() method.
+
+    While processing their input data, container blueprints (e.g. ListBlueprint) yield control to the running event
+     loop after each 'yield_item_budget' processed items, or if 'yield_time_budget' is not None, after the items have
+     been processed for that many seconds since the last yield (whichever comes first). The budgets are shared by all
+     the blueprints used during a single use_async() call, so nested blueprints yield as well.
+
+    If 'executor_item_threshold' is not None, container blueprints whose input data contain more items than that run
+     the items through their item blueprints synchronously in 'executor' instead (or in the event loop's default
+     executor if 'executor' is None). This is useful for input data which are so large that processing them would
+     slow the event loop down even with cooperative yielding.
+
+    Instances of this class are immutable, so a single instance can be shared by any number of use_async() calls.
+    """
+
+    __slots__ = "__yield_item_budget", "__yield_time_budget", "__executor", "__executor_item_threshold"
+
+    _DEFAULT_YIELD_ITEM_BUDGET: Final[int] = 1000
+
+    def __init__(self,
+                 yield_item_budget: int = _DEFAULT_YIELD_ITEM_BUDGET,
+                 yield_time_budget: Optional[float] = None,
+                 executor: Optional[concurrent.futures.Executor] = None,
+                 executor_item_threshold: Optional[int] = None):
+        self.__yield_item_budget: Final[int] = yield_item_budget
+        self.__yield_time_budget: Final[Optional[float]] = yield_time_budget
+        self.__executor: Final[Optional[concurrent.futures.Executor]] = executor
+        self.__executor_item_threshold: Final[Optional[int]] = executor_item_threshold
+
+    @final
+    def get_yield_item_budget(self) -> int:
+        return self.__yield_item_budget
+
+    @final
+    def get_yield_time_budget(self) -> Optional[float]:
+        return self.__yield_time_budget
+
+    @final
+    def get_executor(self) -> Optional[concurrent.futures.Executor]:
+        return self.__executor
+
+    @final
+    def get_executor_item_threshold(self) -> Optional[int]:
+        return self.__executor_item_threshold
@@ -0,0 +1,78 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from typing import final, Final, Generic, List, Sequence, Tuple, TypeVar
+from datalidator.exc.DatalidatorExc import DatalidatorExc
+
+
+__all__ = "BatchUseResult", "BatchUseResult_T"
+BatchUseResult_T = TypeVar("BatchUseResult_T")
+
+
+@final
+class BatchUseResult(Generic[BatchUseResult_T]):
+    """
+    The result of the 'use_many_and_collect_exceptions()' method of blueprints.
+
+    The outputs of successfully processed input items and the exceptions raised while processing the other input items
+     are paired with the indices of the input items they belong to (the indices correspond to the order in which the
+     input items were retrieved from the input iterable). Both sequences are sorted by the indices.
+    """
+
+    __slots__ = "__outputs", "__exceptions", "__processed_item_count"
+
+    def __init__(self, outputs: List[Tuple[int, BatchUseResult_T]], exceptions: List[Tuple[int, DatalidatorExc]], processed_item_count: int):
+        self.__outputs: Final[Tuple[Tuple[int, BatchUseResult_T], ...]] = tuple(outputs)
+        self.__exceptions: Final[Tuple[Tuple[int, DatalidatorExc], ...]] = tuple(exceptions)
+        self.__processed_item_count: Final[int] = processed_item_count
+
+    @final
+    def get_outputs(self) -> Sequence[Tuple[int, BatchUseResult_T]]:
+        return self.__outputs
+
+    @final
+    def get_exceptions(self) -> Sequence[Tuple[int, DatalidatorExc]]:
+        return self.__exceptions
+
+    @final
+    def get_processed_item_count(self) -> int:
+        return self.__processed_item_count
+
+    @final
+    def is_successful(self) -> bool:
+        return len(self.__exceptions) == 0
+
+    @final
+    def get_output_list(self) -> List[BatchUseResult_T]:
+        """
+        Returns the outputs of all the processed input items in a list, in the same order as the input items were
+         retrieved from the input iterable, or raises the exception of the first input item which could not be
+         processed.
+
+        :return: The outputs of all the processed input items.
+        :raises DatalidatorExc: The exception raised while processing the first input item which could not be processed.
+        """
+
+        if self.__exceptions:
+            raise self.__exceptions[0][1]
+
+        return [output for _, output in self.__outputs]
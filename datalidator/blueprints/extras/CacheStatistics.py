@@ -0,0 +1,74 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from typing import final, Final
+
+
+__all__ = "CacheStatistics",
+
+
+@final
+class CacheStatistics:
+    """
+    A snapshot of the statistics of a CachingBlueprint's cache, as returned by its 'get_cache_statistics()' method.
+
+    Lookups of input data which cannot be cached (see the docstring of CachingBlueprint) are counted neither as hits nor
+     as misses.
+    """
+
+    __slots__ = "__hit_count", "__miss_count", "__eviction_count", "__current_size", "__max_size"
+
+    def __init__(self, hit_count: int, miss_count: int, eviction_count: int, current_size: int, max_size: int):
+        self.__hit_count: Final[int] = hit_count
+        self.__miss_count: Final[int] = miss_count
+        self.__eviction_count: Final[int] = eviction_count
+        self.__current_size: Final[int] = current_size
+        self.__max_size: Final[int] = max_size
+
+    @final
+    def get_hit_count(self) -> int:
+        return self.__hit_count
+
+    @final
+    def get_miss_count(self) -> int:
+        return self.__miss_count
+
+    @final
+    def get_eviction_count(self) -> int:
+        # Expired entries which are removed from the cache are not counted as evictions
+        return self.__eviction_count
+
+    @final
+    def get_current_size(self) -> int:
+        return self.__current_size
+
+    @final
+    def get_max_size(self) -> int:
+        return self.__max_size
+
+    @final
+    def get_hit_ratio(self) -> float:
+        lookup_count = self.__hit_count + self.__miss_count
+        if lookup_count == 0:
+            return 0.0
+
+        return self.__hit_count / lookup_count
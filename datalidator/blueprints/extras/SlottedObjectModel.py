@@ -0,0 +1,106 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from typing import Any, Dict, Hashable, Tuple, Callable
+from datalidator.blueprints.extras.SlottedObjectModelMeta import SlottedObjectModelMeta
+
+
+__all__ = "SlottedObjectModel",
+
+
+class SlottedObjectModel(metaclass=SlottedObjectModelMeta):
+    """
+    Used with ObjectBlueprint as a memory-efficient alternative to ObjectModel. The blueprints are declared as class
+     attributes in the same way as in ObjectModel, but the model's instances store the parsed values in slots instead of
+     in a per-instance '__dict__', which makes them several times smaller - this matters when millions of validated
+     objects are held in memory.
+
+    If the model is declared with the 'frozen=True' class keyword argument (e.g. 'class Person(SlottedObjectModel,
+     frozen=True)'), its instances are immutable (assigning to their attributes raises AttributeError) and hashable.
+
+    Like ObjectModel instances, the instances are compared by their fields, and they can be created manually by passing
+     all the fields as keyword arguments, e.g. 'Person(name="John", age=30)'.
+
+    NOTE: The '__slots__' member is declared automatically by the metaclass (see SlottedObjectModelMeta), so it must
+     not be declared by subclasses.
+    """
+
+    def __init__(self, **fields: Any):
+        for field_name, set_field in self.__class__._get_field_setters():
+            try:
+                set_field(self, fields.pop(field_name))
+            except KeyError:
+                raise TypeError("{}() is missing the following field: {}".format(self.__class__.__name__, repr(field_name)))
+
+        if fields:
+            raise TypeError("{}() got unexpected fields: {}".format(self.__class__.__name__, ", ".join(repr(field_name) for field_name in fields.keys())))
+
+    @classmethod
+    def _from_dict(cls, parsed_dict: Dict[Hashable, Any]) -> "SlottedObjectModel":
+        """
+        Creates an instance of the model from 'parsed_dict', which must contain all the model's fields (as the output of
+         the PredefinedDictionaryBlueprint used by ObjectBlueprint does). The slots are populated directly, without the
+         keyword arguments of __init__() having to be built and checked.
+
+        :param parsed_dict: A dictionary containing the values of all the model's fields.
+        :return: An instance of the model.
+        """
+
+        instance = cls.__new__(cls)
+        for field_name, set_field in cls._get_field_setters():
+            set_field(instance, parsed_dict[field_name])
+
+        return instance
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self.__class__._is_frozen():
+            raise AttributeError("Cannot assign to the field {} of the frozen object model {}!".format(repr(name), self.__class__.__name__))
+
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name: str) -> None:
+        if self.__class__._is_frozen():
+            raise AttributeError("Cannot delete the field {} of the frozen object model {}!".format(repr(name), self.__class__.__name__))
+
+        object.__delattr__(self, name)
+
+    def __eq__(self, other: Any) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+
+        return self.__get_field_values() == other.__get_field_values()
+
+    def __hash__(self) -> int:  # Only used by frozen models - see SlottedObjectModelMeta
+        return hash(self.__get_field_values())
+
+    def __repr__(self) -> str:
+        return "{}({})".format(
+            self.__class__.__name__,
+            ", ".join("{}={}".format(field_name, repr(getattr(self, field_name))) for field_name, _ in self.__class__._get_field_setters())
+        )
+
+    def __reduce__(self) -> Tuple[Callable[[Dict[Hashable, Any]], "SlottedObjectModel"], Tuple[Dict[Hashable, Any]]]:
+        # Frozen models cannot be unpickled by setting their attributes
+        return self.__class__._from_dict, ({field_name: getattr(self, field_name) for field_name, _ in self.__class__._get_field_setters()},)
+
+    def __get_field_values(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, field_name) for field_name, _ in self.__class__._get_field_setters())
@@ -0,0 +1,103 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from typing import Any, Dict, Hashable, Optional, Tuple, Callable, Union
+import abc
+from datalidator.blueprints.BlueprintIface import BlueprintIface
+from datalidator.blueprints.extras.OptionalItemIface import OptionalItemIface
+from datalidator.blueprints.exc.err.InvalidBlueprintConfigError import InvalidBlueprintConfigError
+
+
+__all__ = "SlottedObjectModelMeta",
+
+
+class SlottedObjectModelMeta(abc.ABCMeta):
+    """
+    The metaclass of SlottedObjectModel. It collects the blueprints (and optional item specifiers) declared as public
+     class attributes of the model, removes them from the class namespace and declares '__slots__' with their names
+     instead, so that the model's instances do not have a per-instance '__dict__'. Models are made frozen (immutable and
+     hashable) by passing 'frozen=True' as a class keyword argument; the setting is inherited by subclasses.
+    """
+
+    def __new__(mcs, name: str, bases: Tuple[type, ...], namespace: Dict[str, Any], frozen: Optional[bool] = None, **kwargs: Any) -> "SlottedObjectModelMeta":
+        if "__slots__" in namespace:
+            raise InvalidBlueprintConfigError(
+                "The '__slots__' member of slotted object models (here '{}') is declared automatically!".format(name),
+                ""
+            )
+
+        inherited_field_specification = {}
+        inherited_frozen = False
+        for base in reversed(bases):
+            if isinstance(base, SlottedObjectModelMeta):
+                inherited_field_specification.update(base._get_field_specification())
+                inherited_frozen = (inherited_frozen or base._is_frozen())
+
+        own_field_specification = {}
+        class_namespace = {}
+        for attribute_name, attribute_value in namespace.items():
+            # The same rule as the one ObjectBlueprint uses for the instances of ObjectModel
+            if not attribute_name.startswith("_") and isinstance(attribute_value, (BlueprintIface, OptionalItemIface)):
+                own_field_specification[attribute_name] = attribute_value
+            else:
+                class_namespace[attribute_name] = attribute_value
+
+        # Fields redeclared by a subclass (e.g. with a different blueprint) reuse the slot of the superclass
+        class_namespace["__slots__"] = tuple(field_name for field_name in own_field_specification.keys() if field_name not in inherited_field_specification)
+
+        is_frozen = (inherited_frozen if frozen is None else frozen)
+        if not is_frozen and "__hash__" not in class_namespace:
+            class_namespace["__hash__"] = None  # Mutable objects must not be hashable, as __eq__() compares their fields
+        elif is_frozen and "__hash__" not in class_namespace:
+            # Frozen subclasses of mutable models would otherwise inherit '__hash__ = None' from them
+            root_model_class = mcs.__get_root_model_class(bases)
+            if root_model_class is not None:
+                class_namespace["__hash__"] = root_model_class.__dict__["__hash__"]
+
+        cls = super().__new__(mcs, name, bases, class_namespace, **kwargs)
+
+        field_specification = {**inherited_field_specification, **own_field_specification}
+        cls.__field_specification = field_specification
+        cls.__frozen = is_frozen
+        # The slots' member descriptors set the attributes directly, bypassing __setattr__() (which frozen models override)
+        cls.__field_setters = tuple((field_name, getattr(cls, field_name).__set__) for field_name in field_specification.keys())
+
+        return cls
+
+    @staticmethod
+    def __get_root_model_class(bases: Tuple[type, ...]) -> Optional[type]:
+        # The root model class (i.e. SlottedObjectModel) is the one nearest to 'object' in the bases' MRO that uses this metaclass
+        for base in bases:
+            for mro_class in reversed(base.__mro__):
+                if isinstance(mro_class, SlottedObjectModelMeta):
+                    return mro_class
+
+        return None
+
+    def _get_field_specification(cls) -> Dict[Hashable, Union[BlueprintIface[Any], OptionalItemIface[Any]]]:
+        return cls.__field_specification
+
+    def _is_frozen(cls) -> bool:
+        return cls.__frozen
+
+    def _get_field_setters(cls) -> Tuple[Tuple[str, Callable[[Any, Any], None]], ...]:
+        return cls.__field_setters
@@ -0,0 +1,81 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from typing import final, Final, Generic, Optional, TypeVar
+from datalidator.exc.DatalidatorExc import DatalidatorExc
+
+
+__all__ = "UseResult", "UseResult_T"
+UseResult_T = TypeVar("UseResult_T")
+
+
+@final
+class UseResult(Generic[UseResult_T]):
+    """
+    The result of the 'try_use()' method of blueprints.
+
+    A successful result holds the output data produced by the blueprint; an unsuccessful one holds the 'DatalidatorExc'
+     exception which the blueprint's use() method would have raised for the same input data.
+    """
+
+    __slots__ = "__output", "__exception"
+
+    def __init__(self, output: Optional[UseResult_T], exception: Optional[DatalidatorExc]):
+        self.__output: Final[Optional[UseResult_T]] = output
+        self.__exception: Final[Optional[DatalidatorExc]] = exception
+
+    @classmethod
+    def from_output(cls, output: UseResult_T) -> "UseResult[UseResult_T]":  # DP: Factory
+        return cls(output, None)
+
+    @classmethod
+    def from_exception(cls, exception: DatalidatorExc) -> "UseResult[UseResult_T]":  # DP: Factory
+        return cls(None, exception)
+
+    @final
+    def is_successful(self) -> bool:
+        return self.__exception is None
+
+    @final
+    def get_exception(self) -> Optional[DatalidatorExc]:
+        return self.__exception
+
+    @final
+    def get_output(self) -> UseResult_T:
+        """
+        Returns the output data held by this result, or raises the exception held by it if the result is unsuccessful.
+
+        :return: The output data held by this result.
+        :raises DatalidatorExc: The exception held by this result.
+        """
+
+        if self.__exception is not None:
+            raise self.__exception
+
+        return self.__output
+
+    @final
+    def get_output_or_default(self, default_output: UseResult_T) -> UseResult_T:
+        if self.__exception is not None:
+            return default_output
+
+        return self.__output
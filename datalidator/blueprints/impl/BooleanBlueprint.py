@@ -20,8 +20,14 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import final, Final, Any, Tuple, Optional, Type
+from typing import final, Final, Any, Tuple, Union, Optional, Type, Sequence
 from datalidator.blueprints.DefaultBlueprintWithModeSupportImplBase import DefaultBlueprintWithModeSupportImplBase
+from datalidator.blueprints.DataTypeDispatchTable import DataTypeDispatchTable
+from datalidator.blueprints.ParsingMode import ParsingMode
+from datalidator.blueprints.extras.UseResult import UseResult
+from datalidator.blueprints.exc.InvalidInputDataExc import InvalidInputDataExc
+from datalidator.filters.FilterIface import FilterIface
+from datalidator.validators.ValidatorIface import ValidatorIface
 
 
 __all__ = "BooleanBlueprint",
@@ -46,11 +52,32 @@ class BooleanBlueprint(DefaultBlueprintWithModeSupportImplBase[bool]):
     - 'bool' object
     """
 
-    __slots__ = ()
+    __slots__ = "__rational_mode_dispatch_table",
+    __TRANSIENT_SLOTS: Final[Tuple[str, ...]] = ("__rational_mode_dispatch_table",)
 
     __TRUE_STRINGS: Final[Tuple[str, ...]] = ("1", "yes", "y", "true", "on")  # Must be lowercase only!
     __FALSE_STRINGS: Final[Tuple[str, ...]] = ("0", "no", "n", "false", "off")  # Must be lowercase only!
 
+    def __init__(self,
+                 filters: Sequence[FilterIface[bool]] = (),
+                 validators: Sequence[ValidatorIface[bool]] = (),
+                 parsing_mode: ParsingMode = DefaultBlueprintWithModeSupportImplBase._DEFAULT_PARSING_MODE,
+                 tag: str = ""):
+        DefaultBlueprintWithModeSupportImplBase.__init__(self, filters, validators, parsing_mode, tag)
+
+        self.__initialize_transient_slots()
+
+    @final
+    def __initialize_transient_slots(self) -> None:
+        # The dispatch table contains bound private methods of this blueprint, which cannot be pickled. The methods return
+        #  the exceptions instead of raising them, so that the table can be used by both _parse() and _try_parse().
+        self.__rational_mode_dispatch_table: Final[DataTypeDispatchTable[Union[bool, InvalidInputDataExc]]] = DataTypeDispatchTable((
+            ((bool,), self.__perform_generic_conversion_to_bool_without_raising),
+            ((int,), self.__convert_int_to_bool_rationally),
+            ((float,), self.__convert_float_to_bool_rationally),
+            ((str,), self.__convert_str_to_bool_rationally)
+        ))
+
     def _get_allowed_output_data_types(self) -> Optional[Tuple[Type, ...]]:
         return bool,
 
@@ -58,21 +85,28 @@ class BooleanBlueprint(DefaultBlueprintWithModeSupportImplBase[bool]):
         return self.__perform_generic_conversion_to_bool(input_data)
 
     def _parse_in_rational_mode(self, input_data: Any) -> bool:
-        return self._data_conversion_helper.convert_input_using_per_data_type_converter_functions(
-            (
-                ((bool,), self.__perform_generic_conversion_to_bool),
-                ((int,), self.__convert_int_to_bool_rationally),
-                ((float,), self.__convert_float_to_bool_rationally),
-                ((str,), self.__convert_str_to_bool_rationally)
-            ),
-            input_data
-        )
+        output_data = self._data_conversion_helper.convert_input_using_data_type_dispatch_table(self.__rational_mode_dispatch_table, input_data)
+        if isinstance(output_data, BaseException):  # = InvalidInputDataExc (see DataConversionHelper.try_convert_input())
+            raise output_data
+
+        return output_data
 
     def _parse_in_strict_mode(self, input_data: Any) -> bool:
         return self._data_conversion_helper.convert_input_with_data_type_allowlist(
             self.__perform_generic_conversion_to_bool, (bool,), input_data
         )
 
+    def _try_parse_in_loose_mode(self, input_data: Any) -> UseResult[bool]:
+        return self._data_conversion_helper.try_convert_input(self.__perform_generic_conversion_to_bool_without_raising, input_data)
+
+    def _try_parse_in_rational_mode(self, input_data: Any) -> UseResult[bool]:
+        return self._data_conversion_helper.try_convert_input_using_data_type_dispatch_table(self.__rational_mode_dispatch_table, input_data)
+
+    def _try_parse_in_strict_mode(self, input_data: Any) -> UseResult[bool]:
+        return self._data_conversion_helper.try_convert_input_with_data_type_allowlist(
+            self.__perform_generic_conversion_to_bool_without_raising, (bool,), input_data
+        )
+
     @final
     def __perform_generic_conversion_to_bool(self, input_data: Any) -> bool:
         try:
@@ -81,27 +115,35 @@ class BooleanBlueprint(DefaultBlueprintWithModeSupportImplBase[bool]):
             raise self._invalid_input_data_exc_factory.generate_input_data_not_convertible_exc((bool,), input_data)
 
     @final
-    def __convert_int_to_bool_rationally(self, input_data: int) -> bool:
+    def __perform_generic_conversion_to_bool_without_raising(self, input_data: Any) -> Union[bool, InvalidInputDataExc]:
+        # The conversion is too simple to be shared with the method above at the cost of an additional function call
+        try:
+            return bool(input_data)
+        except Exception:
+            return self._invalid_input_data_exc_factory.generate_input_data_not_convertible_exc((bool,), input_data)
+
+    @final
+    def __convert_int_to_bool_rationally(self, input_data: int) -> Union[bool, InvalidInputDataExc]:
         if input_data == 1:
             return True
 
         if input_data == 0:
             return False
 
-        raise self._invalid_input_data_exc_factory.generate_input_data_value_not_allowed_for_data_type_exc(int, (1, 0), input_data)
+        return self._invalid_input_data_exc_factory.generate_input_data_value_not_allowed_for_data_type_exc(int, (1, 0), input_data)
 
     @final
-    def __convert_float_to_bool_rationally(self, input_data: float) -> bool:
+    def __convert_float_to_bool_rationally(self, input_data: float) -> Union[bool, InvalidInputDataExc]:
         if input_data == 1.0:
             return True
 
         if input_data == 0.0:
             return False
 
-        raise self._invalid_input_data_exc_factory.generate_input_data_value_not_allowed_for_data_type_exc(float, (1.0, 0.0), input_data)
+        return self._invalid_input_data_exc_factory.generate_input_data_value_not_allowed_for_data_type_exc(float, (1.0, 0.0), input_data)
 
     @final
-    def __convert_str_to_bool_rationally(self, input_data: str) -> bool:
+    def __convert_str_to_bool_rationally(self, input_data: str) -> Union[bool, InvalidInputDataExc]:
         canonicalized_string = input_data.strip().lower()
         if canonicalized_string in self.__class__.__TRUE_STRINGS:
             return True
@@ -109,6 +151,6 @@ class BooleanBlueprint(DefaultBlueprintWithModeSupportImplBase[bool]):
         if canonicalized_string in self.__class__.__FALSE_STRINGS:
             return False
 
-        raise self._invalid_input_data_exc_factory.generate_input_data_value_not_allowed_for_data_type_exc(
+        return self._invalid_input_data_exc_factory.generate_input_data_value_not_allowed_for_data_type_exc(
             str, (self.__class__.__TRUE_STRINGS + self.__class__.__FALSE_STRINGS), input_data
         )
@@ -20,12 +20,14 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import final, Final, Any, Sequence, Optional, Tuple, Type
+from typing import final, Final, Any, Sequence, Optional, Tuple, Type, Callable, TYPE_CHECKING
 import datetime
 from datalidator.blueprints.DefaultBlueprintWithStandardFeaturesImplBase import DefaultBlueprintWithStandardFeaturesImplBase
 from datalidator.blueprints.impl.DatetimeBlueprint import DatetimeBlueprint
 from datalidator.filters.FilterIface import FilterIface
 from datalidator.validators.ValidatorIface import ValidatorIface
+if TYPE_CHECKING:  # The compiler module imports this module
+    from datalidator.blueprints.compiler.BlueprintCompiler import BlueprintCompiler
 
 
 __all__ = "DateBlueprint",
@@ -62,3 +64,8 @@ class DateBlueprint(DefaultBlueprintWithStandardFeaturesImplBase[datetime.date])
         datetime_object = self.__datetime_blueprint.use(input_data)
 
         return datetime_object.date()
+
+    def _compile_parse(self, blueprint_compiler: "BlueprintCompiler") -> Callable[[Any], datetime.date]:
+        datetime_function = blueprint_compiler.compile_to_function(self.__datetime_blueprint)
+
+        return lambda input_data: datetime_function(input_data).date()
@@ -25,6 +25,7 @@ import datetime
 import time
 import math
 from datalidator.blueprints.DefaultBlueprintWithModeSupportImplBase import DefaultBlueprintWithModeSupportImplBase
+from datalidator.blueprints.DataTypeDispatchTable import DataTypeDispatchTable
 from datalidator.blueprints.ParsingMode import ParsingMode
 from datalidator.filters.FilterIface import FilterIface
 from datalidator.validators.ValidatorIface import ValidatorIface
@@ -62,7 +63,8 @@ class DatetimeBlueprint(DefaultBlueprintWithModeSupportImplBase[datetime.datetim
      ISO 8601 formats can be parsed: https://docs.python.org/3/library/datetime.html#datetime.datetime.fromisoformat
     """
 
-    __slots__ = "__additional_datetime_string_formats",
+    __slots__ = "__additional_datetime_string_formats", "__loose_mode_dispatch_table", "__rational_mode_dispatch_table", "__strict_mode_dispatch_table"
+    __TRANSIENT_SLOTS: Final[Tuple[str, ...]] = ("__loose_mode_dispatch_table", "__rational_mode_dispatch_table", "__strict_mode_dispatch_table")
 
     # I am aware that the parsing modes scheme does not fit this blueprint that well (e.g. converting Unix time
     #  [= a plain number] to datetime could be considered irrational in some cases). If it causes problems, I might
@@ -82,6 +84,37 @@ class DatetimeBlueprint(DefaultBlueprintWithModeSupportImplBase[datetime.datetim
         # Both input datetime strings and datetime string formats are stripped of leading and trailing whitespace.
         self.__additional_datetime_string_formats: Final[Tuple[str, ...]] = tuple(format_string.strip() for format_string in additional_datetime_string_formats)
 
+        self.__initialize_transient_slots()
+
+    @final
+    def __initialize_transient_slots(self) -> None:
+        # The dispatch tables contain bound private methods of this blueprint, which cannot be pickled
+
+        # Can convert: datetime.datetime, time.struct_time, formatted datetime str, Unix timestamp as int/float/str, datetime.date, datetime.time
+        self.__loose_mode_dispatch_table: Final[DataTypeDispatchTable[datetime.datetime]] = DataTypeDispatchTable((
+            ((datetime.datetime,), self.__convert_datetime_to_datetime),  # datetime.datetime is a subclass of datetime.date, so it must be checked prior to datetime.date!
+            ((time.struct_time,), self.__convert_struct_time_to_datetime),
+            ((str,), self.__convert_any_valid_str_to_datetime),  # The string can either contain a Unix timestamp, or a formatted datetime.
+            ((int, float), self.__convert_numeric_unix_timestamp_to_datetime),
+            ((datetime.date,), self.__convert_date_to_datetime),
+            ((datetime.time,), self.__convert_time_to_datetime)
+        ))
+
+        # Can convert: datetime.datetime, time.struct_time, formatted datetime str, Unix timestamp as int/float/str
+        self.__rational_mode_dispatch_table: Final[DataTypeDispatchTable[datetime.datetime]] = DataTypeDispatchTable((
+            ((datetime.datetime,), self.__convert_datetime_to_datetime),
+            ((time.struct_time,), self.__convert_struct_time_to_datetime),
+            ((str,), self.__convert_any_valid_str_to_datetime),  # The string can either contain a Unix timestamp, or a formatted datetime.
+            ((int, float), self.__convert_numeric_unix_timestamp_to_datetime)
+        ))
+
+        # Can convert: datetime.datetime, time.struct_time, formatted datetime str
+        self.__strict_mode_dispatch_table: Final[DataTypeDispatchTable[datetime.datetime]] = DataTypeDispatchTable((
+            ((datetime.datetime,), self.__convert_datetime_to_datetime),
+            ((time.struct_time,), self.__convert_struct_time_to_datetime),
+            ((str,), self.__convert_formatted_str_to_datetime)
+        ))
+
     @final
     def get_additional_datetime_string_formats(self) -> Sequence[str]:
         return self.__additional_datetime_string_formats  # An *immutable* sequence (tuple) is returned
@@ -89,42 +122,14 @@ class DatetimeBlueprint(DefaultBlueprintWithModeSupportImplBase[datetime.datetim
     def _get_allowed_output_data_types(self) -> Optional[Tuple[Type, ...]]:
         return datetime.datetime,
 
-    # Can convert: datetime.datetime, time.struct_time, formatted datetime str, Unix timestamp as int/float/str, datetime.date, datetime.time
     def _parse_in_loose_mode(self, input_data: Any) -> datetime.datetime:
-        return self._data_conversion_helper.convert_input_using_per_data_type_converter_functions(
-            (
-                ((datetime.datetime,), self.__convert_datetime_to_datetime),  # datetime.datetime is a subclass of datetime.date, so it must be checked prior to datetime.date!
-                ((time.struct_time,), self.__convert_struct_time_to_datetime),
-                ((str,), self.__convert_any_valid_str_to_datetime),  # The string can either contain a Unix timestamp, or a formatted datetime.
-                ((int, float), self.__convert_numeric_unix_timestamp_to_datetime),
-                ((datetime.date,), self.__convert_date_to_datetime),
-                ((datetime.time,), self.__convert_time_to_datetime)
-            ),
-            input_data
-        )
-
-    # Can convert: datetime.datetime, time.struct_time, formatted datetime str, Unix timestamp as int/float/str
+        return self._data_conversion_helper.convert_input_using_data_type_dispatch_table(self.__loose_mode_dispatch_table, input_data)
+
     def _parse_in_rational_mode(self, input_data: Any) -> datetime.datetime:
-        return self._data_conversion_helper.convert_input_using_per_data_type_converter_functions(
-            (
-                ((datetime.datetime,), self.__convert_datetime_to_datetime),
-                ((time.struct_time,), self.__convert_struct_time_to_datetime),
-                ((str,), self.__convert_any_valid_str_to_datetime),  # The string can either contain a Unix timestamp, or a formatted datetime.
-                ((int, float), self.__convert_numeric_unix_timestamp_to_datetime)
-            ),
-            input_data
-        )
-
-    # Can convert: datetime.datetime, time.struct_time, formatted datetime str
+        return self._data_conversion_helper.convert_input_using_data_type_dispatch_table(self.__rational_mode_dispatch_table, input_data)
+
     def _parse_in_strict_mode(self, input_data: Any) -> datetime.datetime:
-        return self._data_conversion_helper.convert_input_using_per_data_type_converter_functions(
-            (
-                ((datetime.datetime,), self.__convert_datetime_to_datetime),
-                ((time.struct_time,), self.__convert_struct_time_to_datetime),
-                ((str,), self.__convert_formatted_str_to_datetime)
-            ),
-            input_data
-        )
+        return self._data_conversion_helper.convert_input_using_data_type_dispatch_table(self.__strict_mode_dispatch_table, input_data)
 
     @final
     def __convert_datetime_to_datetime(self, input_data: datetime.datetime) -> datetime.datetime:
@@ -20,11 +20,18 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import final, Final, Dict, Generic, Any, Sequence, Hashable, Optional, Tuple, Type, TypeVar
+from typing import final, Final, Dict, Generic, Any, Sequence, Hashable, List, Optional, Tuple, Type, Callable, TypeVar, TYPE_CHECKING
+import concurrent.futures
+from datalidator.exc.DatalidatorExc import DatalidatorExc
 from datalidator.blueprints.BlueprintIface import BlueprintIface
+from datalidator.blueprints.AsyncUseContext import AsyncUseContext
 from datalidator.blueprints.DefaultBlueprintWithStandardFeaturesImplBase import DefaultBlueprintWithStandardFeaturesImplBase
+from datalidator.blueprints.ParallelItemProcessingHelper import ParallelItemProcessingHelper
+from datalidator.blueprints.exc.err.InvalidBlueprintConfigError import InvalidBlueprintConfigError
 from datalidator.filters.FilterIface import FilterIface
 from datalidator.validators.ValidatorIface import ValidatorIface
+if TYPE_CHECKING:  # The compiler module imports this module
+    from datalidator.blueprints.compiler.BlueprintCompiler import BlueprintCompiler
 
 
 __all__ = "DictionaryBlueprint", "DictionaryBlueprint_KT", "DictionaryBlueprint_VT"
@@ -43,23 +50,63 @@ class DictionaryBlueprint(DefaultBlueprintWithStandardFeaturesImplBase[Dict[Dict
     NOTE: This blueprint takes the input data, converts them to a 'dict' object, runs its keys and values through
      the 'key_blueprint' and 'value_blueprint' objects that have been passed to this object's initializer before,
      and returns the resulting 'dict' object.
+
+    NOTE: By default, the exception related to the first invalid item is raised. If the 'collect_item_exceptions'
+     initializer argument is True, all the items are processed instead, and a single 'InvalidItemsInInputDataExc'
+     exception containing the exceptions related to all the invalid items (paired with the items' paths, e.g.
+     "['Content-Type']") is raised.
+
+    NOTE: If an 'executor' is passed to the initializer, the keys and values of input data containing more than
+     'executor_chunk_size' items are split into chunks of that size, which are run through the key and value blueprints
+     in parallel using the executor (see ParallelItemProcessingHelper). The output dictionary is the same and the same
+     exceptions are raised as if the items were processed sequentially.
+
+    NOTE: When the blueprint is used via the use_async() method, the items are run through the key and value blueprints
+     one by one and control is yielded to the event loop according to the specified AsyncUseOptions. The executor
+     passed to the initializer is used only if the items are offloaded to an executor (see AsyncUseOptions).
     """
 
-    __slots__ = "__key_blueprint", "__value_blueprint"
+    __slots__ = "__key_blueprint", "__value_blueprint", "__collect_item_exceptions", "__executor", "__executor_chunk_size", "__parallel_item_processing_helper"
+    __TRANSIENT_SLOTS: Final[Tuple[str, ...]] = ("__executor", "__parallel_item_processing_helper")
 
     # Dictionary is a specific-enough type, so there is very little chance that any input data would cause an
     #  "irrational" output. Therefore, there is no need for parsing modes support.
 
+    _DEFAULT_EXECUTOR_CHUNK_SIZE: Final[int] = 1000
+
     def __init__(self,
                  key_blueprint: BlueprintIface[DictionaryBlueprint_KT],
                  value_blueprint: BlueprintIface[DictionaryBlueprint_VT],
                  filters: Sequence[FilterIface[Dict[DictionaryBlueprint_KT, DictionaryBlueprint_VT]]] = (),
                  validators: Sequence[ValidatorIface[Dict[DictionaryBlueprint_KT, DictionaryBlueprint_VT]]] = (),
+                 collect_item_exceptions: bool = False,
+                 executor: Optional[concurrent.futures.Executor] = None,
+                 executor_chunk_size: int = _DEFAULT_EXECUTOR_CHUNK_SIZE,
                  tag: str = ""):
         DefaultBlueprintWithStandardFeaturesImplBase.__init__(self, filters, validators, tag)
 
         self.__key_blueprint: Final[BlueprintIface[DictionaryBlueprint_KT]] = key_blueprint
         self.__value_blueprint: Final[BlueprintIface[DictionaryBlueprint_VT]] = value_blueprint
+        self.__collect_item_exceptions: Final[bool] = collect_item_exceptions
+        self.__executor: Final[Optional[concurrent.futures.Executor]] = executor
+        self.__executor_chunk_size: Final[int] = executor_chunk_size
+        self.__parallel_item_processing_helper: Final[Optional[ParallelItemProcessingHelper[Any]]] = self.__get_parallel_item_processing_helper(executor, executor_chunk_size)
+
+    @final
+    def __initialize_transient_slots(self) -> None:
+        # Executors cannot be pickled - unpickled blueprints process the items of their input data sequentially
+        self.__executor: Final[Optional[concurrent.futures.Executor]] = None
+        self.__parallel_item_processing_helper: Final[Optional[ParallelItemProcessingHelper[Any]]] = None
+
+    @final
+    def __get_parallel_item_processing_helper(self, executor: Optional[concurrent.futures.Executor], executor_chunk_size: int) -> Optional[ParallelItemProcessingHelper[Any]]:
+        if executor_chunk_size < 1:
+            raise InvalidBlueprintConfigError("The executor chunk size must be at least 1!", self._tag)
+
+        if executor is None:
+            return None
+
+        return ParallelItemProcessingHelper[Any](executor, executor_chunk_size)
 
     @final
     def get_key_blueprint(self) -> BlueprintIface[DictionaryBlueprint_KT]:
@@ -69,22 +116,186 @@ class DictionaryBlueprint(DefaultBlueprintWithStandardFeaturesImplBase[Dict[Dict
     def get_value_blueprint(self) -> BlueprintIface[DictionaryBlueprint_VT]:
         return self.__value_blueprint
 
+    @final
+    def are_item_exceptions_collected(self) -> bool:
+        return self.__collect_item_exceptions
+
+    @final
+    def get_executor(self) -> Optional[concurrent.futures.Executor]:
+        return self.__executor
+
+    @final
+    def get_executor_chunk_size(self) -> int:
+        return self.__executor_chunk_size
+
     def _get_allowed_output_data_types(self) -> Optional[Tuple[Type, ...]]:
         return dict,
 
     def _parse(self, input_data: Any) -> Dict[DictionaryBlueprint_KT, DictionaryBlueprint_VT]:
+        return self.__parse_using_item_functions(input_data, self.__key_blueprint.use, self.__value_blueprint.use)
+
+    async def _parse_async(self, input_data: Any, async_use_context: AsyncUseContext) -> Dict[DictionaryBlueprint_KT, DictionaryBlueprint_VT]:
+        dict_from_input_data = self.__convert_input_data_to_dict(input_data)
+
+        if async_use_context.should_offload_to_executor(len(dict_from_input_data)) and not self.__do_item_blueprints_require_async_use():
+            # The '_parse()' method, unlike private methods, can be pickled (if the executor runs it in another process).
+            return await async_use_context.run_in_executor(self._parse, dict_from_input_data)
+
+        exc_factory_class = self._invalid_input_data_exc_factory.__class__
+        key_blueprint = self.__key_blueprint
+        value_blueprint = self.__value_blueprint
+        use_key_blueprint_async = self._does_blueprint_require_async_use(key_blueprint)
+        use_value_blueprint_async = self._does_blueprint_benefit_from_async_use(value_blueprint)
+
+        output_dict = {}
+        item_exceptions: List[Tuple[str, DatalidatorExc]] = []
+        for input_key, input_value in dict_from_input_data.items():
+            if async_use_context.consume_item_budget():
+                await async_use_context.yield_to_event_loop()
+
+            # Keys are usually simple values, so they are run through the key blueprint synchronously, unless it cannot
+            #  be used synchronously at all.
+            try:
+                if use_key_blueprint_async:
+                    blueprinted_key = self.__check_blueprinted_dict_key(await self._use_blueprint_async(key_blueprint, input_key, async_use_context), input_data)
+                else:
+                    blueprinted_key = self.__run_dict_key_through_blueprint(input_key, input_data, key_blueprint.use)
+                if use_value_blueprint_async:
+                    blueprinted_value = await self._use_blueprint_async(value_blueprint, input_value, async_use_context)
+                else:
+                    blueprinted_value = self.__run_dict_value_through_blueprint(input_value, value_blueprint.use)
+            except DatalidatorExc as e:
+                if not self.__collect_item_exceptions:
+                    raise e
+
+                item_exceptions.extend(exc_factory_class.get_item_exceptions_with_path(exc_factory_class.get_dict_item_path(input_key), e))
+            else:
+                output_dict[blueprinted_key] = blueprinted_value
+
+        if item_exceptions:
+            raise self._invalid_input_data_exc_factory.generate_invalid_items_in_input_data_exc(item_exceptions, input_data)
+
+        return output_dict
+
+    def _benefits_from_async_use(self) -> bool:
+        return True
+
+    def _requires_async_use(self) -> bool:
+        return DefaultBlueprintWithStandardFeaturesImplBase._requires_async_use(self) or self.__do_item_blueprints_require_async_use()
+
+    @final
+    def __do_item_blueprints_require_async_use(self) -> bool:
+        return self._does_blueprint_require_async_use(self.__key_blueprint) or self._does_blueprint_require_async_use(self.__value_blueprint)
+
+    def _compile_parse(self, blueprint_compiler: "BlueprintCompiler") -> Callable[[Any], Dict[DictionaryBlueprint_KT, DictionaryBlueprint_VT]]:
+        key_function = blueprint_compiler.compile_to_function(self.__key_blueprint)
+        value_function = blueprint_compiler.compile_to_function(self.__value_blueprint)
+
+        return lambda input_data: self.__parse_using_item_functions(input_data, key_function, value_function)
+
+    @final
+    def __parse_using_item_functions(self,
+                                     input_data: Any,
+                                     key_function: Callable[[Any], DictionaryBlueprint_KT],
+                                     value_function: Callable[[Any], DictionaryBlueprint_VT]) -> Dict[DictionaryBlueprint_KT, DictionaryBlueprint_VT]:
+        # The item functions are either the use() methods of the key and value blueprints, or the functions they have
+        #  been compiled into.
         dict_from_input_data = self.__convert_input_data_to_dict(input_data)
 
+        parallel_item_processing_helper = self.__parallel_item_processing_helper
+        if (parallel_item_processing_helper is not None) and parallel_item_processing_helper.should_process_items_in_parallel(len(dict_from_input_data)):
+            return self.__run_items_through_item_blueprints_in_parallel(dict_from_input_data, input_data, parallel_item_processing_helper)
+
+        if self.__collect_item_exceptions:
+            return self.__run_items_through_item_functions_and_collect_exceptions(dict_from_input_data, input_data, key_function, value_function)
+
         # Writing this as dict comprehension is quite unclear
         output_dict = {}
         for input_key, input_value in dict_from_input_data.items():
-            blueprinted_key = self.__run_dict_key_through_blueprint(input_key, input_data)
-            blueprinted_value = self.__run_dict_value_through_blueprint(input_value)
+            blueprinted_key = self.__run_dict_key_through_blueprint(input_key, input_data, key_function)
+            blueprinted_value = self.__run_dict_value_through_blueprint(input_value, value_function)
 
             output_dict[blueprinted_key] = blueprinted_value
 
         return output_dict
 
+    @final
+    def __run_items_through_item_functions_and_collect_exceptions(self,
+                                                                  dict_from_input_data: Dict[Hashable, Any],
+                                                                  input_data: Any,
+                                                                  key_function: Callable[[Any], DictionaryBlueprint_KT],
+                                                                  value_function: Callable[[Any], DictionaryBlueprint_VT]) -> Dict[DictionaryBlueprint_KT, DictionaryBlueprint_VT]:
+        exc_factory_class = self._invalid_input_data_exc_factory.__class__
+
+        output_dict = {}
+        item_exceptions: List[Tuple[str, DatalidatorExc]] = []
+        for input_key, input_value in dict_from_input_data.items():
+            # The path addresses the item using its key from the input data, as its blueprinted key might not be available
+            try:
+                blueprinted_key = self.__run_dict_key_through_blueprint(input_key, input_data, key_function)
+                blueprinted_value = self.__run_dict_value_through_blueprint(input_value, value_function)
+            except DatalidatorExc as e:
+                item_exceptions.extend(exc_factory_class.get_item_exceptions_with_path(exc_factory_class.get_dict_item_path(input_key), e))
+            else:
+                output_dict[blueprinted_key] = blueprinted_value
+
+        if item_exceptions:
+            raise self._invalid_input_data_exc_factory.generate_invalid_items_in_input_data_exc(item_exceptions, input_data)
+
+        return output_dict
+
+    @final
+    def __run_items_through_item_blueprints_in_parallel(self,
+                                                        dict_from_input_data: Dict[Hashable, Any],
+                                                        input_data: Any,
+                                                        parallel_item_processing_helper: ParallelItemProcessingHelper[Any]) -> Dict[DictionaryBlueprint_KT, DictionaryBlueprint_VT]:
+        if not self.__collect_item_exceptions:
+            return self.__run_items_through_item_blueprints_in_parallel_until_first_exception(dict_from_input_data, input_data, parallel_item_processing_helper)
+
+        # The keys and values are run through their blueprints independently of each other. Their results are then
+        #  walked through in the same order as they would have been processed sequentially, so that the same exceptions
+        #  are collected as if the items were processed sequentially.
+        key_results = parallel_item_processing_helper.try_use_blueprint_on_items(self.__key_blueprint, list(dict_from_input_data.keys()))
+        value_results = parallel_item_processing_helper.try_use_blueprint_on_items(self.__value_blueprint, list(dict_from_input_data.values()))
+
+        exc_factory_class = self._invalid_input_data_exc_factory.__class__
+
+        output_dict = {}
+        item_exceptions: List[Tuple[str, DatalidatorExc]] = []
+        for input_key, key_result, value_result in zip(dict_from_input_data.keys(), key_results, value_results):
+            try:
+                blueprinted_key = self.__check_blueprinted_dict_key(key_result.get_output(), input_data)
+                blueprinted_value = value_result.get_output()
+            except DatalidatorExc as e:
+                item_exceptions.extend(exc_factory_class.get_item_exceptions_with_path(exc_factory_class.get_dict_item_path(input_key), e))
+            else:
+                output_dict[blueprinted_key] = blueprinted_value
+
+        if item_exceptions:
+            raise self._invalid_input_data_exc_factory.generate_invalid_items_in_input_data_exc(item_exceptions, input_data)
+
+        return output_dict
+
+    @final
+    def __run_items_through_item_blueprints_in_parallel_until_first_exception(self,
+                                                                              dict_from_input_data: Dict[Hashable, Any],
+                                                                              input_data: Any,
+                                                                              parallel_item_processing_helper: ParallelItemProcessingHelper[Any]) -> Dict[DictionaryBlueprint_KT, DictionaryBlueprint_VT]:
+        # The keys and values are submitted to the executor together, and their outputs are received in the same order
+        #  as if they were processed sequentially (key, value, key, value, ...), so that each key's hashability is
+        #  checked before its value's exception is raised. Once an exception is raised, the remaining tasks are cancelled.
+        output_iterator = parallel_item_processing_helper.use_blueprints_on_item_tuples((self.__key_blueprint, self.__value_blueprint), list(dict_from_input_data.items()))
+
+        output_dict = {}
+        try:
+            for blueprinted_key in output_iterator:
+                blueprinted_key = self.__check_blueprinted_dict_key(blueprinted_key, input_data)
+                output_dict[blueprinted_key] = next(output_iterator)
+        finally:
+            output_iterator.close()  # Cancels the remaining tasks if the hashability check has failed
+
+        return output_dict
+
     @final
     def __convert_input_data_to_dict(self, input_data: Any) -> Dict[Hashable, Any]:
         try:
@@ -93,9 +304,13 @@ class DictionaryBlueprint(DefaultBlueprintWithStandardFeaturesImplBase[Dict[Dict
             raise self._invalid_input_data_exc_factory.generate_input_data_not_convertible_exc((dict,), input_data)
 
     @final
-    def __run_dict_key_through_blueprint(self, input_key: Hashable, input_data: Any) -> DictionaryBlueprint_KT:
-        blueprinted_key = self.__key_blueprint.use(input_key)  # Recursive behaviour
+    def __run_dict_key_through_blueprint(self, input_key: Hashable, input_data: Any, key_function: Callable[[Any], DictionaryBlueprint_KT]) -> DictionaryBlueprint_KT:
+        blueprinted_key = key_function(input_key)  # Recursive behaviour
 
+        return self.__check_blueprinted_dict_key(blueprinted_key, input_data)
+
+    @final
+    def __check_blueprinted_dict_key(self, blueprinted_key: DictionaryBlueprint_KT, input_data: Any) -> DictionaryBlueprint_KT:
         # The output of the key blueprint is used as the resulting dictionary's key, so it must be hashable. This check
         #  of hashability is not necessary there (the dictionary, of course, checks it itself), but it allows us to
         #  raise an exception with an user-readable error message.
@@ -114,6 +329,6 @@ class DictionaryBlueprint(DefaultBlueprintWithStandardFeaturesImplBase[Dict[Dict
         return blueprinted_key
 
     @final
-    def __run_dict_value_through_blueprint(self, input_value: Any) -> DictionaryBlueprint_VT:
+    def __run_dict_value_through_blueprint(self, input_value: Any, value_function: Callable[[Any], DictionaryBlueprint_VT]) -> DictionaryBlueprint_VT:
         # For possible future expansion & code consistency.
-        return self.__value_blueprint.use(input_value)  # Recursive behaviour
+        return value_function(input_value)  # Recursive behaviour
@@ -20,10 +20,12 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import final, Final, Any, Tuple, Type, Sequence, Optional
+from typing import final, Final, Any, Tuple, Type, Sequence, Union, Optional
 import math
 from datalidator.blueprints.DefaultBlueprintWithModeSupportImplBase import DefaultBlueprintWithModeSupportImplBase
 from datalidator.blueprints.ParsingMode import ParsingMode
+from datalidator.blueprints.extras.UseResult import UseResult
+from datalidator.blueprints.exc.InvalidInputDataExc import InvalidInputDataExc
 from datalidator.filters.FilterIface import FilterIface
 from datalidator.validators.ValidatorIface import ValidatorIface
 
@@ -86,8 +88,29 @@ class FloatBlueprint(DefaultBlueprintWithModeSupportImplBase[float]):
             self.__convert_input_data_to_float, self.__class__.__STRICT_MODE_DATA_TYPE_ALLOWLIST, input_data
         )
 
+    def _try_parse_in_loose_mode(self, input_data: Any) -> UseResult[float]:
+        return self._data_conversion_helper.try_convert_input(self.__convert_input_data_to_float_without_raising, input_data)
+
+    def _try_parse_in_rational_mode(self, input_data: Any) -> UseResult[float]:
+        return self._data_conversion_helper.try_convert_input_with_data_type_allowlist(
+            self.__convert_input_data_to_float_without_raising, self.__class__.__RATIONAL_MODE_DATA_TYPE_ALLOWLIST, input_data
+        )
+
+    def _try_parse_in_strict_mode(self, input_data: Any) -> UseResult[float]:
+        return self._data_conversion_helper.try_convert_input_with_data_type_allowlist(
+            self.__convert_input_data_to_float_without_raising, self.__class__.__STRICT_MODE_DATA_TYPE_ALLOWLIST, input_data
+        )
+
     @final
     def __convert_input_data_to_float(self, input_data: Any) -> float:
+        number = self.__convert_input_data_to_float_without_raising(input_data)
+        if isinstance(number, BaseException):  # = InvalidInputDataExc (see DataConversionHelper.try_convert_input())
+            raise number
+
+        return number
+
+    @final
+    def __convert_input_data_to_float_without_raising(self, input_data: Any) -> Union[float, InvalidInputDataExc]:
         original_input_data = input_data  # The exceptions should get the unmodified input data, so they can be relevant
         if isinstance(input_data, str):
             input_data = input_data.replace(",", ".")  # In some countries, commas are used as decimal separators instead of dots
@@ -98,7 +121,7 @@ class FloatBlueprint(DefaultBlueprintWithModeSupportImplBase[float]):
             # float() accepts strings containing integers (e.g. "4") too (important!)
             number = float(input_data)
         except Exception:  # Can be TypeError, ValueError, ...
-            raise self._invalid_input_data_exc_factory.generate_input_data_not_convertible_exc((float,), original_input_data)
+            return self._invalid_input_data_exc_factory.generate_input_data_not_convertible_exc((float,), original_input_data)
 
         # This check is not implemented as a validator, because a badly programmed filter (filters are executed before
         #  validators) could obtain an IEEE 754 special value and behave unexpectedly which could negatively affect a
@@ -110,7 +133,7 @@ class FloatBlueprint(DefaultBlueprintWithModeSupportImplBase[float]):
                 number = 0.0
 
             if not math.isfinite(number):
-                raise self._invalid_input_data_exc_factory.generate_invalid_input_data_exc(
+                return self._invalid_input_data_exc_factory.generate_invalid_input_data_exc(
                     "The parsed float value is not finite: {}".format(number),
                     original_input_data
                 )
@@ -20,8 +20,11 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import final, Any, Final, Tuple, Type, Optional
+from typing import final, Any, Final, Iterable, List, Tuple, Type, Union, Optional
+from datalidator.blueprints.ParsingMode import ParsingMode
 from datalidator.blueprints.DefaultBlueprintWithModeSupportImplBase import DefaultBlueprintWithModeSupportImplBase
+from datalidator.blueprints.extras.UseResult import UseResult
+from datalidator.blueprints.exc.InvalidInputDataExc import InvalidInputDataExc
 
 
 __all__ = "IntegerBlueprint",
@@ -50,6 +53,7 @@ class IntegerBlueprint(DefaultBlueprintWithModeSupportImplBase[int]):
     # The rationality of 'bool' being converted to 'int' can be controversial
     __RATIONAL_MODE_DATA_TYPE_ALLOWLIST: Final[Tuple[Type, ...]] = (int, float, bool, str)
     __STRICT_MODE_DATA_TYPE_ALLOWLIST: Final[Tuple[Type, ...]] = (int,)
+    __SUPPORTED_PARSING_MODES: Final[Tuple[ParsingMode, ...]] = (ParsingMode.MODE_LOOSE, ParsingMode.MODE_RATIONAL, ParsingMode.MODE_STRICT)
 
     def _get_allowed_output_data_types(self) -> Optional[Tuple[Type, ...]]:
         return int,
@@ -67,6 +71,30 @@ class IntegerBlueprint(DefaultBlueprintWithModeSupportImplBase[int]):
             self.__convert_input_data_to_int, self.__class__.__STRICT_MODE_DATA_TYPE_ALLOWLIST, input_data
         )
 
+    def _try_parse_in_loose_mode(self, input_data: Any) -> UseResult[int]:
+        return self._data_conversion_helper.try_convert_input(self.__convert_input_data_to_int_without_raising, input_data)
+
+    def _try_parse_in_rational_mode(self, input_data: Any) -> UseResult[int]:
+        return self._data_conversion_helper.try_convert_input_with_data_type_allowlist(
+            self.__convert_input_data_to_int_without_raising, self.__class__.__RATIONAL_MODE_DATA_TYPE_ALLOWLIST, input_data
+        )
+
+    def _try_parse_in_strict_mode(self, input_data: Any) -> UseResult[int]:
+        return self._data_conversion_helper.try_convert_input_with_data_type_allowlist(
+            self.__convert_input_data_to_int_without_raising, self.__class__.__STRICT_MODE_DATA_TYPE_ALLOWLIST, input_data
+        )
+
+    def _use_many(self, input_data_iterable: Iterable[Any]) -> List[int]:
+        use_function = self._get_batch_use_function()
+
+        # Subclasses might parse the input data differently, and filters & validators might alter or reject the data
+        if (self.__class__ is not IntegerBlueprint) or self.get_filters() or self.get_validators() or (self.get_parsing_mode() not in self.__class__.__SUPPORTED_PARSING_MODES):
+            return [use_function(input_data) for input_data in input_data_iterable]
+
+        # 'int' objects are accepted in all parsing modes and int() returns them unchanged, so they can be passed to the
+        #  output as they are
+        return [(input_data if input_data.__class__ is int else use_function(input_data)) for input_data in input_data_iterable]
+
     @final
     def __convert_input_data_to_int(self, input_data: Any) -> int:
         try:
@@ -75,3 +103,11 @@ class IntegerBlueprint(DefaultBlueprintWithModeSupportImplBase[int]):
             return int(input_data)
         except Exception:  # Can be TypeError, ValueError, ...
             raise self._invalid_input_data_exc_factory.generate_input_data_not_convertible_exc((int,), input_data)
+
+    @final
+    def __convert_input_data_to_int_without_raising(self, input_data: Any) -> Union[int, InvalidInputDataExc]:
+        # The conversion is too simple to be shared with the method above at the cost of an additional function call
+        try:
+            return int(input_data)
+        except Exception:
+            return self._invalid_input_data_exc_factory.generate_input_data_not_convertible_exc((int,), input_data)
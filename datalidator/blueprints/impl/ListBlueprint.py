@@ -20,11 +20,20 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import final, Final, Any, List, Sequence, Tuple, Type, Optional, Generic, TypeVar
+from typing import final, Final, Any, List, Sequence, Tuple, Type, Optional, Callable, Iterator, Generic, TypeVar
 import collections.abc
+import concurrent.futures
+from datalidator.exc.DatalidatorExc import DatalidatorExc
+from datalidator.exc.err.DatalidatorError import DatalidatorError
+from datalidator.exc.err.ThisShouldNeverHappenError import ThisShouldNeverHappenError
 from datalidator.blueprints.BlueprintIface import BlueprintIface
+from datalidator.blueprints.AsyncUseContext import AsyncUseContext
 from datalidator.blueprints.DefaultBlueprintWithModeSupportImplBase import DefaultBlueprintWithModeSupportImplBase
 from datalidator.blueprints.ParsingMode import ParsingMode
+from datalidator.blueprints.StreamErrorPolicy import StreamErrorPolicy
+from datalidator.blueprints.ParallelItemProcessingHelper import ParallelItemProcessingHelper
+from datalidator.blueprints.compiler.BlueprintCompiler import BlueprintCompiler
+from datalidator.blueprints.exc.err.InvalidBlueprintConfigError import InvalidBlueprintConfigError
 from datalidator.filters.FilterIface import FilterIface
 from datalidator.validators.ValidatorIface import ValidatorIface
 
@@ -53,30 +62,127 @@ class ListBlueprint(DefaultBlueprintWithModeSupportImplBase[List[ListBlueprint_T
     NOTE: This blueprint takes the input data, converts them to a 'list' object, runs its items through the
      'item_blueprint' object that has been passed to this object's initializer before, and returns the resulting
      'list' object.
+
+    NOTE: Huge or unbounded input data (e.g. generators) can be processed as a stream using the iter_use() method,
+     which yields the output items one by one instead of returning a list of them.
+
+    NOTE: By default, the exception raised by the item blueprint for the first invalid item is raised. If the
+     'collect_item_exceptions' initializer argument is True, all the items are processed instead, and a single
+     'InvalidItemsInInputDataExc' exception containing the exceptions of all the invalid items (paired with the items'
+     paths, e.g. '[3]') is raised.
+
+    NOTE: If an 'executor' is passed to the initializer, the items of input data containing more than
+     'executor_chunk_size' items are split into chunks of that size, which are run through the item blueprint in
+     parallel using the executor (see ParallelItemProcessingHelper). The output items are in the same order and the
+     same exceptions are raised as if the items were processed sequentially.
+
+    NOTE: When the blueprint is used via the use_async() method, the items are run through the item blueprint one by
+     one and control is yielded to the event loop according to the specified AsyncUseOptions. The executor passed to
+     the initializer is used only if the items are offloaded to an executor (see AsyncUseOptions).
     """
 
-    __slots__ = "__item_blueprint",
+    __slots__ = "__item_blueprint", "__collect_item_exceptions", "__executor", "__executor_chunk_size", "__parallel_item_processing_helper"
+    __TRANSIENT_SLOTS: Final[Tuple[str, ...]] = ("__executor", "__parallel_item_processing_helper")
 
     # Those input data types are disallowed in rational mode because converting them to list might produce "irrational"
     #  results (e.g. a mapping passed to this blueprint would produce a list of its keys - most people would not expect
     #  such behaviour)
     __RATIONAL_MODE_DATA_TYPE_BLOCKLIST: Final[Tuple[Type, ...]] = (collections.abc.Mapping, str, bytes, bytearray)
     __STRICT_MODE_DATA_TYPE_ALLOWLIST: Final[Tuple[Type, ...]] = (list, tuple, set, frozenset)
+    __SUPPORTED_STREAM_ERROR_POLICIES: Final[Tuple[StreamErrorPolicy, ...]] = (StreamErrorPolicy.POLICY_STOP, StreamErrorPolicy.POLICY_SKIP, StreamErrorPolicy.POLICY_COLLECT)
+    _DEFAULT_EXECUTOR_CHUNK_SIZE: Final[int] = 1000
 
     def __init__(self,
                  item_blueprint: BlueprintIface[ListBlueprint_T],
                  filters: Sequence[FilterIface[List[ListBlueprint_T]]] = (),
                  validators: Sequence[ValidatorIface[List[ListBlueprint_T]]] = (),
                  parsing_mode: ParsingMode = DefaultBlueprintWithModeSupportImplBase._DEFAULT_PARSING_MODE,
+                 collect_item_exceptions: bool = False,
+                 executor: Optional[concurrent.futures.Executor] = None,
+                 executor_chunk_size: int = _DEFAULT_EXECUTOR_CHUNK_SIZE,
                  tag: str = ""):
         DefaultBlueprintWithModeSupportImplBase.__init__(self, filters, validators, parsing_mode, tag)
 
         self.__item_blueprint: Final[BlueprintIface[ListBlueprint_T]] = item_blueprint
+        self.__collect_item_exceptions: Final[bool] = collect_item_exceptions
+        self.__executor: Final[Optional[concurrent.futures.Executor]] = executor
+        self.__executor_chunk_size: Final[int] = executor_chunk_size
+        self.__parallel_item_processing_helper: Final[Optional[ParallelItemProcessingHelper[ListBlueprint_T]]] = self.__get_parallel_item_processing_helper(executor, executor_chunk_size)
+
+    @final
+    def __initialize_transient_slots(self) -> None:
+        # Executors cannot be pickled - unpickled blueprints process the items of their input data sequentially
+        self.__executor: Final[Optional[concurrent.futures.Executor]] = None
+        self.__parallel_item_processing_helper: Final[Optional[ParallelItemProcessingHelper[ListBlueprint_T]]] = None
+
+    @final
+    def __get_parallel_item_processing_helper(self, executor: Optional[concurrent.futures.Executor], executor_chunk_size: int) -> Optional[ParallelItemProcessingHelper[ListBlueprint_T]]:
+        if executor_chunk_size < 1:
+            raise InvalidBlueprintConfigError("The executor chunk size must be at least 1!", self._tag)
+
+        if executor is None:
+            return None
+
+        return ParallelItemProcessingHelper[ListBlueprint_T](executor, executor_chunk_size)
 
     @final
     def get_item_blueprint(self) -> BlueprintIface[ListBlueprint_T]:
         return self.__item_blueprint
 
+    @final
+    def are_item_exceptions_collected(self) -> bool:
+        return self.__collect_item_exceptions
+
+    @final
+    def get_executor(self) -> Optional[concurrent.futures.Executor]:
+        return self.__executor
+
+    @final
+    def get_executor_chunk_size(self) -> int:
+        return self.__executor_chunk_size
+
+    @final
+    def iter_use(self, input_data: Any, error_policy: StreamErrorPolicy = StreamErrorPolicy.POLICY_STOP, max_length: Optional[int] = None) -> Iterator[ListBlueprint_T]:
+        """
+        Processes 'input_data' as a stream - the items retrieved from the input data are run through the item blueprint
+         one by one and the output items are yielded as soon as they are processed. Unlike the use() method, neither the
+         input data nor the output data are ever held in memory as a whole, so this method can be used to process huge
+         or unbounded iterables (e.g. generators or database cursors) in constant memory.
+
+        The input data are accepted under the same conditions as in the use() method (which depend on the blueprint's
+         parsing mode). As the output list is never created, the blueprint must not have any filters or validators.
+
+        :param input_data: The untrusted input data whose items should be processed.
+        :param error_policy: What should happen when an invalid item is encountered (see the StreamErrorPolicy enum).
+        :param max_length: If not None, 'InvalidInputDataExc' is raised as soon as the input data are found out to contain more items than this.
+        :return: An iterator yielding the output items.
+        :raises DatalidatorExc: The superclass of all exceptions raised by this library (either immediately or while iterating).
+        """
+
+        if self.get_filters() or self.get_validators():
+            raise InvalidBlueprintConfigError("Blueprints with filters or validators cannot process their input data as a stream!", self._tag)
+
+        if error_policy not in self.__class__.__SUPPORTED_STREAM_ERROR_POLICIES:
+            # This can happen only if the library is used incorrectly (not according to type annotations in this case)
+            raise ThisShouldNeverHappenError(
+                "The supplied stream error policy (of type '{}') is invalid: {}".format(error_policy.__class__.__name__, repr(error_policy)),
+                self._tag
+            )
+
+        if (max_length is not None) and (max_length < 0):
+            raise InvalidBlueprintConfigError("The maximum length must not be negative!", self._tag)
+
+        try:
+            input_data_iterator = self.__convert_input_data_for_current_mode(self.__get_iterator_of_input_data, input_data)
+        except (DatalidatorExc, DatalidatorError) as e:
+            raise e
+        except Exception as f:
+            raise self._generate_unexpected_exception_raised_in_blueprint_exc(f)
+
+        item_function = BlueprintCompiler().compile_to_function(self.__item_blueprint)
+
+        return self.__iterate_over_items(input_data, input_data_iterator, item_function, error_policy, max_length)
+
     def _get_allowed_output_data_types(self) -> Optional[Tuple[Type, ...]]:
         return list,
 
@@ -93,14 +199,198 @@ class ListBlueprint(DefaultBlueprintWithModeSupportImplBase[List[ListBlueprint_T
             self.__convert_input_data_to_list, self.__class__.__STRICT_MODE_DATA_TYPE_ALLOWLIST, input_data
         )
 
+    async def _parse_async(self, input_data: Any, async_use_context: AsyncUseContext) -> List[ListBlueprint_T]:
+        list_from_input_data = self.__convert_input_data_for_current_mode(self.__get_list_of_input_data, input_data)
+
+        if async_use_context.should_offload_to_executor(len(list_from_input_data)) and not self._does_blueprint_require_async_use(self.__item_blueprint):
+            # The list is parsed instead of the input data, as the input data might not be iterable more than once (e.g.
+            #  generators). The list is accepted in all parsing modes, and the '_parse()' method, unlike private
+            #  methods, can be pickled (if the executor runs it in another process).
+            return await async_use_context.run_in_executor(self._parse, list_from_input_data)
+
+        exc_factory_class = self._invalid_input_data_exc_factory.__class__
+        item_blueprint = self.__item_blueprint
+        use_item_blueprint_async = self._does_blueprint_benefit_from_async_use(item_blueprint)
+
+        output_list = []
+        item_exceptions: List[Tuple[str, DatalidatorExc]] = []
+        for item_index, item in enumerate(list_from_input_data):
+            if async_use_context.consume_item_budget():
+                await async_use_context.yield_to_event_loop()
+
+            # Recursive behaviour
+            try:
+                if use_item_blueprint_async:
+                    output_list.append(await self._use_blueprint_async(item_blueprint, item, async_use_context))
+                else:
+                    output_list.append(item_blueprint.use(item))
+            except DatalidatorExc as e:
+                if not self.__collect_item_exceptions:
+                    raise e
+
+                item_exceptions.extend(exc_factory_class.get_item_exceptions_with_path(exc_factory_class.get_list_item_path(item_index), e))
+
+        if item_exceptions:
+            raise self._invalid_input_data_exc_factory.generate_invalid_items_in_input_data_exc(item_exceptions, input_data)
+
+        return output_list
+
+    def _benefits_from_async_use(self) -> bool:
+        return True
+
+    def _requires_async_use(self) -> bool:
+        return DefaultBlueprintWithModeSupportImplBase._requires_async_use(self) or self._does_blueprint_require_async_use(self.__item_blueprint)
+
+    def _compile_parse(self, blueprint_compiler: BlueprintCompiler) -> Callable[[Any], List[ListBlueprint_T]]:
+        item_function = blueprint_compiler.compile_to_function(self.__item_blueprint)
+        data_conversion_helper = self._data_conversion_helper
+        parsing_mode = self.get_parsing_mode()
+
+        def convert_input_data_to_list(input_data: Any) -> List[ListBlueprint_T]:
+            return self.__convert_input_data_to_list_using_item_function(input_data, item_function)
+
+        if parsing_mode == ParsingMode.MODE_LOOSE:
+            return convert_input_data_to_list
+
+        if parsing_mode == ParsingMode.MODE_RATIONAL:
+            data_type_blocklist = self.__class__.__RATIONAL_MODE_DATA_TYPE_BLOCKLIST
+            return lambda input_data: data_conversion_helper.convert_input_with_data_type_blocklist(convert_input_data_to_list, data_type_blocklist, input_data)
+
+        if parsing_mode == ParsingMode.MODE_STRICT:
+            data_type_allowlist = self.__class__.__STRICT_MODE_DATA_TYPE_ALLOWLIST
+            return lambda input_data: data_conversion_helper.convert_input_with_data_type_allowlist(convert_input_data_to_list, data_type_allowlist, input_data)
+
+        return self._parse  # The parsing mode is invalid - the error will be raised when the compiled blueprint is used
+
     @final
     def __convert_input_data_to_list(self, input_data: Any) -> List[ListBlueprint_T]:
+        return self.__convert_input_data_to_list_using_item_function(input_data, self.__item_blueprint.use)
+
+    @final
+    def __convert_input_data_to_list_using_item_function(self, input_data: Any, item_function: Callable[[Any], ListBlueprint_T]) -> List[ListBlueprint_T]:
         # Convert the input data to list before iterating through it (to be able to reasonably catch exceptions related
         #  to invalid input data)
+        list_from_input_data = self.__get_list_of_input_data(input_data)
+
+        parallel_item_processing_helper = self.__parallel_item_processing_helper
+        if (parallel_item_processing_helper is not None) and parallel_item_processing_helper.should_process_items_in_parallel(len(list_from_input_data)):
+            return self.__run_items_through_item_blueprint_in_parallel(list_from_input_data, input_data, parallel_item_processing_helper)
+
+        # Apply the blueprint passed to the initializer (or the function it has been compiled into) to each item of the
+        #  list -> recursive behaviour
+        if self.__collect_item_exceptions:
+            return self.__run_items_through_item_function_and_collect_exceptions(list_from_input_data, input_data, item_function)
+
+        return [item_function(item) for item in list_from_input_data]
+
+    @final
+    def __run_items_through_item_function_and_collect_exceptions(self, list_from_input_data: List[Any], input_data: Any, item_function: Callable[[Any], ListBlueprint_T]) -> List[ListBlueprint_T]:
+        exc_factory_class = self._invalid_input_data_exc_factory.__class__
+
+        output_list = []
+        item_exceptions: List[Tuple[str, DatalidatorExc]] = []
+        for item_index, item in enumerate(list_from_input_data):
+            try:
+                output_list.append(item_function(item))
+            except DatalidatorExc as e:
+                item_exceptions.extend(exc_factory_class.get_item_exceptions_with_path(exc_factory_class.get_list_item_path(item_index), e))
+
+        if item_exceptions:
+            raise self._invalid_input_data_exc_factory.generate_invalid_items_in_input_data_exc(item_exceptions, input_data)
+
+        return output_list
+
+    @final
+    def __run_items_through_item_blueprint_in_parallel(self, list_from_input_data: List[Any], input_data: Any, parallel_item_processing_helper: ParallelItemProcessingHelper[ListBlueprint_T]) -> List[ListBlueprint_T]:
+        # The item blueprint itself is passed to the executor's tasks, as the function it may have been compiled into
+        #  cannot be pickled; both of them behave in the same way.
+        if not self.__collect_item_exceptions:
+            return parallel_item_processing_helper.use_blueprint_on_items(self.__item_blueprint, list_from_input_data)
+
+        exc_factory_class = self._invalid_input_data_exc_factory.__class__
+
+        output_list = []
+        item_exceptions: List[Tuple[str, DatalidatorExc]] = []
+        for item_index, item_result in enumerate(parallel_item_processing_helper.try_use_blueprint_on_items(self.__item_blueprint, list_from_input_data)):
+            if item_result.is_successful():
+                output_list.append(item_result.get_output())
+            else:
+                item_exceptions.extend(exc_factory_class.get_item_exceptions_with_path(exc_factory_class.get_list_item_path(item_index), item_result.get_exception()))
+
+        if item_exceptions:
+            raise self._invalid_input_data_exc_factory.generate_invalid_items_in_input_data_exc(item_exceptions, input_data)
+
+        return output_list
+
+    @final
+    def __convert_input_data_for_current_mode(self, converter_function: Callable[[Any], Any], input_data: Any) -> Any:
+        # Checks the input data according to the blueprint's parsing mode in the same way as the '_parse()' method does,
+        #  and passes them to 'converter_function' (which does not run the items through the item blueprint).
+        parsing_mode = self.get_parsing_mode()
+
+        if parsing_mode == ParsingMode.MODE_LOOSE:
+            return converter_function(input_data)
+
+        if parsing_mode == ParsingMode.MODE_RATIONAL:
+            return self._data_conversion_helper.convert_input_with_data_type_blocklist(
+                converter_function, self.__class__.__RATIONAL_MODE_DATA_TYPE_BLOCKLIST, input_data
+            )
+
+        if parsing_mode == ParsingMode.MODE_STRICT:
+            return self._data_conversion_helper.convert_input_with_data_type_allowlist(
+                converter_function, self.__class__.__STRICT_MODE_DATA_TYPE_ALLOWLIST, input_data
+            )
+
+        return converter_function(self._parse(input_data))  # The parsing mode is invalid - _parse() raises the appropriate error
+
+    @final
+    def __get_list_of_input_data(self, input_data: Any) -> List[Any]:
         try:
-            list_from_input_data = list(input_data)
+            return list(input_data)
         except Exception:
             raise self._invalid_input_data_exc_factory.generate_input_data_not_convertible_exc((list,), input_data)
 
-        # Apply the blueprint passed to the initializer to each item of the list -> recursive behaviour
-        return [self.__item_blueprint.use(item) for item in list_from_input_data]
+    @final
+    def __get_iterator_of_input_data(self, input_data: Any) -> Iterator[Any]:
+        try:
+            return iter(input_data)
+        except Exception:
+            raise self._invalid_input_data_exc_factory.generate_input_data_not_convertible_exc((list,), input_data)
+
+    @final
+    def __iterate_over_items(self, input_data: Any, input_data_iterator: Iterator[Any], item_function: Callable[[Any], ListBlueprint_T], error_policy: StreamErrorPolicy, max_length: Optional[int]) -> Iterator[ListBlueprint_T]:
+        exc_factory_class = self._invalid_input_data_exc_factory.__class__
+
+        item_exceptions: List[Tuple[str, DatalidatorExc]] = []
+        item_index = 0
+
+        while True:
+            try:
+                item = next(input_data_iterator)
+            except StopIteration:
+                break
+            except Exception:
+                # The same exception would be raised by the use() method if the input data failed to be converted to list
+                raise self._invalid_input_data_exc_factory.generate_input_data_not_convertible_exc((list,), input_data)
+
+            if (max_length is not None) and (item_index >= max_length):
+                raise self._invalid_input_data_exc_factory.generate_invalid_input_data_exc(
+                    "The input data contain more than {} item(s)!".format(max_length), input_data
+                )
+
+            if error_policy == StreamErrorPolicy.POLICY_STOP:
+                yield item_function(item)
+            else:
+                try:
+                    output_item = item_function(item)
+                except DatalidatorExc as e:
+                    if error_policy == StreamErrorPolicy.POLICY_COLLECT:
+                        item_exceptions.extend(exc_factory_class.get_item_exceptions_with_path(exc_factory_class.get_list_item_path(item_index), e))
+                else:
+                    # The item is yielded outside the 'try' block, so that exceptions thrown into the generator are not caught
+                    yield output_item
+
+            item_index += 1
+
+        if item_exceptions:
+            raise self._invalid_input_data_exc_factory.generate_invalid_items_in_input_data_exc(item_exceptions, input_data)
@@ -20,43 +20,58 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import final, Final, Any, Sequence, Type, Dict, Hashable, Union, Optional, Tuple
+from typing import final, Final, Any, Sequence, Type, Dict, Hashable, Union, Optional, Tuple, Callable, TYPE_CHECKING
 from datalidator.blueprints.BlueprintIface import BlueprintIface
+from datalidator.blueprints.AsyncUseContext import AsyncUseContext
 from datalidator.blueprints.DefaultBlueprintWithStandardFeaturesImplBase import DefaultBlueprintWithStandardFeaturesImplBase
 from datalidator.blueprints.extras.ObjectModel import ObjectModel
+from datalidator.blueprints.extras.SlottedObjectModel import SlottedObjectModel
 from datalidator.blueprints.extras.OptionalItemIface import OptionalItemIface
 from datalidator.blueprints.impl.PredefinedDictionaryBlueprint import PredefinedDictionaryBlueprint
 from datalidator.blueprints.exc.err.InvalidBlueprintConfigError import InvalidBlueprintConfigError
 from datalidator.filters.FilterIface import FilterIface
 from datalidator.validators.ValidatorIface import ValidatorIface
+if TYPE_CHECKING:  # The compiler module imports this module
+    from datalidator.blueprints.compiler.BlueprintCompiler import BlueprintCompiler
 
 
-__all__ = "ObjectBlueprint",
+__all__ = "ObjectBlueprint", "AnyObjectModel"
+AnyObjectModel = Union[ObjectModel, SlottedObjectModel]
 
 
-class ObjectBlueprint(DefaultBlueprintWithStandardFeaturesImplBase[ObjectModel]):
+class ObjectBlueprint(DefaultBlueprintWithStandardFeaturesImplBase[AnyObjectModel]):
     """
     INPUT:
     - any object convertible to 'dict' whose items conform to the initializer-provided 'object_model'
 
     OUTPUT:
-    - an instance of the initializer-provided subclass of 'ObjectModel'
+    - an instance of the initializer-provided subclass of 'ObjectModel' or 'SlottedObjectModel'
 
     NOTE: See this library's examples for usage information.
+
+    NOTE: Instances of 'SlottedObjectModel' subclasses take up considerably less memory than instances of 'ObjectModel'
+     subclasses, as they do not have a per-instance '__dict__'. Their slots are populated directly from the parsed
+     dictionary.
+
+    NOTE: If the 'collect_item_exceptions' initializer argument is True, the exceptions related to all the invalid
+     items are collected instead of the first one being raised (see PredefinedDictionaryBlueprint).
     """
 
-    __slots__ = "__object_model", "__ignore_input_keys_which_are_not_in_model", "__predefined_dictionary_blueprint"
+    __slots__ = "__object_model", "__ignore_input_keys_which_are_not_in_model", "__collect_item_exceptions", "__predefined_dictionary_blueprint", "__object_model_factory"
+    __TRANSIENT_SLOTS: Final[Tuple[str, ...]] = ("__object_model_factory",)  # Lambdas cannot be pickled
 
     def __init__(self,
-                 object_model: Type[ObjectModel],
+                 object_model: Type[AnyObjectModel],
                  ignore_input_keys_which_are_not_in_model: bool = True,
-                 filters: Sequence[FilterIface[ObjectModel]] = (),
-                 validators: Sequence[ValidatorIface[ObjectModel]] = (),
+                 filters: Sequence[FilterIface[AnyObjectModel]] = (),
+                 validators: Sequence[ValidatorIface[AnyObjectModel]] = (),
+                 collect_item_exceptions: bool = False,
                  tag: str = ""):
         DefaultBlueprintWithStandardFeaturesImplBase.__init__(self, filters, validators, tag)
 
-        self.__object_model: Final[Type[ObjectModel]] = object_model
+        self.__object_model: Final[Type[AnyObjectModel]] = object_model
         self.__ignore_input_keys_which_are_not_in_model: Final[bool] = ignore_input_keys_which_are_not_in_model
+        self.__collect_item_exceptions: Final[bool] = collect_item_exceptions
 
         # The ObjectBlueprint is a wrapper class which delegates most of its functionality to a PredefinedDictionaryBlueprint.
         self.__predefined_dictionary_blueprint: Final[PredefinedDictionaryBlueprint] = PredefinedDictionaryBlueprint(
@@ -64,18 +79,31 @@ class ObjectBlueprint(DefaultBlueprintWithStandardFeaturesImplBase[ObjectModel])
             ignore_unspecified_keys_in_input=ignore_input_keys_which_are_not_in_model,
             filters=(),  # Even if some default filters were added to the blueprint, they would not be used in this case.
             validators=(),  # Even if some default validators were added to the blueprint, they would not be used in this case.
+            collect_item_exceptions=collect_item_exceptions,
             tag=self._tag
         )
+        self.__initialize_transient_slots()
 
     @final
-    def __generate_dict_specification_from_object_model(self, object_model: Type[ObjectModel]) -> Dict[Hashable, Union[BlueprintIface[Any], OptionalItemIface[Any]]]:
-        dict_specification = {}
+    def __initialize_transient_slots(self) -> None:
+        self.__object_model_factory: Final[Callable[[Dict[Hashable, Any]], AnyObjectModel]] = self.__get_object_model_factory(self.__object_model)
 
-        for property_name, property_value in object_model.__dict__.items():
-            if property_name.startswith("_") or not isinstance(property_value, (BlueprintIface, OptionalItemIface)):
-                continue
+    @final
+    def __get_object_model_factory(self, object_model: Type[AnyObjectModel]) -> Callable[[Dict[Hashable, Any]], AnyObjectModel]:
+        # Returns a function which creates an instance of the object model from the dictionary parsed by the
+        #  PredefinedDictionaryBlueprint
+        if issubclass(object_model, SlottedObjectModel):
+            return object_model._from_dict
 
-            dict_specification[property_name] = property_value
+        return lambda parsed_dict: object_model(**parsed_dict)
+
+    @final
+    def __generate_dict_specification_from_object_model(self, object_model: Type[AnyObjectModel]) -> Dict[Hashable, Union[BlueprintIface[Any], OptionalItemIface[Any]]]:
+        if issubclass(object_model, SlottedObjectModel):
+            # The metaclass removes the blueprints from the class's namespace, as they would conflict with the slots
+            dict_specification = dict(object_model._get_field_specification())
+        else:
+            dict_specification = self.__get_dict_specification_from_object_model_namespace(object_model)
 
         if len(dict_specification) == 0:
             # It does not matter whether the object model has no blueprints in it to this class. The error is raised here
@@ -88,18 +116,55 @@ class ObjectBlueprint(DefaultBlueprintWithStandardFeaturesImplBase[ObjectModel])
         return dict_specification
 
     @final
-    def get_object_model(self) -> Type[ObjectModel]:
+    def __get_dict_specification_from_object_model_namespace(self, object_model: Type[ObjectModel]) -> Dict[Hashable, Union[BlueprintIface[Any], OptionalItemIface[Any]]]:
+        dict_specification = {}
+
+        for property_name, property_value in object_model.__dict__.items():
+            if property_name.startswith("_") or not isinstance(property_value, (BlueprintIface, OptionalItemIface)):
+                continue
+
+            dict_specification[property_name] = property_value
+
+        return dict_specification
+
+    @final
+    def get_object_model(self) -> Type[AnyObjectModel]:
         return self.__object_model
 
     @final
     def are_input_keys_which_are_not_in_model_ignored(self) -> bool:
         return self.__ignore_input_keys_which_are_not_in_model
 
+    @final
+    def are_item_exceptions_collected(self) -> bool:
+        return self.__collect_item_exceptions
+
+    @final
+    def get_dict_specification(self) -> Dict[Hashable, Union[BlueprintIface[Any], OptionalItemIface[Any]]]:
+        return self.__predefined_dictionary_blueprint.get_dict_specification()
+
     def _get_allowed_output_data_types(self) -> Optional[Tuple[Type, ...]]:
-        # An instance of the initializer-provided *subclass of* ObjectModel is returned by this blueprint; therefore, the check would not pass
+        # An instance of the initializer-provided *subclass of* ObjectModel (or SlottedObjectModel) is returned by this blueprint; therefore, the check would not pass
         return None
 
-    def _parse(self, input_data: Any) -> ObjectModel:
+    def _parse(self, input_data: Any) -> AnyObjectModel:
         parsed_dict = self.__predefined_dictionary_blueprint.use(input_data)
 
-        return self.__object_model(**parsed_dict)
+        return self.__object_model_factory(parsed_dict)
+
+    async def _parse_async(self, input_data: Any, async_use_context: AsyncUseContext) -> AnyObjectModel:
+        parsed_dict = await self._use_blueprint_async(self.__predefined_dictionary_blueprint, input_data, async_use_context)
+
+        return self.__object_model_factory(parsed_dict)
+
+    def _benefits_from_async_use(self) -> bool:
+        return True
+
+    def _requires_async_use(self) -> bool:
+        return DefaultBlueprintWithStandardFeaturesImplBase._requires_async_use(self) or self._does_blueprint_require_async_use(self.__predefined_dictionary_blueprint)
+
+    def _compile_parse(self, blueprint_compiler: "BlueprintCompiler") -> Callable[[Any], AnyObjectModel]:
+        predefined_dictionary_function = blueprint_compiler.compile_to_function(self.__predefined_dictionary_blueprint)
+        object_model_factory = self.__object_model_factory
+
+        return lambda input_data: object_model_factory(predefined_dictionary_function(input_data))
@@ -20,12 +20,17 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import final, Final, Dict, Any, Hashable, Sequence, Union, Optional, Tuple, Type
+from typing import final, Final, Dict, Any, Hashable, Sequence, List, Union, Optional, Tuple, Type, Callable, FrozenSet, Iterable, TYPE_CHECKING
+from datalidator.exc.DatalidatorExc import DatalidatorExc
 from datalidator.blueprints.BlueprintIface import BlueprintIface
+from datalidator.blueprints.AsyncUseContext import AsyncUseContext
 from datalidator.blueprints.DefaultBlueprintWithStandardFeaturesImplBase import DefaultBlueprintWithStandardFeaturesImplBase
 from datalidator.blueprints.extras.OptionalItemIface import OptionalItemIface
+from datalidator.blueprints.exc.InvalidInputDataExc import InvalidInputDataExc
 from datalidator.filters.FilterIface import FilterIface
 from datalidator.validators.ValidatorIface import ValidatorIface
+if TYPE_CHECKING:  # The compiler module imports this module
+    from datalidator.blueprints.compiler.BlueprintCompiler import BlueprintCompiler
 
 
 __all__ = "PredefinedDictionaryBlueprint",
@@ -40,20 +45,33 @@ class PredefinedDictionaryBlueprint(DefaultBlueprintWithStandardFeaturesImplBase
     - 'dict' object with heterogeneous items that were run through blueprints in the initializer-provided 'dict_specification'
 
     NOTE: See this library's examples for usage information.
+
+    NOTE: Input data whose type is exactly 'dict' are not copied - their items are only looked up. Other input data
+     are converted to a new 'dict' object first.
+
+    NOTE: By default, the exception related to the first invalid item is raised. If the 'collect_item_exceptions'
+     initializer argument is True, all the items are processed instead, and a single 'InvalidItemsInInputDataExc'
+     exception containing the exceptions related to all the invalid, missing and unspecified items (paired with the
+     items' paths, e.g. 'address.zip') is raised.
     """
 
-    __slots__ = "__dict_specification", "__ignore_unspecified_keys_in_input"
+    __slots__ = "__dict_specification", "__ignore_unspecified_keys_in_input", "__collect_item_exceptions", "__specified_keys", "__item_functions", "__async_item_functions"
 
     def __init__(self,
                  dict_specification: Dict[Hashable, Union[BlueprintIface[Any], OptionalItemIface[Any]]],
                  ignore_unspecified_keys_in_input: bool = True,
                  filters: Sequence[FilterIface[Dict[Hashable, Any]]] = (),
                  validators: Sequence[ValidatorIface[Dict[Hashable, Any]]] = (),
+                 collect_item_exceptions: bool = False,
                  tag: str = ""):
         DefaultBlueprintWithStandardFeaturesImplBase.__init__(self, filters, validators, tag)
 
         self.__dict_specification: Final[Dict[Hashable, Union[BlueprintIface[Any], OptionalItemIface[Any]]]] = dict_specification.copy()
         self.__ignore_unspecified_keys_in_input: Final[bool] = ignore_unspecified_keys_in_input
+        self.__collect_item_exceptions: Final[bool] = collect_item_exceptions
+        self.__specified_keys: Final[FrozenSet[Hashable]] = frozenset(self.__dict_specification.keys())
+        self.__item_functions: Final[Tuple[Tuple[Hashable, Optional[OptionalItemIface[Any]], Callable[[Any], Any]], ...]] = self.__get_item_functions(lambda blueprint: blueprint.use)
+        self.__async_item_functions: Final[Tuple[Tuple[Hashable, Optional[OptionalItemIface[Any]], Callable[[Any], Any], Optional[BlueprintIface[Any]]], ...]] = self.__get_async_item_functions()
 
     @final
     def get_dict_specification(self) -> Dict[Hashable, Union[BlueprintIface[Any], OptionalItemIface[Any]]]:
@@ -63,27 +81,176 @@ class PredefinedDictionaryBlueprint(DefaultBlueprintWithStandardFeaturesImplBase
     def are_unspecified_keys_in_input_ignored(self) -> bool:
         return self.__ignore_unspecified_keys_in_input
 
+    @final
+    def are_item_exceptions_collected(self) -> bool:
+        return self.__collect_item_exceptions
+
     def _get_allowed_output_data_types(self) -> Optional[Tuple[Type, ...]]:
         return dict,
 
     def _parse(self, input_data: Any) -> Dict[Hashable, Any]:
+        return self.__parse_using_item_functions(input_data, self.__item_functions)
+
+    async def _parse_async(self, input_data: Any, async_use_context: AsyncUseContext) -> Dict[Hashable, Any]:
+        # Plain dictionaries are not copied, in the same way as in the '_parse()' method. Control may be yielded to the
+        #  event loop while the items are processed, so the input dictionary's keys are not compared with the specified
+        #  keys until all the items have been processed.
+        if input_data.__class__ is dict:
+            dict_from_input_data = None
+            get_input_value = input_data.__getitem__
+        else:
+            dict_from_input_data = self.__convert_input_data_to_dict(input_data)
+            get_input_value = dict_from_input_data.pop  # The keys which are present in the dict specification are removed from the input dictionary
+
+        exc_factory_class = self._invalid_input_data_exc_factory.__class__
+        item_exceptions = self.__get_item_exception_list()
+
+        output_dict = {}
+        for key, optional_item_specification, item_function, async_item_blueprint in self.__async_item_functions:
+            if async_use_context.consume_item_budget():
+                await async_use_context.yield_to_event_loop()
+
+            try:
+                if async_item_blueprint is not None:
+                    output_value = await self.__handle_item_from_input_data_async(key, optional_item_specification, async_item_blueprint, get_input_value, input_data, async_use_context)
+                elif optional_item_specification is not None:
+                    output_value = self.__handle_optional_item_from_input_data(key, optional_item_specification, item_function, get_input_value)
+                else:
+                    output_value = self.__handle_mandatory_item_from_input_data(key, item_function, get_input_value, input_data)
+            except DatalidatorExc as e:
+                if item_exceptions is None:
+                    raise e
+
+                item_exceptions.extend(exc_factory_class.get_item_exceptions_with_path(exc_factory_class.get_dict_item_path(key), e))
+            else:
+                output_dict[key] = output_value
+
+        if not self.__ignore_unspecified_keys_in_input:
+            if dict_from_input_data is None:
+                specified_keys = self.__specified_keys
+                unspecified_keys = [key for key in input_data.keys() if key not in specified_keys]
+            else:
+                unspecified_keys = list(dict_from_input_data.keys())
+
+            if unspecified_keys:
+                self.__handle_unspecified_keys_in_input(unspecified_keys, input_data, item_exceptions)
+
+        if item_exceptions:
+            raise self._invalid_input_data_exc_factory.generate_invalid_items_in_input_data_exc(item_exceptions, input_data)
+
+        return output_dict
+
+    def _benefits_from_async_use(self) -> bool:
+        return True
+
+    def _requires_async_use(self) -> bool:
+        return DefaultBlueprintWithStandardFeaturesImplBase._requires_async_use(self) or any(
+            self._does_blueprint_require_async_use(async_item_blueprint) for _, _, _, async_item_blueprint in self.__async_item_functions if async_item_blueprint is not None
+        )
+
+    def _compile_parse(self, blueprint_compiler: "BlueprintCompiler") -> Callable[[Any], Dict[Hashable, Any]]:
+        item_functions = self.__get_item_functions(blueprint_compiler.compile_to_function)
+
+        return lambda input_data: self.__parse_using_item_functions(input_data, item_functions)
+
+    @final
+    def __get_item_functions(self, blueprint_to_function: Callable[[BlueprintIface[Any]], Callable[[Any], Any]]) -> Tuple[Tuple[Hashable, Optional[OptionalItemIface[Any]], Callable[[Any], Any]], ...]:
+        # Returns a tuple of (key, optional item specifier or None if the item is mandatory, item function) tuples,
+        #  where the item functions are either the use() methods of the blueprints in the dict specification, or the
+        #  functions they have been compiled into.
+        item_functions = []
+
+        for key, specification in self.__dict_specification.items():
+            if isinstance(specification, OptionalItemIface):
+                item_functions.append((key, specification, blueprint_to_function(specification.get_wrapped_blueprint())))
+            else:
+                item_functions.append((key, None, blueprint_to_function(specification)))
+
+        return tuple(item_functions)
+
+    @final
+    def __get_async_item_functions(self) -> Tuple[Tuple[Hashable, Optional[OptionalItemIface[Any]], Callable[[Any], Any], Optional[BlueprintIface[Any]]], ...]:
+        # Returns the item functions (see __get_item_functions()) extended with the blueprints which should be used
+        #  asynchronously when this blueprint is used via the use_async() method, or None for the blueprints which do
+        #  not benefit from it. This is decided only once, as it depends only on the blueprints' configuration.
+        async_item_functions = []
+
+        for key, optional_item_specification, item_function in self.__item_functions:
+            if optional_item_specification is not None:
+                item_blueprint = optional_item_specification.get_wrapped_blueprint()
+            else:
+                item_blueprint = self.__dict_specification[key]
+
+            async_item_blueprint = (item_blueprint if self._does_blueprint_benefit_from_async_use(item_blueprint) else None)
+            async_item_functions.append((key, optional_item_specification, item_function, async_item_blueprint))
+
+        return tuple(async_item_functions)
+
+    @final
+    def __parse_using_item_functions(self, input_data: Any, item_functions: Tuple[Tuple[Hashable, Optional[OptionalItemIface[Any]], Callable[[Any], Any]], ...]) -> Dict[Hashable, Any]:
+        if input_data.__class__ is dict:
+            return self.__parse_dict_using_item_functions(input_data, item_functions)
+
         dict_from_input_data = self.__convert_input_data_to_dict(input_data)
+        item_exceptions = self.__get_item_exception_list()
 
         # The keys which are present in the dict specification are removed from the input dictionary, if they are found there!
         # This behaviour is made use of when checking whether there are unspecified keys in the input dictionary.
-        parsed_data = self.__handle_input_data_according_to_specification(dict_from_input_data, input_data)
+        parsed_data = self.__handle_input_data_according_to_specification(dict_from_input_data.pop, input_data, item_functions, item_exceptions)
 
         # Check if there are unspecified keys in the input dictionary, if required:
         if not self.__ignore_unspecified_keys_in_input and len(dict_from_input_data) != 0:
-            raise self._invalid_input_data_exc_factory.generate_invalid_input_data_exc(
-                "There are keys in the input dictionary which are not specified in the dictionary specification: {}".format(
-                    self._invalid_input_data_exc_factory.__class__.get_single_string_representation_of_values(dict_from_input_data.keys())
-                ),
-                input_data
-            )
+            self.__handle_unspecified_keys_in_input(dict_from_input_data.keys(), input_data, item_exceptions)
+
+        if item_exceptions:
+            raise self._invalid_input_data_exc_factory.generate_invalid_items_in_input_data_exc(item_exceptions, input_data)
+
+        return parsed_data
+
+    @final
+    def __parse_dict_using_item_functions(self, input_data: Dict[Hashable, Any], item_functions: Tuple[Tuple[Hashable, Optional[OptionalItemIface[Any]], Callable[[Any], Any]], ...]) -> Dict[Hashable, Any]:
+        # Plain dictionaries do not need to be copied, as their items are only looked up and the input dictionary is
+        #  not mutated in any way; unspecified keys are detected by comparing the input dictionary's keys with the
+        #  precomputed set of specified keys instead.
+        item_exceptions = self.__get_item_exception_list()
+        parsed_data = self.__handle_input_data_according_to_specification(input_data.__getitem__, input_data, item_functions, item_exceptions)
+
+        if not self.__ignore_unspecified_keys_in_input and not (input_data.keys() <= self.__specified_keys):
+            specified_keys = self.__specified_keys
+            self.__handle_unspecified_keys_in_input([key for key in input_data.keys() if key not in specified_keys], input_data, item_exceptions)
+
+        if item_exceptions:
+            raise self._invalid_input_data_exc_factory.generate_invalid_items_in_input_data_exc(item_exceptions, input_data)
 
         return parsed_data
 
+    @final
+    def __get_item_exception_list(self) -> Optional[List[Tuple[str, DatalidatorExc]]]:
+        # The exceptions related to the input dictionary's items are collected into the returned list, if required;
+        #  otherwise, None is returned and the first of the exceptions is raised immediately.
+        if self.__collect_item_exceptions:
+            return []
+
+        return None
+
+    @final
+    def __handle_unspecified_keys_in_input(self, unspecified_keys: Iterable[Hashable], input_data: Any, item_exceptions: Optional[List[Tuple[str, DatalidatorExc]]]) -> None:
+        if item_exceptions is None:
+            raise self.__generate_unspecified_keys_in_input_exc(unspecified_keys, input_data)
+
+        exc_factory_class = self._invalid_input_data_exc_factory.__class__
+        for key in unspecified_keys:
+            item_exceptions.append((exc_factory_class.get_dict_item_path(key), self.__generate_unspecified_keys_in_input_exc((key,), input_data)))
+
+    @final
+    def __generate_unspecified_keys_in_input_exc(self, unspecified_keys: Iterable[Hashable], input_data: Any) -> InvalidInputDataExc:
+        return self._invalid_input_data_exc_factory.generate_invalid_input_data_exc(
+            "There are keys in the input dictionary which are not specified in the dictionary specification: {}".format(
+                self._invalid_input_data_exc_factory.__class__.get_single_string_representation_of_values(unspecified_keys)
+            ),
+            input_data
+        )
+
     @final
     def __convert_input_data_to_dict(self, input_data: Any) -> Dict[Hashable, Any]:
         try:
@@ -92,36 +259,74 @@ class PredefinedDictionaryBlueprint(DefaultBlueprintWithStandardFeaturesImplBase
             raise self._invalid_input_data_exc_factory.generate_input_data_not_convertible_exc((dict,), input_data)
 
     @final
-    def __handle_input_data_according_to_specification(self, dict_from_input_data: Dict[Hashable, Any], input_data: Any) -> Dict[Hashable, Any]:
+    def __handle_input_data_according_to_specification(self, get_input_value: Callable[[Hashable], Any], input_data: Any, item_functions: Tuple[Tuple[Hashable, Optional[OptionalItemIface[Any]], Callable[[Any], Any]], ...], item_exceptions: Optional[List[Tuple[str, DatalidatorExc]]]) -> Dict[Hashable, Any]:
+        if item_exceptions is not None:
+            return self.__handle_input_data_according_to_specification_and_collect_exceptions(get_input_value, input_data, item_functions, item_exceptions)
+
         output_dict = {}
 
-        for key, specification in self.__dict_specification.items():
-            if isinstance(specification, OptionalItemIface):
-                output_value = self.__handle_optional_item_from_input_data(key, specification, dict_from_input_data)
+        for key, optional_item_specification, item_function in item_functions:
+            if optional_item_specification is not None:
+                output_value = self.__handle_optional_item_from_input_data(key, optional_item_specification, item_function, get_input_value)
             else:
-                output_value = self.__handle_mandatory_item_from_input_data(key, specification, dict_from_input_data, input_data)
+                output_value = self.__handle_mandatory_item_from_input_data(key, item_function, get_input_value, input_data)
 
             output_dict[key] = output_value
 
         return output_dict
 
     @final
-    def __handle_optional_item_from_input_data(self, key: Hashable, specification: OptionalItemIface, dict_from_input_data: Dict[Hashable, Any]) -> Any:
+    def __handle_input_data_according_to_specification_and_collect_exceptions(self, get_input_value: Callable[[Hashable], Any], input_data: Any, item_functions: Tuple[Tuple[Hashable, Optional[OptionalItemIface[Any]], Callable[[Any], Any]], ...], item_exceptions: List[Tuple[str, DatalidatorExc]]) -> Dict[Hashable, Any]:
+        exc_factory_class = self._invalid_input_data_exc_factory.__class__
+
+        output_dict = {}
+
+        for key, optional_item_specification, item_function in item_functions:
+            try:
+                if optional_item_specification is not None:
+                    output_value = self.__handle_optional_item_from_input_data(key, optional_item_specification, item_function, get_input_value)
+                else:
+                    output_value = self.__handle_mandatory_item_from_input_data(key, item_function, get_input_value, input_data)
+            except DatalidatorExc as e:
+                item_exceptions.extend(exc_factory_class.get_item_exceptions_with_path(exc_factory_class.get_dict_item_path(key), e))
+            else:
+                output_dict[key] = output_value
+
+        return output_dict
+
+    @final
+    def __handle_optional_item_from_input_data(self, key: Hashable, specification: OptionalItemIface, item_function: Callable[[Any], Any], get_input_value: Callable[[Hashable], Any]) -> Any:
         try:
-            raw_input_value = dict_from_input_data.pop(key)  # The key is removed from the input dictionary, if it is found there.
+            raw_input_value = get_input_value(key)  # If the input dictionary is a copy, the key is removed from it, if it is found there.
         except KeyError:
             return specification.get_default_value()
         else:
-            return specification.get_wrapped_blueprint().use(raw_input_value)
+            return item_function(raw_input_value)
 
     @final
-    def __handle_mandatory_item_from_input_data(self, key: Hashable, specification: BlueprintIface[Any], dict_from_input_data: Dict[Hashable, Any], input_data: Any) -> Any:
+    def __handle_mandatory_item_from_input_data(self, key: Hashable, item_function: Callable[[Any], Any], get_input_value: Callable[[Hashable], Any], input_data: Any) -> Any:
         try:
-            raw_input_value = dict_from_input_data.pop(key)  # The key is removed from the input dictionary, if it is found there.
+            raw_input_value = get_input_value(key)  # If the input dictionary is a copy, the key is removed from it, if it is found there.
         except KeyError:
-            raise self._invalid_input_data_exc_factory.generate_invalid_input_data_exc(
-                "The input dictionary does not contain the following mandatory key: {}".format(repr(key)),
-                input_data
-            )
+            raise self.__generate_missing_mandatory_key_exc(key, input_data)
         else:
-            return specification.use(raw_input_value)
+            return item_function(raw_input_value)
+
+    @final
+    async def __handle_item_from_input_data_async(self, key: Hashable, optional_item_specification: Optional[OptionalItemIface[Any]], item_blueprint: BlueprintIface[Any], get_input_value: Callable[[Hashable], Any], input_data: Any, async_use_context: AsyncUseContext) -> Any:
+        try:
+            raw_input_value = get_input_value(key)  # If the input dictionary is a copy, the key is removed from it, if it is found there.
+        except KeyError:
+            if optional_item_specification is not None:
+                return optional_item_specification.get_default_value()
+
+            raise self.__generate_missing_mandatory_key_exc(key, input_data)
+        else:
+            return await self._use_blueprint_async(item_blueprint, raw_input_value, async_use_context)
+
+    @final
+    def __generate_missing_mandatory_key_exc(self, key: Hashable, input_data: Any) -> InvalidInputDataExc:
+        return self._invalid_input_data_exc_factory.generate_invalid_input_data_exc(
+            "The input dictionary does not contain the following mandatory key: {}".format(repr(key)),
+            input_data
+        )
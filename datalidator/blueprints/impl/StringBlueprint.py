@@ -27,7 +27,10 @@ import urllib.parse
 import uuid
 from datalidator.exc.err.ThisShouldNeverHappenError import ThisShouldNeverHappenError
 from datalidator.blueprints.DefaultBlueprintWithModeSupportImplBase import DefaultBlueprintWithModeSupportImplBase
+from datalidator.blueprints.DataTypeDispatchTable import DataTypeDispatchTable
 from datalidator.blueprints.ParsingMode import ParsingMode
+from datalidator.blueprints.extras.UseResult import UseResult
+from datalidator.blueprints.exc.InvalidInputDataExc import InvalidInputDataExc
 from datalidator.filters.FilterIface import FilterIface
 from datalidator.validators.ValidatorIface import ValidatorIface
 
@@ -66,7 +69,8 @@ class StringBlueprint(DefaultBlueprintWithModeSupportImplBase[str]):
     - 'str' object
     """
 
-    __slots__ = "__bytes_encoding", "__datetime_string_format", "__date_string_format", "__time_string_format"
+    __slots__ = "__bytes_encoding", "__datetime_string_format", "__date_string_format", "__time_string_format", "__rational_mode_dispatch_table"
+    __TRANSIENT_SLOTS: Final[Tuple[str, ...]] = ("__rational_mode_dispatch_table",)
 
     _DEFAULT_BYTES_ENCODING: Final[str] = "utf-8"
 
@@ -86,6 +90,19 @@ class StringBlueprint(DefaultBlueprintWithModeSupportImplBase[str]):
         self.__date_string_format: Final[Optional[str]] = date_string_format
         self.__time_string_format: Final[Optional[str]] = time_string_format
 
+        self.__initialize_transient_slots()
+
+    @final
+    def __initialize_transient_slots(self) -> None:
+        # The dispatch table contains bound private methods of this blueprint, which cannot be pickled. The methods return
+        #  the exceptions instead of raising them, so that the table can be used by both _parse() and _try_parse().
+        self.__rational_mode_dispatch_table: Final[DataTypeDispatchTable[Union[str, InvalidInputDataExc]]] = DataTypeDispatchTable((
+            ((urllib.parse.ParseResult,), self.__convert_parsed_url_to_str),
+            ((datetime.datetime, datetime.date, datetime.time), self.__convert_datetime_like_object_to_str),
+            ((bytes, bytearray), self.__convert_bytes_to_str),
+            ((type(None), str, bool, int, float, complex, ipaddress.IPv4Address, ipaddress.IPv6Address, ipaddress.IPv4Network, ipaddress.IPv6Network, uuid.UUID), self.__perform_generic_conversion_to_str_without_raising),
+        ))
+
     @classmethod
     @final
     def get_default_bytes_encoding(cls) -> str:
@@ -114,21 +131,28 @@ class StringBlueprint(DefaultBlueprintWithModeSupportImplBase[str]):
         return self.__perform_generic_conversion_to_str(input_data)
 
     def _parse_in_rational_mode(self, input_data: Any) -> str:
-        return self._data_conversion_helper.convert_input_using_per_data_type_converter_functions(
-            (
-                ((urllib.parse.ParseResult,), self.__convert_parsed_url_to_str),
-                ((datetime.datetime, datetime.date, datetime.time), self.__convert_datetime_like_object_to_str),
-                ((bytes, bytearray), self.__convert_bytes_to_str),
-                ((type(None), str, bool, int, float, complex, ipaddress.IPv4Address, ipaddress.IPv6Address, ipaddress.IPv4Network, ipaddress.IPv6Network, uuid.UUID), self.__perform_generic_conversion_to_str),
-            ),
-            input_data
-        )
+        output_data = self._data_conversion_helper.convert_input_using_data_type_dispatch_table(self.__rational_mode_dispatch_table, input_data)
+        if isinstance(output_data, BaseException):  # = InvalidInputDataExc (see DataConversionHelper.try_convert_input())
+            raise output_data
+
+        return output_data
 
     def _parse_in_strict_mode(self, input_data: Any) -> str:
         return self._data_conversion_helper.convert_input_with_data_type_allowlist(
             self.__perform_generic_conversion_to_str, (str,), input_data
         )
 
+    def _try_parse_in_loose_mode(self, input_data: Any) -> UseResult[str]:
+        return self._data_conversion_helper.try_convert_input(self.__perform_generic_conversion_to_str_without_raising, input_data)
+
+    def _try_parse_in_rational_mode(self, input_data: Any) -> UseResult[str]:
+        return self._data_conversion_helper.try_convert_input_using_data_type_dispatch_table(self.__rational_mode_dispatch_table, input_data)
+
+    def _try_parse_in_strict_mode(self, input_data: Any) -> UseResult[str]:
+        return self._data_conversion_helper.try_convert_input_with_data_type_allowlist(
+            self.__perform_generic_conversion_to_str_without_raising, (str,), input_data
+        )
+
     @final
     def __perform_generic_conversion_to_str(self, input_data: Any) -> str:
         try:
@@ -137,14 +161,22 @@ class StringBlueprint(DefaultBlueprintWithModeSupportImplBase[str]):
             raise self._invalid_input_data_exc_factory.generate_input_data_not_convertible_exc((str,), input_data)
 
     @final
-    def __convert_bytes_to_str(self, input_data: Union[bytes, bytearray]) -> str:
+    def __perform_generic_conversion_to_str_without_raising(self, input_data: Any) -> Union[str, InvalidInputDataExc]:
+        # The conversion is too simple to be shared with the method above at the cost of an additional function call
+        try:
+            return str(input_data)
+        except Exception:
+            return self._invalid_input_data_exc_factory.generate_input_data_not_convertible_exc((str,), input_data)
+
+    @final
+    def __convert_bytes_to_str(self, input_data: Union[bytes, bytearray]) -> Union[str, InvalidInputDataExc]:
         try:
             return input_data.decode(self.__bytes_encoding, "strict")
         except Exception:
-            raise self._invalid_input_data_exc_factory.generate_input_data_not_convertible_exc((str,), input_data)
+            return self._invalid_input_data_exc_factory.generate_input_data_not_convertible_exc((str,), input_data)
 
     @final
-    def __convert_datetime_like_object_to_str(self, input_data: Union[datetime.datetime, datetime.date, datetime.time]) -> str:
+    def __convert_datetime_like_object_to_str(self, input_data: Union[datetime.datetime, datetime.date, datetime.time]) -> Union[str, InvalidInputDataExc]:
         # "if-elif cascade" must be used due to the need of using isinstance() (a simple dict() mapping or similar methods would not be able to detect subclasses)
         if isinstance(input_data, datetime.datetime):  # datetime.datetime is a subclass of datetime.date, so it must be checked prior to datetime.date!
             string_format = self.__datetime_string_format
@@ -153,7 +185,7 @@ class StringBlueprint(DefaultBlueprintWithModeSupportImplBase[str]):
         elif isinstance(input_data, datetime.time):
             string_format = self.__time_string_format
         else:
-            # This should never happen, as the convert_input_using_per_data_type_converter_functions() function is used to call this method.
+            # This should never happen, as the convert_input_using_data_type_dispatch_table() function is used to call this method.
             raise ThisShouldNeverHappenError(
                 "The data type of the '{}' method's input data must be one of these: {}, not '{}'!".format(
                     self.__convert_datetime_like_object_to_str.__name__,
@@ -170,17 +202,17 @@ class StringBlueprint(DefaultBlueprintWithModeSupportImplBase[str]):
             return input_data.strftime(string_format)
 
         except Exception:
-            raise self._invalid_input_data_exc_factory.generate_input_data_not_convertible_exc((str,), input_data)
+            return self._invalid_input_data_exc_factory.generate_input_data_not_convertible_exc((str,), input_data)
 
     @final
-    def __convert_parsed_url_to_str(self, input_data: urllib.parse.ParseResult) -> str:
+    def __convert_parsed_url_to_str(self, input_data: urllib.parse.ParseResult) -> Union[str, InvalidInputDataExc]:
         try:
             output_string = urllib.parse.urlunparse(input_data)
         except Exception:
-            raise self._invalid_input_data_exc_factory.generate_input_data_not_convertible_exc((str,), input_data)
+            return self._invalid_input_data_exc_factory.generate_input_data_not_convertible_exc((str,), input_data)
 
         if isinstance(output_string, str):
             return str(output_string)  # Possibly unsubclass the output string
 
         # urllib.parse.ParseResultBytes is a subclass of ParseResult, and when passed to urlunparse(), it returns a bytes object!
-        raise self._invalid_input_data_exc_factory.generate_input_data_not_convertible_exc((str,), input_data)
+        return self._invalid_input_data_exc_factory.generate_input_data_not_convertible_exc((str,), input_data)
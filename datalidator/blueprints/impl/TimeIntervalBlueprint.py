@@ -24,6 +24,9 @@ from typing import final, Final, Any, Union, Dict, Tuple, Optional, Sequence, Ty
 import math
 import re
 from datalidator.blueprints.DefaultBlueprintWithStandardFeaturesImplBase import DefaultBlueprintWithStandardFeaturesImplBase
+from datalidator.blueprints.DataTypeDispatchTable import DataTypeDispatchTable
+from datalidator.filters.FilterIface import FilterIface
+from datalidator.validators.ValidatorIface import ValidatorIface
 
 
 __all__ = "TimeIntervalBlueprint",
@@ -54,7 +57,8 @@ class TimeIntervalBlueprint(DefaultBlueprintWithStandardFeaturesImplBase[float])
      things like connection timeout, login token validity duration, password validity duration, etc.
     """
 
-    __slots__ = ()
+    __slots__ = "__dispatch_table",
+    __TRANSIENT_SLOTS: Final[Tuple[str, ...]] = ("__dispatch_table",)
 
     # THIS DICTIONARY MUST NOT BE MUTATED!!!
     __FORMATTED_STRING_UNIT_SPECIFIERS: Final[Dict[str, Tuple[float, Optional[int]]]] = {
@@ -92,18 +96,25 @@ class TimeIntervalBlueprint(DefaultBlueprintWithStandardFeaturesImplBase[float])
         "years": (31536000., None)
     }
 
+    def __init__(self, filters: Sequence[FilterIface[float]] = (), validators: Sequence[ValidatorIface[float]] = (), tag: str = ""):
+        DefaultBlueprintWithStandardFeaturesImplBase.__init__(self, filters, validators, tag)
+
+        self.__initialize_transient_slots()
+
+    @final
+    def __initialize_transient_slots(self) -> None:
+        # The dispatch table contains bound private methods of this blueprint, which cannot be pickled
+        self.__dispatch_table: Final[DataTypeDispatchTable[float]] = DataTypeDispatchTable((
+            ((str,), self.__convert_str_to_interval),
+            ((int, float), self.__convert_number_to_interval)
+        ))
+
     def _get_allowed_output_data_types(self) -> Optional[Tuple[Type, ...]]:
         return float,
 
     # Can parse: number of seconds as int, float or str; human-readable string (e.g. "7d 23h 10min 1s 50ms")
     def _parse(self, input_data: Any) -> float:
-        numeric_interval = self._data_conversion_helper.convert_input_using_per_data_type_converter_functions(
-            (
-                ((str,), self.__convert_str_to_interval),
-                ((int, float), self.__convert_number_to_interval)
-            ),
-            input_data
-        )
+        numeric_interval = self._data_conversion_helper.convert_input_using_data_type_dispatch_table(self.__dispatch_table, input_data)
 
         return self.__check_output_interval(numeric_interval, input_data)
 
@@ -0,0 +1,52 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from typing import final
+from datalidator.blueprints.jsonbackends.JSONBackendIface import JSONBackendIface
+from datalidator.blueprints.jsonbackends.impl.StandardLibraryJSONBackend import StandardLibraryJSONBackend
+
+
+__all__ = "DefaultJSONBackend",
+
+
+@final
+class DefaultJSONBackend:
+    """
+    Holds the process-wide default JSON backend, which is used by 'JSONBlueprint' and 'JSONLinesBlueprint' instances
+     which have not been provided with a JSON backend when they were initialized. Initially, the default JSON backend is
+     'StandardLibraryJSONBackend'.
+
+    The default JSON backend is looked up each time a blueprint is used (or compiled), so it can be changed even after
+     the blueprints have been created. It should be changed only once, though - ideally when the program starts.
+    """
+
+    __slots__ = ()
+
+    __default_json_backend: JSONBackendIface = StandardLibraryJSONBackend()
+
+    @classmethod
+    def get_default_json_backend(cls) -> JSONBackendIface:
+        return cls.__default_json_backend
+
+    @classmethod
+    def set_default_json_backend(cls, json_backend: JSONBackendIface) -> None:
+        cls.__default_json_backend = json_backend
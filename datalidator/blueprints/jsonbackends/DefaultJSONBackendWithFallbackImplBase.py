@@ -0,0 +1,84 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from typing import final, Final, Any, Callable, Union, Tuple, Type
+import abc
+import json
+import importlib
+from types import ModuleType
+from datalidator.blueprints.jsonbackends.JSONBackendIface import JSONBackendIface
+
+
+__all__ = "DefaultJSONBackendWithFallbackImplBase",
+
+
+class DefaultJSONBackendWithFallbackImplBase(JSONBackendIface, metaclass=abc.ABCMeta):
+    """
+    The base class of JSON backends which make use of an optional third-party module.
+
+    This library has no dependencies, so the module might not be installed. If it cannot be imported, the backend
+     transparently falls back to the standard library's json.loads() function. Whether this has happened can be
+     found out using the is_using_fallback() method.
+    """
+
+    __slots__ = "__deserialize_function", "__using_fallback"
+
+    def __init__(self):
+        try:
+            module = importlib.import_module(self._get_module_name())
+        except ImportError:
+            deserialize_function, using_fallback = json.loads, True
+        else:
+            deserialize_function, using_fallback = self._get_deserialize_function(module), False
+
+        self.__deserialize_function: Final[Callable[[Union[str, bytes, bytearray]], Any]] = deserialize_function
+        self.__using_fallback: Final[bool] = using_fallback
+
+    def __reduce__(self) -> Tuple[Type["DefaultJSONBackendWithFallbackImplBase"], Tuple[()]]:
+        # The deserialize function might be a closure, which cannot be pickled. Furthermore, whether the module is
+        #  installed (and thus whether the fallback is used) must be found out in the process the backend is unpickled in.
+        return self.__class__, ()
+
+    @final
+    def deserialize(self, json_document: Union[str, bytes, bytearray]) -> Any:
+        return self.__deserialize_function(json_document)
+
+    @final
+    def is_using_fallback(self) -> bool:
+        return self.__using_fallback
+
+    @abc.abstractmethod
+    def _get_module_name(self) -> str:
+        """
+        :return: The name of the module the backend makes use of.
+        """
+
+        raise NotImplementedError(DefaultJSONBackendWithFallbackImplBase._get_module_name.__qualname__)
+
+    @abc.abstractmethod
+    def _get_deserialize_function(self, module: ModuleType) -> Callable[[Union[str, bytes, bytearray]], Any]:
+        """
+        :param module: The successfully imported module the backend makes use of.
+        :return: A function which deserializes JSON documents using the module (see the 'deserialize()' method).
+        """
+
+        raise NotImplementedError(DefaultJSONBackendWithFallbackImplBase._get_deserialize_function.__qualname__)
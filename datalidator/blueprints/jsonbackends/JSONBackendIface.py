@@ -0,0 +1,52 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from typing import Any, Union
+import abc
+
+
+__all__ = "JSONBackendIface",
+
+
+class JSONBackendIface(metaclass=abc.ABCMeta):
+    """
+    The interface of JSON backends - objects which are used by 'JSONBlueprint' and 'JSONLinesBlueprint' to deserialize
+     JSON documents.
+
+    JSON backends MUST be thread-safe and SHOULD be immutable.
+    """
+
+    __slots__ = ()
+
+    @abc.abstractmethod
+    def deserialize(self, json_document: Union[str, bytes, bytearray]) -> Any:
+        """
+        Deserializes 'json_document' and returns the resulting Python object.
+
+        The method may raise any exception if the document cannot be deserialized - the blueprints using the backend
+         convert all of them to 'InvalidInputDataExc'.
+
+        :param json_document: The untrusted JSON document to deserialize. Binary documents are encoded in UTF-8 (some backends also support UTF-16 and UTF-32).
+        :return: The deserialized Python object.
+        """
+
+        raise NotImplementedError(JSONBackendIface.deserialize.__qualname__)
@@ -0,0 +1,59 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from typing import final, Any, Callable, Union
+from types import ModuleType
+from datalidator.blueprints.jsonbackends.DefaultJSONBackendWithFallbackImplBase import DefaultJSONBackendWithFallbackImplBase
+
+
+__all__ = "SimdjsonJSONBackend",
+
+
+@final
+class SimdjsonJSONBackend(DefaultJSONBackendWithFallbackImplBase):
+    """
+    Deserializes JSON documents using the 'simdjson' module's (pysimdjson) loads() function, if the module is installed
+     (see the docstring of 'DefaultJSONBackendWithFallbackImplBase').
+
+    BEHAVIOUR (differences from the standard library's json module):
+    - binary documents must be encoded in UTF-8
+    - 'NaN', 'Infinity' and '-Infinity' are rejected
+    - integers which do not fit into 64 bits are rejected
+    - lone surrogates in escape sequences (e.g. '\\ud800') are rejected
+    - if an object contains duplicate keys, the last value is used (same as in the json module)
+    """
+
+    __slots__ = ()
+
+    def _get_module_name(self) -> str:
+        return "simdjson"
+
+    def _get_deserialize_function(self, module: ModuleType) -> Callable[[Union[str, bytes, bytearray]], Any]:
+        loads = module.loads
+
+        def deserialize(json_document: Union[str, bytes, bytearray]) -> Any:
+            if isinstance(json_document, bytearray):
+                json_document = bytes(json_document)  # Not all versions of the module accept 'bytearray' objects
+
+            return loads(json_document)
+
+        return deserialize
@@ -0,0 +1,143 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from typing import final, Final, Any, Callable, Dict, FrozenSet, Pattern, Tuple, Union
+import json
+import json.decoder
+import json.scanner
+from datalidator.blueprints.jsonbackends.JSONBackendIface import JSONBackendIface
+
+
+__all__ = "StandardLibraryJSONBackend",
+
+
+@final
+class StandardLibraryJSONBackend(JSONBackendIface):
+    """
+    Deserializes JSON documents using the standard library's json.loads() function. This is the default JSON backend.
+
+    BEHAVIOUR:
+    - binary documents may be encoded in UTF-8, UTF-16 or UTF-32 (the encoding is detected automatically)
+    - 'NaN', 'Infinity' and '-Infinity' are accepted and deserialized to the corresponding 'float' values
+    - integers of any size are accepted; floats which are too large are deserialized to 'inf'
+    - lone surrogates in escape sequences (e.g. '\\ud800') are accepted
+    - if an object contains duplicate keys, the last value is used
+    """
+
+    __slots__ = ()
+
+    __WHITESPACE_REGEX: Final[Pattern] = json.decoder.WHITESPACE
+    __WHITESPACE_CHARS: Final[FrozenSet[str]] = frozenset(json.decoder.WHITESPACE_STR)
+    __SCAN_STRING: Final[Callable[[str, int, bool], Tuple[str, int]]] = json.decoder.scanstring
+    __SCAN_VALUE: Final[Callable[[str, int], Tuple[Any, int]]] = json.scanner.make_scanner(json.JSONDecoder())
+
+    def deserialize(self, json_document: Union[str, bytes, bytearray]) -> Any:
+        return json.loads(json_document)
+
+    def deserialize_object_items(self, json_document: Union[str, bytes, bytearray], keys: FrozenSet[str]) -> Any:
+        """
+        Deserializes 'json_document' like the deserialize() method, except that if the document's top-level value is
+         an object, only the items whose keys are in 'keys' are put into the returned 'dict'. The values of the other
+         items are still deserialized (so that invalid documents are rejected in the same way as by deserialize()),
+         but they are discarded right away, so that they are never held in memory all at once.
+
+        If an object contains duplicate keys, the last value is used (same as in the deserialize() method).
+
+        :param json_document: The untrusted JSON document to deserialize.
+        :param keys: The keys of the top-level object's items which should be kept.
+        :return: The deserialized Python object.
+        """
+
+        if isinstance(json_document, (bytes, bytearray)):
+            # The same decoding procedure as in json.loads()
+            json_document = json_document.decode(json.detect_encoding(json_document), "surrogatepass")
+
+        whitespace_regex = self.__class__.__WHITESPACE_REGEX
+
+        index = whitespace_regex.match(json_document, 0).end()
+        if json_document[index:index + 1] != "{":
+            return json.loads(json_document)  # The top-level value is not an object
+
+        output_dict, end_index = self.__deserialize_top_level_object_items(json_document, index + 1, keys)
+
+        # The rest of the document is checked in the same way as in json.loads()
+        if whitespace_regex.match(json_document, end_index).end() != len(json_document):
+            raise json.JSONDecodeError("Extra data", json_document, end_index)
+
+        return output_dict
+
+    @final
+    def __deserialize_top_level_object_items(self, json_document: str, index: int, keys: FrozenSet[str]) -> Tuple[Dict[str, Any], int]:
+        # A stripped-down version of json.decoder.JSONObject() which uses the same (C-accelerated, if available) scanners.
+        whitespace_regex = self.__class__.__WHITESPACE_REGEX
+        scan_string = self.__class__.__SCAN_STRING
+        scan_value = self.__class__.__SCAN_VALUE
+        whitespace_chars = self.__class__.__WHITESPACE_CHARS
+        output_dict = {}
+
+        index = whitespace_regex.match(json_document, index).end()
+        if json_document[index:index + 1] == "}":
+            return output_dict, index + 1
+
+        # Like in json.decoder.JSONObject(), the whitespace regex is matched only if there is more than a single
+        #  whitespace character between two tokens, as calling it each time would make up a significant part of the
+        #  per-item overhead.
+        while True:
+            if json_document[index:index + 1] != '"':
+                raise json.JSONDecodeError("Expecting property name enclosed in double quotes", json_document, index)
+
+            key, index = scan_string(json_document, index + 1, True)
+
+            if json_document[index:index + 1] != ":":
+                index = whitespace_regex.match(json_document, index).end()
+                if json_document[index:index + 1] != ":":
+                    raise json.JSONDecodeError("Expecting ':' delimiter", json_document, index)
+            index += 1
+
+            if json_document[index:index + 1] in whitespace_chars:
+                index += 1
+                if json_document[index:index + 1] in whitespace_chars:
+                    index = whitespace_regex.match(json_document, index + 1).end()
+            try:
+                value, index = scan_value(json_document, index)
+            except StopIteration as e:
+                raise json.JSONDecodeError("Expecting value", json_document, e.value)
+
+            if key in keys:
+                output_dict[key] = value
+            del value  # The unneeded values are discarded right away
+
+            delimiter = json_document[index:index + 1]
+            if delimiter in whitespace_chars:
+                index = whitespace_regex.match(json_document, index + 1).end()
+                delimiter = json_document[index:index + 1]
+            index += 1
+
+            if delimiter == "}":
+                return output_dict, index
+            if delimiter != ",":
+                raise json.JSONDecodeError("Expecting ',' delimiter", json_document, index - 1)
+
+            if json_document[index:index + 1] in whitespace_chars:
+                index += 1
+                if json_document[index:index + 1] in whitespace_chars:
+                    index = whitespace_regex.match(json_document, index + 1).end()
@@ -20,10 +20,16 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import final, Final, Any, Sequence, Tuple
+from typing import final, Final, Any, Sequence, Tuple, Callable, TYPE_CHECKING
+from datalidator.exc.DatalidatorExc import DatalidatorExc
+from datalidator.exc.err.DatalidatorError import DatalidatorError
 from datalidator.blueprints.BlueprintIface import BlueprintIface
+from datalidator.blueprints.AsyncUseContext import AsyncUseContext
 from datalidator.blueprints.DefaultBlueprintImplBase import DefaultBlueprintImplBase
+from datalidator.blueprints.extras.UseResult import UseResult
 from datalidator.blueprints.exc.err.InvalidBlueprintConfigError import InvalidBlueprintConfigError
+if TYPE_CHECKING:  # The compiler module imports this module
+    from datalidator.blueprints.compiler.BlueprintCompiler import BlueprintCompiler
 
 
 __all__ = "BlueprintChainingBlueprint",
@@ -56,3 +62,40 @@ class BlueprintChainingBlueprint(DefaultBlueprintImplBase[Any]):
             input_data = blueprint.use(input_data)
 
         return input_data
+
+    def _try_use(self, input_data: Any) -> UseResult[Any]:
+        for blueprint in self.__blueprint_chain:
+            result = self._try_use_blueprint(blueprint, input_data)
+            if not result.is_successful():
+                return result
+            input_data = result.get_output()
+
+        return UseResult.from_output(input_data)
+
+    async def _use_async(self, input_data: Any, async_use_context: AsyncUseContext) -> Any:
+        for blueprint in self.__blueprint_chain:
+            input_data = await self._use_blueprint_async(blueprint, input_data, async_use_context)
+
+        return input_data
+
+    def _benefits_from_async_use(self) -> bool:
+        return any(self._does_blueprint_benefit_from_async_use(blueprint) for blueprint in self.__blueprint_chain)
+
+    def _requires_async_use(self) -> bool:
+        return any(self._does_blueprint_require_async_use(blueprint) for blueprint in self.__blueprint_chain)
+
+    def _compile(self, blueprint_compiler: "BlueprintCompiler") -> Callable[[Any], Any]:
+        chained_functions = tuple(blueprint_compiler.compile_to_function(blueprint) for blueprint in self.__blueprint_chain)
+        generate_unexpected_exception_raised_exc = self._generate_unexpected_exception_raised_in_blueprint_exc
+
+        def compiled_use(input_data: Any) -> Any:
+            try:
+                for chained_function in chained_functions:
+                    input_data = chained_function(input_data)
+                return input_data
+            except (DatalidatorExc, DatalidatorError):
+                raise
+            except Exception as f:
+                raise generate_unexpected_exception_raised_exc(f)
+
+        return compiled_use
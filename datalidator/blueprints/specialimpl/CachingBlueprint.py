@@ -0,0 +1,262 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from typing import final, Final, Any, Hashable, Optional, Tuple, FrozenSet, Type, OrderedDict, TypeVar, Generic
+import collections
+import threading
+import time
+import copy
+import datetime
+import decimal
+import fractions
+import ipaddress
+import uuid
+import urllib.parse
+from datalidator.exc.DatalidatorExc import DatalidatorExc
+from datalidator.blueprints.BlueprintIface import BlueprintIface
+from datalidator.blueprints.AsyncUseContext import AsyncUseContext
+from datalidator.blueprints.DefaultBlueprintImplBase import DefaultBlueprintImplBase
+from datalidator.blueprints.extras.UseResult import UseResult
+from datalidator.blueprints.extras.CacheStatistics import CacheStatistics
+from datalidator.blueprints.exc.err.InvalidBlueprintConfigError import InvalidBlueprintConfigError
+
+
+__all__ = "CachingBlueprint", "CachingBlueprint_T"
+CachingBlueprint_T = TypeVar("CachingBlueprint_T")
+
+
+class CachingBlueprint(DefaultBlueprintImplBase[CachingBlueprint_T], Generic[CachingBlueprint_T]):  # DP: Decorator
+    """
+    Memoizes the outputs of the initializer-provided 'wrapped_blueprint', so that input data which occur repeatedly
+     (e.g. country codes, enum-like strings or IP addresses) do not have to be parsed, filtered and validated again.
+
+    Only input data of the following types are cached (other input data are passed to the wrapped blueprint every
+     time): 'str', 'bytes', 'int', 'bool', 'float' and 'NoneType'. The input data are keyed by their exact type and
+     value, so e.g. 1, 1.0 and True are cached separately, and so are 0.0 and -0.0. Subclasses of those types are not
+     cached, as they might override the methods the cache relies on (e.g. __eq__() or __hash__()).
+
+    The outputs are returned from the cache only if they are of an immutable data type (e.g. 'str', 'int', 'datetime',
+     'IPv4Address' or 'UUID'), so that the caller cannot change the cached output. If 'copy_mutable_outputs' is True,
+     other outputs (e.g. lists or object models) are cached as well, but a deep copy of the cached output is returned
+     on each hit; if it is False (the default), they are not cached at all.
+
+    If 'cache_exceptions' is True (the default), the 'DatalidatorExc' exceptions raised by the wrapped blueprint are
+     cached as well (negative caching) - a copy of the cached exception is raised on each hit. Errors are never cached.
+
+    The cache holds at most 'max_size' entries - when it is full, the least recently used entry is evicted. If 'ttl'
+     (in seconds) is not None, entries which have been in the cache for longer than that are not used anymore. Hit and
+     miss statistics can be obtained using the 'get_cache_statistics()' method.
+
+    NOTE: The wrapped blueprint must always produce the same output for the same input data - blueprints using
+     filters or validators whose behaviour depends on something else than the input data (e.g. the current time) should
+     not be cached, unless a suitably short 'ttl' is used.
+
+    NOTE: The cache is safe to use from multiple threads. It is not pickled - unpickled blueprints start with an empty
+     cache and zeroed statistics.
+    """
+
+    __slots__ = "__wrapped_blueprint", "__max_size", "__ttl", "__cache_exceptions", "__copy_mutable_outputs", "__cache", "__cache_lock", "__hit_count", "__miss_count", "__eviction_count"
+    __TRANSIENT_SLOTS: Final[Tuple[str, ...]] = ("__cache", "__cache_lock", "__hit_count", "__miss_count", "__eviction_count")
+
+    # Exact value equality implies identical output data only for these types (e.g. Decimal("1.0") == Decimal("1.00"),
+    #  and aware datetime objects from different timezones are equal if they represent the same instant). 'float' input
+    #  data are keyed by their hexadecimal representation, as 0.0 == -0.0.
+    __CACHEABLE_INPUT_DATA_TYPES: Final[FrozenSet[Type]] = frozenset((str, bytes, int, bool, float, type(None)))
+    __IMMUTABLE_OUTPUT_DATA_TYPES: Final[FrozenSet[Type]] = frozenset((
+        str, bytes, int, bool, float, complex, type(None), decimal.Decimal, fractions.Fraction,
+        datetime.datetime, datetime.date, datetime.time, datetime.timedelta,
+        ipaddress.IPv4Address, ipaddress.IPv6Address, ipaddress.IPv4Network, ipaddress.IPv6Network,
+        uuid.UUID, urllib.parse.ParseResult
+    ))
+    _DEFAULT_MAX_SIZE: Final[int] = 4096
+
+    def __init__(self,
+                 wrapped_blueprint: BlueprintIface[CachingBlueprint_T],
+                 max_size: int = _DEFAULT_MAX_SIZE,
+                 ttl: Optional[float] = None,
+                 cache_exceptions: bool = True,
+                 copy_mutable_outputs: bool = False,
+                 tag: str = ""):
+        DefaultBlueprintImplBase.__init__(self, tag)
+
+        self.__wrapped_blueprint: Final[BlueprintIface[CachingBlueprint_T]] = wrapped_blueprint
+        self.__max_size: Final[int] = max_size
+        self.__ttl: Final[Optional[float]] = ttl
+        self.__cache_exceptions: Final[bool] = cache_exceptions
+        self.__copy_mutable_outputs: Final[bool] = copy_mutable_outputs
+
+        if self.__max_size < 1:
+            raise InvalidBlueprintConfigError("The maximum size of the cache must be at least 1!", self._tag)
+
+        if (self.__ttl is not None) and (self.__ttl <= 0):
+            raise InvalidBlueprintConfigError("The TTL of the cache entries must be positive!", self._tag)
+
+        self.__initialize_transient_slots()
+
+    @final
+    def __initialize_transient_slots(self) -> None:
+        # The cache entries are (expiration time or None, output data, exception or None) tuples
+        self.__cache: Final[OrderedDict[Hashable, Tuple[Optional[float], Any, Optional[DatalidatorExc]]]] = collections.OrderedDict()
+        self.__cache_lock: Final[threading.Lock] = threading.Lock()
+        self.__hit_count: int = 0
+        self.__miss_count: int = 0
+        self.__eviction_count: int = 0
+
+    @final
+    def get_wrapped_blueprint(self) -> BlueprintIface[CachingBlueprint_T]:
+        return self.__wrapped_blueprint
+
+    @final
+    def get_max_size(self) -> int:
+        return self.__max_size
+
+    @final
+    def get_ttl(self) -> Optional[float]:
+        return self.__ttl
+
+    @final
+    def are_exceptions_cached(self) -> bool:
+        return self.__cache_exceptions
+
+    @final
+    def are_mutable_outputs_copied(self) -> bool:
+        return self.__copy_mutable_outputs
+
+    @final
+    def get_cache_statistics(self) -> CacheStatistics:
+        with self.__cache_lock:
+            return CacheStatistics(self.__hit_count, self.__miss_count, self.__eviction_count, len(self.__cache), self.__max_size)
+
+    @final
+    def clear_cache(self) -> None:
+        """
+        Removes all the entries from the cache. The statistics are not reset.
+        """
+
+        with self.__cache_lock:
+            self.__cache.clear()
+
+    def _use(self, input_data: Any) -> CachingBlueprint_T:
+        return self._try_use(input_data).get_output()
+
+    def _try_use(self, input_data: Any) -> UseResult[CachingBlueprint_T]:
+        cache_key = self.__get_cache_key(input_data)
+        if cache_key is None:
+            return self._try_use_blueprint(self.__wrapped_blueprint, input_data)
+
+        cached_result = self.__look_up_result(cache_key)
+        if cached_result is not None:
+            return cached_result
+
+        result = self._try_use_blueprint(self.__wrapped_blueprint, input_data)
+        self.__store_result(cache_key, result)
+
+        return result
+
+    async def _use_async(self, input_data: Any, async_use_context: AsyncUseContext) -> CachingBlueprint_T:
+        cache_key = self.__get_cache_key(input_data)
+        if cache_key is None:
+            return await self._use_blueprint_async(self.__wrapped_blueprint, input_data, async_use_context)
+
+        cached_result = self.__look_up_result(cache_key)
+        if cached_result is not None:
+            return cached_result.get_output()
+
+        try:
+            result = UseResult.from_output(await self._use_blueprint_async(self.__wrapped_blueprint, input_data, async_use_context))
+        except DatalidatorExc as e:
+            result = UseResult.from_exception(e)
+        self.__store_result(cache_key, result)
+
+        return result.get_output()
+
+    def _benefits_from_async_use(self) -> bool:
+        return self._does_blueprint_benefit_from_async_use(self.__wrapped_blueprint)
+
+    def _requires_async_use(self) -> bool:
+        return self._does_blueprint_require_async_use(self.__wrapped_blueprint)
+
+    @final
+    def __get_cache_key(self, input_data: Any) -> Optional[Hashable]:
+        input_data_type = input_data.__class__
+        if input_data_type is str:  # Fast path - string keys cannot collide with the tuple keys below
+            return input_data
+
+        if input_data_type not in self.__class__.__CACHEABLE_INPUT_DATA_TYPES:
+            return None
+
+        if input_data_type is float:
+            return float, input_data.hex()
+
+        return input_data_type, input_data
+
+    @final
+    def __look_up_result(self, cache_key: Hashable) -> Optional[UseResult[CachingBlueprint_T]]:
+        with self.__cache_lock:
+            cache_entry = self.__cache.get(cache_key, None)
+
+            if (cache_entry is not None) and (cache_entry[0] is not None) and (cache_entry[0] <= time.monotonic()):
+                del self.__cache[cache_key]  # The entry has expired
+                cache_entry = None
+
+            if cache_entry is None:
+                self.__miss_count += 1
+                return None
+
+            self.__cache.move_to_end(cache_key)
+            self.__hit_count += 1
+
+        # The cached data are copied outside the lock, as copying might take some time
+        _, output, exception = cache_entry
+        if exception is not None:
+            # The same exception object must not be raised more than once, as its traceback would grow with each raise
+            return UseResult.from_exception(copy.copy(exception))
+
+        if output.__class__ in self.__class__.__IMMUTABLE_OUTPUT_DATA_TYPES:
+            return UseResult.from_output(output)
+
+        return UseResult.from_output(copy.deepcopy(output))
+
+    @final
+    def __store_result(self, cache_key: Hashable, result: UseResult[CachingBlueprint_T]) -> None:
+        exception = result.get_exception()
+        if exception is not None:
+            if not self.__cache_exceptions:
+                return
+            output = None
+            exception = copy.copy(exception)  # The original exception's traceback would keep the frames it refers to alive
+        else:
+            output = result.get_output()
+            if output.__class__ not in self.__class__.__IMMUTABLE_OUTPUT_DATA_TYPES:
+                if not self.__copy_mutable_outputs:
+                    return
+                output = copy.deepcopy(output)  # The caller might modify the returned output
+
+        expiration_time = ((time.monotonic() + self.__ttl) if self.__ttl is not None else None)
+
+        with self.__cache_lock:
+            self.__cache[cache_key] = (expiration_time, output, exception)
+            self.__cache.move_to_end(cache_key)
+
+            while len(self.__cache) > self.__max_size:
+                self.__cache.popitem(last=False)
+                self.__eviction_count += 1
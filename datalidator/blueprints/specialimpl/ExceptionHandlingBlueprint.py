@@ -20,10 +20,14 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import final, Final, Any, TypeVar, Generic
+from typing import final, Final, Any, Callable, TypeVar, Generic, TYPE_CHECKING
 from datalidator.exc.DatalidatorExc import DatalidatorExc
+from datalidator.exc.err.DatalidatorError import DatalidatorError
 from datalidator.blueprints.BlueprintIface import BlueprintIface
+from datalidator.blueprints.AsyncUseContext import AsyncUseContext
 from datalidator.blueprints.DefaultBlueprintImplBase import DefaultBlueprintImplBase
+if TYPE_CHECKING:  # The compiler module imports this module
+    from datalidator.blueprints.compiler.BlueprintCompiler import BlueprintCompiler
 
 
 __all__ = "ExceptionHandlingBlueprint", "ExceptionHandlingBlueprint_T"
@@ -53,7 +57,37 @@ class ExceptionHandlingBlueprint(DefaultBlueprintImplBase[ExceptionHandlingBluep
         return self.__default_value
 
     def _use(self, input_data: Any) -> ExceptionHandlingBlueprint_T:
+        # The wrapped blueprint's failure is received as a result instead of being raised and caught here
+        return self._try_use_blueprint(self.__wrapped_blueprint, input_data).get_output_or_default(self.__default_value)
+
+    async def _use_async(self, input_data: Any, async_use_context: AsyncUseContext) -> ExceptionHandlingBlueprint_T:
         try:
-            return self.__wrapped_blueprint.use(input_data)
+            return await self._use_blueprint_async(self.__wrapped_blueprint, input_data, async_use_context)
         except DatalidatorExc:
             return self.__default_value
+
+    def _benefits_from_async_use(self) -> bool:
+        return self._does_blueprint_benefit_from_async_use(self.__wrapped_blueprint)
+
+    def _requires_async_use(self) -> bool:
+        return self._does_blueprint_require_async_use(self.__wrapped_blueprint)
+
+    def _compile(self, blueprint_compiler: "BlueprintCompiler") -> Callable[[Any], ExceptionHandlingBlueprint_T]:
+        wrapped_function = blueprint_compiler.compile_to_function(self.__wrapped_blueprint)
+        default_value = self.__default_value
+        generate_unexpected_exception_raised_exc = self._generate_unexpected_exception_raised_in_blueprint_exc
+
+        def compiled_use(input_data: Any) -> ExceptionHandlingBlueprint_T:
+            # Exceptions which are not DatalidatorExc are not handled by this blueprint - they are converted to
+            #  UnexpectedExceptionRaisedInBlueprintExc in the outer context, exactly as the use() method would do.
+            try:
+                try:
+                    return wrapped_function(input_data)
+                except DatalidatorExc:
+                    return default_value
+            except (DatalidatorExc, DatalidatorError):
+                raise
+            except Exception as f:
+                raise generate_unexpected_exception_raised_exc(f)
+
+        return compiled_use
@@ -20,10 +20,18 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import final, Final, Any, Optional, Tuple, Type, TypeVar, Generic
-import json
+from typing import final, Final, Any, Optional, Tuple, Type, Callable, Union, FrozenSet, TypeVar, Generic, TYPE_CHECKING
 from datalidator.blueprints.BlueprintIface import BlueprintIface
+from datalidator.blueprints.AsyncUseContext import AsyncUseContext
 from datalidator.blueprints.DefaultBlueprintWithStandardFeaturesImplBase import DefaultBlueprintWithStandardFeaturesImplBase
+from datalidator.blueprints.exc.err.InvalidBlueprintConfigError import InvalidBlueprintConfigError
+from datalidator.blueprints.jsonbackends.JSONBackendIface import JSONBackendIface
+from datalidator.blueprints.jsonbackends.DefaultJSONBackend import DefaultJSONBackend
+from datalidator.blueprints.jsonbackends.impl.StandardLibraryJSONBackend import StandardLibraryJSONBackend
+from datalidator.blueprints.impl.PredefinedDictionaryBlueprint import PredefinedDictionaryBlueprint
+from datalidator.blueprints.impl.ObjectBlueprint import ObjectBlueprint
+if TYPE_CHECKING:  # The compiler module imports this module
+    from datalidator.blueprints.compiler.BlueprintCompiler import BlueprintCompiler
 
 
 __all__ = "JSONBlueprint", "JSONBlueprint_T"
@@ -34,17 +42,41 @@ class JSONBlueprint(DefaultBlueprintWithStandardFeaturesImplBase[JSONBlueprint_T
     """
     INPUT:
     - 'str' object containing a JSON document
+    - 'bytes', 'bytearray' or 'memoryview' object containing a JSON document (encoded in UTF-8, UTF-16 or UTF-32)
 
     OUTPUT:
     - the value returned by the initializer-provided 'wrapped_blueprint'
 
-    NOTE: The input JSON string is deserialized using json.loads(), the deserialized data is passed into the
-     initializer-provided 'wrapped_blueprint' and its return value is returned.
+    NOTE: The input JSON document is deserialized using the initializer-provided 'json_backend' (if it is None, the
+     process-wide default JSON backend is used - see 'DefaultJSONBackend'; by default, it uses json.loads()), the
+     deserialized data is passed into the initializer-provided 'wrapped_blueprint' and its return value is returned.
+     Binary input data are passed to the JSON backend directly, without being decoded to 'str' first ('memoryview'
+     objects have to be converted to 'bytes' though, as json.loads() does not accept them). The JSON backends differ
+     in some aspects, such as the handling of 'NaN' or big integers - see their docstrings.
+
+    NOTE: If the initializer-provided 'max_input_size' is not None, input data larger than that (in characters in case
+     of 'str' objects, in bytes otherwise) are rejected before they are parsed in any way.
+
+    NOTE: If the initializer-provided 'schema_aware_decoding' is True, the 'wrapped_blueprint' is a
+     'PredefinedDictionaryBlueprint' or an 'ObjectBlueprint' which ignores unspecified keys in input and the standard
+     library's JSON backend is used, the items of the top-level JSON object whose keys are not in the wrapped
+     blueprint's specification are discarded right after they are deserialized, instead of the whole object being
+     built first (see StandardLibraryJSONBackend.deserialize_object_items()). This lowers the peak memory usage when
+     the documents contain many unneeded items, but it costs CPU time - the top-level object is walked through item by
+     item in Python, which makes the decoding about 1.5 to 3 times slower than json.loads(). Therefore, documents
+     smaller than the initializer-provided 'schema_aware_decoding_min_input_size' (in the same units as
+     'max_input_size'), whose decoded form does not take up much memory anyway, are decoded as a whole. The validation
+     results stay the same, but the input data attached to the exceptions raised by the wrapped blueprint do not
+     contain the discarded items. In any other case, the option has no effect.
     """
 
-    __slots__ = "__wrapped_blueprint",
+    __slots__ = "__wrapped_blueprint", "__max_input_size", "__json_backend", "__schema_aware_decoding", "__schema_aware_decoding_min_input_size", "__schema_aware_decoding_keys"
 
-    def __init__(self, wrapped_blueprint: BlueprintIface[JSONBlueprint_T], tag: str = ""):
+    _DEFAULT_SCHEMA_AWARE_DECODING_MIN_INPUT_SIZE: Final[int] = 65536
+
+    __DATA_TYPE_ALLOWLIST: Final[Tuple[Type, ...]] = (str, bytes, bytearray, memoryview)
+
+    def __init__(self, wrapped_blueprint: BlueprintIface[JSONBlueprint_T], max_input_size: Optional[int] = None, json_backend: Optional[JSONBackendIface] = None, schema_aware_decoding: bool = False, schema_aware_decoding_min_input_size: int = _DEFAULT_SCHEMA_AWARE_DECODING_MIN_INPUT_SIZE, tag: str = ""):
         # Passing filters and validators to this blueprint would not make sense, as this blueprint returns the data
         #  returned by the wrapped blueprint without any modification; therefore, the filters and validators within
         #  the wrapped blueprint can safely be used.
@@ -56,24 +88,141 @@ class JSONBlueprint(DefaultBlueprintWithStandardFeaturesImplBase[JSONBlueprint_T
         DefaultBlueprintWithStandardFeaturesImplBase.__init__(self, (), (), tag)
 
         self.__wrapped_blueprint: Final[BlueprintIface[JSONBlueprint_T]] = wrapped_blueprint
+        self.__max_input_size: Final[Optional[int]] = max_input_size
+        self.__json_backend: Final[Optional[JSONBackendIface]] = json_backend
+        self.__schema_aware_decoding: Final[bool] = schema_aware_decoding
+        self.__schema_aware_decoding_min_input_size: Final[int] = schema_aware_decoding_min_input_size
+        self.__schema_aware_decoding_keys: Final[Optional[FrozenSet[str]]] = self.__generate_schema_aware_decoding_keys()
+
+        if (self.__max_input_size is not None) and (self.__max_input_size < 0):
+            raise InvalidBlueprintConfigError("The maximum input size must not be negative!", self._tag)
+
+        if self.__schema_aware_decoding_min_input_size < 0:
+            raise InvalidBlueprintConfigError("The minimum input size for schema-aware decoding must not be negative!", self._tag)
 
     @final
     def get_wrapped_blueprint(self) -> BlueprintIface[JSONBlueprint_T]:
         return self.__wrapped_blueprint
 
+    @final
+    def get_max_input_size(self) -> Optional[int]:
+        return self.__max_input_size
+
+    @final
+    def get_json_backend(self) -> Optional[JSONBackendIface]:
+        return self.__json_backend
+
+    @final
+    def is_schema_aware_decoding_enabled(self) -> bool:
+        return self.__schema_aware_decoding
+
+    @final
+    def get_schema_aware_decoding_min_input_size(self) -> int:
+        return self.__schema_aware_decoding_min_input_size
+
+    @final
+    def __generate_schema_aware_decoding_keys(self) -> Optional[FrozenSet[str]]:
+        if not self.__schema_aware_decoding:
+            return None
+
+        # Subclasses might parse the input data differently, so only the exact classes are taken into account.
+        #  If unspecified keys in input are not ignored, their presence must be detected by the wrapped blueprint.
+        wrapped_blueprint = self.__wrapped_blueprint
+        if wrapped_blueprint.__class__ is PredefinedDictionaryBlueprint:
+            if not wrapped_blueprint.are_unspecified_keys_in_input_ignored():
+                return None
+        elif wrapped_blueprint.__class__ is ObjectBlueprint:
+            if not wrapped_blueprint.are_input_keys_which_are_not_in_model_ignored():
+                return None
+        else:
+            return None
+
+        # JSON object keys are always strings
+        return frozenset(key for key in wrapped_blueprint.get_dict_specification().keys() if isinstance(key, str))
+
     def _get_allowed_output_data_types(self) -> Optional[Tuple[Type, ...]]:
         return None
 
     def _parse(self, input_data: Any) -> JSONBlueprint_T:
         return self._data_conversion_helper.convert_input_with_data_type_allowlist(
-            self.__parse_str, (str,), input_data
+            self.__parse_str, self.__class__.__DATA_TYPE_ALLOWLIST, input_data
         )
 
+    async def _parse_async(self, input_data: Any, async_use_context: AsyncUseContext) -> JSONBlueprint_T:
+        deserialized_json = self._data_conversion_helper.convert_input_with_data_type_allowlist(
+            self.__deserialize_str, self.__class__.__DATA_TYPE_ALLOWLIST, input_data
+        )
+
+        return await self._use_blueprint_async(self.__wrapped_blueprint, deserialized_json, async_use_context)
+
+    def _benefits_from_async_use(self) -> bool:
+        return self._does_blueprint_benefit_from_async_use(self.__wrapped_blueprint)
+
+    def _requires_async_use(self) -> bool:
+        return self._does_blueprint_require_async_use(self.__wrapped_blueprint)
+
+    def _compile_parse(self, blueprint_compiler: "BlueprintCompiler") -> Callable[[Any], JSONBlueprint_T]:
+        wrapped_function = blueprint_compiler.compile_to_function(self.__wrapped_blueprint)
+        data_conversion_helper = self._data_conversion_helper
+        data_type_allowlist = self.__class__.__DATA_TYPE_ALLOWLIST
+        json_backend = self.__get_json_backend_to_use()
+
+        def parse_str(input_data: Union[str, bytes, bytearray, memoryview]) -> JSONBlueprint_T:
+            return self.__parse_str_using_wrapped_function(input_data, wrapped_function, json_backend)
+
+        return lambda input_data: data_conversion_helper.convert_input_with_data_type_allowlist(parse_str, data_type_allowlist, input_data)
+
     @final
-    def __parse_str(self, input_data: str) -> JSONBlueprint_T:
+    def __parse_str(self, input_data: Union[str, bytes, bytearray, memoryview]) -> JSONBlueprint_T:
+        return self.__parse_str_using_wrapped_function(input_data, self.__wrapped_blueprint.use, self.__get_json_backend_to_use())
+
+    @final
+    def __parse_str_using_wrapped_function(self, input_data: Union[str, bytes, bytearray, memoryview], wrapped_function: Callable[[Any], JSONBlueprint_T], json_backend: JSONBackendIface) -> JSONBlueprint_T:
+        return wrapped_function(self.__deserialize_str_using_json_backend(input_data, json_backend))
+
+    @final
+    def __deserialize_str(self, input_data: Union[str, bytes, bytearray, memoryview]) -> Any:
+        return self.__deserialize_str_using_json_backend(input_data, self.__get_json_backend_to_use())
+
+    @final
+    def __deserialize_str_using_json_backend(self, input_data: Union[str, bytes, bytearray, memoryview], json_backend: JSONBackendIface) -> Any:
+        if (self.__max_input_size is not None) and (self.__get_input_size(input_data) > self.__max_input_size):
+            raise self._invalid_input_data_exc_factory.generate_invalid_input_data_exc(
+                "The supplied JSON document is larger than the maximum allowed size ({})!".format(self.__max_input_size),
+                input_data
+            )
+
+        json_document = input_data
+        if isinstance(json_document, memoryview):
+            json_document = json_document.tobytes()  # json.loads() does not accept 'memoryview' objects
+
+        # The document is stripped only if it begins or ends with whitespace, so that it is not copied needlessly.
+        #  JSON backends ignore only JSON whitespace, which is a subset of what strip() removes. Binary documents are
+        #  not stripped, as removing single bytes would break UTF-16 and UTF-32 encoded documents; all the JSON
+        #  backends ignore JSON whitespace around them.
+        if isinstance(json_document, str) and (json_document[:1].isspace() or json_document[-1:].isspace()):
+            json_document = json_document.strip()
+
         try:
-            deserialized_json = json.loads(input_data.strip())
+            if (self.__schema_aware_decoding_keys is not None) and isinstance(json_backend, StandardLibraryJSONBackend) and (self.__get_input_size(input_data) >= self.__schema_aware_decoding_min_input_size):
+                deserialized_json = json_backend.deserialize_object_items(json_document, self.__schema_aware_decoding_keys)
+            else:
+                deserialized_json = json_backend.deserialize(json_document)
         except Exception:
             raise self._invalid_input_data_exc_factory.generate_invalid_input_data_exc("The supplied string does not contain valid JSON data!", input_data)
 
-        return self.__wrapped_blueprint.use(deserialized_json)
+        return deserialized_json
+
+    @final
+    def __get_input_size(self, input_data: Union[str, bytes, bytearray, memoryview]) -> int:
+        if isinstance(input_data, memoryview):
+            return input_data.nbytes
+
+        return len(input_data)
+
+    @final
+    def __get_json_backend_to_use(self) -> JSONBackendIface:
+        if self.__json_backend is None:
+            return DefaultJSONBackend.get_default_json_backend()
+
+        return self.__json_backend
@@ -0,0 +1,236 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from typing import final, Final, Any, List, Optional, Tuple, Type, Callable, Iterator, Union, TypeVar, Generic
+import io
+import re
+import mmap
+from datalidator.exc.DatalidatorExc import DatalidatorExc
+from datalidator.exc.err.DatalidatorError import DatalidatorError
+from datalidator.exc.err.ThisShouldNeverHappenError import ThisShouldNeverHappenError
+from datalidator.blueprints.BlueprintIface import BlueprintIface
+from datalidator.blueprints.DefaultBlueprintWithStandardFeaturesImplBase import DefaultBlueprintWithStandardFeaturesImplBase
+from datalidator.blueprints.StreamErrorPolicy import StreamErrorPolicy
+from datalidator.blueprints.compiler.BlueprintCompiler import BlueprintCompiler
+from datalidator.blueprints.jsonbackends.JSONBackendIface import JSONBackendIface
+from datalidator.blueprints.jsonbackends.DefaultJSONBackend import DefaultJSONBackend
+
+
+__all__ = "JSONLinesBlueprint", "JSONLinesBlueprint_T"
+JSONLinesBlueprint_T = TypeVar("JSONLinesBlueprint_T")
+
+
+class JSONLinesBlueprint(DefaultBlueprintWithStandardFeaturesImplBase[List[JSONLinesBlueprint_T]], Generic[JSONLinesBlueprint_T]):  # DP: Decorator
+    """
+    INPUT:
+    - 'str' object containing JSON Lines (newline-delimited JSON documents)
+    - 'bytes', 'bytearray' or 'memoryview' object containing UTF-8 encoded JSON Lines
+    - 'mmap.mmap' object (memory-mapped file) containing UTF-8 encoded JSON Lines
+    - file object (a subclass of 'io.IOBase', e.g. a file opened in binary mode) containing JSON Lines
+
+    OUTPUT:
+    - 'list' object containing the values returned by the initializer-provided 'wrapped_blueprint' for each of the lines
+
+    NOTE: The input data are split into lines, each (non-blank) line is deserialized using the initializer-provided
+     'json_backend' (see the docstring of JSONBlueprint), and the deserialized data are passed into the
+     initializer-provided 'wrapped_blueprint'. Blank lines are skipped.
+     The input buffers are never copied as a whole - only the line which is being processed is copied. File objects
+     are read line by line.
+
+    NOTE: Huge input data (e.g. multi-gigabyte log files) can be processed as a stream using the iter_use() method,
+     which yields the output items one by one instead of returning a list of them.
+
+    NOTE: When one of the lines cannot be processed, 'InvalidItemsInInputDataExc' is raised. It contains the exception
+     of the line, paired with a path containing the line's number (e.g. 'line 5'; lines are numbered from 1).
+    """
+
+    __slots__ = "__wrapped_blueprint", "__json_backend"
+
+    __DATA_TYPE_ALLOWLIST: Final[Tuple[Type, ...]] = (str, bytes, bytearray, memoryview, mmap.mmap, io.IOBase)
+    __BUFFER_LINE_SEPARATOR_REGEX: Final[re.Pattern] = re.compile(b"\n")
+    __SUPPORTED_STREAM_ERROR_POLICIES: Final[Tuple[StreamErrorPolicy, ...]] = (StreamErrorPolicy.POLICY_STOP, StreamErrorPolicy.POLICY_SKIP, StreamErrorPolicy.POLICY_COLLECT)
+
+    def __init__(self, wrapped_blueprint: BlueprintIface[JSONLinesBlueprint_T], json_backend: Optional[JSONBackendIface] = None, tag: str = ""):
+        # See the comment in JSONBlueprint's initializer on why filters and validators are not supported.
+        DefaultBlueprintWithStandardFeaturesImplBase.__init__(self, (), (), tag)
+
+        self.__wrapped_blueprint: Final[BlueprintIface[JSONLinesBlueprint_T]] = wrapped_blueprint
+        self.__json_backend: Final[Optional[JSONBackendIface]] = json_backend
+
+    @final
+    def get_wrapped_blueprint(self) -> BlueprintIface[JSONLinesBlueprint_T]:
+        return self.__wrapped_blueprint
+
+    @final
+    def get_json_backend(self) -> Optional[JSONBackendIface]:
+        return self.__json_backend
+
+    @final
+    def iter_use(self, input_data: Any, error_policy: StreamErrorPolicy = StreamErrorPolicy.POLICY_STOP) -> Iterator[JSONLinesBlueprint_T]:
+        """
+        Processes 'input_data' as a stream - the lines are read, deserialized and run through the wrapped blueprint one
+         by one and the output items are yielded as soon as they are processed. Unlike the use() method, neither the
+         lines nor the output items are ever held in memory as a whole, so this method can be used to process huge
+         files in bounded memory.
+
+        :param input_data: The untrusted input data whose lines should be processed.
+        :param error_policy: What should happen when an invalid line is encountered (see the StreamErrorPolicy enum). Unless the lines are skipped, their exceptions are wrapped in 'InvalidItemsInInputDataExc'.
+        :return: An iterator yielding the output items.
+        :raises DatalidatorExc: The superclass of all exceptions raised by this library (either immediately or while iterating).
+        """
+
+        if error_policy not in self.__class__.__SUPPORTED_STREAM_ERROR_POLICIES:
+            # This can happen only if the library is used incorrectly (not according to type annotations in this case)
+            raise ThisShouldNeverHappenError(
+                "The supplied stream error policy (of type '{}') is invalid: {}".format(error_policy.__class__.__name__, repr(error_policy)),
+                self._tag
+            )
+
+        try:
+            line_iterator = self._data_conversion_helper.convert_input_with_data_type_allowlist(
+                self.__get_line_iterator, self.__class__.__DATA_TYPE_ALLOWLIST, input_data
+            )
+        except (DatalidatorExc, DatalidatorError) as e:
+            raise e
+        except Exception as f:
+            raise self._generate_unexpected_exception_raised_in_blueprint_exc(f)
+
+        wrapped_function = BlueprintCompiler().compile_to_function(self.__wrapped_blueprint)
+
+        return self.__iterate_over_lines(input_data, line_iterator, wrapped_function, self.__get_json_backend_to_use(), error_policy)
+
+    def _get_allowed_output_data_types(self) -> Optional[Tuple[Type, ...]]:
+        return list,
+
+    def _parse(self, input_data: Any) -> List[JSONLinesBlueprint_T]:
+        return self.__parse_using_wrapped_function(input_data, self.__wrapped_blueprint.use, self.__get_json_backend_to_use())
+
+    def _compile_parse(self, blueprint_compiler: BlueprintCompiler) -> Callable[[Any], List[JSONLinesBlueprint_T]]:
+        wrapped_function = blueprint_compiler.compile_to_function(self.__wrapped_blueprint)
+        json_backend = self.__get_json_backend_to_use()
+
+        return lambda input_data: self.__parse_using_wrapped_function(input_data, wrapped_function, json_backend)
+
+    @final
+    def __parse_using_wrapped_function(self, input_data: Any, wrapped_function: Callable[[Any], JSONLinesBlueprint_T], json_backend: JSONBackendIface) -> List[JSONLinesBlueprint_T]:
+        line_iterator = self._data_conversion_helper.convert_input_with_data_type_allowlist(
+            self.__get_line_iterator, self.__class__.__DATA_TYPE_ALLOWLIST, input_data
+        )
+
+        return list(self.__iterate_over_lines(input_data, line_iterator, wrapped_function, json_backend, StreamErrorPolicy.POLICY_STOP))
+
+    @final
+    def __get_line_iterator(self, input_data: Union[str, bytes, bytearray, memoryview, mmap.mmap, io.IOBase]) -> Iterator[Union[str, bytes]]:
+        if isinstance(input_data, str):
+            return self.__iterate_over_lines_of_str(input_data)
+
+        if isinstance(input_data, io.IOBase):
+            return iter(input_data)  # File objects are read line by line
+
+        try:
+            # The buffer is never copied as a whole - the lines are sliced from a memoryview of it.
+            buffer_view = memoryview(input_data).cast("B")
+        except Exception:
+            raise self._invalid_input_data_exc_factory.generate_input_data_not_convertible_exc((memoryview,), input_data)
+
+        return self.__iterate_over_lines_of_buffer(buffer_view)
+
+    @final
+    def __iterate_over_lines_of_str(self, input_data: str) -> Iterator[str]:
+        line_start = 0
+        input_length = len(input_data)
+
+        while line_start < input_length:
+            line_end = input_data.find("\n", line_start)
+            if line_end == -1:
+                line_end = input_length
+
+            yield input_data[line_start:line_end]
+            line_start = line_end + 1
+
+    @final
+    def __iterate_over_lines_of_buffer(self, buffer_view: memoryview) -> Iterator[bytes]:
+        line_separator_regex = self.__class__.__BUFFER_LINE_SEPARATOR_REGEX
+
+        # The memoryview is released as soon as the iteration ends (or the generator is closed), so that the underlying
+        #  object (e.g. 'mmap.mmap') can be closed afterwards.
+        with buffer_view:
+            line_start = 0
+            buffer_length = len(buffer_view)
+
+            while line_start < buffer_length:
+                line_separator_match = line_separator_regex.search(buffer_view, line_start)
+                line_end = (buffer_length if line_separator_match is None else line_separator_match.start())
+
+                yield bytes(buffer_view[line_start:line_end])
+                line_start = line_end + 1
+
+    @final
+    def __iterate_over_lines(self, input_data: Any, line_iterator: Iterator[Union[str, bytes]], wrapped_function: Callable[[Any], JSONLinesBlueprint_T], json_backend: JSONBackendIface, error_policy: StreamErrorPolicy) -> Iterator[JSONLinesBlueprint_T]:
+        exc_factory_class = self._invalid_input_data_exc_factory.__class__
+        line_exceptions: List[Tuple[str, DatalidatorExc]] = []
+        line_number = 0
+
+        while True:
+            try:
+                line = next(line_iterator)
+            except StopIteration:
+                break
+            except Exception:
+                raise self._invalid_input_data_exc_factory.generate_invalid_input_data_exc("The input data could not be read!", input_data)
+
+            line_number += 1
+            if (not line) or line.isspace():
+                continue
+
+            try:
+                output_item = self.__parse_line(line, wrapped_function, json_backend)
+            except DatalidatorExc as e:
+                # If the wrapped blueprint collects the exceptions of nested items, their paths are prefixed with the line number
+                if error_policy == StreamErrorPolicy.POLICY_STOP:
+                    raise self._invalid_input_data_exc_factory.generate_invalid_items_in_input_data_exc(exc_factory_class.get_item_exceptions_with_path("line {}".format(line_number), e), input_data)
+
+                if error_policy == StreamErrorPolicy.POLICY_COLLECT:
+                    line_exceptions.extend(exc_factory_class.get_item_exceptions_with_path("line {}".format(line_number), e))
+            else:
+                # The item is yielded outside the 'try' block, so that exceptions thrown into the generator are not caught
+                yield output_item
+
+        if line_exceptions:
+            raise self._invalid_input_data_exc_factory.generate_invalid_items_in_input_data_exc(line_exceptions, input_data)
+
+    @final
+    def __parse_line(self, line: Union[str, bytes], wrapped_function: Callable[[Any], JSONLinesBlueprint_T], json_backend: JSONBackendIface) -> JSONLinesBlueprint_T:
+        try:
+            # JSON backends ignore leading and trailing whitespace (including '\r'), so the line does not need to be stripped
+            deserialized_json = json_backend.deserialize(line)
+        except Exception:
+            raise self._invalid_input_data_exc_factory.generate_invalid_input_data_exc("The supplied line does not contain valid JSON data!", line)
+
+        return wrapped_function(deserialized_json)
+
+    @final
+    def __get_json_backend_to_use(self) -> JSONBackendIface:
+        if self.__json_backend is None:
+            return DefaultJSONBackend.get_default_json_backend()
+
+        return self.__json_backend
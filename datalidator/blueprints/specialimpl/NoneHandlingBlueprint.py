@@ -20,9 +20,15 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import final, Final, Any, Optional, TypeVar, Generic
+from typing import final, Final, Any, Optional, Callable, TypeVar, Generic, TYPE_CHECKING
+from datalidator.exc.DatalidatorExc import DatalidatorExc
+from datalidator.exc.err.DatalidatorError import DatalidatorError
 from datalidator.blueprints.BlueprintIface import BlueprintIface
+from datalidator.blueprints.AsyncUseContext import AsyncUseContext
 from datalidator.blueprints.DefaultBlueprintImplBase import DefaultBlueprintImplBase
+from datalidator.blueprints.extras.UseResult import UseResult
+if TYPE_CHECKING:  # The compiler module imports this module
+    from datalidator.blueprints.compiler.BlueprintCompiler import BlueprintCompiler
 
 
 __all__ = "NoneHandlingBlueprint", "NoneHandlingBlueprint_T"
@@ -51,3 +57,38 @@ class NoneHandlingBlueprint(DefaultBlueprintImplBase[Optional[NoneHandlingBluepr
             return None
 
         return self.__wrapped_blueprint.use(input_data)
+
+    def _try_use(self, input_data: Any) -> UseResult[Optional[NoneHandlingBlueprint_T]]:
+        if input_data is None:
+            return UseResult.from_output(None)
+
+        return self._try_use_blueprint(self.__wrapped_blueprint, input_data)
+
+    async def _use_async(self, input_data: Any, async_use_context: AsyncUseContext) -> Optional[NoneHandlingBlueprint_T]:
+        if input_data is None:
+            return None
+
+        return await self._use_blueprint_async(self.__wrapped_blueprint, input_data, async_use_context)
+
+    def _benefits_from_async_use(self) -> bool:
+        return self._does_blueprint_benefit_from_async_use(self.__wrapped_blueprint)
+
+    def _requires_async_use(self) -> bool:
+        return self._does_blueprint_require_async_use(self.__wrapped_blueprint)
+
+    def _compile(self, blueprint_compiler: "BlueprintCompiler") -> Callable[[Any], Optional[NoneHandlingBlueprint_T]]:
+        wrapped_function = blueprint_compiler.compile_to_function(self.__wrapped_blueprint)
+        generate_unexpected_exception_raised_exc = self._generate_unexpected_exception_raised_in_blueprint_exc
+
+        def compiled_use(input_data: Any) -> Optional[NoneHandlingBlueprint_T]:
+            if input_data is None:
+                return None
+
+            try:
+                return wrapped_function(input_data)
+            except (DatalidatorExc, DatalidatorError):
+                raise
+            except Exception as f:
+                raise generate_unexpected_exception_raised_exc(f)
+
+        return compiled_use
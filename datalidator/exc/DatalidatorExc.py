@@ -20,7 +20,9 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
+from typing import final, Any, Callable, Dict, Optional, Tuple, Union
 import abc
+import copyreg
 from datalidator.exc.utils.OriginatorTagCarrierMixin import OriginatorTagCarrierMixin
 
 
@@ -36,8 +38,55 @@ class DatalidatorExc(Exception, OriginatorTagCarrierMixin, metaclass=abc.ABCMeta
      occur even when one is using the library in a completely correct way - for example when invalid input data are
      passed to a blueprint's use() method (which is something that will happen if this library is used to handle
      untrusted user input in any way).
+
+    The error message may also be passed to the initializer as a function which returns it. In such case, the message
+     is rendered only when it is needed for the first time (e.g. when str() is called on the exception, or when its
+     'args' are accessed), so that no time is spent building messages of exceptions which are caught and discarded.
     """
 
-    def __init__(self, error_message: str, originator_tag: str):  # = The error message is mandatory
-        Exception.__init__(self, error_message)
+    # Used when the error message was passed as a string or has already been rendered
+    __error_message_renderer: Optional[Callable[[], str]] = None
+
+    def __init__(self, error_message: Union[str, Callable[[], str]], originator_tag: str):  # = The error message is mandatory
+        if isinstance(error_message, str):
+            Exception.__init__(self, error_message)
+        else:
+            Exception.__init__(self)
+            self.__error_message_renderer = error_message
+
         OriginatorTagCarrierMixin.__init__(self, originator_tag)
+
+    @property
+    def args(self) -> Tuple[Any, ...]:
+        self.__render_error_message()
+        return Exception.args.__get__(self)  # 'args' is a data descriptor of BaseException
+
+    @args.setter
+    def args(self, args: Tuple[Any, ...]) -> None:
+        self.__error_message_renderer = None
+        Exception.args.__set__(self, args)
+
+    def __str__(self) -> str:
+        self.__render_error_message()
+        return Exception.__str__(self)
+
+    def __repr__(self) -> str:
+        self.__render_error_message()
+        return Exception.__repr__(self)
+
+    def __reduce__(self) -> Tuple[Callable[..., "DatalidatorExc"], Tuple[Any, ...], Dict[str, Any]]:
+        # The error message is rendered before pickling, as the function which renders it usually cannot be pickled.
+        #  The unpickled instance is created without calling the initializer (the initializers of subclasses accept
+        #  various arguments) - its 'args' are passed to BaseException.__new__() and its other attributes are restored
+        #  from '__dict__'.
+        self.__render_error_message()
+        return copyreg.__newobj__, (self.__class__, *Exception.args.__get__(self)), self.__dict__.copy()
+
+    @final
+    def __render_error_message(self) -> None:
+        error_message_renderer = self.__error_message_renderer
+        if error_message_renderer is None:
+            return
+
+        self.__error_message_renderer = None
+        Exception.args.__set__(self, (error_message_renderer(),))
@@ -20,7 +20,9 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
+from typing import Any, Callable, Dict, Tuple
 import abc
+import copyreg
 from datalidator.exc.utils.OriginatorTagCarrierMixin import OriginatorTagCarrierMixin
 
 
@@ -41,3 +43,8 @@ class DatalidatorError(RuntimeError, OriginatorTagCarrierMixin, metaclass=abc.AB
     def __init__(self, error_message: str, originator_tag: str):  # = The error message is mandatory
         RuntimeError.__init__(self, error_message)
         OriginatorTagCarrierMixin.__init__(self, originator_tag)
+
+    def __reduce__(self) -> Tuple[Callable[..., "DatalidatorError"], Tuple[Any, ...], Dict[str, Any]]:
+        # The initializers of subclasses accept various arguments, so the unpickled instance is created without calling
+        #  the initializer - see DatalidatorExc.__reduce__().
+        return copyreg.__newobj__, (self.__class__, *self.args), self.__dict__.copy()
@@ -0,0 +1,110 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from typing import final, Final, Optional, Generic, TypeVar
+import abc
+import asyncio
+from datalidator.exc.DatalidatorExc import DatalidatorExc
+from datalidator.exc.err.DatalidatorError import DatalidatorError
+from datalidator.filters.DefaultFilterImplBase import DefaultFilterImplBase
+from datalidator.filters.exc.TimeoutExpiredInFilterExc import TimeoutExpiredInFilterExc
+from datalidator.filters.exc.UnexpectedExceptionRaisedInFilterExc import UnexpectedExceptionRaisedInFilterExc
+from datalidator.filters.exc.err.AsyncFilterUsedSynchronouslyError import AsyncFilterUsedSynchronouslyError
+from datalidator.filters.exc.err.InvalidFilterConfigError import InvalidFilterConfigError
+
+
+__all__ = "DefaultAsyncFilterImplBase", "DefaultAsyncFilterImplBase_T"
+DefaultAsyncFilterImplBase_T = TypeVar("DefaultAsyncFilterImplBase_T")
+
+
+class DefaultAsyncFilterImplBase(DefaultFilterImplBase[DefaultAsyncFilterImplBase_T], Generic[DefaultAsyncFilterImplBase_T], metaclass=abc.ABCMeta):
+    """
+    An extension class of DefaultFilterImplBase for filters which need to wait for something (e.g. I/O) while filtering
+     data, without blocking the event loop they run in.
+
+    Asynchronous filters can only be used by blueprints which are used via the use_async() method (see
+     DefaultBlueprintImplBase.use_async()); their filter() method raises 'AsyncFilterUsedSynchronouslyError'. As each
+     filter receives the output of the previous one, blueprints run their filters one after another, no matter whether
+     they are synchronous or asynchronous.
+
+    If 'timeout' (in seconds) is not None, 'TimeoutExpiredInFilterExc' is raised when the filtering does not finish in
+     time.
+    """
+
+    __slots__ = "__timeout",
+
+    def __init__(self, timeout: Optional[float] = None, tag: str = ""):
+        DefaultFilterImplBase.__init__(self, tag)
+
+        self.__timeout: Final[Optional[float]] = timeout
+
+        if (self.__timeout is not None) and (self.__timeout <= 0):
+            raise InvalidFilterConfigError("The timeout must be positive!", self._tag)
+
+    @final
+    def get_timeout(self) -> Optional[float]:
+        return self.__timeout
+
+    @final
+    async def filter_async(self, data: DefaultAsyncFilterImplBase_T) -> DefaultAsyncFilterImplBase_T:
+        """
+        Filters 'data' and returns the result, like the filter() method of synchronous filters does.
+
+        :param data: The parsed data (i.e. NOT the untrusted input data!) to filter.
+        :return: The filtered data (must be of the same data type as the 'data' argument).
+        :raises DatalidatorExc: The superclass of all exceptions raised by this library.
+        """
+
+        try:
+            if self.__timeout is None:
+                return await self._filter_async(data)
+
+            return await asyncio.wait_for(self._filter_async(data), self.__timeout)
+        except (DatalidatorExc, DatalidatorError) as e:
+            raise e
+        except Exception as f:
+            if (self.__timeout is not None) and isinstance(f, asyncio.TimeoutError):
+                raise TimeoutExpiredInFilterExc("The filtering did not finish within {} second(s)!".format(self.__timeout), self._tag)
+
+            raise UnexpectedExceptionRaisedInFilterExc("{}: {}".format(f.__class__.__name__, str(f)), self._tag, f)
+
+    @final
+    def _filter(self, data: DefaultAsyncFilterImplBase_T) -> DefaultAsyncFilterImplBase_T:
+        raise AsyncFilterUsedSynchronouslyError(
+            "The asynchronous filter {} can only be used by blueprints used via the use_async() method!".format(self.__class__.__name__),
+            self._tag
+        )
+
+    @abc.abstractmethod
+    async def _filter_async(self, data: DefaultAsyncFilterImplBase_T) -> DefaultAsyncFilterImplBase_T:
+        """
+        Filters 'data', i.e. modifies them in a way specific for each concrete filter class, and returns the result.
+         See the docstring of the 'DefaultFilterImplBase._filter()' method for more information.
+
+        This method is called by the @final filter_async() method, which enforces the timeout, if there is one.
+
+        :param data: The parsed data (i.e. NOT the untrusted input data!) to filter.
+        :return: The filtered data (must be of the same data type as the 'data' argument).
+        :raises DatalidatorExc: The superclass of all exceptions raised by this library.
+        """
+
+        raise NotImplementedError(DefaultAsyncFilterImplBase._filter_async.__qualname__)
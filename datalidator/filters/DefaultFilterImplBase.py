@@ -20,7 +20,7 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import final, Generic, TypeVar
+from typing import final, Generic, TypeVar, FrozenSet, Type
 import abc
 from datalidator.DefaultDatalidatorObjectImplBase import DefaultDatalidatorObjectImplBase
 from datalidator.exc.DatalidatorExc import DatalidatorExc
@@ -47,6 +47,21 @@ class DefaultFilterImplBase(FilterIface[DefaultFilterImplBase_T], DefaultDatalid
     def __init__(self, tag: str = ""):
         DefaultDatalidatorObjectImplBase.__init__(self, tag)
 
+    def get_exactly_preserved_data_types(self) -> FrozenSet[Type]:
+        """
+        Returns the data types which this filter is guaranteed to preserve exactly - if the data passed to filter() are
+         of exactly (not a subclass of) one of the returned data types, the filtered data are of exactly the same data
+         type. Blueprints make use of this guarantee to skip checking the data type of the filter's output data.
+
+        The default implementation returns an empty set (i.e. nothing is guaranteed). Subclasses should override this
+         method only if the guarantee holds for all possible configurations of the filter, and subclasses of filters
+         which override this method must override it as well if they change the way data are filtered.
+
+        :return: The data types which this filter is guaranteed to preserve exactly.
+        """
+
+        return frozenset()
+
     @final
     def filter(self, data: DefaultFilterImplBase_T) -> DefaultFilterImplBase_T:
         # For possible future expansion.
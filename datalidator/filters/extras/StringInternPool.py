@@ -0,0 +1,140 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from typing import final, Final, Dict, Tuple, Type, Optional
+import sys
+import threading
+from datalidator.filters.extras.StringInternPoolStatistics import StringInternPoolStatistics
+from datalidator.filters.exc.err.InvalidFilterConfigError import InvalidFilterConfigError
+
+
+__all__ = "StringInternPool",
+
+
+@final
+class StringInternPool:
+    """
+    A bounded pool of strings used by 'StringInternFilter' to deduplicate equal strings, so that e.g. millions of
+     validated records containing one of a few hundred distinct category values hold only a few hundred string objects.
+
+    Unlike sys.intern(), the pool does not make the strings immortal - it is an ordinary dictionary, so the strings are
+     freed when the pool is cleared or garbage-collected. The pool holds at most 'max_size' strings; once it is full,
+     strings which are not in the pool yet are returned as they are (the strings which occur often usually occur early,
+     so they are already pooled by then).
+
+    A single pool can be shared by any number of filters (and blueprints), even from multiple threads. Filters which
+     have not been provided with a pool use the process-wide default pool (see get_default_intern_pool()).
+
+    NOTE: The pool is not pickled - unpickled pools are empty.
+    """
+
+    __slots__ = "__max_size", "__pool", "__lock", "__hit_count", "__miss_count", "__rejection_count", "__pooled_byte_count", "__saved_byte_count"
+
+    _DEFAULT_MAX_SIZE: Final[int] = 65536
+
+    __default_intern_pool: Optional["StringInternPool"] = None  # Created lazily - see get_default_intern_pool()
+    __default_intern_pool_lock: Final[threading.Lock] = threading.Lock()
+
+    def __init__(self, max_size: int = _DEFAULT_MAX_SIZE):
+        self.__max_size: Final[int] = max_size
+
+        if self.__max_size < 1:
+            raise InvalidFilterConfigError("The maximum size of the string intern pool must be at least 1!", "")
+
+        self.__pool: Final[Dict[str, str]] = {}
+        self.__lock: Final[threading.Lock] = threading.Lock()
+        self.__hit_count: int = 0
+        self.__miss_count: int = 0
+        self.__rejection_count: int = 0
+        self.__pooled_byte_count: int = 0
+        self.__saved_byte_count: int = 0
+
+    def __reduce__(self) -> Tuple[Type["StringInternPool"], Tuple[int]]:
+        return self.__class__, (self.__max_size,)
+
+    @classmethod
+    def get_default_intern_pool(cls) -> "StringInternPool":
+        default_intern_pool = cls.__default_intern_pool
+        if default_intern_pool is not None:
+            return default_intern_pool
+
+        # Without the lock, threads interning their first strings at the same time could each create a separate pool
+        with cls.__default_intern_pool_lock:
+            if cls.__default_intern_pool is None:
+                cls.__default_intern_pool = cls()
+
+            return cls.__default_intern_pool
+
+    @classmethod
+    def set_default_intern_pool(cls, intern_pool: "StringInternPool") -> None:
+        with cls.__default_intern_pool_lock:
+            cls.__default_intern_pool = intern_pool
+
+    @final
+    def get_max_size(self) -> int:
+        return self.__max_size
+
+    @final
+    def intern(self, string: str) -> str:
+        """
+        Returns the pooled string equal to 'string' if there is one; otherwise, 'string' is added to the pool (if it is
+         not full) and returned.
+
+        :param string: The string to intern. It must be an instance of exactly the 'str' class, not of its subclass.
+        :return: A string equal to 'string'.
+        """
+
+        with self.__lock:
+            pooled_string = self.__pool.get(string, None)
+
+            if pooled_string is not None:
+                self.__hit_count += 1
+                if pooled_string is not string:
+                    self.__saved_byte_count += sys.getsizeof(string)
+                return pooled_string
+
+            if len(self.__pool) >= self.__max_size:
+                self.__rejection_count += 1
+                return string
+
+            self.__pool[string] = string
+            self.__miss_count += 1
+            self.__pooled_byte_count += sys.getsizeof(string)
+            return string
+
+    @final
+    def clear(self) -> None:
+        """
+        Removes all the strings from the pool. The statistics, except for the pooled byte count, are not reset.
+        """
+
+        with self.__lock:
+            self.__pool.clear()
+            self.__pooled_byte_count = 0
+
+    @final
+    def get_statistics(self) -> StringInternPoolStatistics:
+        with self.__lock:
+            return StringInternPoolStatistics(
+                self.__hit_count, self.__miss_count, self.__rejection_count, len(self.__pool), self.__max_size,
+                self.__pooled_byte_count, self.__saved_byte_count
+            )
@@ -0,0 +1,79 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from typing import final, Final
+
+
+__all__ = "StringInternPoolStatistics",
+
+
+@final
+class StringInternPoolStatistics:
+    """
+    A snapshot of the statistics of a StringInternPool, as returned by its 'get_statistics()' method.
+
+    The byte counts are computed using sys.getsizeof(), so they include the per-object overhead of the strings.
+    """
+
+    __slots__ = "__hit_count", "__miss_count", "__rejection_count", "__current_size", "__max_size", "__pooled_byte_count", "__saved_byte_count"
+
+    def __init__(self, hit_count: int, miss_count: int, rejection_count: int, current_size: int, max_size: int, pooled_byte_count: int, saved_byte_count: int):
+        self.__hit_count: Final[int] = hit_count
+        self.__miss_count: Final[int] = miss_count
+        self.__rejection_count: Final[int] = rejection_count
+        self.__current_size: Final[int] = current_size
+        self.__max_size: Final[int] = max_size
+        self.__pooled_byte_count: Final[int] = pooled_byte_count
+        self.__saved_byte_count: Final[int] = saved_byte_count
+
+    @final
+    def get_hit_count(self) -> int:
+        # The number of strings which were replaced by an equal string from the pool
+        return self.__hit_count
+
+    @final
+    def get_miss_count(self) -> int:
+        # The number of strings which were added to the pool
+        return self.__miss_count
+
+    @final
+    def get_rejection_count(self) -> int:
+        # The number of strings which were not found in the pool and could not be added to it, as it was full
+        return self.__rejection_count
+
+    @final
+    def get_current_size(self) -> int:
+        return self.__current_size
+
+    @final
+    def get_max_size(self) -> int:
+        return self.__max_size
+
+    @final
+    def get_pooled_byte_count(self) -> int:
+        # The memory occupied by the strings held by the pool
+        return self.__pooled_byte_count
+
+    @final
+    def get_saved_byte_count(self) -> int:
+        # The memory occupied by the strings which were replaced by pooled strings (and can therefore be freed)
+        return self.__saved_byte_count
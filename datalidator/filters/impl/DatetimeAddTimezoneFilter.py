@@ -20,7 +20,7 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import final, Final
+from typing import final, Final, FrozenSet, Type
 import datetime
 from datalidator.filters.DefaultFilterImplBase import DefaultFilterImplBase
 
@@ -45,6 +45,9 @@ class DatetimeAddTimezoneFilter(DefaultFilterImplBase[datetime.datetime]):
     def get_added_timezone(self) -> datetime.tzinfo:
         return self.__added_timezone
 
+    def get_exactly_preserved_data_types(self) -> FrozenSet[Type]:
+        return frozenset((datetime.datetime,))
+
     def _filter(self, data: datetime.datetime) -> datetime.datetime:
         if data.tzinfo is None:  # = If the input datetime.datetime object is naive
             data = data.replace(tzinfo=self.__added_timezone)
@@ -20,7 +20,8 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import List, Generic, TypeVar
+from typing import List, Set, Generic, TypeVar, FrozenSet, Type, Any
+from datalidator.EqualityKeyHelper import EqualityKeyHelper
 from datalidator.filters.DefaultFilterImplBase import DefaultFilterImplBase
 
 
@@ -31,19 +32,38 @@ ListDeduplicateItemsFilter_T = TypeVar("ListDeduplicateItemsFilter_T")
 class ListDeduplicateItemsFilter(DefaultFilterImplBase[List[ListDeduplicateItemsFilter_T]], Generic[ListDeduplicateItemsFilter_T]):
     """
     Returns a new list with unique values from the input list (= duplicate values are reduced to one such value).
-    The input list remains unmodified.
+    The input list remains unmodified. The first occurrence of each value is kept, and the items are compared using
+     the '==' operator.
+
+    Items which have an equality key (see EqualityKeyHelper; e.g. strings, numbers, or lists and dictionaries
+     containing only such values) are deduplicated using a set, so lists consisting of them are processed in linear
+     time. Only the other items (e.g. instances of user-defined classes) are compared with the kept items one by one.
     """
 
     __slots__ = ()
 
+    def get_exactly_preserved_data_types(self) -> FrozenSet[Type]:
+        return frozenset((list,))
+
     def _filter(self, data: List[ListDeduplicateItemsFilter_T]) -> List[ListDeduplicateItemsFilter_T]:
         # Converting the input list to set and then back to list would not be possible in all cases, because the items
-        #  would have to be Hashable!
+        #  would have to be Hashable! The items which do not have an equality key are therefore compared with all the
+        #  kept items, and the items which have one are compared with the kept items which do not have one.
 
+        no_equality_key = EqualityKeyHelper.NO_EQUALITY_KEY
         deduplicated_list = []
+        kept_equality_keys: Set[Any] = set()
+        kept_items_without_equality_key = []
 
         for item in data:
-            if item not in deduplicated_list:
+            equality_key = EqualityKeyHelper.get_equality_key(item)
+
+            if equality_key is no_equality_key:
+                if item not in deduplicated_list:
+                    deduplicated_list.append(item)
+                    kept_items_without_equality_key.append(item)
+            elif (equality_key not in kept_equality_keys) and (item not in kept_items_without_equality_key):
                 deduplicated_list.append(item)
+                kept_equality_keys.add(equality_key)
 
         return deduplicated_list
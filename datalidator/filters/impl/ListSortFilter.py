@@ -20,7 +20,7 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import final, Final, Optional, Any, List, Generic, Callable, TypeVar
+from typing import final, Final, Optional, Any, List, Generic, Callable, TypeVar, FrozenSet, Type
 from datalidator.filters.DefaultFilterImplBase import DefaultFilterImplBase
 from datalidator.filters.exc.SortingFailedInFilterExc import SortingFailedInFilterExc
 
@@ -52,6 +52,9 @@ class ListSortFilter(DefaultFilterImplBase[List[ListSortFilter_T]], Generic[List
     def is_order_reversed(self) -> bool:
         return self.__reverse_order
 
+    def get_exactly_preserved_data_types(self) -> FrozenSet[Type]:
+        return frozenset((list,))
+
     def _filter(self, data: List[ListSortFilter_T]) -> List[ListSortFilter_T]:
         try:
             return sorted(data, key=self.__comparison_key_extraction_function, reverse=self.__reverse_order)
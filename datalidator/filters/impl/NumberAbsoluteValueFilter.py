@@ -20,7 +20,7 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import Generic, TypeVar
+from typing import Generic, TypeVar, FrozenSet, Type
 from datalidator.filters.DefaultFilterImplBase import DefaultFilterImplBase
 
 
@@ -35,5 +35,8 @@ class NumberAbsoluteValueFilter(DefaultFilterImplBase[NumberAbsoluteValueFilter_
 
     __slots__ = ()
 
+    def get_exactly_preserved_data_types(self) -> FrozenSet[Type]:
+        return frozenset((int, float))
+
     def _filter(self, data: NumberAbsoluteValueFilter_Number) -> NumberAbsoluteValueFilter_Number:
         return abs(data)
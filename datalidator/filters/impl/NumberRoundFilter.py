@@ -20,7 +20,7 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import final, Final, Generic, TypeVar
+from typing import final, Final, Generic, TypeVar, FrozenSet, Type
 from datalidator.filters.DefaultFilterImplBase import DefaultFilterImplBase
 
 
@@ -44,6 +44,9 @@ class NumberRoundFilter(DefaultFilterImplBase[NumberRoundFilter_Number], Generic
     def get_decimal_places(self) -> int:
         return self.__decimal_places
 
+    def get_exactly_preserved_data_types(self) -> FrozenSet[Type]:
+        return frozenset((int, float))
+
     def _filter(self, data: NumberRoundFilter_Number) -> NumberRoundFilter_Number:
         # The round() function always returns a number of the same type as the input number, but only if the second
         #  argument (decimal places) is provided!
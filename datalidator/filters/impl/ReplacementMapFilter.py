@@ -20,7 +20,8 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import final, Final, Sequence, Tuple, Generic, TypeVar
+from typing import final, Final, Sequence, Tuple, Dict, Optional, Any, Generic, TypeVar
+from datalidator.EqualityKeyHelper import EqualityKeyHelper
 from datalidator.filters.DefaultFilterImplBase import DefaultFilterImplBase
 from datalidator.filters.exc.err.InvalidFilterConfigError import InvalidFilterConfigError
 
@@ -34,30 +35,108 @@ class ReplacementMapFilter(DefaultFilterImplBase[ReplacementMapFilter_T], Generi
     If the input value is found in the first item of a tuple in the initializer-provided replacement map (= a sequence
      of such tuples), the second item of the same tuple is returned instead. Keep in mind that the replacement value is
      returned as it is; therefore, using this filter with mutable values is not recommended!
-    Input values not found in the replacement map are returned as they are.
+    Input values not found in the replacement map are returned as they are. If the input value is equal to multiple
+     old values in the replacement map, the first of them wins.
 
-    NOTE: Input values are compared with the old values in the replacement map using the '==' operator.
+    If 'case_insensitive' is True, input strings are compared with old string values in the replacement map
+     case-insensitively (using str.casefold()); all other values are compared as usual.
+
+    NOTE: Input values are compared with the old values in the replacement map using the '==' operator. However, the
+     old values which have an equality key (see EqualityKeyHelper; e.g. strings, numbers, or lists containing only
+     such values) are put into a dictionary when the filter is initialized, so input values which have one are looked
+     up in (amortized) constant time, regardless of the size of the replacement map. Other input values (e.g. instances
+     of user-defined classes, including subclasses of the built-in types) are compared with all the old values one by
+     one.
     """
 
-    __slots__ = "__replacement_map",
+    __slots__ = "__replacement_map", "__case_insensitive", "__indexed_entries", "__unindexed_entries", "__comparison_entries"
+
+    __TRANSIENT_SLOTS: Final[Tuple[str, ...]] = ("__indexed_entries", "__unindexed_entries", "__comparison_entries")
 
-    def __init__(self, replacement_map: Sequence[Tuple[ReplacementMapFilter_T, ReplacementMapFilter_T]], tag: str = ""):
+    def __init__(self, replacement_map: Sequence[Tuple[ReplacementMapFilter_T, ReplacementMapFilter_T]], case_insensitive: bool = False, tag: str = ""):
         DefaultFilterImplBase.__init__(self, tag)
 
         # Converting the sequence to tuple to prevent it from being (accidentally) modified from the outside.
         # The replacement map is not provided as a dictionary, because the replaced (old) value would have to be Hashable.
         self.__replacement_map: Final[Tuple[Tuple[ReplacementMapFilter_T, ReplacementMapFilter_T], ...]] = tuple(replacement_map)
+        self.__case_insensitive: Final[bool] = case_insensitive
 
         if len(self.__replacement_map) == 0:
             raise InvalidFilterConfigError("The replacement map is empty!", self._tag)
 
+        self.__initialize_transient_slots()
+
+    @final
+    def __initialize_transient_slots(self) -> None:
+        # The entries are (old value's position in the replacement map, old value's comparison key, new value) tuples.
+        #  The comparison key is the old value itself, or the casefolded old value in case-insensitive mode. The indexed
+        #  entries are looked up by the equality key of the comparison key (see EqualityKeyHelper).
+        no_equality_key = EqualityKeyHelper.NO_EQUALITY_KEY
+        indexed_entries = {}
+        unindexed_entries = []
+        comparison_entries = []
+
+        for position, (old_item, new_item) in enumerate(self.__replacement_map):
+            comparison_key = self.__get_comparison_key(old_item)
+            comparison_entries.append((position, comparison_key, new_item))
+
+            equality_key = EqualityKeyHelper.get_equality_key(comparison_key)
+            if equality_key is not no_equality_key and self.__is_value_equal_to_itself(comparison_key):
+                indexed_entries.setdefault(equality_key, (position, comparison_key, new_item))  # The first match wins
+            else:
+                unindexed_entries.append((position, comparison_key, new_item))
+
+        self.__indexed_entries: Final[Dict[Any, Tuple[int, Any, ReplacementMapFilter_T]]] = indexed_entries
+        self.__unindexed_entries: Final[Tuple[Tuple[int, Any, ReplacementMapFilter_T], ...]] = tuple(unindexed_entries)
+        self.__comparison_entries: Final[Tuple[Tuple[int, Any, ReplacementMapFilter_T], ...]] = tuple(comparison_entries)
+
+    @final
+    def __is_value_equal_to_itself(self, value: Any) -> bool:
+        # Equality keys (like the 'in' operator) consider identical objects equal, even NaNs, which are not equal to
+        #  themselves when compared using the '==' operator
+        try:
+            return bool(value == value)
+        except Exception:
+            return False
+
     @final
     def get_replacement_map(self) -> Sequence[Tuple[ReplacementMapFilter_T, ReplacementMapFilter_T]]:
         return self.__replacement_map  # An *immutable* sequence (tuple) is returned
 
+    @final
+    def is_case_insensitive(self) -> bool:
+        return self.__case_insensitive
+
     def _filter(self, data: ReplacementMapFilter_T) -> ReplacementMapFilter_T:
-        for old_item, new_item in self.__replacement_map:
-            if old_item == data:
+        comparison_key = self.__get_comparison_key(data)
+        equality_key = EqualityKeyHelper.get_equality_key(comparison_key)
+
+        if equality_key is EqualityKeyHelper.NO_EQUALITY_KEY:
+            # Such a value might be equal to an indexed value, while not having the same hash (or any hash at all)
+            return self.__find_new_item(comparison_key, self.__comparison_entries, None, data)
+
+        indexed_entry = self.__indexed_entries.get(equality_key, None)
+
+        if indexed_entry is None:
+            return self.__find_new_item(comparison_key, self.__unindexed_entries, None, data)
+
+        # An unindexed old value preceding the indexed one in the replacement map might be equal to the input as well
+        return self.__find_new_item(comparison_key, self.__unindexed_entries, indexed_entry[0], indexed_entry[2])
+
+    @final
+    def __find_new_item(self, comparison_key: Any, entries: Tuple[Tuple[int, Any, ReplacementMapFilter_T], ...], end_position: Optional[int], default: ReplacementMapFilter_T) -> ReplacementMapFilter_T:
+        for position, old_comparison_key, new_item in entries:
+            if end_position is not None and position >= end_position:
+                break
+
+            if old_comparison_key == comparison_key:
                 return new_item
 
-        return data
+        return default
+
+    @final
+    def __get_comparison_key(self, value: Any) -> Any:
+        if self.__case_insensitive and isinstance(value, str):
+            return str.casefold(value)  # Returns an instance of exactly 'str', even if 'value' is an instance of its subclass
+
+        return value
@@ -20,6 +20,7 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
+from typing import FrozenSet, Type
 from datalidator.filters.DefaultFilterImplBase import DefaultFilterImplBase
 
 
@@ -34,5 +35,8 @@ class StringAlwaysEmptyFilter(DefaultFilterImplBase[str]):
 
     __slots__ = ()
 
+    def get_exactly_preserved_data_types(self) -> FrozenSet[Type]:
+        return frozenset((str,))
+
     def _filter(self, data: str) -> str:
         return ""
@@ -20,8 +20,8 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import final, Final
-import unicodedata
+from typing import final, Final, FrozenSet, Type
+from datalidator.ControlAndSeparatorCharacterHelper import ControlAndSeparatorCharacterHelper
 from datalidator.filters.DefaultFilterImplBase import DefaultFilterImplBase
 
 
@@ -50,9 +50,13 @@ class StringControlAndSeparatorCharacterFilter(DefaultFilterImplBase[str]):
     def get_allowed_characters(self) -> str:
         return self.__allowed_characters
 
+    def get_exactly_preserved_data_types(self) -> FrozenSet[Type]:
+        return frozenset((str,))
+
     def _filter(self, data: str) -> str:
-        return "".join(filter(self.__is_character_allowed_in_output, data))
+        # The characters are looked up in precomputed tables (see ControlAndSeparatorCharacterHelper) instead of
+        #  calling unicodedata.category() for each of them
+        if data.isascii():
+            return data.translate(ControlAndSeparatorCharacterHelper.get_ascii_deletion_table(self.__allowed_characters))
 
-    @final
-    def __is_character_allowed_in_output(self, char: str) -> bool:
-        return (char in self.__allowed_characters) or (unicodedata.category(char)[0].upper() not in ("C", "Z"))
+        return ControlAndSeparatorCharacterHelper.get_character_regex(self.__allowed_characters).sub("", data)
@@ -20,7 +20,7 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import Final
+from typing import Final, FrozenSet, Type
 from datalidator.filters.DefaultFilterImplBase import DefaultFilterImplBase
 from datalidator.filters.impl.StringRegexReplaceFilter import StringRegexReplaceFilter
 
@@ -46,5 +46,8 @@ class StringDeduplicateWhitespaceFilter(DefaultFilterImplBase[str]):
             tag=self._tag
         )
 
+    def get_exactly_preserved_data_types(self) -> FrozenSet[Type]:
+        return frozenset((str,))
+
     def _filter(self, data: str) -> str:
         return self.__regex_replacement_filter.filter(data)
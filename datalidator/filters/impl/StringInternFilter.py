@@ -0,0 +1,64 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from typing import final, Final, FrozenSet, Optional, Type
+from datalidator.filters.DefaultFilterImplBase import DefaultFilterImplBase
+from datalidator.filters.extras.StringInternPool import StringInternPool
+
+
+__all__ = "StringInternFilter",
+
+
+class StringInternFilter(DefaultFilterImplBase[str]):
+    """
+    Replaces the input string with an equal string from the initializer-provided 'intern_pool' (see StringInternPool),
+     or from the process-wide default pool if 'intern_pool' is None. The filter should be the last one in the
+     blueprint's filter sequence, so that the final output strings are deduplicated.
+
+    This greatly reduces the memory usage of programs which keep many validated records containing repeated string
+     values (e.g. categories or country codes) in memory, as each distinct value is then held in memory only once.
+     Instances of 'str' subclasses are returned as they are.
+    """
+
+    __slots__ = "__intern_pool",
+
+    def __init__(self, intern_pool: Optional[StringInternPool] = None, tag: str = ""):
+        DefaultFilterImplBase.__init__(self, tag)
+
+        self.__intern_pool: Final[Optional[StringInternPool]] = intern_pool
+
+    @final
+    def get_intern_pool(self) -> StringInternPool:
+        # The default pool is looked up each time, so that it can be changed even after the filter has been created
+        if self.__intern_pool is None:
+            return StringInternPool.get_default_intern_pool()
+
+        return self.__intern_pool
+
+    def get_exactly_preserved_data_types(self) -> FrozenSet[Type]:
+        return frozenset((str,))
+
+    def _filter(self, data: str) -> str:
+        if data.__class__ is not str:
+            return data
+
+        return self.get_intern_pool().intern(data)
@@ -20,6 +20,7 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
+from typing import FrozenSet, Type
 from datalidator.filters.DefaultFilterImplBase import DefaultFilterImplBase
 
 
@@ -33,5 +34,8 @@ class StringLowercaseFilter(DefaultFilterImplBase[str]):
 
     __slots__ = ()
 
+    def get_exactly_preserved_data_types(self) -> FrozenSet[Type]:
+        return frozenset((str,))
+
     def _filter(self, data: str) -> str:
         return data.lower()
@@ -20,7 +20,7 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import final, Final, Union, Callable
+from typing import final, Final, Union, Callable, FrozenSet, Type
 import re
 from datalidator.filters.DefaultFilterImplBase import DefaultFilterImplBase
 from datalidator.filters.exc.RegexFailedInFilterExc import RegexFailedInFilterExc
@@ -81,6 +81,9 @@ class StringRegexReplaceFilter(DefaultFilterImplBase[str]):
     def get_regex_compile_flags(self) -> int:
         return self.__regex_compile_flags
 
+    def get_exactly_preserved_data_types(self) -> FrozenSet[Type]:
+        return frozenset((str,))
+
     def _filter(self, data: str) -> str:
         try:
             return self.__complied_regex.sub(self.__replacement, data, self.__max_replacement_count)
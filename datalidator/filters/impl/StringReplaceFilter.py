@@ -20,7 +20,7 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import final, Final
+from typing import final, Final, FrozenSet, Type
 from datalidator.filters.DefaultFilterImplBase import DefaultFilterImplBase
 from datalidator.filters.exc.err.InvalidFilterConfigError import InvalidFilterConfigError
 
@@ -67,5 +67,8 @@ class StringReplaceFilter(DefaultFilterImplBase[str]):
     def get_max_replacement_count(self) -> int:
         return self.__max_replacement_count
 
+    def get_exactly_preserved_data_types(self) -> FrozenSet[Type]:
+        return frozenset((str,))
+
     def _filter(self, data: str) -> str:
         return data.replace(self.__old_substring, self.__new_substring, self.__max_replacement_count)
@@ -20,7 +20,7 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import final, Final, Optional
+from typing import final, Final, Optional, FrozenSet, Type
 from datalidator.filters.DefaultFilterImplBase import DefaultFilterImplBase
 from datalidator.filters.exc.err.InvalidFilterConfigError import InvalidFilterConfigError
 
@@ -65,6 +65,9 @@ class StringStripFilter(DefaultFilterImplBase[str]):
     def get_stripped_characters(self) -> Optional[str]:
         return self.__stripped_characters
 
+    def get_exactly_preserved_data_types(self) -> FrozenSet[Type]:
+        return frozenset((str,))
+
     def _filter(self, data: str) -> str:
         if self.__do_left_strip:
             data = data.lstrip(self.__stripped_characters)
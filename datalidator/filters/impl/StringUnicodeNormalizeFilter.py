@@ -20,7 +20,7 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import final, Final, Tuple
+from typing import final, Final, Tuple, FrozenSet, Type
 import unicodedata
 from datalidator.filters.DefaultFilterImplBase import DefaultFilterImplBase
 from datalidator.filters.exc.err.InvalidFilterConfigError import InvalidFilterConfigError
@@ -65,5 +65,8 @@ class StringUnicodeNormalizeFilter(DefaultFilterImplBase[str]):
     def get_normal_form(self) -> str:
         return self.__normal_form
 
+    def get_exactly_preserved_data_types(self) -> FrozenSet[Type]:
+        return frozenset((str,))
+
     def _filter(self, data: str) -> str:
         return unicodedata.normalize(self.__normal_form, data)
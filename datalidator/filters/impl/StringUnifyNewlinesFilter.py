@@ -20,7 +20,7 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import final, Final
+from typing import final, Final, FrozenSet, Type
 from datalidator.DatalidatorConstants import DatalidatorConstants
 from datalidator.filters.DefaultFilterImplBase import DefaultFilterImplBase
 from datalidator.filters.impl.StringRegexReplaceFilter import StringRegexReplaceFilter
@@ -65,5 +65,8 @@ class StringUnifyNewlinesFilter(DefaultFilterImplBase[str]):
     def get_replacement_newline(self) -> str:
         return self.__replacement_newline
 
+    def get_exactly_preserved_data_types(self) -> FrozenSet[Type]:
+        return frozenset((str,))
+
     def _filter(self, data: str) -> str:
         return self.__regex_replace_filter.filter(data)
@@ -20,7 +20,7 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import final, Final
+from typing import final, Final, FrozenSet, Type
 import re
 from datalidator.filters.DefaultFilterImplBase import DefaultFilterImplBase
 from datalidator.filters.impl.StringRegexReplaceFilter import StringRegexReplaceFilter
@@ -60,5 +60,8 @@ class StringUnifyWhitespaceFilter(DefaultFilterImplBase[str]):
     def get_replacement_whitespace(self) -> str:
         return self.__replacement_whitespace
 
+    def get_exactly_preserved_data_types(self) -> FrozenSet[Type]:
+        return frozenset((str,))
+
     def _filter(self, data: str) -> str:
         return self.__regex_replacement_filter.filter(data)
@@ -0,0 +1,111 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from typing import final, Final, Optional, Generic, TypeVar
+import abc
+import asyncio
+from datalidator.exc.DatalidatorExc import DatalidatorExc
+from datalidator.exc.err.DatalidatorError import DatalidatorError
+from datalidator.validators.DefaultValidatorImplBase import DefaultValidatorImplBase
+from datalidator.validators.exc.TimeoutExpiredInValidatorExc import TimeoutExpiredInValidatorExc
+from datalidator.validators.exc.UnexpectedExceptionRaisedInValidatorExc import UnexpectedExceptionRaisedInValidatorExc
+from datalidator.validators.exc.err.AsyncValidatorUsedSynchronouslyError import AsyncValidatorUsedSynchronouslyError
+from datalidator.validators.exc.err.InvalidValidatorConfigError import InvalidValidatorConfigError
+
+
+__all__ = "DefaultAsyncValidatorImplBase", "DefaultAsyncValidatorImplBase_T"
+DefaultAsyncValidatorImplBase_T = TypeVar("DefaultAsyncValidatorImplBase_T")
+
+
+class DefaultAsyncValidatorImplBase(DefaultValidatorImplBase[DefaultAsyncValidatorImplBase_T], Generic[DefaultAsyncValidatorImplBase_T], metaclass=abc.ABCMeta):
+    """
+    An extension class of DefaultValidatorImplBase for validators which need to wait for something (e.g. I/O, such as
+     a cache or DNS lookup) while validating data, without blocking the event loop they run in.
+
+    Asynchronous validators can only be used by blueprints which are used via the use_async() method (see
+     DefaultBlueprintImplBase.use_async()); their validate() method raises 'AsyncValidatorUsedSynchronouslyError'.
+     Blueprints run their synchronous validators first, and then all their asynchronous validators concurrently - if
+     more than one of the asynchronous validators fails, the exception of the one which comes first in the blueprint's
+     validator sequence is raised.
+
+    If 'timeout' (in seconds) is not None, 'TimeoutExpiredInValidatorExc' is raised when the validation does not finish
+     in time.
+    """
+
+    __slots__ = "__timeout",
+
+    def __init__(self, timeout: Optional[float] = None, tag: str = ""):
+        DefaultValidatorImplBase.__init__(self, tag)
+
+        self.__timeout: Final[Optional[float]] = timeout
+
+        if (self.__timeout is not None) and (self.__timeout <= 0):
+            raise InvalidValidatorConfigError("The timeout must be positive!", self._tag)
+
+    @final
+    def get_timeout(self) -> Optional[float]:
+        return self.__timeout
+
+    @final
+    async def validate_async(self, data: DefaultAsyncValidatorImplBase_T) -> None:
+        """
+        Checks whether 'data' meet the validator's requirements, like the validate() method of synchronous validators
+         does.
+
+        :param data: The parsed data (i.e. NOT the untrusted input data!) to check.
+        :raises DatalidatorExc: The superclass of all exceptions raised by this library.
+        """
+
+        try:
+            if self.__timeout is None:
+                return await self._validate_async(data)
+
+            return await asyncio.wait_for(self._validate_async(data), self.__timeout)
+        except (DatalidatorExc, DatalidatorError) as e:
+            raise e
+        except Exception as f:
+            if (self.__timeout is not None) and isinstance(f, asyncio.TimeoutError):
+                raise TimeoutExpiredInValidatorExc("The validation did not finish within {} second(s)!".format(self.__timeout), self._tag)
+
+            raise UnexpectedExceptionRaisedInValidatorExc("{}: {}".format(f.__class__.__name__, str(f)), self._tag, f)
+
+    @final
+    def _validate(self, data: DefaultAsyncValidatorImplBase_T) -> None:
+        raise AsyncValidatorUsedSynchronouslyError(
+            "The asynchronous validator {} can only be used by blueprints used via the use_async() method!".format(self.__class__.__name__),
+            self._tag
+        )
+
+    @abc.abstractmethod
+    async def _validate_async(self, data: DefaultAsyncValidatorImplBase_T) -> None:
+        """
+        Checks whether 'data' meet the validator's requirements. If not, 'DataValidationFailedExc' must get raised (the
+         '_generate_data_validation_failed_exc()' method of this class should be used to instantiate it). See the
+         docstring of the 'DefaultValidatorImplBase._validate()' method for more information.
+
+        This method is called by the @final validate_async() method, which enforces the timeout, if there is one.
+
+        :param data: The parsed data (i.e. NOT the untrusted input data!) to check.
+        :raises DatalidatorExc: The superclass of all exceptions raised by this library.
+        """
+
+        raise NotImplementedError(DefaultAsyncValidatorImplBase._validate_async.__qualname__)
@@ -20,7 +20,7 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import final, Generic, TypeVar
+from typing import final, Optional, Generic, TypeVar
 import abc
 from datalidator.DefaultDatalidatorObjectImplBase import DefaultDatalidatorObjectImplBase
 from datalidator.exc.DatalidatorExc import DatalidatorExc
@@ -50,30 +50,66 @@ class DefaultValidatorImplBase(ValidatorIface[DefaultValidatorImplBase_T], Defau
 
     @final
     def validate(self, data: DefaultValidatorImplBase_T) -> None:
-        # For possible future expansion.
-        return self.__validate_in_exception_handling_context(data)
-
-    @final
-    def __validate_in_exception_handling_context(self, data: DefaultValidatorImplBase_T) -> None:
+        # The exception handling context is inlined here (instead of calling try_validate()), as this method is called
+        #  by blueprints for each piece of data they validate.
         try:
-            return self._validate(data)
+            validation_exception = self._validate(data)
         except (DatalidatorExc, DatalidatorError) as e:
             raise e
         except Exception as f:
             raise UnexpectedExceptionRaisedInValidatorExc("{}: {}".format(f.__class__.__name__, str(f)), self._tag, f)
 
+        # Validators which were written before '_validate()' could return exceptions might return arbitrary values. The
+        #  None check comes first, as checking instances of the abstract DatalidatorExc class is comparatively slow.
+        if (validation_exception is not None) and isinstance(validation_exception, DatalidatorExc):
+            raise validation_exception
+
+    @final
+    def try_validate(self, data: DefaultValidatorImplBase_T) -> Optional[DatalidatorExc]:
+        """
+        Checks whether 'data' meet the validator's requirements like validate(), but instead of raising the
+         'DatalidatorExc' exception if they do not, the exception is returned. None is returned if the data are valid.
+         Blueprints use this method when they are used via their try_use() method.
+
+        The built-in validators return the exception from the '_validate()' method instead of raising it, so rejecting
+         data using this method does not involve raising and catching any exception at all.
+
+        Only 'DatalidatorExc' exceptions are returned - errors are raised immediately.
+
+        :param data: The parsed data (i.e. NOT the untrusted input data!) to check.
+        :return: The exception describing why the data are invalid, or None if they are valid.
+        """
+
+        try:
+            validation_exception = self._validate(data)
+        except DatalidatorError as e:
+            raise e
+        except DatalidatorExc as e:
+            return e
+        except Exception as f:
+            return UnexpectedExceptionRaisedInValidatorExc("{}: {}".format(f.__class__.__name__, str(f)), self._tag, f)
+
+        # Validators which were written before '_validate()' could return exceptions might return arbitrary values
+        if (validation_exception is not None) and isinstance(validation_exception, DatalidatorExc):
+            return validation_exception
+
+        return None
+
     @abc.abstractmethod
-    def _validate(self, data: DefaultValidatorImplBase_T) -> None:
+    def _validate(self, data: DefaultValidatorImplBase_T) -> Optional[DatalidatorExc]:
         """
-        Checks whether 'data' meet the validator's requirements. If not, 'DataValidationFailedExc' must get raised (the
-         '_generate_data_validation_failed_exc()' method of this class should be used to instantiate it), but in the
-         vast majority of cases, you should catch its base superclass, 'DatalidatorExc', because other exceptions
-         extending the superclass may get raised as well (for example when the validation process fails). See the
-         exception hierarchy document for more information.
+        Checks whether 'data' meet the validator's requirements. If not, 'DataValidationFailedExc' must be either
+         returned or raised (the '_generate_data_validation_failed_exc()' method of this class should be used to
+         instantiate it). Returning the exception is preferred, as it can then be passed to blueprints used via the
+         try_use() method without being raised and caught (the validate() method raises it). However, in the vast
+         majority of cases, you should catch its base superclass, 'DatalidatorExc', because other exceptions extending
+         the superclass may get raised as well (for example when the validation process fails). See the exception
+         hierarchy document for more information.
 
-        This method is called by the @final validate() method which is reserved for possible future expansion.
+        This method is called by the @final validate() and try_validate() methods.
 
         :param data: The parsed data (i.e. NOT the untrusted input data!) to check.
+        :return: The exception describing why the data are invalid, or None if they are valid.
         :raises DatalidatorExc: The superclass of all exceptions raised by this library.
         """
 
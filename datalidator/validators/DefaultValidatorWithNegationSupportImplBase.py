@@ -20,8 +20,9 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import final, Final, Generic, TypeVar
+from typing import final, Final, Optional, Generic, TypeVar
 import abc
+from datalidator.exc.DatalidatorExc import DatalidatorExc
 from datalidator.validators.DefaultValidatorImplBase import DefaultValidatorImplBase
 
 
@@ -54,29 +55,33 @@ class DefaultValidatorWithNegationSupportImplBase(DefaultValidatorImplBase[Defau
         return self.__negate
 
     @final
-    def _validate(self, data: DefaultValidatorWithNegationSupportImplBase_T) -> None:
+    def _validate(self, data: DefaultValidatorWithNegationSupportImplBase_T) -> Optional[DatalidatorExc]:
         if self.__negate:
             return self._validate_negatively(data)
 
         return self._validate_positively(data)
 
     @abc.abstractmethod
-    def _validate_positively(self, data: DefaultValidatorWithNegationSupportImplBase_T) -> None:
+    def _validate_positively(self, data: DefaultValidatorWithNegationSupportImplBase_T) -> Optional[DatalidatorExc]:
         """
-        Checks whether 'data' meet the validator's default requirements. See this class's docstring for more information.
+        Checks whether 'data' meet the validator's default requirements. See this class's docstring and the docstring
+         of the 'DefaultValidatorImplBase._validate()' method for more information.
 
         :param data: The parsed data (i.e. NOT the untrusted input data!) to check.
+        :return: The exception describing why the data are invalid, or None if they are valid.
         :raises DatalidatorExc: The superclass of all exceptions raised by this library.
         """
 
         raise NotImplementedError(DefaultValidatorWithNegationSupportImplBase._validate_positively.__qualname__)
 
     @abc.abstractmethod
-    def _validate_negatively(self, data: DefaultValidatorWithNegationSupportImplBase_T) -> None:
+    def _validate_negatively(self, data: DefaultValidatorWithNegationSupportImplBase_T) -> Optional[DatalidatorExc]:
         """
-        Checks whether 'data' meet the validator's negated requirements. See this class's docstring for more information.
+        Checks whether 'data' meet the validator's negated requirements. See this class's docstring and the docstring
+         of the 'DefaultValidatorImplBase._validate()' method for more information.
 
         :param data: The parsed data (i.e. NOT the untrusted input data!) to check.
+        :return: The exception describing why the data are invalid, or None if they are valid.
         :raises DatalidatorExc: The superclass of all exceptions raised by this library.
         """
 
@@ -0,0 +1,169 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from typing import final, Final, Tuple, Type, Union, BinaryIO
+import os
+import mmap
+from datalidator.validators.extras.StringIndexFileFormat import StringIndexFileFormat
+from datalidator.validators.exc.err.InvalidValidatorConfigError import InvalidValidatorConfigError
+
+
+__all__ = "StringIndexFile",
+
+
+@final
+class StringIndexFile:
+    """
+    A read-only set of strings stored in a file built by StringIndexFileBuilder, used by
+     StringIndexFileAllowlistValidator and StringIndexFileBlocklistValidator.
+
+    The file is memory-mapped, not loaded, so opening even an index of tens of millions of strings is instantaneous and
+     the index occupies no private memory of the process - its pages are shared via the operating system's page cache
+     by all the processes which use the same file (e.g. the worker processes of a web server). Strings are looked up
+     using a binary search over the sorted entries (O(log n) comparisons); if the file contains a Bloom filter, most of
+     the strings which are not in the index are rejected by it without touching the sorted entries at all.
+
+    Strings are compared by their UTF-8 encoding, i.e. in the same way as by the '==' operator of 'str'. The object
+     can be used from multiple threads; unpickled objects map the file anew (the file must therefore exist at the same
+     path in the unpickling process).
+    """
+
+    __slots__ = "__path", "__file", "__mmap", "__entry_count", "__bloom_filter_bit_count", "__bloom_filter_hash_count", "__offsets_start", "__data_start"
+
+    def __init__(self, path: Union[str, os.PathLike]):
+        self.__path: Final[str] = os.fspath(path)
+
+        try:
+            self.__file: Final[BinaryIO] = open(self.__path, "rb")
+        except OSError as e:
+            raise InvalidValidatorConfigError("The string index file cannot be opened: {}".format(str(e)), "")
+
+        try:
+            self.__mmap: Final[mmap.mmap] = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:  # ValueError is raised if the file is empty
+            self.__file.close()
+            raise InvalidValidatorConfigError("The string index file cannot be memory-mapped: {}".format(str(e)), "")
+
+        try:
+            self.__read_header()
+        except BaseException:
+            self.close()
+            raise
+
+    @final
+    def __read_header(self) -> None:
+        header_struct = StringIndexFileFormat.HEADER_STRUCT
+        if len(self.__mmap) < header_struct.size:
+            raise InvalidValidatorConfigError("The string index file is truncated: {}".format(repr(self.__path)), "")
+
+        (magic, version, bloom_filter_hash_count, entry_count, bloom_filter_bit_count, offsets_start, data_start) = header_struct.unpack_from(self.__mmap, 0)
+
+        if magic != StringIndexFileFormat.MAGIC:
+            raise InvalidValidatorConfigError("The file is not a string index file: {}".format(repr(self.__path)), "")
+        if version != StringIndexFileFormat.VERSION:
+            raise InvalidValidatorConfigError("The string index file has an unsupported format version ({}): {}".format(version, repr(self.__path)), "")
+        if (
+            (bloom_filter_hash_count == 0) != (bloom_filter_bit_count == 0) or
+            offsets_start != header_struct.size + ((bloom_filter_bit_count + 7) // 8) or
+            data_start != offsets_start + ((entry_count + 1) * StringIndexFileFormat.OFFSET_STRUCT.size) or
+            data_start > len(self.__mmap) or
+            data_start + StringIndexFileFormat.OFFSET_STRUCT.unpack_from(self.__mmap, data_start - StringIndexFileFormat.OFFSET_STRUCT.size)[0] != len(self.__mmap)
+        ):
+            raise InvalidValidatorConfigError("The string index file is corrupted or truncated: {}".format(repr(self.__path)), "")
+
+        self.__entry_count: Final[int] = entry_count
+        self.__bloom_filter_bit_count: Final[int] = bloom_filter_bit_count
+        self.__bloom_filter_hash_count: Final[int] = bloom_filter_hash_count
+        self.__offsets_start: Final[int] = offsets_start
+        self.__data_start: Final[int] = data_start
+
+    def __reduce__(self) -> Tuple[Type["StringIndexFile"], Tuple[str]]:
+        return self.__class__, (self.__path,)
+
+    def __enter__(self) -> "StringIndexFile":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.__entry_count
+
+    @final
+    def get_path(self) -> str:
+        return self.__path
+
+    @final
+    def has_bloom_filter(self) -> bool:
+        return self.__bloom_filter_hash_count > 0
+
+    @final
+    def close(self) -> None:
+        # The index must not be used after it has been closed.
+        self.__mmap.close()
+        self.__file.close()
+
+    @final
+    def contains(self, string: str) -> bool:
+        entry = StringIndexFileFormat.encode_string(string)
+
+        if self.__bloom_filter_hash_count > 0 and not self.__may_bloom_filter_contain_entry(entry):
+            return False
+
+        return self.__does_sorted_index_contain_entry(entry)
+
+    @final
+    def __may_bloom_filter_contain_entry(self, entry: bytes) -> bool:
+        mmap_ = self.__mmap
+        bloom_filter_start = StringIndexFileFormat.HEADER_STRUCT.size
+        bit_count = self.__bloom_filter_bit_count
+
+        first_hash, second_hash = StringIndexFileFormat.compute_bloom_filter_hashes(entry)
+        for i in range(self.__bloom_filter_hash_count):
+            position = (first_hash + (i * second_hash)) % bit_count
+            if not (mmap_[bloom_filter_start + (position >> 3)] & (1 << (position & 7))):
+                return False
+
+        return True
+
+    @final
+    def __does_sorted_index_contain_entry(self, entry: bytes) -> bool:
+        mmap_ = self.__mmap
+        offsets_start = self.__offsets_start
+        data_start = self.__data_start
+        unpack_offset_pair = StringIndexFileFormat.OFFSET_PAIR_STRUCT.unpack_from
+        offset_size = StringIndexFileFormat.OFFSET_STRUCT.size
+
+        low, high = 0, self.__entry_count
+        while low < high:
+            middle = (low + high) // 2
+            entry_start, entry_end = unpack_offset_pair(mmap_, offsets_start + (middle * offset_size))
+            middle_entry = mmap_[data_start + entry_start:data_start + entry_end]
+
+            if middle_entry < entry:
+                low = middle + 1
+            elif middle_entry > entry:
+                high = middle
+            else:
+                return True
+
+        return False
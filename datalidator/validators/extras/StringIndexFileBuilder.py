@@ -0,0 +1,175 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from typing import final, Final, Iterable, List, Tuple, Optional, Union, BinaryIO
+import os
+import sys
+import math
+import array
+import argparse
+import tempfile
+from datalidator.validators.extras.StringIndexFileFormat import StringIndexFileFormat
+from datalidator.validators.exc.err.InvalidValidatorConfigError import InvalidValidatorConfigError
+
+
+__all__ = "StringIndexFileBuilder",
+
+
+@final
+class StringIndexFileBuilder:
+    """
+    The offline build tool for string index files, which are used by StringIndexFile (and therefore by
+     StringIndexFileAllowlistValidator and StringIndexFileBlocklistValidator). See StringIndexFileFormat for the
+     description of the file format.
+
+    The builder sorts all the strings in memory, so building an index of tens of millions of strings requires a few
+     gigabytes of memory - it is supposed to be done once, on a build machine, not in each of the worker processes which
+     use the index.
+
+    The tool can also be run from the command line; the input file contains one string per line:
+     python3 -m datalidator.validators.extras.StringIndexFileBuilder [--bloom-filter-bits-per-entry N] INPUT OUTPUT
+    """
+
+    __slots__ = "__bloom_filter_bits_per_entry",
+
+    _DEFAULT_BLOOM_FILTER_BITS_PER_ENTRY: Final[int] = 0  # No Bloom filter
+
+    def __init__(self, bloom_filter_bits_per_entry: int = _DEFAULT_BLOOM_FILTER_BITS_PER_ENTRY):
+        """
+        :param bloom_filter_bits_per_entry: The size of the Bloom filter placed in front of the sorted index, which
+         speeds up the lookups of strings which are not in the index. 0 means that no Bloom filter is created; 10 bits
+         per entry result in a false positive rate of about 1 % (false positives are then resolved by the sorted index,
+         so they only cost time).
+        """
+
+        self.__bloom_filter_bits_per_entry: Final[int] = bloom_filter_bits_per_entry
+
+        if self.__bloom_filter_bits_per_entry < 0:
+            raise InvalidValidatorConfigError("The number of Bloom filter bits per entry must not be negative!", "")
+
+    @final
+    def get_bloom_filter_bits_per_entry(self) -> int:
+        return self.__bloom_filter_bits_per_entry
+
+    @final
+    def build(self, strings: Iterable[str], output_path: Union[str, os.PathLike]) -> int:
+        """
+        Builds a string index file containing 'strings' (duplicates are removed) and writes it to 'output_path'. The
+         file is written to a temporary file first and then atomically renamed, so processes which open the index while
+         it is being rebuilt always get a complete file.
+
+        :return: The number of distinct strings in the built index.
+        """
+
+        entries = sorted(set(map(StringIndexFileFormat.encode_string, strings)))
+
+        output_path = os.fspath(output_path)
+        file_descriptor, temporary_path = tempfile.mkstemp(prefix=".tmp-", dir=(os.path.dirname(output_path) or None))
+        try:
+            with os.fdopen(file_descriptor, "wb") as file:
+                self.__write_index(entries, file)
+            os.chmod(temporary_path, 0o644)  # mkstemp() creates the file readable only by its owner
+            os.replace(temporary_path, output_path)
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+
+        return len(entries)
+
+    @final
+    def __write_index(self, entries: List[bytes], file: BinaryIO) -> None:
+        bloom_filter_bit_count, bloom_filter_hash_count = self.__compute_bloom_filter_parameters(len(entries))
+        bloom_filter = self.__generate_bloom_filter(entries, bloom_filter_bit_count, bloom_filter_hash_count)
+
+        offsets = array.array("Q", [0])
+        current_offset = 0
+        for entry in entries:
+            current_offset += len(entry)
+            offsets.append(current_offset)
+        if sys.byteorder != "little":
+            offsets.byteswap()
+
+        offsets_start = StringIndexFileFormat.HEADER_STRUCT.size + len(bloom_filter)
+        data_start = offsets_start + (len(offsets) * StringIndexFileFormat.OFFSET_STRUCT.size)
+
+        file.write(StringIndexFileFormat.HEADER_STRUCT.pack(
+            StringIndexFileFormat.MAGIC, StringIndexFileFormat.VERSION, bloom_filter_hash_count,
+            len(entries), bloom_filter_bit_count, offsets_start, data_start
+        ))
+        file.write(bloom_filter)
+        file.write(offsets.tobytes())
+        for entry in entries:
+            file.write(entry)
+
+    @final
+    def __compute_bloom_filter_parameters(self, entry_count: int) -> Tuple[int, int]:
+        if self.__bloom_filter_bits_per_entry == 0 or entry_count == 0:
+            return 0, 0
+
+        # The optimal number of hash functions is (bits per entry * ln(2))
+        bit_count = entry_count * self.__bloom_filter_bits_per_entry
+        hash_count = max(1, round(self.__bloom_filter_bits_per_entry * math.log(2)))
+
+        return bit_count, hash_count
+
+    @final
+    def __generate_bloom_filter(self, entries: List[bytes], bit_count: int, hash_count: int) -> bytearray:
+        bloom_filter = bytearray((bit_count + 7) // 8)
+
+        for entry in entries:
+            first_hash, second_hash = StringIndexFileFormat.compute_bloom_filter_hashes(entry)
+            for i in range(hash_count):
+                position = (first_hash + (i * second_hash)) % bit_count
+                bloom_filter[position >> 3] |= (1 << (position & 7))
+
+        return bloom_filter
+
+
+def main(arguments: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python3 -m datalidator.validators.extras.StringIndexFileBuilder",
+        description="Builds a string index file for StringIndexFileAllowlistValidator or StringIndexFileBlocklistValidator from a UTF-8 text file containing one string per line (empty lines are skipped)."
+    )
+    parser.add_argument("--bloom-filter-bits-per-entry", type=int, default=StringIndexFileBuilder._DEFAULT_BLOOM_FILTER_BITS_PER_ENTRY, help="the size of the Bloom filter (0 = no Bloom filter; 10 = about 1 %% false positives)")
+    parser.add_argument("input_path", help="the text file to read the strings from ('-' = standard input)")
+    parser.add_argument("output_path", help="the index file to write")
+    parsed_arguments = parser.parse_args(arguments)
+
+    def read_strings(file) -> Iterable[str]:
+        for line in file:
+            line = line.rstrip("\r\n")
+            if line:
+                yield line
+
+    builder = StringIndexFileBuilder(parsed_arguments.bloom_filter_bits_per_entry)
+    if parsed_arguments.input_path == "-":
+        entry_count = builder.build(read_strings(sys.stdin), parsed_arguments.output_path)
+    else:
+        with open(parsed_arguments.input_path, "r", encoding="utf-8", newline="") as input_file:
+            entry_count = builder.build(read_strings(input_file), parsed_arguments.output_path)
+
+    print("{} distinct strings written to {}".format(entry_count, parsed_arguments.output_path), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
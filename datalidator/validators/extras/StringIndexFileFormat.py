@@ -0,0 +1,67 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from typing import final, Final, Tuple
+import struct
+import hashlib
+
+
+__all__ = "StringIndexFileFormat",
+
+
+@final
+class StringIndexFileFormat:
+    """
+    The on-disk format of string index files, shared by StringIndexFileBuilder (which writes them) and StringIndexFile
+     (which reads them). All integers are unsigned and little-endian.
+
+    The file consists of:
+     - the header (see HEADER_STRUCT): magic bytes, format version, Bloom filter hash count (0 = no Bloom filter),
+       entry count, Bloom filter bit count, and the file offsets of the offset table and of the data section;
+     - the Bloom filter bit array (ceil(bit count / 8) bytes; empty if there is no Bloom filter);
+     - the offset table ((entry count + 1) 64-bit offsets of the entries relative to the start of the data section);
+     - the data section (the UTF-8 encoded entries, sorted bytewise and without duplicates, concatenated).
+
+    Strings are encoded using the 'surrogatepass' error handler, so that any Python string can be stored and looked up.
+    """
+
+    __slots__ = ()
+
+    MAGIC: Final[bytes] = b"DLSTRIDX"
+    VERSION: Final[int] = 1
+    HEADER_STRUCT: Final[struct.Struct] = struct.Struct("<8sIIQQQQ")
+    OFFSET_STRUCT: Final[struct.Struct] = struct.Struct("<Q")
+    OFFSET_PAIR_STRUCT: Final[struct.Struct] = struct.Struct("<QQ")
+
+    def __init__(self):
+        raise NotImplementedError("The '{}' class is not supposed to be instantiated!".format(self.__class__.__name__))
+
+    @classmethod
+    def encode_string(cls, string: str) -> bytes:
+        return string.encode("utf-8", "surrogatepass")
+
+    @classmethod
+    def compute_bloom_filter_hashes(cls, entry: bytes) -> Tuple[int, int]:
+        # The bit positions are derived from the two hashes using double hashing (position = h1 + i*h2). Unlike hash(),
+        #  BLAKE2 produces the same hashes in every process, regardless of the PYTHONHASHSEED.
+        first_hash, second_hash = cls.OFFSET_PAIR_STRUCT.unpack(hashlib.blake2b(entry, digest_size=16).digest())
+        return first_hash, (second_hash | 1)
@@ -0,0 +1,90 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from typing import final, Final, Iterable, Tuple, FrozenSet, Any, Generic, TypeVar
+from datalidator.EqualityKeyHelper import EqualityKeyHelper
+
+
+__all__ = "ValueMembershipIndex", "ValueMembershipIndex_T"
+ValueMembershipIndex_T = TypeVar("ValueMembershipIndex_T")
+
+
+@final
+class ValueMembershipIndex(Generic[ValueMembershipIndex_T]):
+    """
+    An immutable collection of values which answers the question "is a value equal to one of the values in the
+     collection?" in (amortized) constant time, where possible.
+
+    Values which have an equality key (see EqualityKeyHelper; e.g. strings, numbers, dates, UUIDs, IP addresses, or
+     lists and dictionaries containing only such values) are indexed by their equality keys in a hash set; the
+     remaining values (e.g. instances of user-defined classes, including subclasses of the built-in types) are kept in a
+     tuple which is scanned linearly. Looked-up values which do not have an equality key are compared with all the
+     values in the collection linearly.
+
+    The result of 'contains()' is therefore the same as the result of the 'in' operator applied to a tuple of the
+     values, including cases like 1 == 1.0 == True or Decimal("1.5") == 1.5, with one exception: if comparing the
+     looked-up value with some value in the collection raises an exception, the exception might not be raised, as the
+     comparison might not take place at all (a tuple is compared item by item, in order).
+    """
+
+    __slots__ = "__values", "__indexed_equality_keys", "__unindexed_values"
+
+    def __init__(self, values: Iterable[ValueMembershipIndex_T]):
+        self.__values: Final[Tuple[ValueMembershipIndex_T, ...]] = tuple(values)
+
+        no_equality_key = EqualityKeyHelper.NO_EQUALITY_KEY
+        indexed_equality_keys = set()
+        unindexed_values = []
+        for value in self.__values:
+            equality_key = EqualityKeyHelper.get_equality_key(value)
+            if equality_key is no_equality_key:
+                unindexed_values.append(value)
+            else:
+                indexed_equality_keys.add(equality_key)
+
+        self.__indexed_equality_keys: Final[FrozenSet[Any]] = frozenset(indexed_equality_keys)
+        self.__unindexed_values: Final[Tuple[ValueMembershipIndex_T, ...]] = tuple(unindexed_values)
+
+    def __len__(self) -> int:
+        return len(self.__values)
+
+    @final
+    def get_values(self) -> Tuple[ValueMembershipIndex_T, ...]:
+        return self.__values  # An *immutable* sequence (tuple) is returned
+
+    @final
+    def get_unindexed_value_count(self) -> int:
+        # The number of values which have to be scanned linearly on each lookup
+        return len(self.__unindexed_values)
+
+    @final
+    def contains(self, value: Any) -> bool:
+        equality_key = EqualityKeyHelper.get_equality_key(value)
+
+        if equality_key is EqualityKeyHelper.NO_EQUALITY_KEY:
+            # Such a value might be equal to an indexed value, while not having the same hash (or any hash at all)
+            return value in self.__values
+
+        if equality_key in self.__indexed_equality_keys:
+            return True
+
+        return value in self.__unindexed_values
@@ -20,9 +20,11 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import final, Final, Sequence, Tuple, Generic, TypeVar
+from typing import final, Final, Sequence, Tuple, Generic, TypeVar, Optional
+from datalidator.exc.DatalidatorExc import DatalidatorExc
 from datalidator.validators.DefaultValidatorImplBase import DefaultValidatorImplBase
 from datalidator.validators.exc.err.InvalidValidatorConfigError import InvalidValidatorConfigError
+from datalidator.validators.extras.ValueMembershipIndex import ValueMembershipIndex
 
 
 __all__ = "AllowlistValidator", "AllowlistValidator_T"
@@ -33,10 +35,15 @@ class AllowlistValidator(DefaultValidatorImplBase[AllowlistValidator_T], Generic
     """
     The input is valid if its value is present in the initializer-provided allowlist.
 
-    NOTE: The presence of input values in the allowlist is checked using the 'in' operator.
+    NOTE: The presence of input values in the allowlist is checked using the 'in' operator's semantics (i.e. using
+     the '==' operator), but input values of simple built-in types (str, int, float etc.) are looked up in a hash index
+     built at initialization, so the validation of such values does not slow down with the size of the allowlist. See
+     ValueMembershipIndex for details.
     """
 
-    __slots__ = "__allowlist",
+    __slots__ = "__allowlist", "__allowlist_index"
+
+    __TRANSIENT_SLOTS: Final[Tuple[str, ...]] = ("__allowlist_index",)  # The index is rebuilt instead of being pickled
 
     def __init__(self, allowlist: Sequence[AllowlistValidator_T], tag: str = ""):
         DefaultValidatorImplBase.__init__(self, tag)
@@ -47,12 +54,18 @@ class AllowlistValidator(DefaultValidatorImplBase[AllowlistValidator_T], Generic
         if len(self.__allowlist) == 0:
             raise InvalidValidatorConfigError("The allowlist is empty!", self._tag)
 
+        self.__initialize_transient_slots()
+
+    @final
+    def __initialize_transient_slots(self) -> None:
+        self.__allowlist_index: Final[ValueMembershipIndex[AllowlistValidator_T]] = ValueMembershipIndex(self.__allowlist)
+
     @final
     def get_allowlist(self) -> Sequence[AllowlistValidator_T]:
         return self.__allowlist  # An *immutable* sequence (tuple) is returned
 
-    def _validate(self, data: AllowlistValidator_T) -> None:
-        if data in self.__allowlist:
+    def _validate(self, data: AllowlistValidator_T) -> Optional[DatalidatorExc]:
+        if self.__allowlist_index.contains(data):
             return
 
-        raise self._generate_data_validation_failed_exc("The allowlist does not contain the input value: {}".format(repr(data)))
+        return self._generate_data_validation_failed_exc("The allowlist does not contain the input value: {}".format(repr(data)))
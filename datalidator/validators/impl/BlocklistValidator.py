@@ -20,9 +20,11 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import final, Final, Sequence, Tuple, Generic, TypeVar
+from typing import final, Final, Sequence, Tuple, Generic, TypeVar, Optional
+from datalidator.exc.DatalidatorExc import DatalidatorExc
 from datalidator.validators.DefaultValidatorImplBase import DefaultValidatorImplBase
 from datalidator.validators.exc.err.InvalidValidatorConfigError import InvalidValidatorConfigError
+from datalidator.validators.extras.ValueMembershipIndex import ValueMembershipIndex
 
 
 __all__ = "BlocklistValidator", "BlocklistValidator_T"
@@ -33,10 +35,15 @@ class BlocklistValidator(DefaultValidatorImplBase[BlocklistValidator_T], Generic
     """
     The input is valid if its value is not present in the initializer-provided blocklist.
 
-    NOTE: The presence of input values in the blocklist is checked using the 'in' operator.
+    NOTE: The presence of input values in the blocklist is checked using the 'in' operator's semantics (i.e. using
+     the '==' operator), but input values of simple built-in types (str, int, float etc.) are looked up in a hash index
+     built at initialization, so the validation of such values does not slow down with the size of the blocklist. See
+     ValueMembershipIndex for details.
     """
 
-    __slots__ = "__blocklist",
+    __slots__ = "__blocklist", "__blocklist_index"
+
+    __TRANSIENT_SLOTS: Final[Tuple[str, ...]] = ("__blocklist_index",)  # The index is rebuilt instead of being pickled
 
     def __init__(self, blocklist: Sequence[BlocklistValidator_T], tag: str = ""):
         DefaultValidatorImplBase.__init__(self, tag)
@@ -47,10 +54,16 @@ class BlocklistValidator(DefaultValidatorImplBase[BlocklistValidator_T], Generic
         if len(self.__blocklist) == 0:
             raise InvalidValidatorConfigError("The blocklist is empty!", self._tag)
 
+        self.__initialize_transient_slots()
+
+    @final
+    def __initialize_transient_slots(self) -> None:
+        self.__blocklist_index: Final[ValueMembershipIndex[BlocklistValidator_T]] = ValueMembershipIndex(self.__blocklist)
+
     @final
     def get_blocklist(self) -> Sequence[BlocklistValidator_T]:
         return self.__blocklist  # An *immutable* sequence (tuple) is returned
 
-    def _validate(self, data: BlocklistValidator_T) -> None:
-        if data in self.__blocklist:
-            raise self._generate_data_validation_failed_exc("The blocklist contains the input value: {}".format(repr(data)))
+    def _validate(self, data: BlocklistValidator_T) -> Optional[DatalidatorExc]:
+        if self.__blocklist_index.contains(data):
+            return self._generate_data_validation_failed_exc("The blocklist contains the input value: {}".format(repr(data)))
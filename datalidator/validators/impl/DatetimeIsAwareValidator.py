@@ -20,8 +20,9 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import final
+from typing import final, Optional
 import datetime
+from datalidator.exc.DatalidatorExc import DatalidatorExc
 from datalidator.validators.DefaultValidatorWithNegationSupportImplBase import DefaultValidatorWithNegationSupportImplBase
 
 
@@ -39,15 +40,15 @@ class DatetimeIsAwareValidator(DefaultValidatorWithNegationSupportImplBase[datet
 
     __slots__ = ()
 
-    def _validate_positively(self, data: datetime.datetime) -> None:  # Datetime is aware? -> Valid
+    def _validate_positively(self, data: datetime.datetime) -> Optional[DatalidatorExc]:  # Datetime is aware? -> Valid
         if self.__is_datetime_aware(data):
             return
 
-        raise self._generate_data_validation_failed_exc("The input datetime object is not aware: {}".format(str(data)))
+        return self._generate_data_validation_failed_exc("The input datetime object is not aware: {}".format(str(data)))
 
-    def _validate_negatively(self, data: datetime.datetime) -> None:  # Datetime is not aware = datetime is naive? -> Valid
+    def _validate_negatively(self, data: datetime.datetime) -> Optional[DatalidatorExc]:  # Datetime is not aware = datetime is naive? -> Valid
         if self.__is_datetime_aware(data):
-            raise self._generate_data_validation_failed_exc("The input datetime object is aware: {}".format(str(data)))
+            return self._generate_data_validation_failed_exc("The input datetime object is aware: {}".format(str(data)))
 
     @final
     def __is_datetime_aware(self, data: datetime.datetime) -> bool:
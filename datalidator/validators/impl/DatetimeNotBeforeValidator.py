@@ -20,8 +20,9 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import final, Final
+from typing import final, Final, Optional
 import datetime
+from datalidator.exc.DatalidatorExc import DatalidatorExc
 from datalidator.validators.DefaultValidatorImplBase import DefaultValidatorImplBase
 from datalidator.validators.exc.InputDatetimeObjectIsNaiveInValidatorExc import InputDatetimeObjectIsNaiveInValidatorExc
 from datalidator.validators.exc.err.InvalidValidatorConfigError import InvalidValidatorConfigError
@@ -52,11 +53,11 @@ class DatetimeNotBeforeValidator(DefaultValidatorImplBase[datetime.datetime]):
     def get_earliest_acceptable_datetime(self) -> datetime.datetime:
         return self.__earliest_acceptable_datetime
 
-    def _validate(self, data: datetime.datetime) -> None:
+    def _validate(self, data: datetime.datetime) -> Optional[DatalidatorExc]:
         if data.tzinfo is None:
             raise InputDatetimeObjectIsNaiveInValidatorExc("The input datetime object is naive!", self._tag)
 
         if data < self.__earliest_acceptable_datetime:
-            raise self._generate_data_validation_failed_exc(
+            return self._generate_data_validation_failed_exc(
                 "The input datetime object ({}) represents an earlier time than the earliest acceptable time ({})!".format(str(data), str(self.__earliest_acceptable_datetime))
             )
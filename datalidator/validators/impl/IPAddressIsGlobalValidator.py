@@ -20,8 +20,9 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import final, Union
+from typing import final, Union, Optional
 import ipaddress
+from datalidator.exc.DatalidatorExc import DatalidatorExc
 from datalidator.validators.DefaultValidatorWithNegationSupportImplBase import DefaultValidatorWithNegationSupportImplBase
 
 
@@ -45,15 +46,15 @@ class IPAddressIsGlobalValidator(DefaultValidatorWithNegationSupportImplBase[Uni
 
     __slots__ = ()
 
-    def _validate_positively(self, data: Union[ipaddress.IPv4Address, ipaddress.IPv6Address]) -> None:  # IP is global? -> Valid
+    def _validate_positively(self, data: Union[ipaddress.IPv4Address, ipaddress.IPv6Address]) -> Optional[DatalidatorExc]:  # IP is global? -> Valid
         if self.__is_ip_address_global(data):
             return
 
-        raise self._generate_data_validation_failed_exc("The input IP address is not a global address: {}".format(str(data)))
+        return self._generate_data_validation_failed_exc("The input IP address is not a global address: {}".format(str(data)))
 
-    def _validate_negatively(self, data: Union[ipaddress.IPv4Address, ipaddress.IPv6Address]) -> None:  # IP is not global? -> Valid
+    def _validate_negatively(self, data: Union[ipaddress.IPv4Address, ipaddress.IPv6Address]) -> Optional[DatalidatorExc]:  # IP is not global? -> Valid
         if self.__is_ip_address_global(data):
-            raise self._generate_data_validation_failed_exc("The input IP address is a global address: {}".format(str(data)))
+            return self._generate_data_validation_failed_exc("The input IP address is a global address: {}".format(str(data)))
 
     @final
     def __is_ip_address_global(self, ip_address: Union[ipaddress.IPv4Address, ipaddress.IPv6Address]) -> bool:
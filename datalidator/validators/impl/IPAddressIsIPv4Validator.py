@@ -20,8 +20,9 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import Union
+from typing import Union, Optional
 import ipaddress
+from datalidator.exc.DatalidatorExc import DatalidatorExc
 from datalidator.validators.DefaultValidatorImplBase import DefaultValidatorImplBase
 
 
@@ -35,6 +36,6 @@ class IPAddressIsIPv4Validator(DefaultValidatorImplBase[Union[ipaddress.IPv4Addr
 
     __slots__ = ()
 
-    def _validate(self, data: Union[ipaddress.IPv4Address, ipaddress.IPv6Address]) -> None:
+    def _validate(self, data: Union[ipaddress.IPv4Address, ipaddress.IPv6Address]) -> Optional[DatalidatorExc]:
         if data.version != 4:
-            raise self._generate_data_validation_failed_exc("The input IP address is not an IPv4 address: {}".format(str(data)))
+            return self._generate_data_validation_failed_exc("The input IP address is not an IPv4 address: {}".format(str(data)))
@@ -20,8 +20,9 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import final, Final, Union
+from typing import final, Final, Union, Optional
 import ipaddress
+from datalidator.exc.DatalidatorExc import DatalidatorExc
 from datalidator.validators.DefaultValidatorWithNegationSupportImplBase import DefaultValidatorWithNegationSupportImplBase
 
 
@@ -51,17 +52,17 @@ class IPAddressIsInNetworkValidator(DefaultValidatorWithNegationSupportImplBase[
     def get_ip_network(self) -> Union[ipaddress.IPv4Network, ipaddress.IPv6Network]:
         return self.__ip_network
 
-    def _validate_positively(self, data: Union[ipaddress.IPv4Address, ipaddress.IPv6Address]) -> None:  # IP is in network? -> Valid
+    def _validate_positively(self, data: Union[ipaddress.IPv4Address, ipaddress.IPv6Address]) -> Optional[DatalidatorExc]:  # IP is in network? -> Valid
         if self.__is_ip_address_in_network(data):
             return
 
-        raise self._generate_data_validation_failed_exc(
+        return self._generate_data_validation_failed_exc(
             "The input IP address ({}) is not a part of the supplied IP network ({})!".format(str(data), str(self.__ip_network)),
         )
 
-    def _validate_negatively(self, data: Union[ipaddress.IPv4Address, ipaddress.IPv6Address]) -> None:  # IP is not in network? -> Valid
+    def _validate_negatively(self, data: Union[ipaddress.IPv4Address, ipaddress.IPv6Address]) -> Optional[DatalidatorExc]:  # IP is not in network? -> Valid
         if self.__is_ip_address_in_network(data):
-            raise self._generate_data_validation_failed_exc(
+            return self._generate_data_validation_failed_exc(
                 "The input IP address ({}) is a part of the supplied IP network ({})!".format(str(data), str(self.__ip_network)),
             )
 
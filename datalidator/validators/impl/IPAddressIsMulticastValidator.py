@@ -20,8 +20,9 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import final, Union
+from typing import final, Union, Optional
 import ipaddress
+from datalidator.exc.DatalidatorExc import DatalidatorExc
 from datalidator.validators.DefaultValidatorWithNegationSupportImplBase import DefaultValidatorWithNegationSupportImplBase
 
 
@@ -45,15 +46,15 @@ class IPAddressIsMulticastValidator(DefaultValidatorWithNegationSupportImplBase[
 
     __slots__ = ()
 
-    def _validate_positively(self, data: Union[ipaddress.IPv4Address, ipaddress.IPv6Address]) -> None:  # IP is multicast? -> Valid
+    def _validate_positively(self, data: Union[ipaddress.IPv4Address, ipaddress.IPv6Address]) -> Optional[DatalidatorExc]:  # IP is multicast? -> Valid
         if self.__is_ip_address_multicast(data):
             return
 
-        raise self._generate_data_validation_failed_exc("The input IP address is not a multicast address: {}".format(str(data)))
+        return self._generate_data_validation_failed_exc("The input IP address is not a multicast address: {}".format(str(data)))
 
-    def _validate_negatively(self, data: Union[ipaddress.IPv4Address, ipaddress.IPv6Address]) -> None:  # IP is not multicast? -> Valid
+    def _validate_negatively(self, data: Union[ipaddress.IPv4Address, ipaddress.IPv6Address]) -> Optional[DatalidatorExc]:  # IP is not multicast? -> Valid
         if self.__is_ip_address_multicast(data):
-            raise self._generate_data_validation_failed_exc("The input IP address is a multicast address: {}".format(str(data)))
+            return self._generate_data_validation_failed_exc("The input IP address is a multicast address: {}".format(str(data)))
 
     @final
     def __is_ip_address_multicast(self, ip_address: Union[ipaddress.IPv4Address, ipaddress.IPv6Address]) -> bool:
@@ -20,6 +20,8 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
+from typing import Optional
+from datalidator.exc.DatalidatorExc import DatalidatorExc
 from datalidator.validators.DefaultValidatorImplBase import DefaultValidatorImplBase
 
 
@@ -33,6 +35,6 @@ class IntegerIsZeroOrPositiveValidator(DefaultValidatorImplBase[int]):
 
     __slots__ = ()
 
-    def _validate(self, data: int) -> None:
+    def _validate(self, data: int) -> Optional[DatalidatorExc]:
         if data < 0:
-            raise self._generate_data_validation_failed_exc("The input integer is not zero or positive: {}".format(data))
+            return self._generate_data_validation_failed_exc("The input integer is not zero or positive: {}".format(data))
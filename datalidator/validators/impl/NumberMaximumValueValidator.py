@@ -20,8 +20,9 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import final, Final, Generic, TypeVar
+from typing import final, Final, Generic, TypeVar, Optional
 import math
+from datalidator.exc.DatalidatorExc import DatalidatorExc
 from datalidator.validators.DefaultValidatorImplBase import DefaultValidatorImplBase
 from datalidator.validators.exc.err.InvalidValidatorConfigError import InvalidValidatorConfigError
 
@@ -49,8 +50,8 @@ class NumberMaximumValueValidator(DefaultValidatorImplBase[NumberMaximumValueVal
     def get_maximum_acceptable_number(self) -> NumberMaximumValueValidator_Number:
         return self.__maximum_acceptable_number
 
-    def _validate(self, data: NumberMaximumValueValidator_Number) -> None:
+    def _validate(self, data: NumberMaximumValueValidator_Number) -> Optional[DatalidatorExc]:
         if data > self.__maximum_acceptable_number:
-            raise self._generate_data_validation_failed_exc(
+            return self._generate_data_validation_failed_exc(
                 "The input number ({}) is bigger than the maximum acceptable number ({})!".format(data, self.__maximum_acceptable_number)
             )
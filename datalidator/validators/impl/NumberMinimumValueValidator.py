@@ -20,8 +20,9 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import final, Final, Generic, TypeVar
+from typing import final, Final, Generic, TypeVar, Optional
 import math
+from datalidator.exc.DatalidatorExc import DatalidatorExc
 from datalidator.validators.DefaultValidatorImplBase import DefaultValidatorImplBase
 from datalidator.validators.exc.err.InvalidValidatorConfigError import InvalidValidatorConfigError
 
@@ -49,8 +50,8 @@ class NumberMinimumValueValidator(DefaultValidatorImplBase[NumberMinimumValueVal
     def get_minimum_acceptable_number(self) -> NumberMinimumValueValidator_Number:
         return self.__minimum_acceptable_number
 
-    def _validate(self, data: NumberMinimumValueValidator_Number) -> None:
+    def _validate(self, data: NumberMinimumValueValidator_Number) -> Optional[DatalidatorExc]:
         if data < self.__minimum_acceptable_number:
-            raise self._generate_data_validation_failed_exc(
+            return self._generate_data_validation_failed_exc(
                 "The input number ({}) is smaller than the minimum acceptable number ({})!".format(data, self.__minimum_acceptable_number)
             )
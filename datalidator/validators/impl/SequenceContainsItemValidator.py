@@ -20,7 +20,8 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import final, Final, Sequence, TypeVar
+from typing import final, Final, Sequence, TypeVar, Optional
+from datalidator.exc.DatalidatorExc import DatalidatorExc
 from datalidator.validators.DefaultValidatorWithNegationSupportImplBase import DefaultValidatorWithNegationSupportImplBase
 
 
@@ -48,15 +49,15 @@ class SequenceContainsItemValidator(DefaultValidatorWithNegationSupportImplBase[
     def get_checked_item(self) -> SequenceContainsItemValidator_T:
         return self.__checked_item
 
-    def _validate_positively(self, data: Sequence[SequenceContainsItemValidator_T]) -> None:  # Sequence contains item? -> Valid
+    def _validate_positively(self, data: Sequence[SequenceContainsItemValidator_T]) -> Optional[DatalidatorExc]:  # Sequence contains item? -> Valid
         if self.__does_sequence_contain_item(data):
             return
 
-        raise self._generate_data_validation_failed_exc("The item is not present in the input sequence: {}".format(repr(self.__checked_item)))
+        return self._generate_data_validation_failed_exc("The item is not present in the input sequence: {}".format(repr(self.__checked_item)))
 
-    def _validate_negatively(self, data: Sequence[SequenceContainsItemValidator_T]) -> None:  # Sequence does not contain item? -> Valid
+    def _validate_negatively(self, data: Sequence[SequenceContainsItemValidator_T]) -> Optional[DatalidatorExc]:  # Sequence does not contain item? -> Valid
         if self.__does_sequence_contain_item(data):
-            raise self._generate_data_validation_failed_exc("The item is present in the input sequence: {}".format(repr(self.__checked_item)))
+            return self._generate_data_validation_failed_exc("The item is present in the input sequence: {}".format(repr(self.__checked_item)))
 
     @final
     def __does_sequence_contain_item(self, sequence: Sequence[SequenceContainsItemValidator_T]) -> bool:
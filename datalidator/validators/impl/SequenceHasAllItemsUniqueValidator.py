@@ -20,7 +20,10 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import Sequence, Generic, TypeVar
+from typing import Sequence, List, Dict, Generic, TypeVar, Any, Optional
+import collections
+from datalidator.exc.DatalidatorExc import DatalidatorExc
+from datalidator.EqualityKeyHelper import EqualityKeyHelper
 from datalidator.validators.DefaultValidatorImplBase import DefaultValidatorImplBase
 
 
@@ -30,15 +33,31 @@ SequenceHasAllItemsUniqueValidator_T = TypeVar("SequenceHasAllItemsUniqueValidat
 
 class SequenceHasAllItemsUniqueValidator(DefaultValidatorImplBase[SequenceHasAllItemsUniqueValidator_T], Generic[SequenceHasAllItemsUniqueValidator_T]):
     """
-    The input sequence is valid if all of its items are unique.
+    The input sequence is valid if all of its items are unique. The items are compared using the '==' operator.
+
+    Items which have an equality key (see EqualityKeyHelper; e.g. strings, numbers, or lists and dictionaries
+     containing only such values) are counted using a dictionary, so sequences consisting of them are validated in
+     linear time. Only the other items (e.g. instances of user-defined classes) are compared with all the items one by
+     one.
     """
 
     __slots__ = ()
 
-    def _validate(self, data: SequenceHasAllItemsUniqueValidator_T) -> None:
+    def _validate(self, data: SequenceHasAllItemsUniqueValidator_T) -> Optional[DatalidatorExc]:
         # len(data) != len(set(data)) --> This would not work in all cases, because it would require all the sequence's
-        #  items to be Hashable!
-
-        for item in data:
-            if data.count(item) != 1:
-                raise self._generate_data_validation_failed_exc("The input sequence contains a duplicate item: {}".format(repr(item)))
+        #  items to be Hashable! The number of occurrences of each item is therefore computed as data.count(item) would
+        #  compute it, but the items which have an equality key are counted using a dictionary.
+
+        no_equality_key = EqualityKeyHelper.NO_EQUALITY_KEY
+        equality_keys: List[Any] = [EqualityKeyHelper.get_equality_key(item) for item in data]
+        equality_key_counts: Dict[Any, int] = collections.Counter(key for key in equality_keys if key is not no_equality_key)
+        items_without_equality_key = [item for item, key in zip(data, equality_keys) if key is no_equality_key]
+
+        for item, equality_key in zip(data, equality_keys):
+            if equality_key is no_equality_key:
+                item_count = data.count(item)
+            else:
+                item_count = equality_key_counts[equality_key] + items_without_equality_key.count(item)
+
+            if item_count != 1:
+                return self._generate_data_validation_failed_exc("The input sequence contains a duplicate item: {}".format(repr(item)))
@@ -20,7 +20,8 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import final, Sequence, Mapping, Generic, TypeVar
+from typing import final, Sequence, Mapping, Generic, TypeVar, Optional
+from datalidator.exc.DatalidatorExc import DatalidatorExc
 from datalidator.validators.DefaultValidatorWithNegationSupportImplBase import DefaultValidatorWithNegationSupportImplBase
 
 
@@ -41,15 +42,15 @@ class SequenceIsNotEmptyValidator(DefaultValidatorWithNegationSupportImplBase[Se
 
     __slots__ = ()
 
-    def _validate_positively(self, data: SequenceIsNotEmptyValidator_T) -> None:  # Sequence is not empty? -> Valid
+    def _validate_positively(self, data: SequenceIsNotEmptyValidator_T) -> Optional[DatalidatorExc]:  # Sequence is not empty? -> Valid
         if self.__is_sequence_empty(data):
-            raise self._generate_data_validation_failed_exc("The input sequence is empty!")
+            return self._generate_data_validation_failed_exc("The input sequence is empty!")
 
-    def _validate_negatively(self, data: SequenceIsNotEmptyValidator_T) -> None:  # Sequence is empty? -> Valid
+    def _validate_negatively(self, data: SequenceIsNotEmptyValidator_T) -> Optional[DatalidatorExc]:  # Sequence is empty? -> Valid
         if self.__is_sequence_empty(data):
             return
 
-        raise self._generate_data_validation_failed_exc("The input sequence is not empty!")
+        return self._generate_data_validation_failed_exc("The input sequence is not empty!")
 
     @final
     def __is_sequence_empty(self, sequence: SequenceIsNotEmptyValidator_T) -> bool:
@@ -20,7 +20,8 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import final, Final, Sequence, Mapping, Generic, TypeVar
+from typing import final, Final, Sequence, Mapping, Generic, TypeVar, Optional
+from datalidator.exc.DatalidatorExc import DatalidatorExc
 from datalidator.validators.DefaultValidatorImplBase import DefaultValidatorImplBase
 from datalidator.validators.exc.err.InvalidValidatorConfigError import InvalidValidatorConfigError
 
@@ -50,10 +51,10 @@ class SequenceMinimumLengthValidator(DefaultValidatorImplBase[SequenceMinimumLen
     def get_minimum_acceptable_length(self) -> int:
         return self.__minimum_acceptable_length
 
-    def _validate(self, data: SequenceMinimumLengthValidator_T) -> None:
+    def _validate(self, data: SequenceMinimumLengthValidator_T) -> Optional[DatalidatorExc]:
         sequence_length = len(data)
 
         if sequence_length < self.__minimum_acceptable_length:
-            raise self._generate_data_validation_failed_exc(
+            return self._generate_data_validation_failed_exc(
                 "The input sequence's length ({}) is smaller than the minimum acceptable length ({})!".format(sequence_length, self.__minimum_acceptable_length)
             )
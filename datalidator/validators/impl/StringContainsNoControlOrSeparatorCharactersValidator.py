@@ -20,8 +20,9 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import final, Final
-import unicodedata
+from typing import final, Final, Optional
+from datalidator.exc.DatalidatorExc import DatalidatorExc
+from datalidator.ControlAndSeparatorCharacterHelper import ControlAndSeparatorCharacterHelper
 from datalidator.validators.DefaultValidatorImplBase import DefaultValidatorImplBase
 
 
@@ -49,12 +50,15 @@ class StringContainsNoControlOrSeparatorCharactersValidator(DefaultValidatorImpl
     def get_allowed_characters(self) -> str:
         return self.__allowed_characters
 
-    def _validate(self, data: str) -> None:
-        for char in data:
-            if char in self.__allowed_characters:
-                continue
+    def _validate(self, data: str) -> Optional[DatalidatorExc]:
+        # The characters are looked up in precomputed tables (see ControlAndSeparatorCharacterHelper) instead of
+        #  calling unicodedata.category() for each of them
+        if data.isascii():
+            if len(data.translate(ControlAndSeparatorCharacterHelper.get_ascii_deletion_table(self.__allowed_characters))) == len(data):
+                return
 
-            if unicodedata.category(char)[0].upper() in ("C", "Z"):
-                raise self._generate_data_validation_failed_exc(
-                    "The input string contains an Unicode control or separator character: {}".format(repr(char))
-                )
+        match = ControlAndSeparatorCharacterHelper.get_character_regex(self.__allowed_characters).search(data)
+        if match is not None:
+            return self._generate_data_validation_failed_exc(
+                "The input string contains an Unicode control or separator character: {}".format(repr(match.group()))
+            )
@@ -20,7 +20,8 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import final, Final
+from typing import final, Final, Optional
+from datalidator.exc.DatalidatorExc import DatalidatorExc
 from datalidator.validators.DefaultValidatorWithNegationSupportImplBase import DefaultValidatorWithNegationSupportImplBase
 from datalidator.validators.exc.err.InvalidValidatorConfigError import InvalidValidatorConfigError
 
@@ -60,20 +61,20 @@ class StringContainsSubstringValidator(DefaultValidatorWithNegationSupportImplBa
     def is_check_performed_case_sensitively(self) -> bool:
         return self.__perform_check_case_sensitively
 
-    def _validate_positively(self, data: str) -> None:  # Contains substring? -> Valid
+    def _validate_positively(self, data: str) -> Optional[DatalidatorExc]:  # Contains substring? -> Valid
         if self.__does_string_contain_substring(data):
             return
 
-        raise self._generate_data_validation_failed_exc(
+        return self._generate_data_validation_failed_exc(
             "The substring ({}) is not present within the input string: {}".format(
                 repr(self.__checked_substring),
                 repr(data)
             )
         )
 
-    def _validate_negatively(self, data: str) -> None:  # Does not contain substring? -> Valid
+    def _validate_negatively(self, data: str) -> Optional[DatalidatorExc]:  # Does not contain substring? -> Valid
         if self.__does_string_contain_substring(data):
-            raise self._generate_data_validation_failed_exc(
+            return self._generate_data_validation_failed_exc(
                 "The substring ({}) is present within the input string: {}".format(
                     repr(self.__checked_substring),
                     repr(data)
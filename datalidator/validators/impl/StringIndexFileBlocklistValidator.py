@@ -0,0 +1,55 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from typing import final, Final, Optional
+from datalidator.exc.DatalidatorExc import DatalidatorExc
+from datalidator.validators.DefaultValidatorImplBase import DefaultValidatorImplBase
+from datalidator.validators.extras.StringIndexFile import StringIndexFile
+
+
+__all__ = "StringIndexFileBlocklistValidator",
+
+
+class StringIndexFileBlocklistValidator(DefaultValidatorImplBase[str]):
+    """
+    The input string is valid if it is not present in the initializer-provided string index file (see StringIndexFile).
+
+    Unlike BlocklistValidator, this validator is suitable even for blocklists of tens of millions of strings, as the
+     blocklist is not loaded into memory - the index file, built offline using StringIndexFileBuilder, is memory-mapped,
+     so it is shared by all the processes which use it. A single StringIndexFile may be shared by any number of
+     validators.
+    """
+
+    __slots__ = "__index_file",
+
+    def __init__(self, index_file: StringIndexFile, tag: str = ""):
+        DefaultValidatorImplBase.__init__(self, tag)
+
+        self.__index_file: Final[StringIndexFile] = index_file
+
+    @final
+    def get_index_file(self) -> StringIndexFile:
+        return self.__index_file
+
+    def _validate(self, data: str) -> Optional[DatalidatorExc]:
+        if self.__index_file.contains(data):
+            return self._generate_data_validation_failed_exc("The blocklist index file contains the input string: {}".format(repr(data)))
@@ -20,6 +20,8 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
+from typing import Optional
+from datalidator.exc.DatalidatorExc import DatalidatorExc
 from datalidator.DatalidatorConstants import DatalidatorConstants
 from datalidator.validators.DefaultValidatorImplBase import DefaultValidatorImplBase
 
@@ -36,7 +38,7 @@ class StringIsOnlySingleLineValidator(DefaultValidatorImplBase[str]):
 
     __slots__ = ()
 
-    def _validate(self, data: str) -> None:
+    def _validate(self, data: str) -> Optional[DatalidatorExc]:
         for newline_sequence in DatalidatorConstants.NEWLINE_SEQUENCES:
             if newline_sequence in data:
-                raise self._generate_data_validation_failed_exc("The input string contains more than one line: {}".format(repr(data)))
+                return self._generate_data_validation_failed_exc("The input string contains more than one line: {}".format(repr(data)))
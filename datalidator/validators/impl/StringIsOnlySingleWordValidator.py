@@ -20,7 +20,8 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import Final
+from typing import Final, Optional
+from datalidator.exc.DatalidatorExc import DatalidatorExc
 from datalidator.validators.DefaultValidatorImplBase import DefaultValidatorImplBase
 from datalidator.validators.impl.StringMatchesRegexValidator import StringMatchesRegexValidator
 from datalidator.validators.exc.DataValidationFailedExc import DataValidationFailedExc
@@ -48,8 +49,9 @@ class StringIsOnlySingleWordValidator(DefaultValidatorImplBase[str]):
             tag=self._tag
         )
 
-    def _validate(self, data: str) -> None:
-        try:
-            self.__regex_match_validator.validate(data)
-        except DataValidationFailedExc:
-            raise self._generate_data_validation_failed_exc("The input string contains more than one word: {}".format(repr(data)))
+    def _validate(self, data: str) -> Optional[DatalidatorExc]:
+        regex_match_exception = self.__regex_match_validator.try_validate(data)
+        if isinstance(regex_match_exception, DataValidationFailedExc):
+            return self._generate_data_validation_failed_exc("The input string contains more than one word: {}".format(repr(data)))
+
+        return regex_match_exception
@@ -20,8 +20,9 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import final, Final
+from typing import final, Final, Optional
 import re
+from datalidator.exc.DatalidatorExc import DatalidatorExc
 from datalidator.validators.DefaultValidatorWithNegationSupportImplBase import DefaultValidatorWithNegationSupportImplBase
 from datalidator.validators.exc.RegexFailedInValidatorExc import RegexFailedInValidatorExc
 from datalidator.validators.exc.err.RegexCompilationFailedInValidatorError import RegexCompilationFailedInValidatorError
@@ -67,15 +68,15 @@ class StringMatchesRegexValidator(DefaultValidatorWithNegationSupportImplBase[st
     def get_regex_compile_flags(self) -> int:
         return self.__regex_compile_flags
 
-    def _validate_positively(self, data: str) -> None:  # String matches the regex? -> Valid
+    def _validate_positively(self, data: str) -> Optional[DatalidatorExc]:  # String matches the regex? -> Valid
         if self.__does_string_match_regex(data):
             return
 
-        raise self._generate_data_validation_failed_exc("The regex does not match the input string: {}".format(repr(data)))
+        return self._generate_data_validation_failed_exc("The regex does not match the input string: {}".format(repr(data)))
 
-    def _validate_negatively(self, data: str) -> None:  # String does not match the regex? -> Valid
+    def _validate_negatively(self, data: str) -> Optional[DatalidatorExc]:  # String does not match the regex? -> Valid
         if self.__does_string_match_regex(data):
-            raise self._generate_data_validation_failed_exc("The regex matches the input string: {}".format(repr(data)))
+            return self._generate_data_validation_failed_exc("The regex matches the input string: {}".format(repr(data)))
 
     @final
     def __does_string_match_regex(self, string: str) -> bool:
@@ -20,6 +20,8 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
+from typing import Optional
+from datalidator.exc.DatalidatorExc import DatalidatorExc
 from datalidator.validators.DefaultValidatorImplBase import DefaultValidatorImplBase
 
 
@@ -33,6 +35,6 @@ class UnixFilesystemPathIsRelativeValidator(DefaultValidatorImplBase[str]):
 
     __slots__ = ()
 
-    def _validate(self, data: str) -> None:
+    def _validate(self, data: str) -> Optional[DatalidatorExc]:
         if data.startswith("/"):
-            raise self._generate_data_validation_failed_exc("The input Unix filesystem path is not relative: {}".format(repr(data)))
+            return self._generate_data_validation_failed_exc("The input Unix filesystem path is not relative: {}".format(repr(data)))
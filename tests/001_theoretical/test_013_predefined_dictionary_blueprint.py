@@ -1203,3 +1203,34 @@ def test_predefined_dictionary_blueprint_default_ignore_unspecified_keys_in_inpu
 
 def test_predefined_dictionary_blueprint_ignore_unspecified_keys_in_input():
     assert PredefinedDictionaryBlueprint({"test": GenericBlueprint()}, ignore_unspecified_keys_in_input=False).are_unspecified_keys_in_input_ignored() is False
+
+
+class DictSubclass(dict):
+    pass
+
+
+@pytest.mark.parametrize("input_factory", (dict, DictSubclass, lambda input_dict: tuple(input_dict.items())))
+@pytest.mark.parametrize("ignore_unspecified_keys_in_input", (True, False))
+def test_predefined_dictionary_blueprint_input_data_not_mutated(input_factory, ignore_unspecified_keys_in_input):
+    blueprint = PredefinedDictionaryBlueprint({
+        "a": IntegerBlueprint(),
+        1: OptionalItem(StringBlueprint(), "default"),
+        "c": OptionalItem(GenericBlueprint(), None)
+    }, ignore_unspecified_keys_in_input=ignore_unspecified_keys_in_input)
+
+    input_data = input_factory({"a": "10", True: 20})
+    assert blueprint.use(input_data) == {"a": 10, 1: "20", "c": None}
+    assert input_data == input_factory({"a": "10", True: 20})
+
+
+@pytest.mark.parametrize("input_factory", (dict, DictSubclass, lambda input_dict: tuple(input_dict.items())))
+def test_predefined_dictionary_blueprint_unspecified_keys_in_input(input_factory):
+    blueprint = PredefinedDictionaryBlueprint({"a": IntegerBlueprint(), "b": OptionalItem(IntegerBlueprint(), 0)}, ignore_unspecified_keys_in_input=False)
+
+    input_data = input_factory({"x": 1, "a": 2, "y": 3})
+    with pytest.raises(InvalidInputDataExc) as exc_info:
+        blueprint.use(input_data)
+
+    # The unspecified keys are listed in the order in which they are present in the input data
+    assert str(exc_info.value).endswith("('x', 'y')")
+    assert exc_info.value.get_input_data() is input_data
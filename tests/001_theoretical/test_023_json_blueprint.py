@@ -47,6 +47,7 @@ from datalidator.blueprints.exc.InvalidInputDataExc import InvalidInputDataExc
 from datalidator.blueprints.exc.InputDataTypeNotInAllowlistExc import InputDataTypeNotInAllowlistExc
 from datalidator.blueprints.exc.InputDataNotConvertibleExc import InputDataNotConvertibleExc
 from datalidator.blueprints.exc.InputDataValueNotAllowedForDataTypeExc import InputDataValueNotAllowedForDataTypeExc
+from datalidator.blueprints.exc.err.InvalidBlueprintConfigError import InvalidBlueprintConfigError
 from datalidator.filters.impl.StringStripFilter import StringStripFilter
 from datalidator.filters.impl.StringUnicodeNormalizeFilter import StringUnicodeNormalizeFilter
 from datalidator.validators.impl.StringMatchesRegexValidator import StringMatchesRegexValidator
@@ -195,10 +196,10 @@ __JSON_BLUEPRINT_TEST_SUITE = (
         (["abc"], InputDataTypeNotInAllowlistExc),
         ({}, InputDataTypeNotInAllowlistExc),
         ({"abc": "def"}, InputDataTypeNotInAllowlistExc),
-        (b'', InputDataTypeNotInAllowlistExc),
-        (b'hello', InputDataTypeNotInAllowlistExc),
-        (bytearray(b''), InputDataTypeNotInAllowlistExc),
-        (bytearray(b'hello'), InputDataTypeNotInAllowlistExc),
+        (b'', InvalidInputDataExc),
+        (b'hello', InvalidInputDataExc),
+        (bytearray(b''), InvalidInputDataExc),
+        (bytearray(b'hello'), InvalidInputDataExc),
         (str, InputDataTypeNotInAllowlistExc),
         (object(), InputDataTypeNotInAllowlistExc),
         (theoretical_testutils.EmptyObject(), InputDataTypeNotInAllowlistExc),
@@ -539,3 +540,56 @@ def test_json_blueprint(blueprint, input_, output):
 ))
 def test_json_blueprint_wrapped_blueprint(wrapped_bp):
     assert JSONBlueprint(wrapped_blueprint=wrapped_bp).get_wrapped_blueprint() is wrapped_bp
+
+
+@pytest.mark.parametrize(("input_", "output"), (
+    (b'[1, "2", 3.9]', [1, 2, 3]),
+    (b'  \t[1, "2", 3.9]\r\n', [1, 2, 3]),
+    (bytearray(b'[1, "2", 3.9]'), [1, 2, 3]),
+    (memoryview(b'[1, "2", 3.9]'), [1, 2, 3]),
+    (memoryview(b'xx[1, "2", 3.9]xx')[2:-2], [1, 2, 3]),
+    ('[1, "2", 3.9]'.encode("utf-16"), [1, 2, 3]),
+    ('\n [1, "2", 3.9]\t\r\n'.encode("utf-16-le"), [1, 2, 3]),
+    ('\n [1, "2", 3.9]\t\r\n'.encode("utf-16-be"), [1, 2, 3]),
+    ('\n [1, "2", 3.9]\t\r\n'.encode("utf-16"), [1, 2, 3]),
+    ('\n [1, "2", 3.9]\t\r\n'.encode("utf-32"), [1, 2, 3]),
+    ('\n [1, "2", 3.9]\t\r\n'.encode("utf-32-le"), [1, 2, 3]),
+    ('\n [1, "2", 3.9]\t\r\n'.encode("utf-32-be"), [1, 2, 3]),
+    ('["\u0159e\u0159icha"]'.encode("utf-8"), InputDataNotConvertibleExc),
+    (b'', InvalidInputDataExc),
+    (b'   ', InvalidInputDataExc),
+    (b'[1, 2', InvalidInputDataExc),
+    (b'[1, "\xff"]', InvalidInputDataExc),
+    (memoryview(b'[1, 2'), InvalidInputDataExc),
+    (b'[1, null]', InputDataTypeNotInAllowlistExc),
+))
+def test_json_blueprint_binary_input(input_, output):
+    theoretical_testutils.perform_test(JSONBlueprint(wrapped_blueprint=ListBlueprint(item_blueprint=IntegerBlueprint())), input_, output)
+
+
+@pytest.mark.parametrize(("max_input_size", "input_", "output"), (
+    (None, "[1, 2, 3]", [1, 2, 3]),
+    (9, "[1, 2, 3]", [1, 2, 3]),
+    (9, "  [1, 2, 3]  ", InvalidInputDataExc),
+    (8, "[1, 2, 3]", InvalidInputDataExc),
+    (9, b"[1, 2, 3]", [1, 2, 3]),
+    (8, b"[1, 2, 3]", InvalidInputDataExc),
+    (8, bytearray(b"[1, 2, 3]"), InvalidInputDataExc),
+    (8, memoryview(b"[1, 2, 3]"), InvalidInputDataExc),
+    (5, '["\u0159"]', ["\u0159"]),
+    (4, '["\u0159"]', InvalidInputDataExc),
+    (6, '["\u0159"]'.encode("utf-8"), ["\u0159"]),
+    (5, '["\u0159"]'.encode("utf-8"), InvalidInputDataExc),
+    (0, "", InvalidInputDataExc),
+    (0, "1", InvalidInputDataExc),
+))
+def test_json_blueprint_max_input_size(max_input_size, input_, output):
+    theoretical_testutils.perform_test(JSONBlueprint(wrapped_blueprint=GenericBlueprint(), max_input_size=max_input_size), input_, output)
+
+
+def test_json_blueprint_invalid_max_input_size():
+    assert JSONBlueprint(wrapped_blueprint=GenericBlueprint(), max_input_size=100).get_max_input_size() == 100
+    assert JSONBlueprint(wrapped_blueprint=GenericBlueprint()).get_max_input_size() is None
+
+    with pytest.raises(InvalidBlueprintConfigError):
+        JSONBlueprint(wrapped_blueprint=GenericBlueprint(), max_input_size=-1)
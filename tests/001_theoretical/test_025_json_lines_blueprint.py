@@ -0,0 +1,169 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import os
+import os.path
+import sys
+if "DATALIDATOR_TESTS_AUTOPATH" in os.environ:
+    __TESTS_DIR = os.path.dirname(os.path.realpath(__file__))
+    __MODULE_DIR = os.path.realpath(os.path.join(__TESTS_DIR, "../.."))
+    if __TESTS_DIR not in sys.path:
+        sys.path.insert(0, __TESTS_DIR)
+    if __MODULE_DIR not in sys.path:
+        sys.path.insert(0, __MODULE_DIR)
+
+import io
+import mmap
+import theoretical_testutils
+import pytest
+from datalidator.blueprints.StreamErrorPolicy import StreamErrorPolicy
+from datalidator.blueprints.specialimpl.JSONLinesBlueprint import JSONLinesBlueprint
+from datalidator.blueprints.impl.IntegerBlueprint import IntegerBlueprint
+from datalidator.blueprints.impl.ListBlueprint import ListBlueprint
+from datalidator.blueprints.impl.GenericBlueprint import GenericBlueprint
+from datalidator.blueprints.impl.PredefinedDictionaryBlueprint import PredefinedDictionaryBlueprint
+from datalidator.blueprints.impl.StringBlueprint import StringBlueprint
+from datalidator.blueprints.exc.InvalidInputDataExc import InvalidInputDataExc
+from datalidator.blueprints.exc.InvalidItemsInInputDataExc import InvalidItemsInInputDataExc
+from datalidator.blueprints.exc.InputDataTypeNotInAllowlistExc import InputDataTypeNotInAllowlistExc
+from datalidator.exc.err.ThisShouldNeverHappenError import ThisShouldNeverHappenError
+
+
+class FailingFile(io.RawIOBase):
+    def readable(self):
+        return True
+
+    def readline(self, size=-1):
+        raise OSError("The file could not be read!")
+
+
+__JSON_LINES_BLUEPRINT_TEST_SUITE = (
+    (JSONLinesBlueprint(IntegerBlueprint()), (
+        ("", []),
+        ("\n\n", []),
+        ("123", [123]),
+        ("1\n2\n3", [1, 2, 3]),
+        ("1\n2\n3\n", [1, 2, 3]),
+        ("1\r\n2\r\n3\r\n", [1, 2, 3]),
+        (" 1 \n\n  \n\t2\t\n", [1, 2]),
+        ('"1"\n2.9\ntrue', [1, 2, 1]),
+        (b"1\n2\n3\n", [1, 2, 3]),
+        (b"1\r\n\r\n2", [1, 2]),
+        (bytearray(b"1\n2\n3\n"), [1, 2, 3]),
+        (memoryview(b"1\n2\n3\n"), [1, 2, 3]),
+        (memoryview(b"0\n1\n2\n3\n")[2:], [1, 2, 3]),
+        (io.BytesIO(b"1\n2\n3\n"), [1, 2, 3]),
+        (io.StringIO("1\n2\n3\n"), [1, 2, 3]),
+        ("1\n[2]\n3", InvalidItemsInInputDataExc),
+        ("1\n{\n3", InvalidItemsInInputDataExc),
+        (b"1\n\xff\n3", InvalidItemsInInputDataExc),
+        ("[1, 2, 3]", InvalidItemsInInputDataExc),
+        (FailingFile(), InvalidInputDataExc),
+        (None, InputDataTypeNotInAllowlistExc),
+        (1, InputDataTypeNotInAllowlistExc),
+        (["1", "2"], InputDataTypeNotInAllowlistExc),
+        ((i for i in ("1", "2")), InputDataTypeNotInAllowlistExc),
+        (theoretical_testutils.EmptyObject(), InputDataTypeNotInAllowlistExc),
+    )),
+    (JSONLinesBlueprint(PredefinedDictionaryBlueprint({"level": StringBlueprint(), "code": IntegerBlueprint()})), (
+        ('{"level": "info", "code": 1}\n{"code": "2", "level": "error"}', [{"level": "info", "code": 1}, {"level": "error", "code": 2}]),
+        ('{"level": "info", "code": 1}\n{"level": "error"}', InvalidItemsInInputDataExc),
+    )),
+)
+
+
+@pytest.mark.parametrize(("blueprint", "input_", "output"), theoretical_testutils.test_function_parameter_generator(__JSON_LINES_BLUEPRINT_TEST_SUITE))
+def test_json_lines_blueprint(blueprint, input_, output):
+    theoretical_testutils.perform_test(blueprint, input_, output)
+
+
+def test_json_lines_blueprint_wrapped_blueprint():
+    wrapped_bp = GenericBlueprint()
+    assert JSONLinesBlueprint(wrapped_blueprint=wrapped_bp).get_wrapped_blueprint() is wrapped_bp
+
+
+def test_json_lines_blueprint_line_numbers():
+    with pytest.raises(InvalidItemsInInputDataExc) as e_info:
+        JSONLinesBlueprint(IntegerBlueprint(tag="item"), tag="lines").use('1\n\n"x"\n4')
+
+    assert e_info.value.get_originator_tag() == "lines"
+    assert len(e_info.value.get_item_exceptions()) == 1
+    assert e_info.value.get_item_exceptions()[0][0] == "line 3"
+    assert e_info.value.get_item_exceptions()[0][1].get_originator_tag() == "item"
+
+
+def test_json_lines_blueprint_iter_use_is_lazy():
+    input_file = io.BytesIO(b"1\n2\n3\n")
+    output_iterator = JSONLinesBlueprint(IntegerBlueprint()).iter_use(input_file)
+
+    assert next(output_iterator) == 1
+    assert input_file.read() == b"2\n3\n"
+
+
+@pytest.mark.parametrize(("error_policy", "output"), (
+    (StreamErrorPolicy.POLICY_STOP, [1]),
+    (StreamErrorPolicy.POLICY_SKIP, [1, 4]),
+    (StreamErrorPolicy.POLICY_COLLECT, [1, 4]),
+))
+def test_json_lines_blueprint_iter_use_error_policy(error_policy, output):
+    output_items = []
+    try:
+        for output_item in JSONLinesBlueprint(IntegerBlueprint()).iter_use(b'1\nx\n"y"\n4\n', error_policy=error_policy):
+            output_items.append(output_item)
+    except InvalidItemsInInputDataExc as e:
+        assert error_policy != StreamErrorPolicy.POLICY_SKIP
+        expected_paths = (("line 2",) if error_policy == StreamErrorPolicy.POLICY_STOP else ("line 2", "line 3"))
+        assert tuple(path for path, _ in e.get_item_exceptions()) == expected_paths
+    else:
+        assert error_policy == StreamErrorPolicy.POLICY_SKIP
+
+    assert output_items == output
+
+
+@pytest.mark.parametrize(("error_policy", "expected_paths"), (
+    (StreamErrorPolicy.POLICY_STOP, ("line 2[1]", "line 2[2]")),
+    (StreamErrorPolicy.POLICY_COLLECT, ("line 2[1]", "line 2[2]", "line 3[0]")),
+))
+def test_json_lines_blueprint_iter_use_nested_collected_item_exceptions(error_policy, expected_paths):
+    blueprint = JSONLinesBlueprint(ListBlueprint(IntegerBlueprint(), collect_item_exceptions=True))
+
+    with pytest.raises(InvalidItemsInInputDataExc) as e_info:
+        list(blueprint.iter_use('[1, 2]\n[3, "x", "y"]\n["z"]\n', error_policy=error_policy))
+
+    assert tuple(path for path, _ in e_info.value.get_item_exceptions()) == expected_paths
+    assert not any(isinstance(item_exception, InvalidItemsInInputDataExc) for _, item_exception in e_info.value.get_item_exceptions())
+
+
+def test_json_lines_blueprint_iter_use_mmap():
+    memory_map = mmap.mmap(-1, 6)
+    memory_map.write(b"1\n2\n3\n")
+
+    assert list(JSONLinesBlueprint(IntegerBlueprint()).iter_use(memory_map)) == [1, 2, 3]
+    memory_map.close()  # The memoryview of the memory map must have been released
+
+
+def test_json_lines_blueprint_iter_use_invalid_input_data():
+    with pytest.raises(InputDataTypeNotInAllowlistExc):
+        JSONLinesBlueprint(IntegerBlueprint()).iter_use(["1"])
+
+    with pytest.raises(ThisShouldNeverHappenError):
+        JSONLinesBlueprint(IntegerBlueprint()).iter_use("1", error_policy=None)  # noqa
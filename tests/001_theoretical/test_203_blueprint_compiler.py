@@ -0,0 +1,240 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import os
+import os.path
+import sys
+if "DATALIDATOR_TESTS_AUTOPATH" in os.environ:
+    __TESTS_DIR = os.path.dirname(os.path.realpath(__file__))
+    __MODULE_DIR = os.path.realpath(os.path.join(__TESTS_DIR, "../.."))
+    if __TESTS_DIR not in sys.path:
+        sys.path.insert(0, __TESTS_DIR)
+    if __MODULE_DIR not in sys.path:
+        sys.path.insert(0, __MODULE_DIR)
+
+from typing import Any
+import theoretical_testutils
+import pytest
+import importlib
+import inspect
+import collections.abc
+from datalidator.blueprints.BlueprintIface import BlueprintIface
+from datalidator.blueprints.DefaultBlueprintImplBase import DefaultBlueprintImplBase
+from datalidator.blueprints.ParsingMode import ParsingMode
+from datalidator.blueprints.compiler.BlueprintCompiler import BlueprintCompiler
+from datalidator.blueprints.compiler.CompiledBlueprint import CompiledBlueprint
+from datalidator.blueprints.impl.IntegerBlueprint import IntegerBlueprint
+from datalidator.blueprints.impl.StringBlueprint import StringBlueprint
+from datalidator.blueprints.impl.ListBlueprint import ListBlueprint
+from datalidator.blueprints.impl.GenericBlueprint import GenericBlueprint
+from datalidator.blueprints.impl.PredefinedDictionaryBlueprint import PredefinedDictionaryBlueprint
+from datalidator.blueprints.specialimpl.ExceptionHandlingBlueprint import ExceptionHandlingBlueprint
+from datalidator.blueprints.specialimpl.NoneHandlingBlueprint import NoneHandlingBlueprint
+from datalidator.blueprints.exc.InvalidInputDataExc import InvalidInputDataExc
+from datalidator.blueprints.exc.UnexpectedExceptionRaisedInBlueprintExc import UnexpectedExceptionRaisedInBlueprintExc
+from datalidator.exc.DatalidatorExc import DatalidatorExc
+from datalidator.exc.err.ThisShouldNeverHappenError import ThisShouldNeverHappenError
+from datalidator.filters.impl.StringStripFilter import StringStripFilter
+from datalidator.validators.impl.SequenceMaximumLengthValidator import SequenceMaximumLengthValidator
+
+
+class CountingBlueprint(DefaultBlueprintImplBase[Any]):
+    __slots__ = "compile_count",
+
+    def __init__(self, tag: str = ""):
+        DefaultBlueprintImplBase.__init__(self, tag)
+        self.compile_count = 0
+
+    def _use(self, input_data: Any) -> Any:
+        return input_data
+
+    def _compile(self, blueprint_compiler):
+        self.compile_count += 1
+        return DefaultBlueprintImplBase._compile(self, blueprint_compiler)
+
+
+class ForeignBlueprint(BlueprintIface[Any]):
+    # Does not extend DefaultBlueprintImplBase, so the unexpected exceptions it raises are not converted by it.
+    def get_tag(self) -> str:
+        return "foreign"
+
+    def use(self, input_data: Any) -> Any:
+        raise KeyError(input_data)
+
+
+# (test module name, test suite name) - the test suites of these modules are re-run with compiled blueprints
+__COMPILED_BLUEPRINT_PARITY_TEST_SUITES = (
+    ("test_001_boolean_blueprint", "__BOOLEAN_BLUEPRINT_TEST_SUITE"),
+    ("test_002_bytes_blueprint", "__BYTES_BLUEPRINT_TEST_SUITE"),
+    ("test_003_date_blueprint", "__DATE_BLUEPRINT_TEST_SUITE"),
+    ("test_004_datetime_blueprint", "__DATETIME_BLUEPRINT_TEST_SUITE"),
+    ("test_005_dictionary_blueprint", "__DICTIONARY_BLUEPRINT_TEST_SUITE"),
+    ("test_006_float_blueprint", "__FLOAT_BLUEPRINT_TEST_SUITE"),
+    ("test_007_generic_blueprint", "__GENERIC_BLUEPRINT_TEST_SUITE"),
+    ("test_008_integer_blueprint", "__INTEGER_BLUEPRINT_TEST_SUITE"),
+    ("test_011_list_blueprint", "__LIST_BLUEPRINT_TEST_SUITE"),
+    ("test_012_object_blueprint", "__OBJECT_BLUEPRINT_TEST_SUITE"),
+    ("test_013_predefined_dictionary_blueprint", "__PREDEFINED_DICTIONARY_BLUEPRINT_TEST_SUITE"),
+    ("test_014_string_blueprint", "__STRING_BLUEPRINT_TEST_SUITE"),
+    ("test_015_time_blueprint", "__TIME_BLUEPRINT_TEST_SUITE"),
+    ("test_016_time_interval_blueprint", "__TIME_INTERVAL_BLUEPRINT_TEST_SUITE"),
+    ("test_017_unix_filesystem_path_blueprint", "__UNIX_FILESYSTEM_PATH_TEST_SUITE"),
+    ("test_019_uuid_blueprint", "__UUID_BLUEPRINT_TEST_SUITE"),
+    ("test_020_blueprint_chaining_blueprint", "__BLUEPRINT_CHAINING_BLUEPRINT_TEST_SUITE"),
+    ("test_021_default_value_none_handling_blueprint", "__DEFAULT_VALUE_NONE_HANDLING_BLUEPRINT"),
+    ("test_022_exception_handling_blueprint", "__EXCEPTION_HANDLING_BLUEPRINT_TEST_SUITE"),
+    ("test_023_json_blueprint", "__JSON_BLUEPRINT_TEST_SUITE"),
+    ("test_024_none_handling_blueprint", "__NONE_HANDLING_BLUEPRINT_TEST_SUITE"),
+    ("test_100_replacement_map_filter", "__REPLACEMENT_MAP_FILTER_TEST_SUITE"),
+    ("test_150_allowlist_validator", "__ALLOWLIST_VALIDATOR_TEST_SUITE"),
+    ("test_151_blocklist_validator", "__BLOCKLIST_VALIDATOR_TEST_SUITE"),
+)
+
+
+def contains_iterator(input_) -> bool:
+    if isinstance(input_, collections.abc.Iterator):
+        return True
+
+    if isinstance(input_, dict):
+        return any(contains_iterator(key) or contains_iterator(value) for key, value in input_.items())
+
+    if isinstance(input_, (list, tuple, set, frozenset)):
+        return any(contains_iterator(item) for item in input_)
+
+    return False
+
+
+def use_and_describe_outcome(blueprint, input_):
+    try:
+        return "output", blueprint.use(input_)
+    except DatalidatorExc as e:
+        return "exception", e.__class__, e.get_originator_tag(), str(e)
+
+
+def are_outcomes_equal(outcome_1, outcome_2) -> bool:
+    if outcome_1 == outcome_2:
+        return True
+
+    # NaN is not equal to itself
+    return repr(outcome_1) == repr(outcome_2)
+
+
+@pytest.mark.parametrize(("test_module_name", "test_suite_name"), __COMPILED_BLUEPRINT_PARITY_TEST_SUITES)
+def test_compiled_blueprint_parity(test_module_name, test_suite_name):
+    test_suite = getattr(importlib.import_module(test_module_name), test_suite_name)
+
+    for blueprint, tested_values in test_suite:
+        if inspect.isgeneratorfunction(tested_values):
+            tested_values = tested_values()
+
+        compiled_blueprint = BlueprintCompiler().compile(blueprint)
+
+        for input_, _ in tested_values:
+            if contains_iterator(input_):
+                continue  # Iterators cannot be used twice
+
+            assert are_outcomes_equal(use_and_describe_outcome(blueprint, input_), use_and_describe_outcome(compiled_blueprint, input_))
+
+
+def test_compiled_blueprint_attributes():
+    blueprint = IntegerBlueprint(tag="abc")
+    compiled_blueprint = BlueprintCompiler().compile(blueprint)
+
+    assert isinstance(compiled_blueprint, BlueprintIface)
+    assert compiled_blueprint.get_tag() == "abc"
+    assert compiled_blueprint.get_source_blueprint() is blueprint
+
+
+def test_compiled_blueprint_recompilation():
+    compiled_blueprint = BlueprintCompiler().compile(IntegerBlueprint())
+    recompiled_blueprint = BlueprintCompiler().compile(ListBlueprint(item_blueprint=compiled_blueprint))
+
+    assert recompiled_blueprint.use(["1", 2]) == [1, 2]
+    assert BlueprintCompiler().compile_to_function(compiled_blueprint) is compiled_blueprint.get_compiled_function()
+
+
+def test_compiled_blueprint_shared_nested_blueprint_is_compiled_once():
+    shared_blueprint = CountingBlueprint()
+    blueprint = PredefinedDictionaryBlueprint(dict_specification={
+        "a": shared_blueprint,
+        "b": ListBlueprint(item_blueprint=shared_blueprint),
+    })
+
+    compiled_blueprint = BlueprintCompiler().compile(blueprint)
+
+    assert shared_blueprint.compile_count == 1
+    assert compiled_blueprint.use({"a": 1, "b": (2, 3)}) == {"a": 1, "b": [2, 3]}
+
+
+def test_compiled_blueprint_nested_originator_tags():
+    blueprint = ListBlueprint(
+        item_blueprint=PredefinedDictionaryBlueprint(dict_specification={
+            "name": StringBlueprint(filters=(StringStripFilter(),), parsing_mode=ParsingMode.MODE_STRICT, tag="name")
+        }, tag="item"),
+        validators=(SequenceMaximumLengthValidator(2, tag="length"),),
+        tag="list"
+    )
+    compiled_blueprint = BlueprintCompiler().compile(blueprint)
+
+    assert compiled_blueprint.use([{"name": " abc "}]) == [{"name": "abc"}]
+
+    for input_, originator_tag in (([{"name": 1}], "name"), ([{}], "item"), ("abc", "list"), ([{"name": ""}] * 3, "length")):
+        with pytest.raises(DatalidatorExc) as e_info:
+            compiled_blueprint.use(input_)
+        assert e_info.value.get_originator_tag() == originator_tag
+
+
+def test_compiled_blueprint_foreign_blueprint_unexpected_exception():
+    compiled_blueprint = BlueprintCompiler().compile(NoneHandlingBlueprint(ForeignBlueprint(), tag="wrapper"))
+
+    assert compiled_blueprint.use(None) is None
+    with pytest.raises(UnexpectedExceptionRaisedInBlueprintExc) as e_info:
+        compiled_blueprint.use(1)
+    assert e_info.value.get_originator_tag() == "wrapper"
+    assert isinstance(e_info.value.get_raised_exception(), KeyError)
+
+
+def test_compiled_blueprint_exception_handling_blueprint():
+    compiled_blueprint = BlueprintCompiler().compile(ExceptionHandlingBlueprint(IntegerBlueprint(), default_value=-1))
+
+    assert compiled_blueprint.use("5") == 5
+    assert compiled_blueprint.use("x") == -1
+
+    with pytest.raises(UnexpectedExceptionRaisedInBlueprintExc):
+        BlueprintCompiler().compile(ExceptionHandlingBlueprint(ForeignBlueprint(), default_value=-1)).use(1)
+
+
+def test_compiled_blueprint_invalid_parsing_mode():
+    compiled_blueprint = BlueprintCompiler().compile(ListBlueprint(item_blueprint=GenericBlueprint(), parsing_mode=ParsingMode._MODE_INVALID))  # noqa
+
+    with pytest.raises(ThisShouldNeverHappenError):
+        compiled_blueprint.use([])
+
+
+@pytest.mark.parametrize("input_", ("1", 2, 3.0, True))
+def test_compiled_blueprint_valid_input(input_):
+    theoretical_testutils.perform_test(BlueprintCompiler().compile(IntegerBlueprint()), input_, int(input_))
+
+
+@pytest.mark.parametrize("input_", ("x", None, [], 1.5j))
+def test_compiled_blueprint_invalid_input(input_):
+    theoretical_testutils.perform_test(BlueprintCompiler().compile(IntegerBlueprint()), input_, InvalidInputDataExc)
@@ -0,0 +1,172 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import os
+import os.path
+import sys
+if "DATALIDATOR_TESTS_AUTOPATH" in os.environ:
+    __TESTS_DIR = os.path.dirname(os.path.realpath(__file__))
+    __MODULE_DIR = os.path.realpath(os.path.join(__TESTS_DIR, "../.."))
+    if __TESTS_DIR not in sys.path:
+        sys.path.insert(0, __TESTS_DIR)
+    if __MODULE_DIR not in sys.path:
+        sys.path.insert(0, __MODULE_DIR)
+
+import theoretical_testutils
+import pytest
+from datalidator.blueprints.ParsingMode import ParsingMode
+from datalidator.blueprints.DefaultBlueprintImplBase import DefaultBlueprintImplBase
+from datalidator.blueprints.extras.BatchUseResult import BatchUseResult
+from datalidator.blueprints.impl.IntegerBlueprint import IntegerBlueprint
+from datalidator.blueprints.impl.ListBlueprint import ListBlueprint
+from datalidator.blueprints.impl.StringBlueprint import StringBlueprint
+from datalidator.blueprints.specialimpl.JSONBlueprint import JSONBlueprint
+from datalidator.blueprints.exc.InputDataNotConvertibleExc import InputDataNotConvertibleExc
+from datalidator.blueprints.exc.InputDataTypeNotInAllowlistExc import InputDataTypeNotInAllowlistExc
+from datalidator.blueprints.exc.UnexpectedExceptionRaisedInBlueprintExc import UnexpectedExceptionRaisedInBlueprintExc
+from datalidator.exc.DatalidatorExc import DatalidatorExc
+from datalidator.exc.err.ThisShouldNeverHappenError import ThisShouldNeverHappenError
+from datalidator.validators.impl.IntegerIsPositiveValidator import IntegerIsPositiveValidator
+from datalidator.validators.exc.DataValidationFailedExc import DataValidationFailedExc
+
+
+class CustomInt(int):
+    pass
+
+
+class FailingBlueprint(DefaultBlueprintImplBase[int]):
+    __slots__ = ()
+
+    def _use(self, input_data):
+        if input_data == 0:
+            raise ZeroDivisionError("zero")
+
+        return input_data
+
+
+class NegatingIntegerBlueprint(IntegerBlueprint):
+    __slots__ = ()
+
+    def _parse_in_rational_mode(self, input_data):
+        return -IntegerBlueprint._parse_in_rational_mode(self, input_data)
+
+
+__USE_MANY_TEST_SUITE = (
+    (IntegerBlueprint(), (
+        ([], []),
+        ((1, 2, 3), [1, 2, 3]),
+        ([1, "2", 3.0, True, CustomInt(5), " 6 "], [1, 2, 3, 1, 5, 6]),
+        ((i for i in range(5)), [0, 1, 2, 3, 4]),
+        ({"1": None, "2": None}, [1, 2]),
+        ([1, "abc", 3], InputDataNotConvertibleExc),
+        ([1, None], InputDataTypeNotInAllowlistExc),
+    )),
+    (IntegerBlueprint(parsing_mode=ParsingMode.MODE_STRICT), (
+        ([1, 2, 3], [1, 2, 3]),
+        ([1, CustomInt(2)], [1, 2]),
+        ([1, "2"], InputDataTypeNotInAllowlistExc),
+        ([1, True], [1, 1]),
+    )),
+    (IntegerBlueprint(validators=(IntegerIsPositiveValidator(),)), (
+        ([1, "2"], [1, 2]),
+        ([1, 0], DataValidationFailedExc),
+        (["1", -1], DataValidationFailedExc),
+    )),
+    (NegatingIntegerBlueprint(), (
+        ([1, "2"], [-1, -2]),
+    )),
+    (IntegerBlueprint(parsing_mode=ParsingMode._MODE_INVALID), (  # noqa
+        ([], []),
+        ([1], ThisShouldNeverHappenError),
+    )),
+    (StringBlueprint(), (
+        (["a", 1, 2.5], ["a", "1", "2.5"]),
+        (["a", [1]], InputDataTypeNotInAllowlistExc),
+    )),
+    (ListBlueprint(item_blueprint=IntegerBlueprint()), (
+        ([[1, "2"], (), {3}], [[1, 2], [], [3]]),
+        ([[1], [None]], InputDataTypeNotInAllowlistExc),
+    )),
+    (JSONBlueprint(StringBlueprint()), (
+        (['"a"', '123'], ["a", "123"]),
+        (['"a"', '[1, 2]'], InputDataTypeNotInAllowlistExc),
+    )),
+    (FailingBlueprint(), (
+        ([1, 2], [1, 2]),
+        ([1, 0], UnexpectedExceptionRaisedInBlueprintExc),
+    )),
+)
+
+
+@pytest.mark.parametrize(("blueprint", "input_", "output"), theoretical_testutils.test_function_parameter_generator(__USE_MANY_TEST_SUITE))
+def test_use_many(blueprint, input_, output):
+    if isinstance(output, type) and issubclass(output, Exception):
+        with pytest.raises(output):
+            blueprint.use_many(input_)
+    else:
+        assert blueprint.use_many(input_) == output
+
+
+def test_use_many_and_collect_exceptions():
+    result = IntegerBlueprint(validators=(IntegerIsPositiveValidator(),)).use_many_and_collect_exceptions(["1", "x", 3, None, -5, 6])
+
+    assert isinstance(result, BatchUseResult)
+    assert not result.is_successful()
+    assert result.get_processed_item_count() == 6
+    assert tuple(result.get_outputs()) == ((0, 1), (2, 3), (5, 6))
+    assert tuple(index for index, _ in result.get_exceptions()) == (1, 3, 4)
+    assert tuple(e.__class__ for _, e in result.get_exceptions()) == (InputDataNotConvertibleExc, InputDataTypeNotInAllowlistExc, DataValidationFailedExc)
+    assert all(isinstance(e, DatalidatorExc) for _, e in result.get_exceptions())
+
+    with pytest.raises(InputDataNotConvertibleExc):
+        result.get_output_list()
+
+
+def test_use_many_and_collect_exceptions_successful():
+    result = StringBlueprint().use_many_and_collect_exceptions(i for i in ("a", "b", 1))
+
+    assert result.is_successful()
+    assert result.get_processed_item_count() == 3
+    assert tuple(result.get_exceptions()) == ()
+    assert result.get_output_list() == ["a", "b", "1"]
+
+
+def test_use_many_and_collect_exceptions_empty():
+    result = IntegerBlueprint().use_many_and_collect_exceptions(())
+
+    assert result.is_successful()
+    assert result.get_processed_item_count() == 0
+    assert result.get_output_list() == []
+
+
+def test_use_many_and_collect_exceptions_unexpected_exception():
+    result = FailingBlueprint(tag="failing").use_many_and_collect_exceptions([0, 1])
+
+    assert tuple(result.get_outputs()) == ((1, 1),)
+    assert result.get_exceptions()[0][0] == 0
+    assert isinstance(result.get_exceptions()[0][1], UnexpectedExceptionRaisedInBlueprintExc)
+    assert result.get_exceptions()[0][1].get_originator_tag() == "failing"
+
+
+def test_use_many_and_collect_exceptions_error():
+    with pytest.raises(ThisShouldNeverHappenError):
+        IntegerBlueprint(parsing_mode=ParsingMode._MODE_INVALID).use_many_and_collect_exceptions([1, "x"])  # noqa
@@ -0,0 +1,189 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import os
+import os.path
+import sys
+if "DATALIDATOR_TESTS_AUTOPATH" in os.environ:
+    __TESTS_DIR = os.path.dirname(os.path.realpath(__file__))
+    __MODULE_DIR = os.path.realpath(os.path.join(__TESTS_DIR, "../.."))
+    if __TESTS_DIR not in sys.path:
+        sys.path.insert(0, __TESTS_DIR)
+    if __MODULE_DIR not in sys.path:
+        sys.path.insert(0, __MODULE_DIR)
+
+import itertools
+import theoretical_testutils
+import pytest
+from datalidator.blueprints.ParsingMode import ParsingMode
+from datalidator.blueprints.StreamErrorPolicy import StreamErrorPolicy
+from datalidator.blueprints.impl.IntegerBlueprint import IntegerBlueprint
+from datalidator.blueprints.impl.ListBlueprint import ListBlueprint
+from datalidator.blueprints.impl.DictionaryBlueprint import DictionaryBlueprint
+from datalidator.blueprints.impl.StringBlueprint import StringBlueprint
+from datalidator.blueprints.exc.InvalidInputDataExc import InvalidInputDataExc
+from datalidator.blueprints.exc.InputDataNotConvertibleExc import InputDataNotConvertibleExc
+from datalidator.blueprints.exc.InputDataTypeInBlocklistExc import InputDataTypeInBlocklistExc
+from datalidator.blueprints.exc.InputDataTypeNotInAllowlistExc import InputDataTypeNotInAllowlistExc
+from datalidator.blueprints.exc.InvalidItemsInInputDataExc import InvalidItemsInInputDataExc
+from datalidator.blueprints.exc.err.InvalidBlueprintConfigError import InvalidBlueprintConfigError
+from datalidator.exc.err.ThisShouldNeverHappenError import ThisShouldNeverHappenError
+from datalidator.validators.impl.SequenceMaximumLengthValidator import SequenceMaximumLengthValidator
+
+
+class FailingIterable:
+    def __iter__(self):
+        yield 1
+        raise OSError("The cursor has been closed!")
+
+
+def test_iter_use_is_lazy():
+    consumed_items = []
+
+    def generate_input_items():
+        for i in itertools.count():
+            consumed_items.append(i)
+            yield str(i)
+
+    output_iterator = ListBlueprint(item_blueprint=IntegerBlueprint()).iter_use(generate_input_items())
+    assert consumed_items == []
+
+    assert list(itertools.islice(output_iterator, 3)) == [0, 1, 2]
+    assert consumed_items == [0, 1, 2]
+
+
+@pytest.mark.parametrize(("input_", "output"), (
+    ([], []),
+    (["1", 2, 3.0], [1, 2, 3]),
+    ((i for i in ("1", "2")), [1, 2]),
+    (range(5), [0, 1, 2, 3, 4]),
+    ({1, 2}, [1, 2]),
+))
+def test_iter_use_valid(input_, output):
+    assert list(ListBlueprint(item_blueprint=IntegerBlueprint()).iter_use(input_)) == output
+
+
+@pytest.mark.parametrize(("parsing_mode", "input_", "exc_class"), (
+    (ParsingMode.MODE_LOOSE, None, InputDataNotConvertibleExc),
+    (ParsingMode.MODE_LOOSE, 123, InputDataNotConvertibleExc),
+    (ParsingMode.MODE_RATIONAL, "123", InputDataTypeInBlocklistExc),
+    (ParsingMode.MODE_RATIONAL, {"1": 2}, InputDataTypeInBlocklistExc),
+    (ParsingMode.MODE_STRICT, (i for i in range(2)), InputDataTypeNotInAllowlistExc),
+))
+def test_iter_use_invalid_input_data(parsing_mode, input_, exc_class):
+    # The exception is raised immediately, not when iterating
+    with pytest.raises(exc_class):
+        ListBlueprint(item_blueprint=IntegerBlueprint(), parsing_mode=parsing_mode).iter_use(input_)
+
+
+def test_iter_use_loose_mode():
+    assert list(ListBlueprint(item_blueprint=IntegerBlueprint(), parsing_mode=ParsingMode.MODE_LOOSE).iter_use("123")) == [1, 2, 3]
+
+
+def test_iter_use_stop_policy():
+    output_iterator = ListBlueprint(item_blueprint=IntegerBlueprint(tag="item")).iter_use(["1", "x", "3"])
+
+    assert next(output_iterator) == 1
+    with pytest.raises(InputDataNotConvertibleExc) as e_info:
+        next(output_iterator)
+    assert e_info.value.get_originator_tag() == "item"
+    with pytest.raises(StopIteration):
+        next(output_iterator)
+
+
+def test_iter_use_skip_policy():
+    output_iterator = ListBlueprint(item_blueprint=IntegerBlueprint()).iter_use(["1", "x", None, "4"], error_policy=StreamErrorPolicy.POLICY_SKIP)
+
+    assert list(output_iterator) == [1, 4]
+
+
+def test_iter_use_collect_policy():
+    output_items = []
+    output_iterator = ListBlueprint(item_blueprint=IntegerBlueprint(tag="item"), tag="list").iter_use(["1", "x", None, "4"], error_policy=StreamErrorPolicy.POLICY_COLLECT)
+
+    with pytest.raises(InvalidItemsInInputDataExc) as e_info:
+        for output_item in output_iterator:
+            output_items.append(output_item)
+
+    assert output_items == [1, 4]
+    assert isinstance(e_info.value, InvalidInputDataExc)
+    assert e_info.value.get_originator_tag() == "list"
+    assert tuple(path for path, _ in e_info.value.get_item_exceptions()) == ("[1]", "[2]")
+    assert tuple(e.__class__ for _, e in e_info.value.get_item_exceptions()) == (InputDataNotConvertibleExc, InputDataTypeNotInAllowlistExc)
+    assert all(e.get_originator_tag() == "item" for _, e in e_info.value.get_item_exceptions())
+
+
+def test_iter_use_collect_policy_valid():
+    output_iterator = ListBlueprint(item_blueprint=IntegerBlueprint()).iter_use(["1", "2"], error_policy=StreamErrorPolicy.POLICY_COLLECT)
+
+    assert list(output_iterator) == [1, 2]
+
+
+def test_iter_use_collect_nested_item_exceptions():
+    item_blueprint = DictionaryBlueprint(key_blueprint=StringBlueprint(), value_blueprint=ListBlueprint(IntegerBlueprint(), collect_item_exceptions=True), collect_item_exceptions=True)
+    blueprint = ListBlueprint(item_blueprint=item_blueprint, collect_item_exceptions=True)
+    input_data = [{"a": [1, "x"]}, {"b": [2]}, {"c": [None, 3, "y"]}]
+
+    with pytest.raises(InvalidItemsInInputDataExc) as streaming_e_info:
+        list(blueprint.iter_use(input_data, error_policy=StreamErrorPolicy.POLICY_COLLECT))
+    with pytest.raises(InvalidItemsInInputDataExc) as use_e_info:
+        blueprint.use(input_data)
+
+    streaming_paths = tuple(path for path, _ in streaming_e_info.value.get_item_exceptions())
+    assert streaming_paths == ("[0].a[1]", "[2].c[0]", "[2].c[2]")
+    assert streaming_paths == tuple(path for path, _ in use_e_info.value.get_item_exceptions())
+    assert not any(isinstance(e, InvalidItemsInInputDataExc) for _, e in streaming_e_info.value.get_item_exceptions())
+
+
+@pytest.mark.parametrize("error_policy", (StreamErrorPolicy.POLICY_STOP, StreamErrorPolicy.POLICY_SKIP, StreamErrorPolicy.POLICY_COLLECT))
+def test_iter_use_max_length(error_policy):
+    blueprint = ListBlueprint(item_blueprint=IntegerBlueprint())
+
+    assert list(blueprint.iter_use(range(3), error_policy=error_policy, max_length=3)) == [0, 1, 2]
+
+    output_items = []
+    with pytest.raises(InvalidInputDataExc):
+        for output_item in blueprint.iter_use(itertools.count(), error_policy=error_policy, max_length=3):
+            output_items.append(output_item)
+    assert output_items == [0, 1, 2]
+
+
+def test_iter_use_failing_iterable():
+    output_iterator = ListBlueprint(item_blueprint=IntegerBlueprint()).iter_use(FailingIterable(), error_policy=StreamErrorPolicy.POLICY_SKIP)
+
+    assert next(output_iterator) == 1
+    with pytest.raises(InputDataNotConvertibleExc):
+        next(output_iterator)
+
+
+def test_iter_use_invalid_config():
+    with pytest.raises(InvalidBlueprintConfigError):
+        ListBlueprint(item_blueprint=IntegerBlueprint(), validators=(SequenceMaximumLengthValidator(5),)).iter_use([])
+
+    with pytest.raises(InvalidBlueprintConfigError):
+        ListBlueprint(item_blueprint=IntegerBlueprint()).iter_use([], max_length=-1)
+
+    with pytest.raises(ThisShouldNeverHappenError):
+        ListBlueprint(item_blueprint=IntegerBlueprint()).iter_use([], error_policy=None)  # noqa
+
+    with pytest.raises(ThisShouldNeverHappenError):
+        ListBlueprint(item_blueprint=IntegerBlueprint(), parsing_mode=ParsingMode._MODE_INVALID).iter_use([])  # noqa
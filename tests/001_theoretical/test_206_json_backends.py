@@ -0,0 +1,193 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import os
+import os.path
+import sys
+if "DATALIDATOR_TESTS_AUTOPATH" in os.environ:
+    __TESTS_DIR = os.path.dirname(os.path.realpath(__file__))
+    __MODULE_DIR = os.path.realpath(os.path.join(__TESTS_DIR, "../.."))
+    if __TESTS_DIR not in sys.path:
+        sys.path.insert(0, __TESTS_DIR)
+    if __MODULE_DIR not in sys.path:
+        sys.path.insert(0, __MODULE_DIR)
+
+import importlib.util
+import json
+import pickle
+import types
+import theoretical_testutils
+import pytest
+from datalidator.blueprints.impl.GenericBlueprint import GenericBlueprint
+from datalidator.blueprints.impl.IntegerBlueprint import IntegerBlueprint
+from datalidator.blueprints.impl.ListBlueprint import ListBlueprint
+from datalidator.blueprints.specialimpl.JSONBlueprint import JSONBlueprint
+from datalidator.blueprints.specialimpl.JSONLinesBlueprint import JSONLinesBlueprint
+from datalidator.blueprints.compiler.BlueprintCompiler import BlueprintCompiler
+from datalidator.blueprints.jsonbackends.JSONBackendIface import JSONBackendIface
+from datalidator.blueprints.jsonbackends.DefaultJSONBackend import DefaultJSONBackend
+from datalidator.blueprints.jsonbackends.impl.StandardLibraryJSONBackend import StandardLibraryJSONBackend
+from datalidator.blueprints.jsonbackends.impl.OrjsonJSONBackend import OrjsonJSONBackend
+from datalidator.blueprints.jsonbackends.impl.UjsonJSONBackend import UjsonJSONBackend
+from datalidator.blueprints.jsonbackends.impl.SimdjsonJSONBackend import SimdjsonJSONBackend
+from datalidator.blueprints.exc.InvalidInputDataExc import InvalidInputDataExc
+from datalidator.blueprints.exc.InvalidItemsInInputDataExc import InvalidItemsInInputDataExc
+from datalidator.blueprints.exc.InputDataTypeNotInAllowlistExc import InputDataTypeNotInAllowlistExc
+
+
+class ConstantJSONBackend(JSONBackendIface):
+    __slots__ = ()
+
+    def deserialize(self, json_document):
+        return [1, 2, 3]
+
+
+class FailingJSONBackend(JSONBackendIface):
+    __slots__ = ()
+
+    def deserialize(self, json_document):
+        raise KeyError(json_document)
+
+
+@pytest.fixture
+def default_json_backend_restorer():
+    original_default_json_backend = DefaultJSONBackend.get_default_json_backend()
+    yield
+    DefaultJSONBackend.set_default_json_backend(original_default_json_backend)
+
+
+__JSON_BACKENDS = (StandardLibraryJSONBackend(), OrjsonJSONBackend(), UjsonJSONBackend(), SimdjsonJSONBackend())
+
+
+@pytest.mark.parametrize("json_backend", __JSON_BACKENDS)
+@pytest.mark.parametrize(("input_", "output"), (
+    ('[1, "2", 3.9]', [1, 2, 3]),
+    (b'[1, "2", 3.9]', [1, 2, 3]),
+    (bytearray(b'[1, "2", 3.9]'), [1, 2, 3]),
+    (memoryview(b'[1, "2", 3.9]'), [1, 2, 3]),
+    (' \r\n[1, "2", 3.9]\t ', [1, 2, 3]),
+    (b' \r\n[1, "2", 3.9]\t ', [1, 2, 3]),
+    ('[]', []),
+    ('[1, 2', InvalidInputDataExc),
+    ('[1, 2]]', InvalidInputDataExc),
+    (b'[1, "\xff"]', InvalidInputDataExc),
+    ('', InvalidInputDataExc),
+    (b'', InvalidInputDataExc),
+    ('invalid', InvalidInputDataExc),
+    ('[1, null]', InputDataTypeNotInAllowlistExc),
+    (None, InputDataTypeNotInAllowlistExc),
+))
+def test_json_backend(json_backend, input_, output):
+    theoretical_testutils.perform_test(JSONBlueprint(ListBlueprint(IntegerBlueprint()), json_backend=json_backend), input_, output)
+
+
+@pytest.mark.parametrize("json_backend", __JSON_BACKENDS)
+def test_json_backend_json_lines(json_backend):
+    blueprint = JSONLinesBlueprint(IntegerBlueprint(), json_backend=json_backend)
+
+    assert blueprint.get_json_backend() is json_backend
+    assert blueprint.use(b'1\n"2"\n\n3.9\n') == [1, 2, 3]
+    with pytest.raises(InvalidItemsInInputDataExc):
+        blueprint.use(b'1\n[2\n3\n')
+
+
+@pytest.mark.parametrize(("json_backend_class", "module_name"), (
+    (OrjsonJSONBackend, "orjson"),
+    (UjsonJSONBackend, "ujson"),
+    (SimdjsonJSONBackend, "simdjson"),
+))
+def test_json_backend_fallback(json_backend_class, module_name):
+    assert json_backend_class().is_using_fallback() == (importlib.util.find_spec(module_name) is None)
+
+
+@pytest.mark.parametrize(("json_backend_class", "module_name"), (
+    (OrjsonJSONBackend, "orjson"),
+    (UjsonJSONBackend, "ujson"),
+    (SimdjsonJSONBackend, "simdjson"),
+))
+def test_json_backend_pickling(monkeypatch, json_backend_class, module_name):
+    # A stub of the module is used, so that the backend does not fall back to the json module even if the module is not installed
+    stub_module = types.ModuleType(module_name)
+    stub_module.loads = json.loads
+    monkeypatch.setitem(sys.modules, module_name, stub_module)
+
+    blueprint = JSONBlueprint(ListBlueprint(IntegerBlueprint()), json_backend=json_backend_class())
+    assert not blueprint.get_json_backend().is_using_fallback()
+
+    unpickled_blueprint = pickle.loads(pickle.dumps(blueprint))
+    assert unpickled_blueprint.get_json_backend().__class__ is json_backend_class
+    assert not unpickled_blueprint.get_json_backend().is_using_fallback()
+    assert unpickled_blueprint.use(bytearray(b'[1, "2", 3.9]')) == [1, 2, 3]
+
+
+def test_json_backend_orjson_behaviour():
+    json_backend = OrjsonJSONBackend()
+    if json_backend.is_using_fallback():
+        pytest.skip("orjson is not installed")
+
+    blueprint = JSONBlueprint(GenericBlueprint(), json_backend=json_backend)
+
+    with pytest.raises(InvalidInputDataExc):
+        blueprint.use("NaN")
+    with pytest.raises(InvalidInputDataExc):
+        blueprint.use('"\\ud800"')
+    with pytest.raises(InvalidInputDataExc):
+        blueprint.use(' 1 '.encode("utf-16"))
+    assert blueprint.use('{"a": 1, "a": 2}') == {"a": 2}
+
+
+def test_json_backend_standard_library_behaviour():
+    blueprint = JSONBlueprint(GenericBlueprint(), json_backend=StandardLibraryJSONBackend())
+
+    assert repr(blueprint.use("NaN")) == "nan"
+    assert blueprint.use("123456789012345678901234567890") == 123456789012345678901234567890
+    assert blueprint.use(' 1 '.encode("utf-16")) == 1
+    assert blueprint.use('{"a": 1, "a": 2}') == {"a": 2}
+
+
+def test_json_backend_custom():
+    assert JSONBlueprint(GenericBlueprint(), json_backend=ConstantJSONBackend()).use("anything") == [1, 2, 3]
+
+    with pytest.raises(InvalidInputDataExc):
+        JSONBlueprint(GenericBlueprint(), json_backend=FailingJSONBackend()).use("[]")
+
+
+def test_json_backend_default(default_json_backend_restorer):
+    blueprint = JSONBlueprint(GenericBlueprint())
+
+    assert blueprint.get_json_backend() is None
+    assert isinstance(DefaultJSONBackend.get_default_json_backend(), StandardLibraryJSONBackend)
+    assert blueprint.use("[]") == []
+
+    # The default JSON backend is looked up each time the blueprint is used or compiled
+    DefaultJSONBackend.set_default_json_backend(ConstantJSONBackend())
+    assert DefaultJSONBackend.get_default_json_backend().__class__ is ConstantJSONBackend
+    assert blueprint.use("[]") == [1, 2, 3]
+    assert JSONLinesBlueprint(GenericBlueprint()).use("[]\n") == [[1, 2, 3]]
+
+    compiled_blueprint = BlueprintCompiler().compile(blueprint)
+    DefaultJSONBackend.set_default_json_backend(StandardLibraryJSONBackend())
+    assert compiled_blueprint.use("[]") == [1, 2, 3]
+    assert blueprint.use("[]") == []
+
+    # A JSON backend passed to the blueprint's initializer takes precedence
+    assert JSONBlueprint(GenericBlueprint(), json_backend=ConstantJSONBackend()).use("[]") == [1, 2, 3]
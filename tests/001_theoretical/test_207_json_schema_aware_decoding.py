@@ -0,0 +1,182 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import os
+import os.path
+import sys
+if "DATALIDATOR_TESTS_AUTOPATH" in os.environ:
+    __TESTS_DIR = os.path.dirname(os.path.realpath(__file__))
+    __MODULE_DIR = os.path.realpath(os.path.join(__TESTS_DIR, "../.."))
+    if __TESTS_DIR not in sys.path:
+        sys.path.insert(0, __TESTS_DIR)
+    if __MODULE_DIR not in sys.path:
+        sys.path.insert(0, __MODULE_DIR)
+
+import theoretical_testutils
+import pytest
+from datalidator.blueprints.impl.GenericBlueprint import GenericBlueprint
+from datalidator.blueprints.impl.IntegerBlueprint import IntegerBlueprint
+from datalidator.blueprints.impl.StringBlueprint import StringBlueprint
+from datalidator.blueprints.impl.ListBlueprint import ListBlueprint
+from datalidator.blueprints.impl.PredefinedDictionaryBlueprint import PredefinedDictionaryBlueprint
+from datalidator.blueprints.impl.ObjectBlueprint import ObjectBlueprint
+from datalidator.blueprints.specialimpl.JSONBlueprint import JSONBlueprint
+from datalidator.blueprints.compiler.BlueprintCompiler import BlueprintCompiler
+from datalidator.blueprints.extras.ObjectModel import ObjectModel
+from datalidator.blueprints.extras.OptionalItem import OptionalItem
+from datalidator.blueprints.jsonbackends.JSONBackendIface import JSONBackendIface
+from datalidator.blueprints.jsonbackends.impl.StandardLibraryJSONBackend import StandardLibraryJSONBackend
+from datalidator.blueprints.exc.InvalidInputDataExc import InvalidInputDataExc
+from datalidator.blueprints.exc.InputDataTypeNotInAllowlistExc import InputDataTypeNotInAllowlistExc
+from datalidator.blueprints.exc.InputDataNotConvertibleExc import InputDataNotConvertibleExc
+from datalidator.blueprints.exc.err.InvalidBlueprintConfigError import InvalidBlueprintConfigError
+
+
+class RecordingJSONBackend(JSONBackendIface):
+    __slots__ = "deserialized_documents",
+
+    def __init__(self):
+        self.deserialized_documents = []
+
+    def deserialize(self, json_document):
+        self.deserialized_documents.append(json_document)
+        return {"a": 1, "z": 2}
+
+
+class GenericTestObjectModel(ObjectModel):
+    a = IntegerBlueprint()
+    b = OptionalItem(ListBlueprint(StringBlueprint()), [])
+
+
+def generate_predefined_dictionary_blueprint(ignore_unspecified_keys_in_input=True):
+    return PredefinedDictionaryBlueprint({
+        "a": IntegerBlueprint(),
+        "b": OptionalItem(ListBlueprint(StringBlueprint()), []),
+        1: OptionalItem(IntegerBlueprint(), 0)  # Non-string keys can never be present in JSON objects
+    }, ignore_unspecified_keys_in_input=ignore_unspecified_keys_in_input)
+
+
+@pytest.mark.parametrize(("input_", "output"), (
+    ('{"a": 1}', {"a": 1, "b": [], 1: 0}),
+    ('{"a": "2", "b": [1, "x"]}', {"a": 2, "b": ["1", "x"], 1: 0}),
+    ('{"z": {"a": [1, {"b": null}]}, "a": 3, "y": NaN}', {"a": 3, "b": [], 1: 0}),
+    ('{"a": 1, "a": 2, "z": 0, "z": 1}', {"a": 2, "b": [], 1: 0}),
+    ('{"z": "\\ud800", "a": 1}', {"a": 1, "b": [], 1: 0}),
+    (' \r\n{ "a" : 1 , "z" : true }\t ', {"a": 1, "b": [], 1: 0}),
+    (b'{"a": 1, "z": "\xc5\x99"}', {"a": 1, "b": [], 1: 0}),
+    (bytearray(b'{"a": 1, "z": []}'), {"a": 1, "b": [], 1: 0}),
+    (memoryview(b'{"a": 1, "z": []}'), {"a": 1, "b": [], 1: 0}),
+    ('{"a": 1, "z": []}'.encode("utf-16"), {"a": 1, "b": [], 1: 0}),
+    ('{"z": 1}', InvalidInputDataExc),
+    ('{"a": null}', InputDataTypeNotInAllowlistExc),
+    ('{}', InvalidInputDataExc),
+    ('[]', InvalidInputDataExc),
+    ('1', InputDataNotConvertibleExc),
+    ('{"a": 1, "z": [1, 2}', InvalidInputDataExc),
+    ('{"a": 1, "z": [1, 2]', InvalidInputDataExc),
+    ('{"a": 1, "z": }', InvalidInputDataExc),
+    ('{"a": 1,}', InvalidInputDataExc),
+    ('{"a": 1} {}', InvalidInputDataExc),
+    ('{"a": 1}]', InvalidInputDataExc),
+    ('{a: 1}', InvalidInputDataExc),
+    ('{"a" 1}', InvalidInputDataExc),
+    ('{"z": "\x01", "a": 1}', InvalidInputDataExc),
+    (b'{"a": 1, "z": "\xff"}', InvalidInputDataExc),
+    ('', InvalidInputDataExc),
+    ('   ', InvalidInputDataExc),
+    (None, InputDataTypeNotInAllowlistExc),
+))
+def test_schema_aware_decoding(input_, output):
+    # The results must be the same as when the option is disabled, or when the input data are too small for it to apply
+    for schema_aware_decoding, min_input_size in ((True, 0), (True, 65536), (False, 0)):
+        blueprint = JSONBlueprint(generate_predefined_dictionary_blueprint(), schema_aware_decoding=schema_aware_decoding, schema_aware_decoding_min_input_size=min_input_size)
+
+        theoretical_testutils.perform_test(blueprint, input_, output)
+        theoretical_testutils.perform_test(BlueprintCompiler().compile(blueprint), input_, output)
+
+
+@pytest.mark.parametrize(("input_", "output"), (
+    ('{"a": 1, "z": {"a": 2}}', {"a": 1}),
+    ('{"z": 1, "b": ["x", 2]}', {"b": ["x", 2]}),
+    ('[{"a": 1, "z": 2}]', [{"a": 1, "z": 2}]),
+    ('"a"', "a"),
+))
+def test_schema_aware_decoding_standard_library_json_backend(input_, output):
+    assert StandardLibraryJSONBackend().deserialize_object_items(input_, frozenset(("a", "b"))) == output
+
+
+def test_schema_aware_decoding_object_blueprint():
+    blueprint = JSONBlueprint(ObjectBlueprint(GenericTestObjectModel), schema_aware_decoding=True, schema_aware_decoding_min_input_size=0)
+
+    assert blueprint.is_schema_aware_decoding_enabled() is True
+    assert ObjectBlueprint(GenericTestObjectModel).get_dict_specification().keys() == {"a", "b"}
+
+    output = blueprint.use('{"a": "5", "z": [1, 2, 3], "b": [1]}')
+    assert isinstance(output, GenericTestObjectModel)
+    assert output.a == 5 and output.b == ["1"]
+
+    with pytest.raises(InvalidInputDataExc):
+        JSONBlueprint(ObjectBlueprint(GenericTestObjectModel, ignore_input_keys_which_are_not_in_model=False), schema_aware_decoding=True).use('{"a": 1, "z": 2}')
+
+
+def test_schema_aware_decoding_discarded_items():
+    # The input data attached to the exceptions raised by the wrapped blueprint do not contain the discarded items
+    try:
+        JSONBlueprint(generate_predefined_dictionary_blueprint(), schema_aware_decoding=True, schema_aware_decoding_min_input_size=0).use('{"z": 1, "y": 2}')
+    except InvalidInputDataExc as e:
+        assert e.get_input_data() == {}
+    else:
+        pytest.fail("No exception was raised!")
+
+
+def test_schema_aware_decoding_min_input_size():
+    assert JSONBlueprint(GenericBlueprint()).get_schema_aware_decoding_min_input_size() == 65536
+    assert JSONBlueprint(GenericBlueprint(), schema_aware_decoding_min_input_size=0).get_schema_aware_decoding_min_input_size() == 0
+
+    with pytest.raises(InvalidBlueprintConfigError):
+        JSONBlueprint(GenericBlueprint(), schema_aware_decoding=True, schema_aware_decoding_min_input_size=-1)
+
+    # Documents smaller than the minimum input size are decoded as a whole
+    blueprint = JSONBlueprint(generate_predefined_dictionary_blueprint(), schema_aware_decoding=True, schema_aware_decoding_min_input_size=17)
+    for input_, discarded_input_data in (('{"z": 1, "y": 22}', {}), ('{"z": 1, "y": 2}', {"z": 1, "y": 2})):
+        with pytest.raises(InvalidInputDataExc) as e_info:
+            blueprint.use(input_)
+        assert e_info.value.get_input_data() == discarded_input_data
+
+    large_document = '{{"a": 1, "z": [{}]}}'.format(", ".join(["1"] * 40000))
+    assert len(large_document) >= 65536
+    assert JSONBlueprint(generate_predefined_dictionary_blueprint(), schema_aware_decoding=True).use(large_document) == {"a": 1, "b": [], 1: 0}
+
+
+def test_schema_aware_decoding_not_applicable():
+    assert JSONBlueprint(GenericBlueprint()).is_schema_aware_decoding_enabled() is False
+    assert JSONBlueprint(GenericBlueprint(), schema_aware_decoding=True).use('{"a": 1, "z": 2}') == {"a": 1, "z": 2}
+
+    # If unspecified keys in input are not ignored, their presence must be detected by the wrapped blueprint
+    with pytest.raises(InvalidInputDataExc):
+        JSONBlueprint(generate_predefined_dictionary_blueprint(ignore_unspecified_keys_in_input=False), schema_aware_decoding=True).use('{"a": 1, "z": 2}')
+
+    # Only the standard library's JSON backend supports schema-aware decoding
+    json_backend = RecordingJSONBackend()
+    blueprint = JSONBlueprint(PredefinedDictionaryBlueprint({"a": GenericBlueprint()}), json_backend=json_backend, schema_aware_decoding=True)
+    assert blueprint.use('{"a": 1}') == {"a": 1}
+    assert json_backend.deserialized_documents == ['{"a": 1}']
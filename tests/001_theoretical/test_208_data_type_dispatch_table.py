@@ -0,0 +1,142 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import os
+import os.path
+import sys
+if "DATALIDATOR_TESTS_AUTOPATH" in os.environ:
+    __TESTS_DIR = os.path.dirname(os.path.realpath(__file__))
+    __MODULE_DIR = os.path.realpath(os.path.join(__TESTS_DIR, "../.."))
+    if __TESTS_DIR not in sys.path:
+        sys.path.insert(0, __TESTS_DIR)
+    if __MODULE_DIR not in sys.path:
+        sys.path.insert(0, __MODULE_DIR)
+
+import theoretical_testutils
+import pytest
+import datetime
+from datalidator.blueprints.DataTypeDispatchTable import DataTypeDispatchTable
+from datalidator.blueprints.DataConversionHelper import DataConversionHelper
+from datalidator.blueprints.exc.utils.InvalidInputDataExcFactory import InvalidInputDataExcFactory
+from datalidator.blueprints.impl.BooleanBlueprint import BooleanBlueprint
+from datalidator.blueprints.impl.DatetimeBlueprint import DatetimeBlueprint
+from datalidator.blueprints.impl.StringBlueprint import StringBlueprint
+from datalidator.blueprints.impl.TimeIntervalBlueprint import TimeIntervalBlueprint
+from datalidator.blueprints.ParsingMode import ParsingMode
+from datalidator.blueprints.exc.InputDataTypeNotInAllowlistExc import InputDataTypeNotInAllowlistExc
+
+
+class IntSubclass(int):
+    pass
+
+
+class ClassOverridingObject:
+    @property
+    def __class__(self):
+        return int
+
+
+__DISPATCH_TABLE_TEST_SUITE = (
+    (1, "int"),
+    (True, "bool"),  # bool is a subclass of int, but it is listed first
+    (10, "int"),
+    (IntSubclass(10), "int"),
+    (10.5, "float-or-str"),
+    ("abc", "float-or-str"),
+    (datetime.datetime(2022, 1, 1), "date"),
+    (datetime.date(2022, 1, 1), "date"),
+    (ClassOverridingObject(), "int"),
+    (None, None),
+    (b"abc", None),
+    ([1], None),
+)
+
+
+def generate_dispatch_table():
+    return DataTypeDispatchTable((
+        ((bool,), lambda _: "bool"),
+        ((int,), lambda _: "int"),
+        ((float, str), lambda _: "float-or-str"),
+        ((datetime.date,), lambda _: "date")
+    ))
+
+
+@pytest.mark.parametrize(("input_", "output"), __DISPATCH_TABLE_TEST_SUITE)
+def test_data_type_dispatch_table(input_, output):
+    dispatch_table = generate_dispatch_table()
+
+    # The converter function must be the same when it is resolved for the first time and when it is looked up in the cache
+    for _ in range(2):
+        converter_function = dispatch_table.get_converter_function(input_)
+
+        if output is None:
+            assert converter_function is None
+        else:
+            assert converter_function(input_) == output
+
+
+def test_data_type_dispatch_table_getters():
+    dispatch_table = generate_dispatch_table()
+
+    assert dispatch_table.get_data_type_allowlist() == (bool, int, float, str, datetime.date)
+    assert len(dispatch_table.get_type_converter_pairs()) == 4
+    assert isinstance(dispatch_table.get_type_converter_pairs(), tuple)
+
+
+def test_data_type_dispatch_table_many_data_types():
+    dispatch_table = DataTypeDispatchTable((((int,), lambda _: "int"),))
+
+    for i in range(1000):
+        assert dispatch_table.get_converter_function(type("IntSubclass{}".format(i), (int,), {})(i))(None) == "int"
+        assert dispatch_table.get_converter_function(type("Class{}".format(i), (), {})()) is None
+
+
+def test_data_conversion_helper_data_type_dispatch_table():
+    data_conversion_helper = DataConversionHelper(InvalidInputDataExcFactory(""))
+    dispatch_table = DataTypeDispatchTable((
+        ((int,), lambda input_data: input_data * 2),
+        ((str,), lambda input_data: input_data + "!")
+    ))
+
+    assert data_conversion_helper.convert_input_using_data_type_dispatch_table(dispatch_table, 4) == 8
+    assert data_conversion_helper.convert_input_using_data_type_dispatch_table(dispatch_table, "hi") == "hi!"
+    with pytest.raises(InputDataTypeNotInAllowlistExc):
+        data_conversion_helper.convert_input_using_data_type_dispatch_table(dispatch_table, 4.5)
+
+
+@pytest.mark.parametrize(("blueprint", "input_", "output"), (
+    (BooleanBlueprint(), "yes", True),
+    (BooleanBlueprint(), IntSubclass(0), False),
+    (BooleanBlueprint(), None, InputDataTypeNotInAllowlistExc),
+    (StringBlueprint(), datetime.date(2022, 1, 1), "2022-01-01"),
+    (StringBlueprint(), bytearray(b"abc"), "abc"),
+    (StringBlueprint(), [], InputDataTypeNotInAllowlistExc),
+    (DatetimeBlueprint(parsing_mode=ParsingMode.MODE_LOOSE), datetime.date(2022, 1, 1), datetime.datetime(2022, 1, 1)),
+    (DatetimeBlueprint(parsing_mode=ParsingMode.MODE_STRICT), 0, InputDataTypeNotInAllowlistExc),
+    (TimeIntervalBlueprint(), "1min", 60.0),
+    (TimeIntervalBlueprint(), IntSubclass(5), 5.0),
+    (TimeIntervalBlueprint(), b"5", InputDataTypeNotInAllowlistExc),
+))
+def test_data_type_dispatch_table_blueprints(blueprint, input_, output):
+    # The blueprints are used repeatedly, so that the cached converter functions are used as well
+    for _ in range(2):
+        theoretical_testutils.perform_test(blueprint, input_, output)
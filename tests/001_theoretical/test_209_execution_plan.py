@@ -0,0 +1,153 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import os
+import os.path
+import sys
+if "DATALIDATOR_TESTS_AUTOPATH" in os.environ:
+    __TESTS_DIR = os.path.dirname(os.path.realpath(__file__))
+    __MODULE_DIR = os.path.realpath(os.path.join(__TESTS_DIR, "../.."))
+    if __TESTS_DIR not in sys.path:
+        sys.path.insert(0, __TESTS_DIR)
+    if __MODULE_DIR not in sys.path:
+        sys.path.insert(0, __MODULE_DIR)
+
+import theoretical_testutils
+import pytest
+from datalidator.blueprints.ParsingMode import ParsingMode
+from datalidator.blueprints.impl.StringBlueprint import StringBlueprint
+from datalidator.blueprints.impl.IntegerBlueprint import IntegerBlueprint
+from datalidator.blueprints.impl.BooleanBlueprint import BooleanBlueprint
+from datalidator.blueprints.compiler.BlueprintCompiler import BlueprintCompiler
+from datalidator.blueprints.exc.UnexpectedOutputDataTypeExc import UnexpectedOutputDataTypeExc
+from datalidator.filters.FilterIface import FilterIface
+from datalidator.filters.DefaultFilterImplBase import DefaultFilterImplBase
+from datalidator.filters.impl.StringStripFilter import StringStripFilter
+from datalidator.filters.impl.StringUppercaseFilter import StringUppercaseFilter
+from datalidator.filters.impl.NumberAbsoluteValueFilter import NumberAbsoluteValueFilter
+from datalidator.filters.impl.NumberMaximumClampFilter import NumberMaximumClampFilter
+from datalidator.filters.impl.ReplacementMapFilter import ReplacementMapFilter
+from datalidator.exc.err.ThisShouldNeverHappenError import ThisShouldNeverHappenError
+
+
+class StrSubclass(str):
+    pass
+
+
+class StrSubclassReturningFilter(FilterIface[str]):
+    __slots__ = ()
+
+    def get_tag(self) -> str:
+        return ""
+
+    def filter(self, data):
+        return StrSubclass(data)
+
+
+class StrSubclassReturningStripFilter(StringStripFilter):
+    __slots__ = ()
+
+    def get_exactly_preserved_data_types(self):
+        return frozenset()
+
+    def _filter(self, data):
+        return StrSubclass(StringStripFilter._filter(self, data))
+
+
+class CountingStringBlueprint(StringBlueprint):
+    __slots__ = "allowed_output_data_types_call_count",
+
+    def __init__(self, *args, **kwargs):
+        StringBlueprint.__init__(self, *args, **kwargs)
+        self.allowed_output_data_types_call_count = 0
+
+    def _get_allowed_output_data_types(self):
+        self.allowed_output_data_types_call_count += 1
+        return StringBlueprint._get_allowed_output_data_types(self)
+
+
+__EXECUTION_PLAN_TEST_SUITE = (
+    (StringBlueprint(filters=(StringStripFilter(), StringUppercaseFilter())), (
+        ("  abc ", "ABC"),
+        (123, "123"),
+    )),
+    (StringBlueprint(filters=(StringStripFilter(), StrSubclassReturningFilter())), (
+        ("  abc ", UnexpectedOutputDataTypeExc),
+    )),
+    (StringBlueprint(filters=(StrSubclassReturningStripFilter(),)), (
+        ("  abc ", UnexpectedOutputDataTypeExc),
+    )),
+    (StringBlueprint(filters=(ReplacementMapFilter(((" abc ", 1),)),)), (
+        (" abc ", UnexpectedOutputDataTypeExc),
+        ("abc", "abc"),
+    )),
+    (IntegerBlueprint(filters=(NumberAbsoluteValueFilter(),)), (
+        (-5, 5),
+        ("-5", 5),
+    )),
+    (IntegerBlueprint(filters=(NumberMaximumClampFilter(5.5),)), (
+        (1, 1),
+        (6, UnexpectedOutputDataTypeExc),
+    )),
+    (BooleanBlueprint(filters=(NumberAbsoluteValueFilter(),)), (
+        (True, UnexpectedOutputDataTypeExc),  # abs(True) == 1; 'bool' is not preserved by the filter
+    )),
+)
+
+
+@pytest.mark.parametrize(("blueprint", "input_", "output"), theoretical_testutils.test_function_parameter_generator(__EXECUTION_PLAN_TEST_SUITE))
+def test_execution_plan(blueprint, input_, output):
+    # The blueprints are used repeatedly, so that the already built execution plans are used as well
+    for _ in range(2):
+        theoretical_testutils.perform_test(blueprint, input_, output)
+        theoretical_testutils.perform_test(BlueprintCompiler().compile(blueprint), input_, output)
+
+
+def test_execution_plan_built_once():
+    blueprint = CountingStringBlueprint(filters=(StringStripFilter(),))
+    assert blueprint.allowed_output_data_types_call_count == 0
+
+    for _ in range(5):
+        assert blueprint.use(" abc ") == "abc"
+    BlueprintCompiler().compile(blueprint)
+
+    assert blueprint.allowed_output_data_types_call_count == 1
+
+
+@pytest.mark.parametrize("parsing_mode", (None, "rational", [], 2))
+def test_execution_plan_invalid_parsing_mode(parsing_mode):
+    # Invalid parsing modes are reported when the blueprint is used, not when it is initialized
+    blueprint = IntegerBlueprint(parsing_mode=parsing_mode)
+
+    with pytest.raises(ThisShouldNeverHappenError):
+        blueprint.use(1)
+
+
+@pytest.mark.parametrize(("filter_", "exactly_preserved_data_types"), (
+    (StringStripFilter(), {str}),
+    (NumberAbsoluteValueFilter(), {int, float}),
+    (NumberMaximumClampFilter(5), set()),
+    (ReplacementMapFilter(((1, 2),)), set()),
+))
+def test_filter_exactly_preserved_data_types(filter_, exactly_preserved_data_types):
+    assert isinstance(filter_, DefaultFilterImplBase)
+    assert filter_.get_exactly_preserved_data_types() == exactly_preserved_data_types
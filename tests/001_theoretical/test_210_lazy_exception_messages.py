@@ -0,0 +1,181 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import os
+import os.path
+import sys
+if "DATALIDATOR_TESTS_AUTOPATH" in os.environ:
+    __TESTS_DIR = os.path.dirname(os.path.realpath(__file__))
+    __MODULE_DIR = os.path.realpath(os.path.join(__TESTS_DIR, "../.."))
+    if __TESTS_DIR not in sys.path:
+        sys.path.insert(0, __TESTS_DIR)
+    if __MODULE_DIR not in sys.path:
+        sys.path.insert(0, __MODULE_DIR)
+
+import pytest
+from datalidator.blueprints.impl.IntegerBlueprint import IntegerBlueprint
+from datalidator.blueprints.impl.BooleanBlueprint import BooleanBlueprint
+from datalidator.blueprints.impl.ListBlueprint import ListBlueprint
+from datalidator.blueprints.specialimpl.ExceptionHandlingBlueprint import ExceptionHandlingBlueprint
+from datalidator.blueprints.exc.InvalidInputDataExc import InvalidInputDataExc
+from datalidator.blueprints.exc.InvalidItemsInInputDataExc import InvalidItemsInInputDataExc
+from datalidator.blueprints.exc.InputDataTypeNotInAllowlistExc import InputDataTypeNotInAllowlistExc
+from datalidator.blueprints.exc.InputDataTypeInBlocklistExc import InputDataTypeInBlocklistExc
+from datalidator.blueprints.exc.InputDataNotConvertibleExc import InputDataNotConvertibleExc
+from datalidator.blueprints.exc.InputDataValueNotAllowedForDataTypeExc import InputDataValueNotAllowedForDataTypeExc
+from datalidator.blueprints.exc.InputDataNotUnsubclassableExc import InputDataNotUnsubclassableExc
+from datalidator.blueprints.exc.utils.InvalidInputDataExcFactory import InvalidInputDataExcFactory
+from datalidator.exc.err.ThisShouldNeverHappenError import ThisShouldNeverHappenError
+
+
+class ReprCountingObject:
+    __slots__ = "repr_call_count",
+
+    def __init__(self):
+        self.repr_call_count = 0
+
+    def __repr__(self):
+        self.repr_call_count += 1
+        return "ReprCountingObject()"
+
+
+class ReprRaisingObject:
+    __slots__ = ()
+
+    def __repr__(self):
+        raise ValueError("repr")
+
+
+@pytest.fixture
+def input_data_repr_length_limit_restorer():
+    original_input_data_repr_length_limit = InvalidInputDataExcFactory.get_input_data_repr_length_limit()
+    yield
+    InvalidInputDataExcFactory.set_input_data_repr_length_limit(original_input_data_repr_length_limit)
+
+
+__EXC_FACTORY = InvalidInputDataExcFactory("tag")
+
+
+@pytest.mark.parametrize(("exc", "exc_class", "error_message"), (
+    (__EXC_FACTORY.generate_invalid_input_data_exc("Message", 1), InvalidInputDataExc, "Message"),
+    (__EXC_FACTORY.generate_invalid_input_data_exc(lambda: "Lazy message", 1), InvalidInputDataExc, "Lazy message"),
+    (__EXC_FACTORY.generate_input_data_type_not_in_allowlist_exc((int,), "abc"), InputDataTypeNotInAllowlistExc, "The input data must be of type 'int', not 'str'!"),
+    (__EXC_FACTORY.generate_input_data_type_not_in_allowlist_exc([int, float], "abc"), InputDataTypeNotInAllowlistExc, "The input data must be of one of these types: ('int', 'float'), not 'str'!"),
+    (__EXC_FACTORY.generate_input_data_type_in_blocklist_exc((dict,), {}), InputDataTypeInBlocklistExc, "The input data must not be of type 'dict'!"),
+    (__EXC_FACTORY.generate_input_data_type_in_blocklist_exc((dict, set), {}), InputDataTypeInBlocklistExc, "The input data (of type 'dict') must not be of these types: ('dict', 'set')!"),
+    (__EXC_FACTORY.generate_input_data_not_convertible_exc((int,), "abc"), InputDataNotConvertibleExc, "The input data (of type 'str') are not convertible to 'int': 'abc'"),
+    (__EXC_FACTORY.generate_input_data_not_convertible_exc((int, float), "abc"), InputDataNotConvertibleExc, "The input data (of type 'str': 'abc') are not convertible to at least one of these types: ('int', 'float')"),
+    (__EXC_FACTORY.generate_input_data_value_not_allowed_for_data_type_exc(int, (0, 1), 2), InputDataValueNotAllowedForDataTypeExc, "If the input data are of type 'int', their value must be one of these: (0, 1), not 2!"),
+    (__EXC_FACTORY.generate_input_data_not_unsubclassable_exc(int, True), InputDataNotUnsubclassableExc, "The input data of type 'bool' (a subclass of 'int') could not be unsubclassed to 'int'!"),
+    (__EXC_FACTORY.generate_invalid_items_in_input_data_exc((("[0]", __EXC_FACTORY.generate_invalid_input_data_exc(lambda: "Item message", 1)),), [1]), InvalidItemsInInputDataExc, "The input data contain 1 invalid item(s): [0] -> Item message"),
+))
+def test_lazy_exception_message(exc, exc_class, error_message):
+    assert exc.__class__ is exc_class
+    assert exc.get_originator_tag() == "tag"
+    assert str(exc) == error_message
+    assert exc.args == (error_message,)
+    assert repr(exc) == "{}({})".format(exc_class.__name__, repr(error_message))
+
+
+def test_lazy_exception_message_not_rendered():
+    input_data = ReprCountingObject()
+    exc = __EXC_FACTORY.generate_input_data_not_convertible_exc((int,), input_data)
+
+    assert input_data.repr_call_count == 0
+    assert str(exc) == "The input data (of type 'ReprCountingObject') are not convertible to 'int': ReprCountingObject()"
+    assert str(exc) == "The input data (of type 'ReprCountingObject') are not convertible to 'int': ReprCountingObject()"
+    assert input_data.repr_call_count == 1  # The message is rendered only once
+
+    # Exceptions swallowed by ExceptionHandlingBlueprint are never rendered
+    input_data = ReprCountingObject()
+    assert ExceptionHandlingBlueprint(IntegerBlueprint(), None).use(input_data) is None
+    assert input_data.repr_call_count == 0
+
+
+def test_lazy_exception_message_args():
+    exc = __EXC_FACTORY.generate_invalid_input_data_exc(lambda: "Lazy message", 1)
+
+    exc.args = ("Other message",)
+    assert str(exc) == "Other message"
+    assert exc.args == ("Other message",)
+
+
+def test_lazy_exception_message_unrepresentable_input_data():
+    exc = __EXC_FACTORY.generate_input_data_not_convertible_exc((int,), ReprRaisingObject())
+
+    assert str(exc) == "The input data (of type 'ReprRaisingObject') are not convertible to 'int': <unrepresentable object>"
+
+
+def test_exception_structured_fields():
+    with pytest.raises(InputDataTypeNotInAllowlistExc) as exc_info:
+        BooleanBlueprint().use([])
+    assert exc_info.value.get_data_type_allowlist() == (bool, int, float, str)
+    assert exc_info.value.get_input_data() == []
+
+    with pytest.raises(InputDataTypeInBlocklistExc) as exc_info:
+        ListBlueprint(IntegerBlueprint()).use("abc")
+    assert str in exc_info.value.get_data_type_blocklist()
+
+    with pytest.raises(InputDataValueNotAllowedForDataTypeExc) as exc_info:
+        BooleanBlueprint().use(2)
+    assert exc_info.value.get_data_type() is int
+    assert exc_info.value.get_allowed_values() == (1, 0)
+
+    exc = __EXC_FACTORY.generate_input_data_not_convertible_exc([int, float], "abc")
+    assert exc.get_converted_to() == (int, float)
+
+    exc = __EXC_FACTORY.generate_input_data_not_unsubclassable_exc(int, True)
+    assert exc.get_unsubclassed_to() is int
+
+    # The structured fields are optional when the exceptions are instantiated directly
+    assert InputDataNotConvertibleExc("Message", "", 1).get_converted_to() == ()
+
+
+@pytest.mark.parametrize(("length_limit", "input_data", "truncated_repr"), (
+    (None, "a" * 20, repr("a" * 20)),
+    (10, "a" * 20, "'aaaaaaaaa..."),
+    (10, b"a" * 20, "b'aaaaaaaa..."),
+    (10, bytearray(b"a" * 20), "bytearray(..."),
+    (10, list(range(20)), "[0, 1, 2, ..."),
+    (10, "abc", "'abc'"),
+    (0, "abc", "..."),
+    (10, ReprRaisingObject(), "<unrepresentable object>"),
+))
+def test_input_data_repr_length_limit(input_data_repr_length_limit_restorer, length_limit, input_data, truncated_repr):
+    assert InvalidInputDataExcFactory.get_truncated_repr(input_data, length_limit) == truncated_repr
+
+    InvalidInputDataExcFactory.set_input_data_repr_length_limit(length_limit)
+    assert InvalidInputDataExcFactory.get_input_data_repr_length_limit() == length_limit
+
+    assert str(__EXC_FACTORY.generate_input_data_not_convertible_exc((int,), input_data)).endswith(": " + truncated_repr)
+
+
+def test_input_data_repr_length_limit_blueprint(input_data_repr_length_limit_restorer):
+    InvalidInputDataExcFactory.set_input_data_repr_length_limit(5)
+
+    with pytest.raises(InputDataNotConvertibleExc) as exc_info:
+        IntegerBlueprint().use("x" * 10_000_000)
+    assert str(exc_info.value) == "The input data (of type 'str') are not convertible to 'int': 'xxxx..."
+
+    with pytest.raises(ThisShouldNeverHappenError):
+        InvalidInputDataExcFactory.set_input_data_repr_length_limit(-1)
+    assert InvalidInputDataExcFactory.get_input_data_repr_length_limit() == 5
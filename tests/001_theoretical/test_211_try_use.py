@@ -0,0 +1,237 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import os
+import os.path
+import sys
+if "DATALIDATOR_TESTS_AUTOPATH" in os.environ:
+    __TESTS_DIR = os.path.dirname(os.path.realpath(__file__))
+    __MODULE_DIR = os.path.realpath(os.path.join(__TESTS_DIR, "../.."))
+    if __TESTS_DIR not in sys.path:
+        sys.path.insert(0, __TESTS_DIR)
+    if __MODULE_DIR not in sys.path:
+        sys.path.insert(0, __MODULE_DIR)
+
+
+import pytest
+from datalidator.blueprints.BlueprintIface import BlueprintIface
+from datalidator.blueprints.ParsingMode import ParsingMode
+from datalidator.blueprints.impl.IntegerBlueprint import IntegerBlueprint
+from datalidator.blueprints.impl.FloatBlueprint import FloatBlueprint
+from datalidator.blueprints.impl.BooleanBlueprint import BooleanBlueprint
+from datalidator.blueprints.impl.StringBlueprint import StringBlueprint
+from datalidator.blueprints.specialimpl.ExceptionHandlingBlueprint import ExceptionHandlingBlueprint
+from datalidator.blueprints.specialimpl.NoneHandlingBlueprint import NoneHandlingBlueprint
+from datalidator.blueprints.specialimpl.DefaultValueNoneHandlingBlueprint import DefaultValueNoneHandlingBlueprint
+from datalidator.blueprints.specialimpl.BlueprintChainingBlueprint import BlueprintChainingBlueprint
+from datalidator.blueprints.extras.UseResult import UseResult
+from datalidator.blueprints.exc.InputDataNotConvertibleExc import InputDataNotConvertibleExc
+from datalidator.blueprints.exc.InputDataTypeNotInAllowlistExc import InputDataTypeNotInAllowlistExc
+from datalidator.blueprints.exc.InputDataValueNotAllowedForDataTypeExc import InputDataValueNotAllowedForDataTypeExc
+from datalidator.blueprints.exc.InvalidInputDataExc import InvalidInputDataExc
+from datalidator.blueprints.exc.UnexpectedExceptionRaisedInBlueprintExc import UnexpectedExceptionRaisedInBlueprintExc
+from datalidator.blueprints.exc.err.InvalidBlueprintConfigError import InvalidBlueprintConfigError
+from datalidator.exc.DatalidatorExc import DatalidatorExc
+from datalidator.validators.ValidatorIface import ValidatorIface
+from datalidator.validators.impl.IntegerIsPositiveValidator import IntegerIsPositiveValidator
+from datalidator.validators.impl.StringIsOnlySingleWordValidator import StringIsOnlySingleWordValidator
+from datalidator.validators.exc.DataValidationFailedExc import DataValidationFailedExc
+
+
+class RaisingBlueprint(BlueprintIface[int]):
+    __slots__ = "raised_exception",
+
+    def __init__(self, raised_exception: Exception):
+        self.raised_exception = raised_exception
+
+    def use(self, input_data):
+        raise self.raised_exception
+
+    def get_tag(self):
+        return "raising"
+
+
+class OddNumberRejectingValidator(ValidatorIface[int]):
+    # Not a subclass of DefaultValidatorImplBase, so its exception must be caught by blueprints' try_use()
+    __slots__ = ()
+
+    def validate(self, data):
+        if data % 2 == 1:
+            raise DataValidationFailedExc("The number is odd!", "odd")
+
+    def get_tag(self):
+        return "odd"
+
+
+class ErrorRaisingIntegerBlueprint(IntegerBlueprint):
+    __slots__ = ()
+
+    def _parse_in_rational_mode(self, input_data):
+        raise InvalidBlueprintConfigError("Error", self._tag)
+
+
+class ValueErrorRaisingIntegerBlueprint(IntegerBlueprint):
+    __slots__ = ()
+
+    def _parse_in_rational_mode(self, input_data):
+        raise ValueError("Unexpected")
+
+
+@pytest.mark.parametrize(("blueprint", "input_", "output"), (
+    (IntegerBlueprint(), "123", 123),
+    (IntegerBlueprint(validators=[IntegerIsPositiveValidator()]), 1, 1),
+    (NoneHandlingBlueprint(IntegerBlueprint()), None, None),
+    (NoneHandlingBlueprint(IntegerBlueprint()), "5", 5),
+    (DefaultValueNoneHandlingBlueprint(IntegerBlueprint(), 10), None, 10),
+    (DefaultValueNoneHandlingBlueprint(IntegerBlueprint(), 10), "5", 5),
+    (ExceptionHandlingBlueprint(IntegerBlueprint(), -1), "5", 5),
+    (ExceptionHandlingBlueprint(IntegerBlueprint(), -1), "hello", -1),
+    (ExceptionHandlingBlueprint(NoneHandlingBlueprint(IntegerBlueprint()), -1), None, None),
+    (ExceptionHandlingBlueprint(NoneHandlingBlueprint(IntegerBlueprint()), -1), "hello", -1),
+    (ExceptionHandlingBlueprint(ValueErrorRaisingIntegerBlueprint(), -1), "5", -1),
+    (ExceptionHandlingBlueprint(RaisingBlueprint(InputDataNotConvertibleExc("Message", "raising", "str")), -1), "5", -1),
+    (BlueprintChainingBlueprint([IntegerBlueprint(), IntegerBlueprint()]), "5", 5),
+))
+def test_try_use_successful(blueprint, input_, output):
+    result = blueprint.try_use(input_)
+
+    assert isinstance(result, UseResult)
+    assert result.is_successful()
+    assert result.get_exception() is None
+    assert result.get_output() == output
+    assert result.get_output_or_default(object()) == output
+    assert blueprint.use(input_) == output
+
+
+@pytest.mark.parametrize(("blueprint", "input_", "exc_class", "tag"), (
+    (IntegerBlueprint(tag="int"), "hello", InputDataNotConvertibleExc, "int"),
+    (IntegerBlueprint(validators=[IntegerIsPositiveValidator(tag="positive")]), 0, DataValidationFailedExc, "positive"),
+    (NoneHandlingBlueprint(IntegerBlueprint(tag="int")), "hello", InputDataNotConvertibleExc, "int"),
+    (DefaultValueNoneHandlingBlueprint(IntegerBlueprint(tag="int"), 10), "hello", InputDataNotConvertibleExc, "int"),
+    (NoneHandlingBlueprint(NoneHandlingBlueprint(IntegerBlueprint(tag="int"))), "hello", InputDataNotConvertibleExc, "int"),
+    (BlueprintChainingBlueprint([IntegerBlueprint(tag="first"), IntegerBlueprint(tag="second")]), "hello", InputDataNotConvertibleExc, "first"),
+    (BlueprintChainingBlueprint([NoneHandlingBlueprint(IntegerBlueprint(tag="first")), IntegerBlueprint(tag="second")]), None, InputDataTypeNotInAllowlistExc, "second"),
+    (ValueErrorRaisingIntegerBlueprint(tag="value_error"), "5", UnexpectedExceptionRaisedInBlueprintExc, "value_error"),
+    (NoneHandlingBlueprint(ValueErrorRaisingIntegerBlueprint(tag="value_error"), tag="none"), "5", UnexpectedExceptionRaisedInBlueprintExc, "value_error"),
+    (NoneHandlingBlueprint(RaisingBlueprint(ValueError("Unexpected")), tag="none"), "5", UnexpectedExceptionRaisedInBlueprintExc, "none"),
+    (IntegerBlueprint(validators=[OddNumberRejectingValidator()]), "5", DataValidationFailedExc, "odd"),
+))
+def test_try_use_unsuccessful(blueprint, input_, exc_class, tag):
+    result = blueprint.try_use(input_)
+
+    assert isinstance(result, UseResult)
+    assert not result.is_successful()
+    assert isinstance(result.get_exception(), exc_class)
+    assert result.get_exception().get_originator_tag() == tag
+    assert result.get_output_or_default(-1) == -1
+
+    with pytest.raises(exc_class) as exc_info:
+        result.get_output()
+    assert exc_info.value is result.get_exception()
+
+    with pytest.raises(exc_class) as exc_info:
+        blueprint.use(input_)
+    assert exc_info.value.get_originator_tag() == tag
+
+
+@pytest.mark.parametrize("blueprint", (
+    ErrorRaisingIntegerBlueprint(),
+    NoneHandlingBlueprint(ErrorRaisingIntegerBlueprint()),
+    ExceptionHandlingBlueprint(ErrorRaisingIntegerBlueprint(), -1),
+    ExceptionHandlingBlueprint(RaisingBlueprint(InvalidBlueprintConfigError("Error", "raising")), -1),
+))
+def test_try_use_error(blueprint):
+    with pytest.raises(InvalidBlueprintConfigError):
+        blueprint.try_use("5")
+
+
+@pytest.mark.parametrize(("blueprint", "input_", "exc_class"), (
+    (IntegerBlueprint(), "hello", InputDataNotConvertibleExc),
+    (IntegerBlueprint(), None, InputDataTypeNotInAllowlistExc),
+    (IntegerBlueprint(parsing_mode=ParsingMode.MODE_LOOSE), "hello", InputDataNotConvertibleExc),
+    (IntegerBlueprint(parsing_mode=ParsingMode.MODE_STRICT), "5", InputDataTypeNotInAllowlistExc),
+    (IntegerBlueprint(validators=[IntegerIsPositiveValidator()]), "-5", DataValidationFailedExc),
+    (FloatBlueprint(), "hello", InputDataNotConvertibleExc),
+    (FloatBlueprint(), "inf", InvalidInputDataExc),
+    (FloatBlueprint(parsing_mode=ParsingMode.MODE_STRICT), 5, InputDataTypeNotInAllowlistExc),
+    (BooleanBlueprint(), "maybe", InputDataValueNotAllowedForDataTypeExc),
+    (BooleanBlueprint(), 2, InputDataValueNotAllowedForDataTypeExc),
+    (BooleanBlueprint(), None, InputDataTypeNotInAllowlistExc),
+    (BooleanBlueprint(parsing_mode=ParsingMode.MODE_STRICT), 1, InputDataTypeNotInAllowlistExc),
+    (StringBlueprint(), b"\xff", InputDataNotConvertibleExc),
+    (StringBlueprint(), [], InputDataTypeNotInAllowlistExc),
+    (StringBlueprint(parsing_mode=ParsingMode.MODE_STRICT), 5, InputDataTypeNotInAllowlistExc),
+    (StringBlueprint(validators=[StringIsOnlySingleWordValidator()]), "hello world", DataValidationFailedExc),
+    (ExceptionHandlingBlueprint(NoneHandlingBlueprint(IntegerBlueprint()), -1), "hello", None),
+))
+def test_try_use_does_not_raise_exceptions(blueprint, input_, exc_class):
+    # An exception which has been raised has a traceback; the ones produced on the non-raising path do not
+    result = blueprint.try_use(input_)
+
+    if exc_class is None:
+        assert result.is_successful()
+    else:
+        assert isinstance(result.get_exception(), exc_class)
+        assert result.get_exception().__traceback__ is None
+
+
+@pytest.mark.parametrize("blueprint_class", (IntegerBlueprint, FloatBlueprint, BooleanBlueprint, StringBlueprint))
+@pytest.mark.parametrize("parsing_mode", (ParsingMode.MODE_LOOSE, ParsingMode.MODE_RATIONAL, ParsingMode.MODE_STRICT))
+@pytest.mark.parametrize("input_", (
+    5, 0, 1, -1, 5.5, 1.0, float("nan"), True, False, "5", " 1.5\n", "1,5", "yes", "Off", "hello", "", b"bytes", None, [], {}, object()
+))
+def test_try_use_equals_use(blueprint_class, parsing_mode, input_):
+    blueprint = blueprint_class(parsing_mode=parsing_mode)
+    result = blueprint.try_use(input_)
+
+    try:
+        output = blueprint.use(input_)
+    except DatalidatorExc as e:
+        assert result.get_exception().__class__ is e.__class__
+        assert str(result.get_exception()) == str(e)
+    else:
+        assert result.is_successful()
+        if blueprint_class is not StringBlueprint:  # object() is converted to a string containing its address
+            assert (result.get_output() == output) or (output != output)  # NaN
+        assert result.get_output().__class__ is output.__class__
+
+
+def test_try_validate():
+    validator = IntegerIsPositiveValidator(tag="positive")
+
+    assert validator.try_validate(1) is None
+
+    exception = validator.try_validate(0)
+    assert isinstance(exception, DataValidationFailedExc)
+    assert exception.get_originator_tag() == "positive"
+    assert exception.__traceback__ is None
+
+    with pytest.raises(DataValidationFailedExc):
+        validator.validate(0)
+
+
+def test_use_result_from_output_none():
+    result = UseResult.from_output(None)
+
+    assert result.is_successful()
+    assert result.get_output() is None
+    assert result.get_output_or_default(1) is None
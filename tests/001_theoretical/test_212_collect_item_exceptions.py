@@ -0,0 +1,195 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import os
+import os.path
+import sys
+if "DATALIDATOR_TESTS_AUTOPATH" in os.environ:
+    __TESTS_DIR = os.path.dirname(os.path.realpath(__file__))
+    __MODULE_DIR = os.path.realpath(os.path.join(__TESTS_DIR, "../.."))
+    if __TESTS_DIR not in sys.path:
+        sys.path.insert(0, __TESTS_DIR)
+    if __MODULE_DIR not in sys.path:
+        sys.path.insert(0, __MODULE_DIR)
+
+
+import pytest
+import theoretical_testutils
+from datalidator.blueprints.impl.IntegerBlueprint import IntegerBlueprint
+from datalidator.blueprints.impl.StringBlueprint import StringBlueprint
+from datalidator.blueprints.impl.ListBlueprint import ListBlueprint
+from datalidator.blueprints.impl.DictionaryBlueprint import DictionaryBlueprint
+from datalidator.blueprints.impl.PredefinedDictionaryBlueprint import PredefinedDictionaryBlueprint
+from datalidator.blueprints.impl.ObjectBlueprint import ObjectBlueprint
+from datalidator.blueprints.extras.ObjectModel import ObjectModel
+from datalidator.blueprints.extras.OptionalItem import OptionalItem
+from datalidator.blueprints.compiler.BlueprintCompiler import BlueprintCompiler
+from datalidator.blueprints.exc.InvalidInputDataExc import InvalidInputDataExc
+from datalidator.blueprints.exc.InvalidItemsInInputDataExc import InvalidItemsInInputDataExc
+from datalidator.blueprints.exc.InputDataNotConvertibleExc import InputDataNotConvertibleExc
+from datalidator.blueprints.exc.InputDataTypeNotInAllowlistExc import InputDataTypeNotInAllowlistExc
+from datalidator.blueprints.exc.InputDataTypeInBlocklistExc import InputDataTypeInBlocklistExc
+from datalidator.validators.impl.IntegerIsPositiveValidator import IntegerIsPositiveValidator
+from datalidator.validators.exc.DataValidationFailedExc import DataValidationFailedExc
+
+
+class AddressObjectModel(ObjectModel):
+    zip = IntegerBlueprint(tag="zip")
+    city = StringBlueprint(tag="city")
+
+
+class PersonObjectModel(ObjectModel):
+    name = StringBlueprint(tag="name")
+    address = ObjectBlueprint(AddressObjectModel, collect_item_exceptions=True, tag="address")
+    nickname = OptionalItem(StringBlueprint(tag="nickname"), None)
+
+
+def generate_nested_blueprint():
+    return PredefinedDictionaryBlueprint({
+        "items": ListBlueprint(ObjectBlueprint(PersonObjectModel, collect_item_exceptions=True, tag="person"), collect_item_exceptions=True, tag="items"),
+        "headers": DictionaryBlueprint(StringBlueprint(tag="header_key"), IntegerBlueprint(tag="header_value"), collect_item_exceptions=True, tag="headers"),
+        "count": IntegerBlueprint(validators=[IntegerIsPositiveValidator(tag="count_validator")], tag="count")
+    }, ignore_unspecified_keys_in_input=False, collect_item_exceptions=True, tag="root")
+
+
+__COLLECT_ITEM_EXCEPTIONS_TEST_SUITE = (
+    (ListBlueprint(IntegerBlueprint(), collect_item_exceptions=True), (
+        ([], []),
+        (["1", 2, 3.0], [1, 2, 3]),
+        ((1, "x", None), InvalidItemsInInputDataExc),
+        (1, InputDataNotConvertibleExc),
+        ("123", InputDataTypeInBlocklistExc),
+    )),
+    (DictionaryBlueprint(StringBlueprint(), IntegerBlueprint(), collect_item_exceptions=True), (
+        ({}, {}),
+        ({"a": "1", 2: 3}, {"a": 1, "2": 3}),
+        ({"a": "x", "b": None}, InvalidItemsInInputDataExc),
+        ({(): 1}, InvalidItemsInInputDataExc),
+        (1, InputDataNotConvertibleExc),
+    )),
+    (PredefinedDictionaryBlueprint({"a": IntegerBlueprint(), "b": OptionalItem(IntegerBlueprint(), 0)}, ignore_unspecified_keys_in_input=False, collect_item_exceptions=True), (
+        ({"a": 1}, {"a": 1, "b": 0}),
+        ({"a": "1", "b": "2"}, {"a": 1, "b": 2}),
+        ((("a", 1),), {"a": 1, "b": 0}),
+        ({}, InvalidItemsInInputDataExc),
+        ({"a": 1, "c": 3}, InvalidItemsInInputDataExc),
+        ((("a", 1), ("c", 3)), InvalidItemsInInputDataExc),
+        ({"a": "x", "b": "y"}, InvalidItemsInInputDataExc),
+        (1, InputDataNotConvertibleExc),
+    )),
+    (generate_nested_blueprint(), (
+        ({"items": [], "headers": {}, "count": 1}, {"items": [], "headers": {}, "count": 1}),
+        ({"items": [], "headers": {}, "count": 0}, InvalidItemsInInputDataExc),
+    )),
+)
+
+
+@pytest.mark.parametrize(("blueprint", "input_", "output"), theoretical_testutils.test_function_parameter_generator(__COLLECT_ITEM_EXCEPTIONS_TEST_SUITE))
+def test_collect_item_exceptions(blueprint, input_, output):
+    theoretical_testutils.perform_test(blueprint, input_, output)
+
+
+@pytest.mark.parametrize(("blueprint", "input_", "output"), theoretical_testutils.test_function_parameter_generator(__COLLECT_ITEM_EXCEPTIONS_TEST_SUITE))
+def test_collect_item_exceptions_compiled(blueprint, input_, output):
+    theoretical_testutils.perform_test(BlueprintCompiler().compile(blueprint), input_, output)
+
+
+@pytest.mark.parametrize(("blueprint", "input_", "item_exceptions"), (
+    (ListBlueprint(IntegerBlueprint(tag="int"), collect_item_exceptions=True, tag="list"), (1, "x", None, 4, "y"), (
+        ("[1]", InputDataNotConvertibleExc, "int"),
+        ("[2]", InputDataTypeNotInAllowlistExc, "int"),
+        ("[4]", InputDataNotConvertibleExc, "int"),
+    )),
+    (DictionaryBlueprint(StringBlueprint(tag="key"), IntegerBlueprint(tag="value"), collect_item_exceptions=True, tag="dict"), {"a": "x", "Content-Type": None, (): 1, 1: 1}, (
+        ("a", InputDataNotConvertibleExc, "value"),
+        ("['Content-Type']", InputDataTypeNotInAllowlistExc, "value"),
+        ("[()]", InputDataTypeNotInAllowlistExc, "key"),
+    )),
+    (PredefinedDictionaryBlueprint({"a": IntegerBlueprint(tag="a"), "b": IntegerBlueprint(tag="b"), 1: IntegerBlueprint(tag="1")}, ignore_unspecified_keys_in_input=False, collect_item_exceptions=True, tag="pd"), {"a": "x", 1: 1, "c": 3, "d": 4}, (
+        ("a", InputDataNotConvertibleExc, "a"),
+        ("b", InvalidInputDataExc, "pd"),
+        ("c", InvalidInputDataExc, "pd"),
+        ("d", InvalidInputDataExc, "pd"),
+    )),
+    (generate_nested_blueprint(), {
+        "items": [
+            {"name": "John", "address": {"zip": 12345, "city": "Prague"}},
+            {"name": [], "address": {"zip": "x"}},
+            {"name": "Jane", "address": None, "nickname": 1.5},
+        ],
+        "headers": {"Content-Length": "abc"},
+        "count": 0,
+        "extra": True
+    }, (
+        ("items[1].name", InputDataTypeNotInAllowlistExc, "name"),
+        ("items[1].address.zip", InputDataNotConvertibleExc, "zip"),
+        ("items[1].address.city", InvalidInputDataExc, "address"),
+        ("items[2].address", InputDataNotConvertibleExc, "address"),
+        ("headers['Content-Length']", InputDataNotConvertibleExc, "header_value"),
+        ("count", DataValidationFailedExc, "count_validator"),
+        ("extra", InvalidInputDataExc, "root"),
+    )),
+))
+def test_collect_item_exceptions_paths(blueprint, input_, item_exceptions):
+    for blueprint_function in (blueprint.use, BlueprintCompiler().compile_to_function(blueprint)):
+        with pytest.raises(InvalidItemsInInputDataExc) as exc_info:
+            blueprint_function(input_)
+
+        assert exc_info.value.get_originator_tag() == blueprint.get_tag()
+        assert len(exc_info.value.get_item_exceptions()) == len(item_exceptions)
+        for (item_path, item_exception), (expected_item_path, expected_exc_class, expected_originator_tag) in zip(exc_info.value.get_item_exceptions(), item_exceptions):
+            assert item_path == expected_item_path
+            assert item_exception.__class__ is expected_exc_class
+            assert item_exception.get_originator_tag() == expected_originator_tag
+
+
+@pytest.mark.parametrize("blueprint", (
+    ListBlueprint(IntegerBlueprint()),
+    DictionaryBlueprint(StringBlueprint(), IntegerBlueprint()),
+    PredefinedDictionaryBlueprint({"a": IntegerBlueprint()}),
+    ObjectBlueprint(AddressObjectModel),
+))
+def test_collect_item_exceptions_disabled_by_default(blueprint):
+    assert not blueprint.are_item_exceptions_collected()
+
+
+def test_collect_item_exceptions_object_blueprint():
+    blueprint = ObjectBlueprint(AddressObjectModel, collect_item_exceptions=True)
+    assert blueprint.are_item_exceptions_collected()
+
+    output = blueprint.use({"zip": "123", "city": "Prague"})
+    assert isinstance(output, AddressObjectModel)
+    assert (output.zip, output.city) == (123, "Prague")
+
+    with pytest.raises(InvalidItemsInInputDataExc) as exc_info:
+        blueprint.use({"zip": "abc"})
+    assert tuple(item_path for item_path, _ in exc_info.value.get_item_exceptions()) == ("zip", "city")
+
+
+def test_collect_item_exceptions_not_collected_by_nested_blueprint():
+    blueprint = ListBlueprint(PredefinedDictionaryBlueprint({"a": IntegerBlueprint(), "b": IntegerBlueprint()}, tag="pd"), collect_item_exceptions=True)
+
+    with pytest.raises(InvalidItemsInInputDataExc) as exc_info:
+        blueprint.use([{"a": "x", "b": "y"}])
+    assert len(exc_info.value.get_item_exceptions()) == 1
+    assert exc_info.value.get_item_exceptions()[0][0] == "[0]"
+    assert isinstance(exc_info.value.get_item_exceptions()[0][1], InputDataNotConvertibleExc)
@@ -0,0 +1,212 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import os
+import os.path
+import sys
+if "DATALIDATOR_TESTS_AUTOPATH" in os.environ:
+    __TESTS_DIR = os.path.dirname(os.path.realpath(__file__))
+    __MODULE_DIR = os.path.realpath(os.path.join(__TESTS_DIR, "../.."))
+    if __TESTS_DIR not in sys.path:
+        sys.path.insert(0, __TESTS_DIR)
+    if __MODULE_DIR not in sys.path:
+        sys.path.insert(0, __MODULE_DIR)
+
+
+import pytest
+import concurrent.futures
+import theoretical_testutils
+from datalidator.blueprints.BlueprintIface import BlueprintIface
+from datalidator.blueprints.impl.IntegerBlueprint import IntegerBlueprint
+from datalidator.blueprints.impl.StringBlueprint import StringBlueprint
+from datalidator.blueprints.impl.ListBlueprint import ListBlueprint
+from datalidator.blueprints.impl.DictionaryBlueprint import DictionaryBlueprint
+from datalidator.blueprints.compiler.BlueprintCompiler import BlueprintCompiler
+from datalidator.blueprints.ParallelItemProcessingHelper import ParallelItemProcessingHelper
+from datalidator.blueprints.exc.InvalidInputDataExc import InvalidInputDataExc
+from datalidator.blueprints.exc.InvalidItemsInInputDataExc import InvalidItemsInInputDataExc
+from datalidator.blueprints.exc.InputDataNotConvertibleExc import InputDataNotConvertibleExc
+from datalidator.blueprints.exc.InputDataTypeNotInAllowlistExc import InputDataTypeNotInAllowlistExc
+from datalidator.blueprints.exc.err.InvalidBlueprintConfigError import InvalidBlueprintConfigError
+from datalidator.filters.impl.ListSortFilter import ListSortFilter
+
+
+__EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+
+
+class UseCountingIntegerBlueprint(BlueprintIface[int]):
+    __slots__ = "use_count", "integer_blueprint"
+
+    def __init__(self):
+        self.use_count = 0
+        self.integer_blueprint = IntegerBlueprint()
+
+    def use(self, input_data):
+        self.use_count += 1  # The blueprint is used by a single worker thread
+        return self.integer_blueprint.use(input_data)
+
+    def get_tag(self):
+        return ""
+
+
+__PARALLEL_ITEM_PROCESSING_TEST_SUITE = (
+    (ListBlueprint(IntegerBlueprint(), executor=__EXECUTOR, executor_chunk_size=3), (
+        ([], []),
+        ([1, 2, 3], [1, 2, 3]),
+        ([str(i) for i in range(20)], list(range(20))),
+        (range(20), list(range(20))),
+        (["1"] * 10 + ["x"], InputDataNotConvertibleExc),
+        ([1, 2, 3, 4, 5, None], InputDataTypeNotInAllowlistExc),
+        (1, InputDataNotConvertibleExc),
+    )),
+    (ListBlueprint(IntegerBlueprint(), filters=[ListSortFilter(None)], executor=__EXECUTOR, executor_chunk_size=2), (
+        ([5, "4", 3.0, 2, 1], [1, 2, 3, 4, 5]),
+    )),
+    (ListBlueprint(IntegerBlueprint(), collect_item_exceptions=True, executor=__EXECUTOR, executor_chunk_size=2), (
+        ([str(i) for i in range(20)], list(range(20))),
+        ([1, 2, 3, "x", 5, None], InvalidItemsInInputDataExc),
+    )),
+    (DictionaryBlueprint(StringBlueprint(), IntegerBlueprint(), executor=__EXECUTOR, executor_chunk_size=2), (
+        ({}, {}),
+        ({"a": 1}, {"a": 1}),
+        ({i: str(i) for i in range(10)}, {str(i): i for i in range(10)}),
+        ({"a": 1, "b": 2, "c": "x"}, InputDataNotConvertibleExc),
+        ({"a": 1, "b": 2, (): 3}, InputDataTypeNotInAllowlistExc),
+    )),
+    (DictionaryBlueprint(ListBlueprint(IntegerBlueprint()), IntegerBlueprint(), executor=__EXECUTOR, executor_chunk_size=1), (
+        ({(1, 2): 1, (3, 4): 2}, InvalidInputDataExc),  # The output of the key blueprint is not hashable
+    )),
+    (DictionaryBlueprint(StringBlueprint(), IntegerBlueprint(), collect_item_exceptions=True, executor=__EXECUTOR, executor_chunk_size=2), (
+        ({i: str(i) for i in range(10)}, {str(i): i for i in range(10)}),
+        ({"a": 1, "b": "x", (): 3}, InvalidItemsInInputDataExc),
+    )),
+)
+
+
+@pytest.mark.parametrize(("blueprint", "input_", "output"), theoretical_testutils.test_function_parameter_generator(__PARALLEL_ITEM_PROCESSING_TEST_SUITE))
+def test_parallel_item_processing(blueprint, input_, output):
+    theoretical_testutils.perform_test(blueprint, input_, output)
+
+
+@pytest.mark.parametrize(("blueprint", "input_", "output"), theoretical_testutils.test_function_parameter_generator(__PARALLEL_ITEM_PROCESSING_TEST_SUITE))
+def test_parallel_item_processing_compiled(blueprint, input_, output):
+    theoretical_testutils.perform_test(BlueprintCompiler().compile(blueprint), input_, output)
+
+
+@pytest.mark.parametrize(("blueprint", "input_"), (
+    (ListBlueprint(IntegerBlueprint(tag="int"), tag="list"), ["1", "x", 3, None] * 10),
+    (ListBlueprint(IntegerBlueprint(tag="int"), collect_item_exceptions=True, tag="list"), ["1", "x", 3, None] * 10),
+    (DictionaryBlueprint(StringBlueprint(tag="key"), IntegerBlueprint(tag="value"), tag="dict"), {"a": 1, "b": "x", (): 3, "c": None, (1,): "y"}),
+    (DictionaryBlueprint(StringBlueprint(tag="key"), IntegerBlueprint(tag="value"), tag="dict"), {"a": 1, (): "x", "b": "y"}),
+    (DictionaryBlueprint(StringBlueprint(tag="key"), IntegerBlueprint(tag="value"), tag="dict"), {"a": 1, "b": "x", (): 3}),
+    (DictionaryBlueprint(ListBlueprint(IntegerBlueprint(tag="key")), IntegerBlueprint(tag="value"), tag="dict"), {(1,): 1, (2, 3): "x", (4,): 4}),
+    (DictionaryBlueprint(StringBlueprint(tag="key"), IntegerBlueprint(tag="value"), collect_item_exceptions=True, tag="dict"), {"a": 1, "b": "x", (): 3, "c": None, (1,): "y"}),
+))
+@pytest.mark.parametrize("executor_chunk_size", (1, 2, 3, 100))
+def test_parallel_item_processing_raises_same_exceptions_as_sequential(blueprint, input_, executor_chunk_size):
+    parallel_blueprint = blueprint.__class__(
+        *((blueprint.get_item_blueprint(),) if isinstance(blueprint, ListBlueprint) else (blueprint.get_key_blueprint(), blueprint.get_value_blueprint())),
+        collect_item_exceptions=blueprint.are_item_exceptions_collected(),
+        executor=__EXECUTOR,
+        executor_chunk_size=executor_chunk_size,
+        tag=blueprint.get_tag()
+    )
+
+    with pytest.raises(InvalidInputDataExc) as sequential_exc_info:
+        blueprint.use(input_)
+
+    with pytest.raises(InvalidInputDataExc) as parallel_exc_info:
+        parallel_blueprint.use(input_)
+
+    assert parallel_exc_info.value.__class__ is sequential_exc_info.value.__class__
+    assert parallel_exc_info.value.get_originator_tag() == sequential_exc_info.value.get_originator_tag()
+    assert str(parallel_exc_info.value) == str(sequential_exc_info.value)
+
+
+def test_parallel_item_processing_cancels_remaining_chunks():
+    item_blueprint = UseCountingIntegerBlueprint()
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    blueprint = ListBlueprint(item_blueprint, executor=executor, executor_chunk_size=1)
+
+    with pytest.raises(InputDataNotConvertibleExc):
+        blueprint.use(["x"] + (["1"] * 1000))
+
+    executor.shutdown(wait=True)
+    assert item_blueprint.use_count < 1001
+
+
+@pytest.mark.parametrize("input_", (
+    {("x" if i == 0 else str(i)): i for i in range(1001)},  # The first key is invalid
+    {str(i): ("x" if i == 0 else i) for i in range(1001)},  # The first value is invalid
+))
+def test_parallel_item_processing_cancels_remaining_chunks_dictionary(input_):
+    key_blueprint = UseCountingIntegerBlueprint()
+    value_blueprint = UseCountingIntegerBlueprint()
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    blueprint = DictionaryBlueprint(key_blueprint, value_blueprint, executor=executor, executor_chunk_size=1)
+
+    with pytest.raises(InputDataNotConvertibleExc):
+        blueprint.use(input_)
+
+    executor.shutdown(wait=True)
+    assert key_blueprint.use_count < 1001
+    assert value_blueprint.use_count < 1001
+
+
+@pytest.mark.parametrize("blueprint_class, args", (
+    (ListBlueprint, (IntegerBlueprint(),)),
+    (DictionaryBlueprint, (StringBlueprint(), IntegerBlueprint())),
+))
+def test_parallel_item_processing_config(blueprint_class, args):
+    blueprint = blueprint_class(*args)
+    assert blueprint.get_executor() is None
+    assert blueprint.get_executor_chunk_size() == blueprint_class._DEFAULT_EXECUTOR_CHUNK_SIZE
+
+    blueprint = blueprint_class(*args, executor=__EXECUTOR, executor_chunk_size=5)
+    assert blueprint.get_executor() is __EXECUTOR
+    assert blueprint.get_executor_chunk_size() == 5
+
+    for executor_chunk_size in (0, -1):
+        with pytest.raises(InvalidBlueprintConfigError):
+            blueprint_class(*args, executor=__EXECUTOR, executor_chunk_size=executor_chunk_size)
+
+
+def test_parallel_item_processing_helper():
+    helper = ParallelItemProcessingHelper(__EXECUTOR, 3)
+
+    assert helper.get_executor() is __EXECUTOR
+    assert helper.get_chunk_size() == 3
+    assert not helper.should_process_items_in_parallel(3)
+    assert helper.should_process_items_in_parallel(4)
+
+    assert helper.use_blueprint_on_items(IntegerBlueprint(), ["1", 2, 3.0, "4", 5]) == [1, 2, 3, 4, 5]
+
+    results = helper.try_use_blueprint_on_items(IntegerBlueprint(), ["1", "x", 3.0, None, 5])
+    assert [result.is_successful() for result in results] == [True, False, True, False, True]
+    assert [result.get_output_or_default(None) for result in results] == [1, None, 3, None, 5]
+    assert isinstance(results[1].get_exception(), InputDataNotConvertibleExc)
+    assert isinstance(results[3].get_exception(), InputDataTypeNotInAllowlistExc)
+
+    output_iterator = helper.use_blueprints_on_item_tuples((StringBlueprint(), IntegerBlueprint()), [(1, "1"), (2, "2"), (3, "3"), (4, "x"), (5, "5")])
+    assert [next(output_iterator) for _ in range(7)] == ["1", 1, "2", 2, "3", 3, "4"]
+    with pytest.raises(InputDataNotConvertibleExc):
+        next(output_iterator)
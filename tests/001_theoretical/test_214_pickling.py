@@ -0,0 +1,225 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import os
+import os.path
+import sys
+if "DATALIDATOR_TESTS_AUTOPATH" in os.environ:
+    __TESTS_DIR = os.path.dirname(os.path.realpath(__file__))
+    __MODULE_DIR = os.path.realpath(os.path.join(__TESTS_DIR, "../.."))
+    if __TESTS_DIR not in sys.path:
+        sys.path.insert(0, __TESTS_DIR)
+    if __MODULE_DIR not in sys.path:
+        sys.path.insert(0, __MODULE_DIR)
+
+import pytest
+import pickle
+import datetime
+import zoneinfo
+import ipaddress
+import concurrent.futures
+import theoretical_testutils
+from datalidator.blueprints.ParsingMode import ParsingMode
+from datalidator.blueprints.impl.BooleanBlueprint import BooleanBlueprint
+from datalidator.blueprints.impl.DatetimeBlueprint import DatetimeBlueprint
+from datalidator.blueprints.impl.DictionaryBlueprint import DictionaryBlueprint
+from datalidator.blueprints.impl.IntegerBlueprint import IntegerBlueprint
+from datalidator.blueprints.impl.IPAddressBlueprint import IPAddressBlueprint
+from datalidator.blueprints.impl.ListBlueprint import ListBlueprint
+from datalidator.blueprints.impl.ObjectBlueprint import ObjectBlueprint
+from datalidator.blueprints.impl.PredefinedDictionaryBlueprint import PredefinedDictionaryBlueprint
+from datalidator.blueprints.impl.StringBlueprint import StringBlueprint
+from datalidator.blueprints.impl.TimeIntervalBlueprint import TimeIntervalBlueprint
+from datalidator.blueprints.specialimpl.BlueprintChainingBlueprint import BlueprintChainingBlueprint
+from datalidator.blueprints.specialimpl.DefaultValueNoneHandlingBlueprint import DefaultValueNoneHandlingBlueprint
+from datalidator.blueprints.specialimpl.ExceptionHandlingBlueprint import ExceptionHandlingBlueprint
+from datalidator.blueprints.specialimpl.JSONBlueprint import JSONBlueprint
+from datalidator.blueprints.extras.ObjectModel import ObjectModel
+from datalidator.blueprints.extras.OptionalItem import OptionalItem
+from datalidator.blueprints.exc.InvalidInputDataExc import InvalidInputDataExc
+from datalidator.blueprints.exc.InputDataNotConvertibleExc import InputDataNotConvertibleExc
+from datalidator.blueprints.exc.InputDataTypeNotInAllowlistExc import InputDataTypeNotInAllowlistExc
+from datalidator.blueprints.exc.InputDataValueNotAllowedForDataTypeExc import InputDataValueNotAllowedForDataTypeExc
+from datalidator.blueprints.exc.InvalidItemsInInputDataExc import InvalidItemsInInputDataExc
+from datalidator.blueprints.exc.err.InvalidBlueprintConfigError import InvalidBlueprintConfigError
+from datalidator.filters.impl.DatetimeAddTimezoneFilter import DatetimeAddTimezoneFilter
+from datalidator.filters.impl.ListDeduplicateItemsFilter import ListDeduplicateItemsFilter
+from datalidator.filters.impl.StringRegexReplaceFilter import StringRegexReplaceFilter
+from datalidator.filters.impl.StringStripFilter import StringStripFilter
+from datalidator.validators.impl.AllowlistValidator import AllowlistValidator
+from datalidator.validators.impl.IntegerIsPositiveValidator import IntegerIsPositiveValidator
+from datalidator.validators.impl.IPAddressIsInNetworkValidator import IPAddressIsInNetworkValidator
+from datalidator.validators.impl.StringMatchesRegexValidator import StringMatchesRegexValidator
+from datalidator.validators.exc.DataValidationFailedExc import DataValidationFailedExc
+
+
+class PicklingTestObjectModel(ObjectModel):
+    username = StringBlueprint(
+        filters=(StringStripFilter(),),
+        validators=(StringMatchesRegexValidator(r'^[A-Za-z0-9]{3,15}\Z'),),
+        parsing_mode=ParsingMode.MODE_STRICT
+    )
+    age = OptionalItem(IntegerBlueprint(validators=(IntegerIsPositiveValidator(),)), None)
+
+
+def pickle_and_unpickle(object_):
+    return pickle.loads(pickle.dumps(object_))
+
+
+__PICKLED_BLUEPRINT_TEST_SUITE = (
+    (BooleanBlueprint(), (
+        ("true", True),
+        ("no", False),
+        ("hello", InputDataValueNotAllowedForDataTypeExc),
+    )),
+    (BooleanBlueprint(parsing_mode=ParsingMode.MODE_STRICT), (
+        (True, True),
+        ("true", InputDataTypeNotInAllowlistExc),
+    )),
+    (StringBlueprint(filters=(StringRegexReplaceFilter(r'\s+', " "),), validators=(AllowlistValidator(("a b", "c d")),)), (
+        ("a \n\t b", "a b"),
+        ("c  d", "c d"),
+        ("e f", DataValidationFailedExc),
+    )),
+    (DatetimeBlueprint(filters=(DatetimeAddTimezoneFilter(zoneinfo.ZoneInfo("Europe/Prague")),)), (
+        ("2022-01-01T12:00:00", datetime.datetime(2022, 1, 1, 12, 0, 0, tzinfo=zoneinfo.ZoneInfo("Europe/Prague"))),
+        ("hello", InputDataNotConvertibleExc),
+    )),
+    (TimeIntervalBlueprint(), (
+        ("5", 5.0),
+        ("1min 30s", 90.0),
+        ("hello", InvalidInputDataExc),
+    )),
+    (IPAddressBlueprint(validators=(IPAddressIsInNetworkValidator(ipaddress.ip_network("10.0.0.0/8")),)), (
+        ("10.1.2.3", ipaddress.ip_address("10.1.2.3")),
+        ("192.168.0.1", DataValidationFailedExc),
+    )),
+    (ListBlueprint(IntegerBlueprint(), filters=(ListDeduplicateItemsFilter(),)), (
+        ([1, "2", 2, 3.0], [1, 2, 3]),
+        ([1, "x"], InputDataNotConvertibleExc),
+    )),
+    (ListBlueprint(IntegerBlueprint(), collect_item_exceptions=True), (
+        ([1, "x", None], InvalidItemsInInputDataExc),
+    )),
+    (DictionaryBlueprint(StringBlueprint(), IntegerBlueprint()), (
+        ({"a": "1"}, {"a": 1}),
+        ({"a": "x"}, InputDataNotConvertibleExc),
+    )),
+    (PredefinedDictionaryBlueprint({"a": IntegerBlueprint(), "b": OptionalItem(StringBlueprint(), "default")}), (
+        ({"a": 1}, {"a": 1, "b": "default"}),
+        ({"b": "x"}, InvalidInputDataExc),
+    )),
+    (ObjectBlueprint(PicklingTestObjectModel), (
+        ({"username": " abc ", "age": "25"}, PicklingTestObjectModel(username="abc", age=25)),
+        ({"username": "abc"}, PicklingTestObjectModel(username="abc", age=None)),
+        ({"username": "a"}, DataValidationFailedExc),
+    )),
+    (BlueprintChainingBlueprint((StringBlueprint(), IntegerBlueprint())), (
+        (" 123 ", 123),
+        ("x", InputDataNotConvertibleExc),
+    )),
+    (DefaultValueNoneHandlingBlueprint(IntegerBlueprint(), 10), (
+        (None, 10),
+        ("5", 5),
+    )),
+    (ExceptionHandlingBlueprint(IntegerBlueprint(), -1), (
+        ("5", 5),
+        ("x", -1),
+    )),
+    (JSONBlueprint(ListBlueprint(BooleanBlueprint())), (
+        ('[true, "no"]', [True, False]),
+        ('[', InvalidInputDataExc),
+    )),
+)
+
+
+@pytest.mark.parametrize(("blueprint", "input_", "output"), theoretical_testutils.test_function_parameter_generator(__PICKLED_BLUEPRINT_TEST_SUITE))
+def test_pickled_blueprint(blueprint, input_, output):
+    theoretical_testutils.perform_test(pickle_and_unpickle(blueprint), input_, output)
+
+
+def test_pickled_blueprint_preserves_config():
+    blueprint = pickle_and_unpickle(StringBlueprint(parsing_mode=ParsingMode.MODE_STRICT, tag="test_tag"))
+
+    assert isinstance(blueprint, StringBlueprint)
+    assert blueprint.get_parsing_mode() == ParsingMode.MODE_STRICT
+    assert blueprint.get_tag() == "test_tag"
+
+
+@pytest.mark.parametrize("blueprint", (
+    ListBlueprint(IntegerBlueprint(), executor=concurrent.futures.ThreadPoolExecutor(max_workers=1), executor_chunk_size=5),
+    DictionaryBlueprint(StringBlueprint(), IntegerBlueprint(), executor=concurrent.futures.ThreadPoolExecutor(max_workers=1), executor_chunk_size=5),
+))
+def test_pickled_blueprint_has_no_executor(blueprint):
+    unpickled_blueprint = pickle_and_unpickle(blueprint)
+
+    assert unpickled_blueprint.get_executor() is None
+    assert unpickled_blueprint.get_executor_chunk_size() == 5
+
+
+def test_pickled_blueprint_in_process_pool():
+    with concurrent.futures.ProcessPoolExecutor(max_workers=2) as executor:
+        blueprint = ListBlueprint(StringBlueprint(filters=(StringStripFilter(),)), executor=executor, executor_chunk_size=3)
+        assert blueprint.use([" a ", 1, "b "] * 5) == ["a", "1", "b"] * 5
+
+        blueprint = ListBlueprint(IntegerBlueprint(), executor=executor, executor_chunk_size=3)
+        with pytest.raises(InputDataNotConvertibleExc):
+            blueprint.use(["1"] * 10 + ["x"])
+
+
+def test_pickled_exception():
+    try:
+        IntegerBlueprint(tag="test_tag").use("x")
+    except InputDataNotConvertibleExc as e:
+        exception = e
+    else:
+        assert False
+
+    unpickled_exception = pickle_and_unpickle(exception)
+
+    assert isinstance(unpickled_exception, InputDataNotConvertibleExc)
+    assert str(unpickled_exception) == str(exception)
+    assert unpickled_exception.get_originator_tag() == "test_tag"
+    assert unpickled_exception.get_input_data() == "x"
+    assert tuple(unpickled_exception.get_converted_to()) == tuple(exception.get_converted_to())
+
+
+def test_pickled_item_exceptions():
+    try:
+        ListBlueprint(IntegerBlueprint(), collect_item_exceptions=True).use([1, "x", None])
+    except InvalidItemsInInputDataExc as e:
+        exception = e
+    else:
+        assert False
+
+    unpickled_exception = pickle_and_unpickle(exception)
+
+    assert str(unpickled_exception) == str(exception)
+    assert [(path, type(item_exception)) for path, item_exception in unpickled_exception.get_item_exceptions()] == [(path, type(item_exception)) for path, item_exception in exception.get_item_exceptions()]
+
+
+def test_pickled_error():
+    error = pickle_and_unpickle(InvalidBlueprintConfigError("The configuration is invalid!", "test_tag"))
+
+    assert isinstance(error, InvalidBlueprintConfigError)
+    assert str(error) == "The configuration is invalid!"
+    assert error.get_originator_tag() == "test_tag"
@@ -0,0 +1,302 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import os
+import os.path
+import sys
+if "DATALIDATOR_TESTS_AUTOPATH" in os.environ:
+    __TESTS_DIR = os.path.dirname(os.path.realpath(__file__))
+    __MODULE_DIR = os.path.realpath(os.path.join(__TESTS_DIR, "../.."))
+    if __TESTS_DIR not in sys.path:
+        sys.path.insert(0, __TESTS_DIR)
+    if __MODULE_DIR not in sys.path:
+        sys.path.insert(0, __MODULE_DIR)
+
+import pytest
+import asyncio
+import threading
+import concurrent.futures
+import theoretical_testutils
+from datalidator.blueprints.BlueprintIface import BlueprintIface
+from datalidator.blueprints.ParsingMode import ParsingMode
+from datalidator.blueprints.AsyncUseContext import AsyncUseContext
+from datalidator.blueprints.extras.AsyncUseOptions import AsyncUseOptions
+from datalidator.blueprints.extras.ObjectModel import ObjectModel
+from datalidator.blueprints.extras.OptionalItem import OptionalItem
+from datalidator.blueprints.impl.IntegerBlueprint import IntegerBlueprint
+from datalidator.blueprints.impl.StringBlueprint import StringBlueprint
+from datalidator.blueprints.impl.ListBlueprint import ListBlueprint
+from datalidator.blueprints.impl.DictionaryBlueprint import DictionaryBlueprint
+from datalidator.blueprints.impl.PredefinedDictionaryBlueprint import PredefinedDictionaryBlueprint
+from datalidator.blueprints.impl.ObjectBlueprint import ObjectBlueprint
+from datalidator.blueprints.specialimpl.NoneHandlingBlueprint import NoneHandlingBlueprint
+from datalidator.blueprints.specialimpl.DefaultValueNoneHandlingBlueprint import DefaultValueNoneHandlingBlueprint
+from datalidator.blueprints.specialimpl.ExceptionHandlingBlueprint import ExceptionHandlingBlueprint
+from datalidator.blueprints.specialimpl.BlueprintChainingBlueprint import BlueprintChainingBlueprint
+from datalidator.blueprints.specialimpl.JSONBlueprint import JSONBlueprint
+from datalidator.blueprints.exc.InvalidInputDataExc import InvalidInputDataExc
+from datalidator.blueprints.exc.InvalidItemsInInputDataExc import InvalidItemsInInputDataExc
+from datalidator.blueprints.exc.InputDataNotConvertibleExc import InputDataNotConvertibleExc
+from datalidator.blueprints.exc.InputDataTypeNotInAllowlistExc import InputDataTypeNotInAllowlistExc
+from datalidator.blueprints.exc.InputDataTypeInBlocklistExc import InputDataTypeInBlocklistExc
+from datalidator.blueprints.exc.UnexpectedExceptionRaisedInBlueprintExc import UnexpectedExceptionRaisedInBlueprintExc
+from datalidator.filters.impl.ListSortFilter import ListSortFilter
+from datalidator.validators.impl.SequenceMaximumLengthValidator import SequenceMaximumLengthValidator
+from datalidator.validators.exc.DataValidationFailedExc import DataValidationFailedExc
+
+
+class AsyncUsingBlueprint(BlueprintIface):
+    __slots__ = "blueprint", "async_use_options"
+
+    def __init__(self, blueprint, async_use_options=None):
+        self.blueprint = blueprint
+        self.async_use_options = async_use_options
+
+    def use(self, input_data):
+        return asyncio.run(self.blueprint.use_async(input_data, self.async_use_options))
+
+    def get_tag(self):
+        return ""
+
+
+class ThreadRecordingIntegerBlueprint(BlueprintIface[int]):
+    __slots__ = "thread_idents", "integer_blueprint"
+
+    def __init__(self):
+        self.thread_idents = set()
+        self.integer_blueprint = IntegerBlueprint()
+
+    def use(self, input_data):
+        self.thread_idents.add(threading.get_ident())
+        return self.integer_blueprint.use(input_data)
+
+    def get_tag(self):
+        return ""
+
+
+class ExceptionRaisingIterable:
+    def __iter__(self):
+        raise theoretical_testutils.TestException()
+
+
+class AsyncTestObjectModel(ObjectModel):
+    id = IntegerBlueprint()
+    tags = OptionalItem(ListBlueprint(StringBlueprint()), [])
+
+
+__USE_ASYNC_TEST_SUITE = (
+    (ListBlueprint(IntegerBlueprint()), (
+        ([], []),
+        ([1, "2", 3.0], [1, 2, 3]),
+        (range(5000), list(range(5000))),
+        ((0, "1", 2.0), [0, 1, 2]),
+        ([1, "x"], InputDataNotConvertibleExc),
+        ("123", InputDataTypeInBlocklistExc),
+        (None, InputDataNotConvertibleExc),
+        (ExceptionRaisingIterable(), InputDataNotConvertibleExc),
+    )),
+    (ListBlueprint(IntegerBlueprint(), parsing_mode=ParsingMode.MODE_STRICT), (
+        ([1, 2], [1, 2]),
+        (range(2), InputDataTypeNotInAllowlistExc),
+    )),
+    (ListBlueprint(IntegerBlueprint(), filters=[ListSortFilter(None)], validators=[SequenceMaximumLengthValidator(3)]), (
+        ([3, "1", 2], [1, 2, 3]),
+        ([1, 2, 3, 4], DataValidationFailedExc),
+    )),
+    (ListBlueprint(ListBlueprint(IntegerBlueprint()), collect_item_exceptions=True), (
+        ([[1], [2, "3"]], [[1], [2, 3]]),
+        ([[1], [2, "x"], None], InvalidItemsInInputDataExc),
+    )),
+    (DictionaryBlueprint(StringBlueprint(), ListBlueprint(IntegerBlueprint())), (
+        ({}, {}),
+        ({"a": [1, "2"], 1: []}, {"a": [1, 2], "1": []}),
+        ({"a": [1, "x"]}, InputDataNotConvertibleExc),
+        ({(): [1]}, InputDataTypeNotInAllowlistExc),
+        (1, InputDataNotConvertibleExc),
+    )),
+    (DictionaryBlueprint(ListBlueprint(IntegerBlueprint()), IntegerBlueprint()), (
+        ({(1, 2): 1}, InvalidInputDataExc),  # The output of the key blueprint is not hashable
+    )),
+    (DictionaryBlueprint(StringBlueprint(), IntegerBlueprint(), collect_item_exceptions=True), (
+        ({"a": 1, "b": "2"}, {"a": 1, "b": 2}),
+        ({"a": "x", (): 1}, InvalidItemsInInputDataExc),
+    )),
+    (PredefinedDictionaryBlueprint({"a": IntegerBlueprint(), "b": OptionalItem(ListBlueprint(IntegerBlueprint()), None)}), (
+        ({"a": 1}, {"a": 1, "b": None}),
+        ({"a": "1", "b": ["2"], "c": 3}, {"a": 1, "b": [2]}),
+        ((("a", 1), ("b", [2])), {"a": 1, "b": [2]}),
+        ({"b": [2]}, InvalidInputDataExc),
+        ({"a": 1, "b": ["x"]}, InputDataNotConvertibleExc),
+        (1, InputDataNotConvertibleExc),
+    )),
+    (PredefinedDictionaryBlueprint({"a": IntegerBlueprint(), "b": ListBlueprint(IntegerBlueprint())}, ignore_unspecified_keys_in_input=False, collect_item_exceptions=True), (
+        ({"a": 1, "b": []}, {"a": 1, "b": []}),
+        ({"a": 1, "b": [], "c": 3}, InvalidItemsInInputDataExc),
+        ((("a", 1), ("b", []), ("c", 3)), InvalidItemsInInputDataExc),
+        ({"b": ["x"]}, InvalidItemsInInputDataExc),
+    )),
+    (ObjectBlueprint(AsyncTestObjectModel), (
+        ({"id": "1"}, AsyncTestObjectModel(id=1, tags=[])),
+        ({"id": 1, "tags": ["a", 2]}, AsyncTestObjectModel(id=1, tags=["a", "2"])),
+        ({"tags": []}, InvalidInputDataExc),
+    )),
+    (NoneHandlingBlueprint(ListBlueprint(IntegerBlueprint())), (
+        (None, None),
+        (["1"], [1]),
+        (["x"], InputDataNotConvertibleExc),
+    )),
+    (DefaultValueNoneHandlingBlueprint(ListBlueprint(IntegerBlueprint()), [0]), (
+        (None, [0]),
+        (["1"], [1]),
+    )),
+    (ExceptionHandlingBlueprint(ListBlueprint(IntegerBlueprint()), []), (
+        (["1"], [1]),
+        (["x"], []),
+        (ExceptionRaisingIterable(), []),
+    )),
+    (BlueprintChainingBlueprint((ListBlueprint(StringBlueprint()), ListBlueprint(IntegerBlueprint()))), (
+        ([1, "2"], [1, 2]),
+        (["x"], InputDataNotConvertibleExc),
+    )),
+    (JSONBlueprint(ListBlueprint(PredefinedDictionaryBlueprint({"id": IntegerBlueprint()}))), (
+        ('[{"id": 1}, {"id": "2"}]', [{"id": 1}, {"id": 2}]),
+        ('[{"id": "x"}]', InputDataNotConvertibleExc),
+        ('[', InvalidInputDataExc),
+        (1, InputDataTypeNotInAllowlistExc),
+    )),
+    (IntegerBlueprint(), (
+        ("1", 1),
+        ("x", InputDataNotConvertibleExc),
+    )),
+)
+
+__ASYNC_USE_OPTIONS = (
+    None,
+    AsyncUseOptions(yield_item_budget=1),
+    AsyncUseOptions(yield_item_budget=10, yield_time_budget=0.0),
+    AsyncUseOptions(executor_item_threshold=1),
+    AsyncUseOptions(executor=concurrent.futures.ThreadPoolExecutor(max_workers=2), executor_item_threshold=1),
+)
+
+
+@pytest.mark.parametrize("async_use_options", __ASYNC_USE_OPTIONS)
+@pytest.mark.parametrize(("blueprint", "input_", "output"), theoretical_testutils.test_function_parameter_generator(__USE_ASYNC_TEST_SUITE))
+def test_use_async(blueprint, input_, output, async_use_options):
+    theoretical_testutils.perform_test(AsyncUsingBlueprint(blueprint, async_use_options), input_, output)
+
+
+def test_use_async_yields_to_event_loop():
+    async def run():
+        tick_count = 0
+        done = False
+
+        async def tick():
+            nonlocal tick_count
+            while not done:
+                tick_count += 1
+                await asyncio.sleep(0)
+
+        tick_task = asyncio.create_task(tick())
+        await asyncio.sleep(0)
+
+        blueprint = ListBlueprint(PredefinedDictionaryBlueprint({"a": ListBlueprint(IntegerBlueprint())}))
+        output = await blueprint.use_async([{"a": [1, 2, 3]}] * 1000, AsyncUseOptions(yield_item_budget=100))
+
+        done = True
+        await tick_task
+        return output, tick_count
+
+    output, tick_count = asyncio.run(run())
+
+    assert output == [{"a": [1, 2, 3]}] * 1000
+    assert tick_count >= 50  # 5000 items (1000 lists, 1000 dictionaries and 3000 integers) in total
+
+
+def test_use_async_offloads_to_executor():
+    item_blueprint = ThreadRecordingIntegerBlueprint()
+    blueprint = ListBlueprint(item_blueprint)
+
+    assert asyncio.run(blueprint.use_async(["1", "2", "3"], AsyncUseOptions(executor_item_threshold=3))) == [1, 2, 3]
+    assert item_blueprint.thread_idents == {threading.get_ident()}
+
+    assert asyncio.run(blueprint.use_async(["1", "2", "3", "4"], AsyncUseOptions(executor_item_threshold=3))) == [1, 2, 3, 4]
+    assert len(item_blueprint.thread_idents) == 2
+
+    # Generators can be iterated over only once
+    assert asyncio.run(blueprint.use_async((str(i) for i in range(5)), AsyncUseOptions(executor_item_threshold=3))) == [0, 1, 2, 3, 4]
+
+
+def test_use_async_unexpected_exception():
+    class ExceptionRaisingBlueprint(IntegerBlueprint):
+        async def _parse_async(self, input_data, async_use_context):
+            raise theoretical_testutils.TestException()
+
+        def _benefits_from_async_use(self):
+            return True
+
+    with pytest.raises(UnexpectedExceptionRaisedInBlueprintExc):
+        asyncio.run(ExceptionRaisingBlueprint().use_async(1))
+
+    with pytest.raises(UnexpectedExceptionRaisedInBlueprintExc):
+        asyncio.run(ListBlueprint(ExceptionRaisingBlueprint()).use_async([1]))
+
+    assert asyncio.run(ListBlueprint(ExceptionHandlingBlueprint(ExceptionRaisingBlueprint(), 0)).use_async([1])) == [0]
+
+
+@pytest.mark.parametrize(("blueprint", "benefits_from_async_use"), (
+    (IntegerBlueprint(), False),
+    (ListBlueprint(IntegerBlueprint()), True),
+    (DictionaryBlueprint(StringBlueprint(), IntegerBlueprint()), True),
+    (PredefinedDictionaryBlueprint({"a": IntegerBlueprint()}), True),
+    (ObjectBlueprint(AsyncTestObjectModel), True),
+    (NoneHandlingBlueprint(IntegerBlueprint()), False),
+    (NoneHandlingBlueprint(ListBlueprint(IntegerBlueprint())), True),
+    (BlueprintChainingBlueprint((StringBlueprint(), IntegerBlueprint())), False),
+    (BlueprintChainingBlueprint((StringBlueprint(), ListBlueprint(IntegerBlueprint()))), True),
+    (JSONBlueprint(IntegerBlueprint()), False),
+    (JSONBlueprint(ListBlueprint(IntegerBlueprint())), True),
+))
+def test_benefits_from_async_use(blueprint, benefits_from_async_use):
+    assert blueprint._benefits_from_async_use() == benefits_from_async_use
+
+
+def test_async_use_context():
+    async def run():
+        async_use_context = AsyncUseContext(AsyncUseOptions(yield_item_budget=3, executor_item_threshold=10))
+
+        assert async_use_context.consume_item_budget() is False
+        assert async_use_context.consume_item_budget() is False
+        assert async_use_context.consume_item_budget() is True
+        await async_use_context.yield_to_event_loop()
+        assert async_use_context.consume_item_budget() is False
+
+        assert async_use_context.should_offload_to_executor(10) is False
+        assert async_use_context.should_offload_to_executor(11) is True
+        assert await async_use_context.run_in_executor(abs, -5) == 5
+
+    asyncio.run(run())
+
+    options = AsyncUseOptions()
+    assert options.get_yield_item_budget() == 1000
+    assert options.get_yield_time_budget() is None
+    assert options.get_executor() is None
+    assert options.get_executor_item_threshold() is None
@@ -0,0 +1,230 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import os
+import os.path
+import sys
+if "DATALIDATOR_TESTS_AUTOPATH" in os.environ:
+    __TESTS_DIR = os.path.dirname(os.path.realpath(__file__))
+    __MODULE_DIR = os.path.realpath(os.path.join(__TESTS_DIR, "../.."))
+    if __TESTS_DIR not in sys.path:
+        sys.path.insert(0, __TESTS_DIR)
+    if __MODULE_DIR not in sys.path:
+        sys.path.insert(0, __MODULE_DIR)
+
+import pytest
+import time
+import asyncio
+import pickle
+import theoretical_testutils
+from datalidator.blueprints.extras.AsyncUseOptions import AsyncUseOptions
+from datalidator.blueprints.impl.IntegerBlueprint import IntegerBlueprint
+from datalidator.blueprints.impl.StringBlueprint import StringBlueprint
+from datalidator.blueprints.impl.ListBlueprint import ListBlueprint
+from datalidator.blueprints.impl.DictionaryBlueprint import DictionaryBlueprint
+from datalidator.blueprints.impl.PredefinedDictionaryBlueprint import PredefinedDictionaryBlueprint
+from datalidator.blueprints.specialimpl.NoneHandlingBlueprint import NoneHandlingBlueprint
+from datalidator.blueprints.specialimpl.BlueprintChainingBlueprint import BlueprintChainingBlueprint
+from datalidator.blueprints.specialimpl.JSONBlueprint import JSONBlueprint
+from datalidator.blueprints.exc.UnexpectedOutputDataTypeExc import UnexpectedOutputDataTypeExc
+from datalidator.filters.DefaultAsyncFilterImplBase import DefaultAsyncFilterImplBase
+from datalidator.filters.impl.StringStripFilter import StringStripFilter
+from datalidator.filters.exc.TimeoutExpiredInFilterExc import TimeoutExpiredInFilterExc
+from datalidator.filters.exc.UnexpectedExceptionRaisedInFilterExc import UnexpectedExceptionRaisedInFilterExc
+from datalidator.filters.exc.err.AsyncFilterUsedSynchronouslyError import AsyncFilterUsedSynchronouslyError
+from datalidator.filters.exc.err.InvalidFilterConfigError import InvalidFilterConfigError
+from datalidator.validators.DefaultAsyncValidatorImplBase import DefaultAsyncValidatorImplBase
+from datalidator.validators.impl.StringContainsSubstringValidator import StringContainsSubstringValidator
+from datalidator.validators.exc.DataValidationFailedExc import DataValidationFailedExc
+from datalidator.validators.exc.TimeoutExpiredInValidatorExc import TimeoutExpiredInValidatorExc
+from datalidator.validators.exc.UnexpectedExceptionRaisedInValidatorExc import UnexpectedExceptionRaisedInValidatorExc
+from datalidator.validators.exc.err.AsyncValidatorUsedSynchronouslyError import AsyncValidatorUsedSynchronouslyError
+from datalidator.validators.exc.err.InvalidValidatorConfigError import InvalidValidatorConfigError
+
+
+class SleepingValidator(DefaultAsyncValidatorImplBase[str]):
+    __slots__ = "sleep_duration", "invalid_data"
+
+    def __init__(self, sleep_duration, invalid_data, timeout=None, tag=""):
+        DefaultAsyncValidatorImplBase.__init__(self, timeout, tag)
+        self.sleep_duration = sleep_duration
+        self.invalid_data = invalid_data
+
+    async def _validate_async(self, data):
+        await asyncio.sleep(self.sleep_duration)
+        if data == self.invalid_data:
+            raise self._generate_data_validation_failed_exc("The data are invalid! (tag: {})".format(self._tag))
+
+
+class ExceptionRaisingValidator(DefaultAsyncValidatorImplBase[str]):
+    async def _validate_async(self, data):
+        raise theoretical_testutils.TestException()
+
+
+class SleepingUppercaseFilter(DefaultAsyncFilterImplBase[str]):
+    __slots__ = "sleep_duration",
+
+    def __init__(self, sleep_duration, timeout=None, tag=""):
+        DefaultAsyncFilterImplBase.__init__(self, timeout, tag)
+        self.sleep_duration = sleep_duration
+
+    async def _filter_async(self, data):
+        await asyncio.sleep(self.sleep_duration)
+        return data.upper()
+
+
+class IntegerReturningFilter(DefaultAsyncFilterImplBase[str]):
+    async def _filter_async(self, data):
+        return len(data)
+
+
+class ExceptionRaisingFilter(DefaultAsyncFilterImplBase[str]):
+    async def _filter_async(self, data):
+        raise theoretical_testutils.TestException()
+
+
+class AsyncUsingBlueprint:
+    __slots__ = "blueprint",
+
+    def __init__(self, blueprint):
+        self.blueprint = blueprint
+
+    def use(self, input_data):
+        return asyncio.run(self.blueprint.use_async(input_data, AsyncUseOptions(executor_item_threshold=1)))
+
+
+__ASYNC_VALIDATORS_AND_FILTERS_TEST_SUITE = (
+    (StringBlueprint(filters=[StringStripFilter(), SleepingUppercaseFilter(0.0)], validators=[SleepingValidator(0.0, "ABC")]), (
+        (" hello ", "HELLO"),
+        (" abc ", DataValidationFailedExc),
+        (123, "123"),
+    )),
+    (StringBlueprint(filters=[SleepingUppercaseFilter(0.0), StringStripFilter()], validators=[StringContainsSubstringValidator("E")]), (
+        (" hello ", "HELLO"),
+        ("abc", DataValidationFailedExc),
+    )),
+    (StringBlueprint(filters=[IntegerReturningFilter()]), (
+        ("abc", UnexpectedOutputDataTypeExc),
+    )),
+    (StringBlueprint(filters=[ExceptionRaisingFilter()]), (
+        ("abc", UnexpectedExceptionRaisedInFilterExc),
+    )),
+    (StringBlueprint(validators=[ExceptionRaisingValidator()]), (
+        ("abc", UnexpectedExceptionRaisedInValidatorExc),
+    )),
+    (StringBlueprint(filters=[SleepingUppercaseFilter(1.0, timeout=0.01)]), (
+        ("abc", TimeoutExpiredInFilterExc),
+    )),
+    (StringBlueprint(validators=[SleepingValidator(0.0, "abc"), SleepingValidator(1.0, "", timeout=0.01)]), (
+        ("abc", DataValidationFailedExc),
+        ("def", TimeoutExpiredInValidatorExc),
+    )),
+    (ListBlueprint(StringBlueprint(validators=[SleepingValidator(0.0, "abc")])), (
+        (["def", 123], ["def", "123"]),
+        (["def", "abc"], DataValidationFailedExc),
+    )),
+    (DictionaryBlueprint(StringBlueprint(filters=[SleepingUppercaseFilter(0.0)]), IntegerBlueprint()), (
+        ({"a": "1", "b": 2}, {"A": 1, "B": 2}),
+    )),
+    (PredefinedDictionaryBlueprint({"a": NoneHandlingBlueprint(StringBlueprint(validators=[SleepingValidator(0.0, "abc")]))}), (
+        ({"a": None}, {"a": None}),
+        ({"a": "def"}, {"a": "def"}),
+        ({"a": "abc"}, DataValidationFailedExc),
+    )),
+    (JSONBlueprint(BlueprintChainingBlueprint((IntegerBlueprint(), StringBlueprint(filters=[SleepingUppercaseFilter(0.0)])))), (
+        ("123", "123"),
+    )),
+)
+
+
+@pytest.mark.parametrize(("blueprint", "input_", "output"), theoretical_testutils.test_function_parameter_generator(__ASYNC_VALIDATORS_AND_FILTERS_TEST_SUITE))
+def test_async_validators_and_filters(blueprint, input_, output):
+    theoretical_testutils.perform_test(AsyncUsingBlueprint(blueprint), input_, output)
+
+
+def test_async_validators_run_concurrently():
+    blueprint = StringBlueprint(validators=[SleepingValidator(0.2, "abc", tag="1"), SleepingValidator(0.2, "abc", tag="2"), SleepingValidator(0.2, "", tag="3")])
+
+    start_time = time.perf_counter()
+    assert asyncio.run(blueprint.use_async("def")) == "def"
+    assert time.perf_counter() - start_time < 0.5
+
+    # The exception of the first failed validator is raised, even though the second one fails earlier
+    blueprint = StringBlueprint(validators=[SleepingValidator(0.1, "abc", tag="1"), SleepingValidator(0.0, "abc", tag="2")])
+    with pytest.raises(DataValidationFailedExc) as exc_info:
+        asyncio.run(blueprint.use_async("abc"))
+    assert exc_info.value.get_originator_tag() == "1"
+
+
+def test_sync_validators_run_before_async_validators():
+    blueprint = StringBlueprint(validators=[SleepingValidator(0.0, "abc", tag="async"), StringContainsSubstringValidator("x", tag="sync")])
+
+    with pytest.raises(DataValidationFailedExc) as exc_info:
+        asyncio.run(blueprint.use_async("abc"))
+    assert exc_info.value.get_originator_tag() == "sync"
+
+
+@pytest.mark.parametrize("blueprint", (
+    StringBlueprint(validators=[SleepingValidator(0.0, "abc")]),
+    StringBlueprint(filters=[SleepingUppercaseFilter(0.0)]),
+    ListBlueprint(StringBlueprint(validators=[SleepingValidator(0.0, "abc")])),
+))
+def test_async_validators_and_filters_used_synchronously(blueprint):
+    with pytest.raises((AsyncValidatorUsedSynchronouslyError, AsyncFilterUsedSynchronouslyError)):
+        blueprint.use(["abc"] if isinstance(blueprint, ListBlueprint) else "abc")
+
+
+@pytest.mark.parametrize(("blueprint", "requires_async_use"), (
+    (StringBlueprint(), False),
+    (StringBlueprint(validators=[SleepingValidator(0.0, "")]), True),
+    (StringBlueprint(filters=[SleepingUppercaseFilter(0.0)]), True),
+    (ListBlueprint(StringBlueprint()), False),
+    (ListBlueprint(StringBlueprint(), validators=[SleepingValidator(0.0, "")]), True),
+    (ListBlueprint(StringBlueprint(validators=[SleepingValidator(0.0, "")])), True),
+    (DictionaryBlueprint(StringBlueprint(filters=[SleepingUppercaseFilter(0.0)]), IntegerBlueprint()), True),
+    (PredefinedDictionaryBlueprint({"a": NoneHandlingBlueprint(StringBlueprint(validators=[SleepingValidator(0.0, "")]))}), True),
+    (BlueprintChainingBlueprint((IntegerBlueprint(), StringBlueprint())), False),
+    (JSONBlueprint(StringBlueprint(validators=[SleepingValidator(0.0, "")])), True),
+))
+def test_requires_async_use(blueprint, requires_async_use):
+    assert blueprint._requires_async_use() == requires_async_use
+    if requires_async_use:
+        assert blueprint._benefits_from_async_use() is True
+
+
+def test_async_validator_and_filter_config():
+    with pytest.raises(InvalidValidatorConfigError):
+        SleepingValidator(0.0, "", timeout=0)
+
+    with pytest.raises(InvalidFilterConfigError):
+        SleepingUppercaseFilter(0.0, timeout=-1.0)
+
+    assert SleepingValidator(0.0, "", timeout=2.5).get_timeout() == 2.5
+    assert SleepingUppercaseFilter(0.0).get_timeout() is None
+
+
+def test_async_validators_and_filters_pickling():
+    blueprint = pickle.loads(pickle.dumps(StringBlueprint(filters=[SleepingUppercaseFilter(0.0)], validators=[SleepingValidator(0.0, "ABC", timeout=1.0)])))
+
+    assert asyncio.run(blueprint.use_async("def")) == "DEF"
+    with pytest.raises(DataValidationFailedExc):
+        asyncio.run(blueprint.use_async("abc"))
@@ -0,0 +1,261 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import os
+import os.path
+import sys
+if "DATALIDATOR_TESTS_AUTOPATH" in os.environ:
+    __TESTS_DIR = os.path.dirname(os.path.realpath(__file__))
+    __MODULE_DIR = os.path.realpath(os.path.join(__TESTS_DIR, "../.."))
+    if __TESTS_DIR not in sys.path:
+        sys.path.insert(0, __TESTS_DIR)
+    if __MODULE_DIR not in sys.path:
+        sys.path.insert(0, __MODULE_DIR)
+
+import pytest
+import time
+import uuid
+import pickle
+import asyncio
+import datetime
+import ipaddress
+import threading
+import theoretical_testutils
+from datalidator.exc.DatalidatorExc import DatalidatorExc
+from datalidator.blueprints.ParsingMode import ParsingMode
+from datalidator.blueprints.impl.IntegerBlueprint import IntegerBlueprint
+from datalidator.blueprints.impl.StringBlueprint import StringBlueprint
+from datalidator.blueprints.impl.IPAddressBlueprint import IPAddressBlueprint
+from datalidator.blueprints.impl.UUIDBlueprint import UUIDBlueprint
+from datalidator.blueprints.impl.DatetimeBlueprint import DatetimeBlueprint
+from datalidator.blueprints.impl.ListBlueprint import ListBlueprint
+from datalidator.blueprints.specialimpl.CachingBlueprint import CachingBlueprint
+from datalidator.blueprints.specialimpl.ExceptionHandlingBlueprint import ExceptionHandlingBlueprint
+from datalidator.blueprints.exc.InputDataNotConvertibleExc import InputDataNotConvertibleExc
+from datalidator.blueprints.exc.InputDataTypeNotInAllowlistExc import InputDataTypeNotInAllowlistExc
+from datalidator.blueprints.exc.err.InvalidBlueprintConfigError import InvalidBlueprintConfigError
+from datalidator.filters.impl.StringStripFilter import StringStripFilter
+from datalidator.filters.impl.StringUppercaseFilter import StringUppercaseFilter
+from datalidator.validators.impl.SequenceMaximumLengthValidator import SequenceMaximumLengthValidator
+from datalidator.validators.exc.DataValidationFailedExc import DataValidationFailedExc
+
+
+class RepeatedlyUsingBlueprint:
+    # Uses the blueprint on the same input data several times, so that the cached results are used as well
+    __slots__ = "blueprint",
+
+    def __init__(self, blueprint):
+        self.blueprint = blueprint
+
+    def use(self, input_data):
+        results = []
+        for _ in range(3):
+            try:
+                results.append(self.blueprint.use(input_data))
+            except DatalidatorExc as e:
+                results.append(e)
+
+        assert len({result.__class__ for result in results}) == 1
+        if isinstance(results[0], DatalidatorExc):
+            assert len({id(result) for result in results}) == 3  # The same exception object must not be raised twice
+            raise results[-1]
+
+        assert results[0] == results[1] == results[2]
+        return results[-1]
+
+
+class CallCountingBlueprint:
+    __slots__ = "wrapped_blueprint", "call_count"
+
+    def __init__(self, wrapped_blueprint):
+        self.wrapped_blueprint = wrapped_blueprint
+        self.call_count = 0
+
+    def use(self, input_data):
+        self.call_count += 1
+        return self.wrapped_blueprint.use(input_data)
+
+    def get_tag(self):
+        return ""
+
+
+__CACHING_BLUEPRINT_TEST_SUITE = (
+    (CachingBlueprint(IPAddressBlueprint()), (
+        ("192.168.1.1", ipaddress.ip_address("192.168.1.1")),
+        ("::1", ipaddress.ip_address("::1")),
+        ("hello", InputDataNotConvertibleExc),
+        (b"127.0.0.1", InputDataTypeNotInAllowlistExc),
+        (None, InputDataTypeNotInAllowlistExc),
+    )),
+    (CachingBlueprint(StringBlueprint(filters=[StringStripFilter(), StringUppercaseFilter()]), max_size=2), (
+        (" cz ", "CZ"),
+        ("sk", "SK"),
+        (1, "1"),
+        (1.0, "1.0"),
+        (True, "TRUE"),
+        (0.0, "0.0"),
+        (-0.0, "-0.0"),
+        ([1], InputDataTypeNotInAllowlistExc),
+    )),
+    (CachingBlueprint(UUIDBlueprint(), cache_exceptions=False), (
+        ("12345678-1234-5678-1234-567812345678", uuid.UUID("12345678-1234-5678-1234-567812345678")),
+        ("hello", InputDataNotConvertibleExc),
+    )),
+    (CachingBlueprint(DatetimeBlueprint(parsing_mode=ParsingMode.MODE_LOOSE), ttl=60.0), (
+        (0, datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)),
+        ("1970-01-01T00:00:00+00:00", datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)),
+    )),
+    (CachingBlueprint(ListBlueprint(IntegerBlueprint(), parsing_mode=ParsingMode.MODE_LOOSE, validators=[SequenceMaximumLengthValidator(3)]), copy_mutable_outputs=True), (
+        ("123", [1, 2, 3]),
+        ("1234", DataValidationFailedExc),
+        ("1x", InputDataNotConvertibleExc),
+        ((1, 2), [1, 2]),
+    )),
+    (ExceptionHandlingBlueprint(CachingBlueprint(IntegerBlueprint()), -1), (
+        ("1", 1),
+        ("x", -1),
+    )),
+)
+
+
+@pytest.mark.parametrize(("blueprint", "input_", "output"), theoretical_testutils.test_function_parameter_generator(__CACHING_BLUEPRINT_TEST_SUITE))
+def test_caching_blueprint(blueprint, input_, output):
+    theoretical_testutils.perform_test(RepeatedlyUsingBlueprint(blueprint), input_, output)
+
+
+def test_caching_blueprint_statistics():
+    wrapped_blueprint = CallCountingBlueprint(IntegerBlueprint())
+    blueprint = CachingBlueprint(wrapped_blueprint, max_size=2)
+
+    assert blueprint.use("1") == 1
+    assert blueprint.use("1") == 1
+    assert blueprint.use(1) == 1  # Keyed by the exact type
+    assert blueprint.use("2") == 2  # Evicts "1"
+    assert blueprint.use("1") == 1  # Evicts 1
+    with pytest.raises(InputDataTypeNotInAllowlistExc):
+        blueprint.use([1])  # Not cacheable
+    with pytest.raises(InputDataNotConvertibleExc):
+        blueprint.use("x")  # Evicts "2"
+    with pytest.raises(InputDataNotConvertibleExc):
+        blueprint.use("x")
+
+    statistics = blueprint.get_cache_statistics()
+    assert statistics.get_hit_count() == 2
+    assert statistics.get_miss_count() == 5
+    assert statistics.get_eviction_count() == 3
+    assert statistics.get_current_size() == 2
+    assert statistics.get_max_size() == 2
+    assert statistics.get_hit_ratio() == 2 / 7
+    assert wrapped_blueprint.call_count == 6
+
+    blueprint.clear_cache()
+    assert blueprint.get_cache_statistics().get_current_size() == 0
+    assert blueprint.use("1") == 1
+    assert wrapped_blueprint.call_count == 7
+
+
+def test_caching_blueprint_ttl():
+    wrapped_blueprint = CallCountingBlueprint(IntegerBlueprint())
+    blueprint = CachingBlueprint(wrapped_blueprint, ttl=0.05)
+
+    assert blueprint.use("1") == 1
+    assert blueprint.use("1") == 1
+    assert wrapped_blueprint.call_count == 1
+
+    time.sleep(0.1)
+    assert blueprint.use("1") == 1
+    assert wrapped_blueprint.call_count == 2
+    assert blueprint.get_cache_statistics().get_eviction_count() == 0
+
+
+def test_caching_blueprint_mutable_outputs():
+    wrapped_blueprint = CallCountingBlueprint(ListBlueprint(IntegerBlueprint(), parsing_mode=ParsingMode.MODE_LOOSE))
+
+    blueprint = CachingBlueprint(wrapped_blueprint)
+    blueprint.use("12")
+    blueprint.use("12")
+    assert wrapped_blueprint.call_count == 2  # Mutable outputs are not cached by default
+
+    blueprint = CachingBlueprint(wrapped_blueprint, copy_mutable_outputs=True)
+    output = blueprint.use("12")
+    output.append(3)
+    assert blueprint.use("12") == [1, 2]
+    assert blueprint.use("12") is not blueprint.use("12")
+    assert wrapped_blueprint.call_count == 3
+
+
+def test_caching_blueprint_try_use_and_use_async():
+    blueprint = CachingBlueprint(IntegerBlueprint())
+
+    assert blueprint.try_use("1").get_output() == 1
+    assert isinstance(blueprint.try_use("x").get_exception(), InputDataNotConvertibleExc)
+    assert asyncio.run(blueprint.use_async("1")) == 1
+    with pytest.raises(InputDataNotConvertibleExc):
+        asyncio.run(blueprint.use_async("x"))
+    assert asyncio.run(ListBlueprint(blueprint).use_async(["2", "2", 3])) == [2, 2, 3]
+
+    assert blueprint.get_cache_statistics().get_hit_count() == 3
+
+
+def test_caching_blueprint_threads():
+    blueprint = CachingBlueprint(IntegerBlueprint(), max_size=16)
+    errors = []
+
+    def run():
+        try:
+            for i in range(2000):
+                assert blueprint.use(str(i % 32)) == i % 32
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert blueprint.get_cache_statistics().get_current_size() == 16
+
+
+def test_caching_blueprint_pickling():
+    blueprint = CachingBlueprint(IntegerBlueprint(), max_size=10, ttl=5.0)
+    blueprint.use("1")
+
+    unpickled_blueprint = pickle.loads(pickle.dumps(blueprint))
+    assert unpickled_blueprint.get_max_size() == 10
+    assert unpickled_blueprint.get_ttl() == 5.0
+    assert unpickled_blueprint.get_cache_statistics().get_current_size() == 0
+    assert unpickled_blueprint.use("1") == 1
+    assert unpickled_blueprint.use("1") == 1
+    assert unpickled_blueprint.get_cache_statistics().get_hit_count() == 1
+
+
+@pytest.mark.parametrize("kwargs", (
+    {"max_size": 0},
+    {"max_size": -1},
+    {"ttl": 0},
+    {"ttl": -1.0},
+))
+def test_caching_blueprint_invalid_config(kwargs):
+    with pytest.raises(InvalidBlueprintConfigError):
+        CachingBlueprint(IntegerBlueprint(), **kwargs)
@@ -0,0 +1,203 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import os
+import os.path
+import sys
+if "DATALIDATOR_TESTS_AUTOPATH" in os.environ:
+    __TESTS_DIR = os.path.dirname(os.path.realpath(__file__))
+    __MODULE_DIR = os.path.realpath(os.path.join(__TESTS_DIR, "../.."))
+    if __TESTS_DIR not in sys.path:
+        sys.path.insert(0, __TESTS_DIR)
+    if __MODULE_DIR not in sys.path:
+        sys.path.insert(0, __MODULE_DIR)
+
+import pytest
+import pickle
+import sys
+import threading
+import theoretical_testutils
+from datalidator.blueprints.ParsingMode import ParsingMode
+from datalidator.blueprints.impl.StringBlueprint import StringBlueprint
+from datalidator.blueprints.impl.ListBlueprint import ListBlueprint
+from datalidator.blueprints.impl.PredefinedDictionaryBlueprint import PredefinedDictionaryBlueprint
+from datalidator.blueprints.exc.InputDataTypeNotInAllowlistExc import InputDataTypeNotInAllowlistExc
+from datalidator.filters.impl.StringInternFilter import StringInternFilter
+from datalidator.filters.impl.StringStripFilter import StringStripFilter
+from datalidator.filters.impl.StringLowercaseFilter import StringLowercaseFilter
+from datalidator.filters.extras.StringInternPool import StringInternPool
+from datalidator.filters.exc.err.InvalidFilterConfigError import InvalidFilterConfigError
+
+
+class StrSubclass(str):
+    pass
+
+
+__STRING_INTERN_FILTER_TEST_SUITE = (
+    (StringBlueprint(filters=[StringStripFilter(), StringLowercaseFilter(), StringInternFilter(StringInternPool())]), (
+        ("hello", "hello"),
+        (" HELLO ", "hello"),
+        ("", ""),
+        (" Příliš žluťoučký kůň\n", "příliš žluťoučký kůň"),
+        (123, "123"),
+        (None, "none"),
+    )),
+    (StringBlueprint(filters=[StringInternFilter()], parsing_mode=ParsingMode.MODE_STRICT), (
+        ("hello", "hello"),
+        (123, InputDataTypeNotInAllowlistExc),
+    )),
+)
+
+
+@pytest.mark.parametrize(("blueprint", "input_", "output"), theoretical_testutils.test_function_parameter_generator(__STRING_INTERN_FILTER_TEST_SUITE))
+def test_string_intern_filter(blueprint, input_, output):
+    theoretical_testutils.perform_test(blueprint, input_, output)
+
+
+def test_string_intern_filter_deduplicates_strings():
+    intern_pool = StringInternPool()
+    blueprint = ListBlueprint(PredefinedDictionaryBlueprint({
+        "category": StringBlueprint(filters=[StringStripFilter(), StringInternFilter(intern_pool)]),
+        "name": StringBlueprint(filters=[StringInternFilter(intern_pool)])
+    }))
+
+    output = blueprint.use([{"category": " category{} ".format(i % 3), "name": "category{}".format(i % 3)} for i in range(300)])
+
+    assert len({id(item["category"]) for item in output} | {id(item["name"]) for item in output}) == 3
+    assert output[0]["category"] == "category0"
+
+    statistics = intern_pool.get_statistics()
+    assert statistics.get_miss_count() == 3
+    assert statistics.get_hit_count() == 597
+    assert statistics.get_rejection_count() == 0
+    assert statistics.get_current_size() == 3
+    assert statistics.get_pooled_byte_count() == 3 * sys.getsizeof("category0")
+    assert statistics.get_saved_byte_count() == 597 * sys.getsizeof("category0")
+
+
+def test_string_intern_pool_max_size():
+    intern_pool = StringInternPool(max_size=2)
+    string_filter = StringInternFilter(intern_pool)
+
+    first_a = "".join(["a", "b"])
+    assert string_filter.filter(first_a) is first_a
+    assert string_filter.filter("".join(["a", "b"])) is first_a
+    assert string_filter.filter("cd") == "cd"
+
+    third_string = "".join(["e", "f"])
+    assert string_filter.filter(third_string) is third_string
+    assert string_filter.filter("".join(["e", "f"])) is not third_string  # The pool is full
+
+    statistics = intern_pool.get_statistics()
+    assert statistics.get_current_size() == 2
+    assert statistics.get_max_size() == 2
+    assert statistics.get_rejection_count() == 2
+
+    intern_pool.clear()
+    assert intern_pool.get_statistics().get_current_size() == 0
+    assert intern_pool.get_statistics().get_pooled_byte_count() == 0
+    assert string_filter.filter(third_string) is third_string
+    assert intern_pool.get_statistics().get_current_size() == 1
+
+
+def test_string_intern_filter_str_subclass():
+    intern_pool = StringInternPool()
+    string = StrSubclass("hello")
+
+    assert StringInternFilter(intern_pool).filter(string) is string
+    assert intern_pool.get_statistics().get_current_size() == 0
+
+
+def test_string_intern_filter_default_pool():
+    original_default_pool = StringInternPool.get_default_intern_pool()
+    try:
+        intern_pool = StringInternPool()
+        StringInternPool.set_default_intern_pool(intern_pool)
+
+        string_filter = StringInternFilter()
+        assert string_filter.get_intern_pool() is intern_pool
+        string_filter.filter("hello")
+        assert intern_pool.get_statistics().get_current_size() == 1
+    finally:
+        StringInternPool.set_default_intern_pool(original_default_pool)
+
+    assert StringInternFilter().get_intern_pool() is original_default_pool
+
+
+def test_string_intern_filter_default_pool_created_once_by_concurrent_threads():
+    original_default_pool = StringInternPool.get_default_intern_pool()
+    try:
+        StringInternPool._StringInternPool__default_intern_pool = None  # Simulates a process which has not interned anything yet
+
+        barrier = threading.Barrier(8)
+        default_pools = []
+
+        def get_default_pool():
+            barrier.wait()
+            default_pools.append(StringInternFilter().get_intern_pool())
+
+        threads = [threading.Thread(target=get_default_pool) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(default_pools) == 8
+        assert all(default_pool is default_pools[0] for default_pool in default_pools)
+    finally:
+        StringInternPool.set_default_intern_pool(original_default_pool)
+
+
+def test_string_intern_pool_threads():
+    intern_pool = StringInternPool()
+    outputs = []
+
+    def run():
+        outputs.extend(intern_pool.intern("".join(["value", str(i % 10)])) for i in range(1000))
+
+    threads = [threading.Thread(target=run) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(output) for output in outputs}) == 10
+    assert intern_pool.get_statistics().get_hit_count() + intern_pool.get_statistics().get_miss_count() == 4000
+
+
+def test_string_intern_filter_pickling():
+    intern_pool = StringInternPool(max_size=5)
+    intern_pool.intern("hello")
+
+    blueprint = pickle.loads(pickle.dumps(StringBlueprint(filters=[StringInternFilter(intern_pool), StringInternFilter()])))
+    unpickled_pool = blueprint.get_filters()[0].get_intern_pool()
+
+    assert unpickled_pool.get_max_size() == 5
+    assert unpickled_pool.get_statistics().get_current_size() == 0
+    assert blueprint.get_filters()[1].get_intern_pool() is StringInternPool.get_default_intern_pool()
+    assert blueprint.use(" hello ") == " hello "
+
+
+@pytest.mark.parametrize("max_size", (0, -1))
+def test_string_intern_pool_invalid_config(max_size):
+    with pytest.raises(InvalidFilterConfigError):
+        StringInternPool(max_size=max_size)
@@ -0,0 +1,188 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import os
+import os.path
+import sys
+if "DATALIDATOR_TESTS_AUTOPATH" in os.environ:
+    __TESTS_DIR = os.path.dirname(os.path.realpath(__file__))
+    __MODULE_DIR = os.path.realpath(os.path.join(__TESTS_DIR, "../.."))
+    if __TESTS_DIR not in sys.path:
+        sys.path.insert(0, __TESTS_DIR)
+    if __MODULE_DIR not in sys.path:
+        sys.path.insert(0, __MODULE_DIR)
+
+import pytest
+import copy
+import pickle
+import asyncio
+import theoretical_testutils
+from datalidator.blueprints.impl.ObjectBlueprint import ObjectBlueprint
+from datalidator.blueprints.impl.IntegerBlueprint import IntegerBlueprint
+from datalidator.blueprints.impl.StringBlueprint import StringBlueprint
+from datalidator.blueprints.impl.ListBlueprint import ListBlueprint
+from datalidator.blueprints.compiler.BlueprintCompiler import BlueprintCompiler
+from datalidator.blueprints.extras.SlottedObjectModel import SlottedObjectModel
+from datalidator.blueprints.extras.OptionalItem import OptionalItem
+from datalidator.blueprints.exc.InvalidInputDataExc import InvalidInputDataExc
+from datalidator.blueprints.exc.InputDataNotConvertibleExc import InputDataNotConvertibleExc
+from datalidator.blueprints.exc.err.InvalidBlueprintConfigError import InvalidBlueprintConfigError
+
+
+class UserModel(SlottedObjectModel):
+    id = IntegerBlueprint()
+    name = StringBlueprint()
+    tags = OptionalItem(ListBlueprint(StringBlueprint()), [])
+
+
+class FrozenUserModel(SlottedObjectModel, frozen=True):
+    id = IntegerBlueprint()
+    name = OptionalItem(StringBlueprint(), "anonymous")
+
+
+class AdminModel(FrozenUserModel):
+    id = StringBlueprint()  # Redeclared with a different blueprint
+    permissions = IntegerBlueprint()
+
+    def has_permission(self, permission):
+        return (self.permissions & permission) != 0
+
+
+class EmptyModel(SlottedObjectModel):
+    _private = IntegerBlueprint()
+
+
+__SLOTTED_OBJECT_MODEL_TEST_SUITE = (
+    (ObjectBlueprint(UserModel), (
+        ({"id": 1, "name": "joe"}, UserModel(id=1, name="joe", tags=[])),
+        ({"id": "2", "name": 3, "tags": ["a", 1], "unknown": None}, UserModel(id=2, name="3", tags=["a", "1"])),
+        ((("id", 1), ("name", "joe")), UserModel(id=1, name="joe", tags=[])),
+        ({"id": 1}, InvalidInputDataExc),
+        ({"id": "x", "name": "joe"}, InputDataNotConvertibleExc),
+        (None, InputDataNotConvertibleExc),
+    )),
+    (ObjectBlueprint(FrozenUserModel, ignore_input_keys_which_are_not_in_model=False), (
+        ({"id": 1}, FrozenUserModel(id=1, name="anonymous")),
+        ({"id": 1, "name": "joe", "x": 1}, InvalidInputDataExc),
+    )),
+    (ObjectBlueprint(AdminModel), (
+        ({"id": 1, "permissions": "3"}, AdminModel(id="1", name="anonymous", permissions=3)),
+    )),
+    (ListBlueprint(ObjectBlueprint(FrozenUserModel)), (
+        ([{"id": 1}, {"id": 2, "name": "joe"}], [FrozenUserModel(id=1, name="anonymous"), FrozenUserModel(id=2, name="joe")]),
+    )),
+)
+
+
+@pytest.mark.parametrize(("blueprint", "input_", "output"), theoretical_testutils.test_function_parameter_generator(__SLOTTED_OBJECT_MODEL_TEST_SUITE))
+def test_slotted_object_model(blueprint, input_, output):
+    theoretical_testutils.perform_test(blueprint, input_, output)
+
+
+def test_slotted_object_model_slots():
+    user = ObjectBlueprint(UserModel).use({"id": 1, "name": "joe"})
+
+    assert not hasattr(user, "__dict__")
+    assert UserModel.__slots__ == ("id", "name", "tags")
+    assert AdminModel.__slots__ == ("permissions",)
+    assert ObjectBlueprint(AdminModel).get_dict_specification().keys() == {"id", "name", "permissions"}
+    with pytest.raises(AttributeError):
+        user.unknown = 1
+
+    user.name = "john"
+    assert user.name == "john"
+    assert repr(user) == "UserModel(id=1, name='john', tags=[])"
+    assert UserModel.__hash__ is None
+
+
+def test_slotted_object_model_frozen():
+    admin = ObjectBlueprint(AdminModel).use({"id": 1, "permissions": 2})
+
+    with pytest.raises(AttributeError):
+        admin.permissions = 1
+    with pytest.raises(AttributeError):
+        del admin.id
+
+    assert admin.has_permission(2) and not admin.has_permission(1)
+    assert hash(admin) == hash(AdminModel(id="1", name="anonymous", permissions=2))
+    assert len({admin, AdminModel(id="1", name="anonymous", permissions=2)}) == 1
+    assert admin != FrozenUserModel(id="1", name="anonymous")
+
+
+def test_slotted_object_model_frozen_subclass_of_mutable_model():
+    class MutableModel(SlottedObjectModel):
+        x = IntegerBlueprint()
+
+    class FrozenModel(MutableModel, frozen=True):
+        y = StringBlueprint()
+
+    frozen = ObjectBlueprint(FrozenModel).use({"x": 1, "y": "a"})
+
+    with pytest.raises(AttributeError):
+        frozen.y = "b"
+
+    assert MutableModel.__hash__ is None
+    assert hash(frozen) == hash(FrozenModel(x=1, y="a"))
+    assert len({frozen, FrozenModel(x=1, y="a"), FrozenModel(x=1, y="b")}) == 2
+    assert frozen == FrozenModel(x=1, y="a")
+    assert frozen != FrozenModel(x=2, y="a")
+
+
+def test_slotted_object_model_initializer():
+    assert UserModel(id=1, name="joe", tags=[]).tags == []
+
+    with pytest.raises(TypeError):
+        UserModel(id=1, name="joe")
+    with pytest.raises(TypeError):
+        UserModel(id=1, name="joe", tags=[], unknown=None)
+
+
+def test_slotted_object_model_pickling_and_copying():
+    user = UserModel(id=1, name="joe", tags=["a"])
+    admin = AdminModel(id="1", name="joe", permissions=1)
+
+    assert pickle.loads(pickle.dumps(user)) == user
+    assert pickle.loads(pickle.dumps(admin)) == admin
+    assert copy.deepcopy(admin) == admin
+
+    user_copy = copy.deepcopy(user)
+    user_copy.tags.append("b")
+    assert user.tags == ["a"]
+
+    blueprint = pickle.loads(pickle.dumps(ObjectBlueprint(FrozenUserModel)))
+    assert blueprint.use({"id": 5}) == FrozenUserModel(id=5, name="anonymous")
+
+
+def test_slotted_object_model_compiled_and_async():
+    blueprint = ObjectBlueprint(UserModel)
+
+    assert BlueprintCompiler().compile_to_function(blueprint)({"id": "1", "name": "joe"}) == UserModel(id=1, name="joe", tags=[])
+    assert asyncio.run(blueprint.use_async({"id": "1", "name": "joe"})) == UserModel(id=1, name="joe", tags=[])
+
+
+def test_slotted_object_model_invalid_config():
+    with pytest.raises(InvalidBlueprintConfigError):
+        ObjectBlueprint(EmptyModel)
+
+    with pytest.raises(InvalidBlueprintConfigError):
+        class ModelWithSlots(SlottedObjectModel):
+            __slots__ = ("id",)
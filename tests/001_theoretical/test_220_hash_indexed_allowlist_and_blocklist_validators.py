@@ -0,0 +1,198 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import os
+import os.path
+import sys
+if "DATALIDATOR_TESTS_AUTOPATH" in os.environ:
+    __TESTS_DIR = os.path.dirname(os.path.realpath(__file__))
+    __MODULE_DIR = os.path.realpath(os.path.join(__TESTS_DIR, "../.."))
+    if __TESTS_DIR not in sys.path:
+        sys.path.insert(0, __TESTS_DIR)
+    if __MODULE_DIR not in sys.path:
+        sys.path.insert(0, __MODULE_DIR)
+
+import pytest
+import math
+import pickle
+import decimal
+import fractions
+import datetime
+import uuid
+import theoretical_testutils
+from datalidator.blueprints.impl.GenericBlueprint import GenericBlueprint
+from datalidator.validators.impl.AllowlistValidator import AllowlistValidator
+from datalidator.validators.impl.BlocklistValidator import BlocklistValidator
+from datalidator.validators.extras.ValueMembershipIndex import ValueMembershipIndex
+from datalidator.validators.exc.DataValidationFailedExc import DataValidationFailedExc
+
+
+class StrSubclass(str):
+    pass
+
+
+class EqualToEverything:
+    def __eq__(self, other):
+        return True
+
+    def __hash__(self):
+        return 0
+
+
+class CaseInsensitiveString:
+    def __init__(self, value):
+        self.value = value
+
+    def __eq__(self, other):
+        if isinstance(other, str):
+            return self.value.lower() == other.lower()
+        return NotImplemented
+
+    __hash__ = None
+
+
+__MIXED_VALUES = (1, "abc", b"abc", 2.5, None, decimal.Decimal("3.25"), datetime.date(2022, 1, 1), uuid.UUID(int=1), [1, 2], {"a": 1}, (3, 4), StrSubclass("sub"))
+
+
+__HASH_INDEXED_ALLOWLIST_VALIDATOR_TEST_SUITE = (
+    (GenericBlueprint(validators=[AllowlistValidator(__MIXED_VALUES)]), (
+        (1, 1),
+        (1.0, 1.0),
+        (True, True),
+        (decimal.Decimal(1), decimal.Decimal(1)),
+        (fractions.Fraction(1, 1), fractions.Fraction(1, 1)),
+        (complex(1, 0), complex(1, 0)),
+        (2, DataValidationFailedExc),
+        (False, DataValidationFailedExc),
+        (0, DataValidationFailedExc),
+        ("abc", "abc"),
+        (StrSubclass("abc"), StrSubclass("abc")),
+        ("ABC", DataValidationFailedExc),
+        (b"abc", b"abc"),
+        (bytearray(b"abc"), bytearray(b"abc")),
+        ("sub", "sub"),
+        (StrSubclass("sub"), StrSubclass("sub")),
+        (2.5, 2.5),
+        (fractions.Fraction(5, 2), fractions.Fraction(5, 2)),
+        (decimal.Decimal("2.50"), decimal.Decimal("2.50")),
+        (None, None),
+        (decimal.Decimal("3.250"), decimal.Decimal("3.250")),
+        (3.25, 3.25),
+        (datetime.date(2022, 1, 1), datetime.date(2022, 1, 1)),
+        (datetime.datetime(2022, 1, 1), DataValidationFailedExc),
+        (uuid.UUID(int=1), uuid.UUID(int=1)),
+        ([1, 2], [1, 2]),
+        ([1, 2, 3], DataValidationFailedExc),
+        ({"a": 1}, {"a": 1}),
+        ((3, 4), (3, 4)),
+        ((3.0, 4.0), (3.0, 4.0)),
+        ((3, 5), DataValidationFailedExc),
+        (float("nan"), DataValidationFailedExc),
+        (float("inf"), DataValidationFailedExc),
+    )),
+    (GenericBlueprint(validators=[AllowlistValidator([EqualToEverything()])]), (
+        (1, 1),
+        ("abc", "abc"),
+        (None, None),
+        ([], []),
+    )),
+    (GenericBlueprint(validators=[AllowlistValidator(["xyz", CaseInsensitiveString("Hello")])]), (
+        ("xyz", "xyz"),
+        ("hello", "hello"),
+        ("HELLO", "HELLO"),
+        ("XYZ", DataValidationFailedExc),
+        (1, DataValidationFailedExc),
+    )),
+    (GenericBlueprint(validators=[AllowlistValidator(["hello"])]), (
+        ("hello", "hello"),
+        (CaseInsensitiveString("HeLLo"), lambda output: isinstance(output, CaseInsensitiveString)),
+        (CaseInsensitiveString("bye"), DataValidationFailedExc),
+    )),
+    (GenericBlueprint(validators=[BlocklistValidator(__MIXED_VALUES)]), (
+        (1, DataValidationFailedExc),
+        (1.0, DataValidationFailedExc),
+        (True, DataValidationFailedExc),
+        (2, 2),
+        (False, False),
+        ("abc", DataValidationFailedExc),
+        (StrSubclass("abc"), DataValidationFailedExc),
+        ("ABC", "ABC"),
+        (decimal.Decimal("3.250"), DataValidationFailedExc),
+        ([1, 2], DataValidationFailedExc),
+        ([2, 1], [2, 1]),
+        ((3.0, 4.0), DataValidationFailedExc),
+        (float("nan"), lambda output: math.isnan(output)),
+    )),
+    (GenericBlueprint(validators=[BlocklistValidator(["xyz", CaseInsensitiveString("Hello")])]), (
+        ("HELLO", DataValidationFailedExc),
+        ("XYZ", "XYZ"),
+    )),
+)
+
+
+@pytest.mark.parametrize(("blueprint", "input_", "output"), theoretical_testutils.test_function_parameter_generator(__HASH_INDEXED_ALLOWLIST_VALIDATOR_TEST_SUITE))
+def test_hash_indexed_allowlist_and_blocklist_validators(blueprint, input_, output):
+    theoretical_testutils.perform_test(blueprint, input_, output)
+
+
+def test_value_membership_index_matches_in_operator():
+    nan = float("nan")
+    values = (*__MIXED_VALUES, nan, EqualToEverything, -0.0, datetime.timedelta(hours=1))
+    index = ValueMembershipIndex(values)
+
+    assert len(index) == len(values)
+    assert index.get_values() == values
+    assert index.get_unindexed_value_count() == 2  # StrSubclass("sub") and the class
+
+    for lookup_value in (*values, 0, 0.0, False, True, "", b"", "sub", 3.25, datetime.timedelta(minutes=60), float("nan"), (), [], {}, [1, 2.0], StrSubclass("abc")):
+        assert index.contains(lookup_value) == (lookup_value in values)
+
+
+def test_value_membership_index_unhashable_decimal():
+    index = ValueMembershipIndex(["abc", decimal.Decimal("sNaN")])
+
+    assert index.get_unindexed_value_count() == 1
+    assert index.contains("abc")
+    assert not index.contains("xyz")
+
+
+def test_hash_indexed_allowlist_validator_large_allowlist():
+    allowlist = ["SKU-{:08d}".format(i) for i in range(100_000)]
+    blueprint = GenericBlueprint(validators=[AllowlistValidator(allowlist)])
+
+    for value in ("SKU-00000000", "SKU-00050000", "SKU-00099999"):
+        assert blueprint.use(value) == value
+
+    for value in ("SKU-00100000", "SKU-0000000", "sku-00000000"):
+        with pytest.raises(DataValidationFailedExc):
+            blueprint.use(value)
+
+
+def test_hash_indexed_allowlist_and_blocklist_validators_pickling():
+    blueprint = pickle.loads(pickle.dumps(GenericBlueprint(validators=[AllowlistValidator([1, "abc", [2]]), BlocklistValidator([True, "xyz"])])))
+
+    assert blueprint.get_validators()[0].get_allowlist() == (1, "abc", [2])
+    assert blueprint.get_validators()[1].get_blocklist() == (True, "xyz")
+    assert blueprint.use("abc") == "abc"
+    assert blueprint.use([2]) == [2]
+    with pytest.raises(DataValidationFailedExc):
+        blueprint.use(1.0)  # Not blocked by True only, since 1.0 == True
@@ -0,0 +1,192 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import os
+import os.path
+import sys
+if "DATALIDATOR_TESTS_AUTOPATH" in os.environ:
+    __TESTS_DIR = os.path.dirname(os.path.realpath(__file__))
+    __MODULE_DIR = os.path.realpath(os.path.join(__TESTS_DIR, "../.."))
+    if __TESTS_DIR not in sys.path:
+        sys.path.insert(0, __TESTS_DIR)
+    if __MODULE_DIR not in sys.path:
+        sys.path.insert(0, __MODULE_DIR)
+
+import pytest
+import pickle
+import random
+import struct
+from datalidator.blueprints.impl.StringBlueprint import StringBlueprint
+from datalidator.validators.impl.StringIndexFileAllowlistValidator import StringIndexFileAllowlistValidator
+from datalidator.validators.impl.StringIndexFileBlocklistValidator import StringIndexFileBlocklistValidator
+from datalidator.validators.extras.StringIndexFile import StringIndexFile
+from datalidator.validators.extras.StringIndexFileBuilder import StringIndexFileBuilder, main as string_index_file_builder_main
+from datalidator.validators.exc.DataValidationFailedExc import DataValidationFailedExc
+from datalidator.validators.exc.err.InvalidValidatorConfigError import InvalidValidatorConfigError
+
+
+__INDEXED_STRINGS = ("", "abc", "ABC", "abc ", "řeřicha", "🤍", "\x00", "\r\n", "a" * 1000, "\ud800", "duplicate", "duplicate")
+__NOT_INDEXED_STRINGS = (" ", "ab", "abcd", "Abc", "rericha", "a" * 999, "a" * 1001, "\x00\x00", "\n", "\udfff", "duplicat")
+
+
+@pytest.mark.parametrize("bloom_filter_bits_per_entry", (0, 1, 10, 32))
+def test_string_index_file_contains(tmp_path, bloom_filter_bits_per_entry):
+    index_path = tmp_path / "index.bin"
+    assert StringIndexFileBuilder(bloom_filter_bits_per_entry).build(__INDEXED_STRINGS, index_path) == len(__INDEXED_STRINGS) - 1
+
+    with StringIndexFile(index_path) as index_file:
+        assert len(index_file) == len(__INDEXED_STRINGS) - 1
+        assert index_file.has_bloom_filter() == (bloom_filter_bits_per_entry > 0)
+        assert index_file.get_path() == str(index_path)
+
+        for string in __INDEXED_STRINGS:
+            assert index_file.contains(string)
+        for string in __NOT_INDEXED_STRINGS:
+            assert not index_file.contains(string)
+
+
+@pytest.mark.parametrize("bloom_filter_bits_per_entry", (0, 10))
+def test_string_index_file_many_strings(tmp_path, bloom_filter_bits_per_entry):
+    random_ = random.Random(1234)
+    strings = {"{:x}@example.com".format(random_.getrandbits(48)) for _ in range(20000)}
+    other_strings = {"{:x}@example.com".format(random_.getrandbits(48)) for _ in range(2000)} - strings
+
+    index_path = tmp_path / "index.bin"
+    StringIndexFileBuilder(bloom_filter_bits_per_entry).build(strings, index_path)
+
+    with StringIndexFile(index_path) as index_file:
+        assert len(index_file) == len(strings)
+        assert all(index_file.contains(string) for string in strings)
+        assert not any(index_file.contains(string) for string in other_strings)
+
+
+def test_string_index_file_empty(tmp_path):
+    index_path = tmp_path / "index.bin"
+    assert StringIndexFileBuilder(10).build([], index_path) == 0
+
+    with StringIndexFile(index_path) as index_file:
+        assert len(index_file) == 0
+        assert not index_file.has_bloom_filter()
+        assert not index_file.contains("")
+
+
+def test_string_index_file_allowlist_and_blocklist_validators(tmp_path):
+    index_path = tmp_path / "index.bin"
+    StringIndexFileBuilder(10).build(__INDEXED_STRINGS, index_path)
+    index_file = StringIndexFile(index_path)
+
+    allowlist_blueprint = StringBlueprint(validators=[StringIndexFileAllowlistValidator(index_file)])
+    blocklist_blueprint = StringBlueprint(validators=[StringIndexFileBlocklistValidator(index_file)])
+    assert allowlist_blueprint.get_validators()[0].get_index_file() is index_file
+
+    for string in __INDEXED_STRINGS:
+        assert allowlist_blueprint.use(string) == string
+        with pytest.raises(DataValidationFailedExc):
+            blocklist_blueprint.use(string)
+
+    for string in __NOT_INDEXED_STRINGS:
+        with pytest.raises(DataValidationFailedExc):
+            allowlist_blueprint.use(string)
+        assert blocklist_blueprint.use(string) == string
+
+    with pytest.raises(DataValidationFailedExc):
+        allowlist_blueprint.use(123)  # Converted to "123" before being validated
+
+    index_file.close()
+
+
+def test_string_index_file_pickling(tmp_path):
+    index_path = tmp_path / "index.bin"
+    StringIndexFileBuilder().build(["abc", "def"], index_path)
+
+    with StringIndexFile(index_path) as index_file:
+        blueprint = pickle.loads(pickle.dumps(StringBlueprint(validators=[StringIndexFileAllowlistValidator(index_file)])))
+
+    unpickled_index_file = blueprint.get_validators()[0].get_index_file()
+    assert blueprint.use("def") == "def"
+    with pytest.raises(DataValidationFailedExc):
+        blueprint.use("ghi")
+    unpickled_index_file.close()
+
+
+def test_string_index_file_builder_rebuild(tmp_path):
+    index_path = tmp_path / "index.bin"
+    StringIndexFileBuilder().build(["abc"], index_path)
+
+    with StringIndexFile(index_path) as old_index_file:
+        StringIndexFileBuilder().build(["def"], index_path)  # The old file remains mapped
+
+        with StringIndexFile(index_path) as new_index_file:
+            assert old_index_file.contains("abc") and not old_index_file.contains("def")
+            assert new_index_file.contains("def") and not new_index_file.contains("abc")
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["index.bin"]
+
+
+def test_string_index_file_builder_command_line(tmp_path, capsys):
+    input_path = tmp_path / "input.txt"
+    input_path.write_bytes("abc\r\ndef\n\nřeřicha\n abc \nabc\n".encode("utf-8"))
+    index_path = tmp_path / "index.bin"
+
+    assert string_index_file_builder_main(["--bloom-filter-bits-per-entry", "8", str(input_path), str(index_path)]) == 0
+    assert "4 distinct strings" in capsys.readouterr().err
+
+    with StringIndexFile(index_path) as index_file:
+        assert index_file.has_bloom_filter()
+        for string in ("abc", "def", "řeřicha", " abc "):
+            assert index_file.contains(string)
+        for string in ("", "abc\r", " abc"):
+            assert not index_file.contains(string)
+
+
+def test_string_index_file_invalid_files(tmp_path):
+    with pytest.raises(InvalidValidatorConfigError):
+        StringIndexFile(tmp_path / "nonexistent.bin")
+
+    empty_path = tmp_path / "empty.bin"
+    empty_path.write_bytes(b"")
+    with pytest.raises(InvalidValidatorConfigError):
+        StringIndexFile(empty_path)
+
+    garbage_path = tmp_path / "garbage.bin"
+    garbage_path.write_bytes(b"\x00" * 100)
+    with pytest.raises(InvalidValidatorConfigError):
+        StringIndexFile(garbage_path)
+
+    index_path = tmp_path / "index.bin"
+    StringIndexFileBuilder(10).build(["abc", "def"], index_path)
+    index_data = index_path.read_bytes()
+
+    truncated_path = tmp_path / "truncated.bin"
+    truncated_path.write_bytes(index_data[:-1])
+    with pytest.raises(InvalidValidatorConfigError):
+        StringIndexFile(truncated_path)
+
+    future_version_path = tmp_path / "future_version.bin"
+    future_version_path.write_bytes(index_data[:8] + struct.pack("<I", 1000) + index_data[12:])
+    with pytest.raises(InvalidValidatorConfigError):
+        StringIndexFile(future_version_path)
+
+
+def test_string_index_file_builder_invalid_config():
+    with pytest.raises(InvalidValidatorConfigError):
+        StringIndexFileBuilder(-1)
@@ -0,0 +1,197 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import os
+import os.path
+import sys
+if "DATALIDATOR_TESTS_AUTOPATH" in os.environ:
+    __TESTS_DIR = os.path.dirname(os.path.realpath(__file__))
+    __MODULE_DIR = os.path.realpath(os.path.join(__TESTS_DIR, "../.."))
+    if __TESTS_DIR not in sys.path:
+        sys.path.insert(0, __TESTS_DIR)
+    if __MODULE_DIR not in sys.path:
+        sys.path.insert(0, __MODULE_DIR)
+
+import pytest
+import math
+import pickle
+import decimal
+import theoretical_testutils
+from datalidator.blueprints.impl.GenericBlueprint import GenericBlueprint
+from datalidator.blueprints.impl.StringBlueprint import StringBlueprint
+from datalidator.filters.impl.ReplacementMapFilter import ReplacementMapFilter
+
+
+class StrSubclass(str):
+    pass
+
+
+class EqualToEverything:
+    def __eq__(self, other):
+        return True
+
+    def __hash__(self):
+        return 0
+
+
+class CaseInsensitiveString:
+    def __init__(self, value):
+        self.value = value
+
+    def __eq__(self, other):
+        if isinstance(other, str):
+            return self.value.lower() == other.lower()
+        return NotImplemented
+
+    __hash__ = None
+
+
+__NAN = float("nan")
+
+
+__INDEXED_REPLACEMENT_MAP_FILTER_TEST_SUITE = (
+    (GenericBlueprint(filters=[ReplacementMapFilter([
+        (1, "one"),
+        (True, "true"),
+        (1.0, "one (float)"),
+        ("abc", "ABC"),
+        ([1, 2], "list"),
+        ("abc", "second ABC"),
+        ((3, 4), "tuple"),
+        (StrSubclass("sub"), "subclass"),
+        ("sub", "plain sub"),
+        (__NAN, "nan"),
+        (decimal.Decimal("2.5"), "two and a half"),
+        (None, "none"),
+    ])]), (
+        (1, "one"),
+        (True, "one"),
+        (1.0, "one"),
+        (decimal.Decimal(1), "one"),
+        (complex(1, 0), "one"),
+        (0, 0),
+        ("abc", "ABC"),
+        (StrSubclass("abc"), "ABC"),
+        ("ABC", "ABC"),
+        ("abc ", "abc "),
+        ([1, 2], "list"),
+        ([1.0, 2.0], "list"),
+        ([2, 1], [2, 1]),
+        ((3, 4), "tuple"),
+        ((3, 4.0), "tuple"),
+        ("sub", "subclass"),
+        (StrSubclass("sub"), "subclass"),
+        (2.5, "two and a half"),
+        (decimal.Decimal("2.50"), "two and a half"),
+        (None, "none"),
+        (__NAN, lambda output: math.isnan(output)),  # NaN is not equal to itself
+        (float("inf"), float("inf")),
+    )),
+    (GenericBlueprint(filters=[ReplacementMapFilter([
+        ("xyz", 1),
+        (CaseInsensitiveString("Hello"), 2),
+        ("hello", 3),
+    ])]), (
+        ("xyz", 1),
+        ("hello", 2),
+        ("HELLO", 2),
+        ("bye", "bye"),
+        (1, 1),
+    )),
+    (GenericBlueprint(filters=[ReplacementMapFilter([
+        ("hello", 1),
+        (EqualToEverything(), 2),
+        (5, 3),
+    ])]), (
+        ("hello", 1),
+        (5, 2),
+        (None, 2),
+        ([], 2),
+    )),
+    (GenericBlueprint(filters=[ReplacementMapFilter([("hello", 1)])]), (
+        ("hello", 1),
+        (CaseInsensitiveString("HeLLo"), 1),
+        (CaseInsensitiveString("bye"), lambda output: isinstance(output, CaseInsensitiveString)),
+    )),
+    (StringBlueprint(filters=[ReplacementMapFilter([
+        ("Czech Republic", "CZ"),
+        ("CZECHIA", "CZ"),
+        ("Straße", "street"),
+        ("česko", "CZ (lowercase)"),
+        ("Česko", "CZ (uppercase)"),
+        (StrSubclass("Deutschland"), "DE"),
+    ], case_insensitive=True)]), (
+        ("Czech Republic", "CZ"),
+        ("czech republic", "CZ"),
+        ("CZECH REPUBLIC", "CZ"),
+        ("czechia", "CZ"),
+        ("Czechia ", "Czechia "),
+        ("STRASSE", "street"),
+        ("strasse", "street"),
+        ("ČESKO", "CZ (lowercase)"),
+        ("česko", "CZ (lowercase)"),
+        ("deutschland", "DE"),
+        ("DEUTSCHLAND", "DE"),
+        ("Germany", "Germany"),
+    )),
+    (GenericBlueprint(filters=[ReplacementMapFilter([
+        ("abc", 1),
+        (123, 2),
+        (b"ABC", 3),
+    ], case_insensitive=True)]), (
+        ("ABC", 1),
+        (StrSubclass("aBc"), 1),
+        (123, 2),
+        (123.0, 2),
+        (b"ABC", 3),
+        (b"abc", b"abc"),
+    )),
+)
+
+
+@pytest.mark.parametrize(("blueprint", "input_", "output"), theoretical_testutils.test_function_parameter_generator(__INDEXED_REPLACEMENT_MAP_FILTER_TEST_SUITE))
+def test_indexed_replacement_map_filter(blueprint, input_, output):
+    theoretical_testutils.perform_test(blueprint, input_, output)
+
+
+def test_indexed_replacement_map_filter_large_map():
+    replacement_map = [("alias-{}".format(i), "CANONICAL-{}".format(i % 250)) for i in range(3000)]
+    blueprint = StringBlueprint(filters=[ReplacementMapFilter(replacement_map, case_insensitive=True)])
+
+    assert blueprint.use("alias-0") == "CANONICAL-0"
+    assert blueprint.use("ALIAS-2999") == "CANONICAL-249"
+    assert blueprint.use("alias-3000") == "alias-3000"
+
+
+def test_indexed_replacement_map_filter_signalling_nan():
+    filter_ = ReplacementMapFilter([("abc", 1), (decimal.Decimal("sNaN"), 2)])
+
+    assert GenericBlueprint(filters=[filter_]).use("abc") == 1
+
+
+def test_indexed_replacement_map_filter_pickling():
+    filter_ = pickle.loads(pickle.dumps(ReplacementMapFilter([("Abc", 1), ([2], 2)], case_insensitive=True)))
+
+    assert filter_.is_case_insensitive()
+    assert filter_.get_replacement_map() == (("Abc", 1), ([2], 2))
+    assert GenericBlueprint(filters=[filter_]).use("aBC") == 1
+    assert GenericBlueprint(filters=[filter_]).use([2]) == 2
@@ -0,0 +1,226 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import os
+import os.path
+import sys
+if "DATALIDATOR_TESTS_AUTOPATH" in os.environ:
+    __TESTS_DIR = os.path.dirname(os.path.realpath(__file__))
+    __MODULE_DIR = os.path.realpath(os.path.join(__TESTS_DIR, "../.."))
+    if __TESTS_DIR not in sys.path:
+        sys.path.insert(0, __TESTS_DIR)
+    if __MODULE_DIR not in sys.path:
+        sys.path.insert(0, __MODULE_DIR)
+
+import pytest
+import math
+import random
+import decimal
+import fractions
+import theoretical_testutils
+from datalidator.EqualityKeyHelper import EqualityKeyHelper
+from datalidator.blueprints.impl.GenericBlueprint import GenericBlueprint
+from datalidator.filters.impl.ListDeduplicateItemsFilter import ListDeduplicateItemsFilter
+from datalidator.validators.impl.SequenceHasAllItemsUniqueValidator import SequenceHasAllItemsUniqueValidator
+from datalidator.validators.exc.DataValidationFailedExc import DataValidationFailedExc
+
+
+class StrSubclass(str):
+    pass
+
+
+class EqualToEverything:
+    def __eq__(self, other):
+        return True
+
+    def __hash__(self):
+        return 0
+
+    def __repr__(self):
+        return "EqualToEverything()"
+
+
+class CaseInsensitiveString:
+    def __init__(self, value):
+        self.value = value
+
+    def __eq__(self, other):
+        if isinstance(other, (str, CaseInsensitiveString)):
+            return self.value.lower() == str(other).lower()
+        return NotImplemented
+
+    def __str__(self):
+        return self.value
+
+    __hash__ = None
+
+
+__NAN = float("nan")
+__EQUAL_TO_EVERYTHING = EqualToEverything()
+
+
+def reference_deduplicate(list_):
+    deduplicated_list = []
+    for item in list_:
+        if item not in deduplicated_list:
+            deduplicated_list.append(item)
+    return deduplicated_list
+
+
+def reference_first_duplicate_index(sequence):
+    for index, item in enumerate(sequence):
+        if sequence.count(item) != 1:
+            return index
+    return None
+
+
+def same_items(first_list, second_list):
+    return len(first_list) == len(second_list) and all(first is second for first, second in zip(first_list, second_list))
+
+
+__DEDUPLICATION_TEST_SUITE = (
+    (GenericBlueprint(filters=[ListDeduplicateItemsFilter()]), (
+        ([], []),
+        ([1, 2, 3], [1, 2, 3]),
+        ([3, 1, 3, 2, 1], [3, 1, 2]),
+        ([1, True, 1.0, decimal.Decimal(1), fractions.Fraction(1), complex(1, 0)], lambda output: output == [1] and output[0].__class__ is int),
+        ([True, 1], lambda output: output == [True] and output[0].__class__ is bool),
+        ([0, False, 0.0, -0.0, None, "", b""], [0, None, "", b""]),
+        (["a", b"a", "a", b"a"], ["a", b"a"]),
+        ([[1, 2], [1, 2], [2, 1], (1, 2), (1.0, 2.0)], [[1, 2], [2, 1], (1, 2)]),
+        ([{"a": 1}, {"a": 1.0}, {"a": 2}, {"b": 1}, {"a": [1]}, {"a": [True]}], [{"a": 1}, {"a": 2}, {"b": 1}, {"a": [1]}]),
+        ([{1, 2}, frozenset((2, 1)), {1}], [{1, 2}, {1}]),
+        ([[], (), {}, set(), ""], [[], (), {}, set(), ""]),
+        ([StrSubclass("x"), "x", "y", StrSubclass("y")], ["x", "y"]),
+        (["Hello", CaseInsensitiveString("HELLO"), "hello", CaseInsensitiveString("bye")], lambda output: [str(item) for item in output] == ["Hello", "hello", "bye"]),
+        ([CaseInsensitiveString("HELLO"), "Hello", "hello", "x"], lambda output: str(output[0]) == "HELLO" and output[1:] == ["x"]),
+        ([1, "a", __EQUAL_TO_EVERYTHING, 2, "b", [3]], [1, "a", 2, "b", [3]]),
+        ([__EQUAL_TO_EVERYTHING, 1, "a", [3]], [__EQUAL_TO_EVERYTHING]),
+        ([__NAN, __NAN, float("nan")], lambda output: len(output) == 2 and output[0] is __NAN),
+        ([[__NAN], [__NAN]], lambda output: len(output) == 1),
+    )),
+)
+
+__UNIQUENESS_TEST_SUITE = (
+    (GenericBlueprint(validators=[SequenceHasAllItemsUniqueValidator()]), (
+        ([], []),
+        ((), ()),
+        ("", ""),
+        ("abc", "abc"),
+        ("abca", DataValidationFailedExc),
+        (b"abc", b"abc"),
+        (b"abcb", DataValidationFailedExc),
+        ([1, 2, 3], [1, 2, 3]),
+        ([1, 2, 1.0], DataValidationFailedExc),
+        ([1, True], DataValidationFailedExc),
+        ([0, None, "", b"", [], (), {}], [0, None, "", b"", [], (), {}]),
+        ([[1, 2], [2, 1], (1, 2)], [[1, 2], [2, 1], (1, 2)]),
+        ([[1, 2], (3,), [1.0, 2.0]], DataValidationFailedExc),
+        ([{"a": 1}, {"a": 2}], [{"a": 1}, {"a": 2}]),
+        ([{"a": 1}, {"a": True}], DataValidationFailedExc),
+        ([{1, 2}, frozenset((1, 2))], DataValidationFailedExc),
+        (["x", StrSubclass("x")], DataValidationFailedExc),
+        (["Hello", CaseInsensitiveString("HELLO")], DataValidationFailedExc),
+        ([CaseInsensitiveString("HELLO"), "x"], lambda output: len(output) == 2),
+        ([1, __EQUAL_TO_EVERYTHING], DataValidationFailedExc),
+        ([__EQUAL_TO_EVERYTHING], lambda output: output == [__EQUAL_TO_EVERYTHING]),
+        ([__NAN, float("nan")], lambda output: len(output) == 2),
+        ([__NAN, __NAN], DataValidationFailedExc),
+    )),
+)
+
+
+@pytest.mark.parametrize(("blueprint", "input_", "output"), theoretical_testutils.test_function_parameter_generator(__DEDUPLICATION_TEST_SUITE))
+def test_list_deduplicate_items_filter_hybrid(blueprint, input_, output):
+    theoretical_testutils.perform_test(blueprint, input_, output)
+
+
+@pytest.mark.parametrize(("blueprint", "input_", "output"), theoretical_testutils.test_function_parameter_generator(__UNIQUENESS_TEST_SUITE))
+def test_sequence_has_all_items_unique_validator_hybrid(blueprint, input_, output):
+    theoretical_testutils.perform_test(blueprint, input_, output)
+
+
+def test_hybrid_deduplication_and_uniqueness_match_reference_implementations():
+    random_ = random.Random(5678)
+    values = (
+        0, 1, 2, True, False, 0.0, 1.0, 2.5, __NAN, "", "a", "A", b"a", None, decimal.Decimal("2.5"), [], [1], [1.0], (1,),
+        {}, {"a": 1}, {"a": True}, {1}, frozenset((1,)), StrSubclass("a"), CaseInsensitiveString("a"), [StrSubclass("a")],
+        {"a": [1, (2, None)]}, {"a": [1, (2.0, None)]}, (__NAN,), 2 ** 61 - 1, 2 * (2 ** 61 - 1), 2 ** 70, 2.0 ** 70,
+        decimal.Decimal(2 ** 70), 0.5, fractions.Fraction(1, 2), complex(0.5, 0), complex(0.5, 1), float("inf")
+    )
+    deduplicate_filter = ListDeduplicateItemsFilter()
+    uniqueness_validator = SequenceHasAllItemsUniqueValidator()
+
+    for _ in range(500):
+        list_ = [random_.choice(values) for _ in range(random_.randint(0, 12))]
+
+        assert same_items(deduplicate_filter.filter(list_), reference_deduplicate(list_))
+
+        first_duplicate_index = reference_first_duplicate_index(list_)
+        if first_duplicate_index is None:
+            uniqueness_validator.validate(list_)
+        else:
+            with pytest.raises(DataValidationFailedExc) as exc_info:
+                uniqueness_validator.validate(list_)
+            assert repr(list_[first_duplicate_index]) in str(exc_info.value)
+
+
+@pytest.mark.parametrize("list_", (
+    ["item-{}".format(i) for i in range(50000)],
+    [{"id": i, "tags": ["x", i]} for i in range(50000)],
+    [[i, i + 1] for i in range(50000)],
+    [k * (2 ** 61 - 1) for k in range(1, 50001)],  # All these integers have the same hash
+    list(range(50000)) + [0],
+))
+def test_hybrid_deduplication_and_uniqueness_large_lists(list_):
+    # With the quadratic algorithms (or with naive hashing), each of these would take at least tens of seconds
+    deduplicated_list = ListDeduplicateItemsFilter().filter(list_)
+    assert len(deduplicated_list) == 50000
+
+    if len(list_) == 50000:
+        SequenceHasAllItemsUniqueValidator().validate(list_)
+    else:
+        with pytest.raises(DataValidationFailedExc):
+            SequenceHasAllItemsUniqueValidator().validate(list_)
+
+
+def test_equality_key_helper():
+    get_equality_key = EqualityKeyHelper.get_equality_key
+
+    assert get_equality_key(1) == get_equality_key(1.0) == get_equality_key(True)
+    assert get_equality_key([1, {"a": (2,)}]) == get_equality_key([1.0, {"a": (2.0,)}])
+    assert get_equality_key([1]) != get_equality_key((1,))
+    assert get_equality_key({1}) == get_equality_key(frozenset((1,)))
+    assert get_equality_key(StrSubclass("a")) is EqualityKeyHelper.NO_EQUALITY_KEY
+    assert get_equality_key([1, StrSubclass("a")]) is EqualityKeyHelper.NO_EQUALITY_KEY
+    assert get_equality_key({StrSubclass("a"): 1}) is EqualityKeyHelper.NO_EQUALITY_KEY
+    assert get_equality_key(decimal.Decimal("sNaN")) is EqualityKeyHelper.NO_EQUALITY_KEY
+    assert get_equality_key(__NAN) == get_equality_key(__NAN)
+    assert get_equality_key(__NAN) != get_equality_key(float("nan"))
+    assert get_equality_key(float("inf")) == get_equality_key(decimal.Decimal("Infinity")) != get_equality_key(float("-inf"))
+    assert get_equality_key(2 ** 70) == get_equality_key(2.0 ** 70) == get_equality_key(decimal.Decimal(2 ** 70))
+    assert get_equality_key(0.5) == get_equality_key(fractions.Fraction(1, 2)) == get_equality_key(complex(0.5, 0))
+    assert get_equality_key(complex(1, 2)) != get_equality_key(complex(2, 1))
+    assert get_equality_key(decimal.Decimal("1E+999999999")) is EqualityKeyHelper.NO_EQUALITY_KEY
+
+    with pytest.raises(NotImplementedError):
+        EqualityKeyHelper()
@@ -0,0 +1,144 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import os
+import os.path
+import sys
+if "DATALIDATOR_TESTS_AUTOPATH" in os.environ:
+    __TESTS_DIR = os.path.dirname(os.path.realpath(__file__))
+    __MODULE_DIR = os.path.realpath(os.path.join(__TESTS_DIR, "../.."))
+    if __TESTS_DIR not in sys.path:
+        sys.path.insert(0, __TESTS_DIR)
+    if __MODULE_DIR not in sys.path:
+        sys.path.insert(0, __MODULE_DIR)
+
+import pytest
+import random
+import sys
+import unicodedata
+import theoretical_testutils
+from datalidator.ControlAndSeparatorCharacterHelper import ControlAndSeparatorCharacterHelper
+from datalidator.blueprints.impl.StringBlueprint import StringBlueprint
+from datalidator.filters.impl.StringControlAndSeparatorCharacterFilter import StringControlAndSeparatorCharacterFilter
+from datalidator.validators.impl.StringContainsNoControlOrSeparatorCharactersValidator import StringContainsNoControlOrSeparatorCharactersValidator
+from datalidator.validators.exc.DataValidationFailedExc import DataValidationFailedExc
+
+
+class StrSubclass(str):
+    pass
+
+
+__ALPHABETS = (
+    "abcdefghijklmnopqrstuvwxyz ABCXYZ.,:;!?0123456789\r\n\t\x00\x1b\x7f",
+    "příliš žluťoučký kůň úpěl ďábelské ódy ÄÖÜß\xa0\xad\x85  ​‎",
+    "".join(map(chr, range(0x4e00, 0x4e40))) + "。、 　﻿￹",
+    "abc 🤍😀🎉\U0001d173\U000e0001\U000e007f\U000f0000\U0010fffd\U0010ffff\U0003fffe𐏿",
+)
+
+
+def reference_filter(data, allowed_characters):
+    return "".join(filter(lambda char: (char in allowed_characters) or (unicodedata.category(char)[0] not in ("C", "Z")), data))
+
+
+def reference_first_invalid_character(data, allowed_characters):
+    for char in data:
+        if (char not in allowed_characters) and (unicodedata.category(char)[0] in ("C", "Z")):
+            return char
+    return None
+
+
+__CONTROL_AND_SEPARATOR_CHARACTER_TEST_SUITE = (
+    (StringBlueprint(filters=[StringControlAndSeparatorCharacterFilter()]), (
+        ("", ""),
+        ("hello world", "hello world"),
+        ("hello\x00 world\x7f\r\n\t", "hello world\r\n\t"),
+        ("\x0b\x0c\x1c\x1d\x1e\x1f\x85", ""),
+        ("a\xa0b c d　e", "abcde"),
+        ("ř​ř﻿ř", "řřř"),
+        ("🤍\U000e0001🤍\U000f0000🤍", "🤍🤍🤍"),
+        (StrSubclass("a\x00b"), lambda output: output == "ab" and output.__class__ is str),
+    )),
+    (StringBlueprint(filters=[StringControlAndSeparatorCharacterFilter(allowed_characters="\x00 \U000e0001")]), (
+        ("a\x00 b\r\n", "a\x00b"),
+        ("a  b", "a b"),
+        ("🤍\U000e0001\U000e0002", "🤍\U000e0001"),
+    )),
+    (StringBlueprint(validators=[StringContainsNoControlOrSeparatorCharactersValidator()]), (
+        ("", ""),
+        ("hello world\r\n\t", "hello world\r\n\t"),
+        ("hello\x00world", DataValidationFailedExc),
+        ("hello\x7f", DataValidationFailedExc),
+        ("příliš žluťoučký kůň", "příliš žluťoučký kůň"),
+        ("příliš\xa0žluťoučký", DataValidationFailedExc),
+        ("中文 🤍", "中文 🤍"),
+        ("中文　🤍", DataValidationFailedExc),
+        ("🤍\U000e0001", DataValidationFailedExc),
+        ("\U0010ffff", DataValidationFailedExc),
+    )),
+    (StringBlueprint(validators=[StringContainsNoControlOrSeparatorCharactersValidator(allowed_characters="")]), (
+        ("hello", "hello"),
+        ("hello world", DataValidationFailedExc),
+        ("hello\n", DataValidationFailedExc),
+    )),
+)
+
+
+@pytest.mark.parametrize(("blueprint", "input_", "output"), theoretical_testutils.test_function_parameter_generator(__CONTROL_AND_SEPARATOR_CHARACTER_TEST_SUITE))
+def test_control_and_separator_character_filter_and_validator(blueprint, input_, output):
+    theoretical_testutils.perform_test(blueprint, input_, output)
+
+
+@pytest.mark.parametrize("allowed_characters", (" \r\n\t", "", "\x00\x7f \U000e0001\U0010ffff", "abc"))
+def test_control_and_separator_character_filter_and_validator_match_reference_implementations(allowed_characters):
+    random_ = random.Random(9876)
+    filter_ = StringControlAndSeparatorCharacterFilter(allowed_characters=allowed_characters)
+    validator = StringContainsNoControlOrSeparatorCharactersValidator(allowed_characters=allowed_characters)
+
+    for alphabet in (*__ALPHABETS, "".join(__ALPHABETS)):
+        for _ in range(50):
+            data = "".join(random_.choice(alphabet) for _ in range(random_.randint(0, 30)))
+
+            assert filter_.filter(data) == reference_filter(data, allowed_characters)
+
+            first_invalid_character = reference_first_invalid_character(data, allowed_characters)
+            if first_invalid_character is None:
+                validator.validate(data)
+            else:
+                with pytest.raises(DataValidationFailedExc) as exc_info:
+                    validator.validate(data)
+                assert str(exc_info.value).endswith(repr(first_invalid_character))
+
+
+@pytest.mark.parametrize("allowed_characters", (" \r\n\t", "", "\U0001d173\ud800"))
+def test_control_and_separator_character_regex_covers_all_code_points(allowed_characters):
+    all_characters = "".join(map(chr, range(sys.maxunicode + 1)))
+
+    assert ControlAndSeparatorCharacterHelper.get_character_regex(allowed_characters).sub("", all_characters) == reference_filter(all_characters, allowed_characters)
+
+
+def test_control_and_separator_character_helper_caching():
+    assert ControlAndSeparatorCharacterHelper.get_character_regex("\r\n") is ControlAndSeparatorCharacterHelper.get_character_regex("\r\n")
+    assert ControlAndSeparatorCharacterHelper.get_ascii_deletion_table("\r\n") is ControlAndSeparatorCharacterHelper.get_ascii_deletion_table("\r\n")
+    assert set(ControlAndSeparatorCharacterHelper.get_ascii_deletion_table("")) == {*range(0x00, 0x21), 0x7f}
+
+    with pytest.raises(NotImplementedError):
+        ControlAndSeparatorCharacterHelper()